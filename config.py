@@ -45,6 +45,14 @@ class CanvasConfig:
     # Grid overlay
     DEFAULT_GRID_SIZE = 32
 
+    # Sheet overview
+    OVERVIEW_TILE_SIZE = 512  # Mipmap tile edge in pixels
+    OVERVIEW_ZOOM_MIN = 0.01
+    OVERVIEW_ZOOM_MAX = 16.0
+    OVERVIEW_MIN_OVERLAY_PX = 3  # Boxes smaller than this on screen are not drawn
+    OVERVIEW_OVERLAY_COLOR = QColor(0, 200, 255, 200)
+    OVERVIEW_REGION_TILE_CACHE = 64  # Rendered region-outline tiles kept for panning
+
 
 class AnimationConfig:
     """Animation playback settings."""
@@ -59,6 +67,9 @@ class AnimationConfig:
 
     # Timer calculation
     TIMER_BASE = 1000  # milliseconds
+    CLOCK_STATS_WINDOW = 120  # Recent ticks used for measured FPS and jitter
+    TICKER_FALLBACK_INTERVAL_MS = 16  # Shared preview ticker period if refresh rate is unknown
+    CONTROLS_REFRESH_HZ = 20  # Max slider/button refreshes per second during playback
 
 
 class FrameExtractionConfig:
@@ -197,6 +208,15 @@ class DetectionConfig:
     SPACING_CROSS_SAMPLE_STEP = 5  # Sample every Nth pixel along the cross-axis
     SPACING_FRAME_EXISTS_SAMPLE_LIMIT = 20  # Look this many cross-axis px to confirm next frame
 
+    # ==========================================================================
+    # AUTO-SEGMENTATION — used by sprite_model/sprite_segmentation.py
+    # ==========================================================================
+    # Differences are mean absolute channel change over the pixels either frame
+    # covers (non-background), in 0..1, so they don't shrink for small sprites
+    SEGMENT_SAMPLE_SIZE = 64  # Frames are subsampled to at most this many px per side
+    SEGMENT_LOOP_THRESHOLD = 0.02  # Change below this counts as the same pose
+    SEGMENT_MIN_CYCLE_LENGTH = 2  # Shortest cycle that a loop closure may split off
+
 
 class UIConfig:
     """
@@ -229,6 +249,9 @@ class UIConfig:
     THUMBNAIL_SIZE = 80  # Default thumbnail size in grid views
     THUMBNAIL_PADDING = 4  # Padding around thumbnails
     DRAG_THRESHOLD = 8  # Pixels before drag is detected
+    THUMBNAIL_WORKERS = 2  # Threads generating grid thumbnails in the background
+    THUMBNAIL_CACHE_FILE = "thumbnails.sqlite"  # Persistent cache in the user cache dir
+    THUMBNAIL_CACHE_MAX_BYTES = 128 * 1024 * 1024  # Evict least recently used beyond this
 
     # Icon button sizes
     ICON_BUTTON_SIZE = 32  # Standard icon button (play, etc.)
@@ -334,6 +357,7 @@ class AppConfig:
 
     TAB_INDEX_FRAME_VIEW = 0
     TAB_INDEX_ANIMATION_SPLIT = 1
+    TAB_INDEX_SHEET_OVERVIEW = 2
 
     # ==========================================================================
     # APPLICATION METADATA (formerly AppConfig)
@@ -394,6 +418,7 @@ class AppConfig:
 
         # Auto-save settings
         AUTOSAVE_DELAY_MS = 1000  # Debounce delay before saving
+        SEGMENT_SAVE_DELAY_MS = 300  # Debounce delay before writing segment files
 
         # Default values for settings that don't exist
         DEFAULTS = {
@@ -428,6 +453,7 @@ class ExportConfig:
     # Default naming patterns
     DEFAULT_PATTERN = "{name}_{index:03d}"
     DEFAULT_SCALE_FACTORS = [1.0, 2.0, 4.0]
+    ALIAS_MAP_SUFFIX = "_aliases.json"  # Duplicate-frame map written beside aliased exports
 
     # Enhanced Sprite Sheet Layout Configuration
     # ==========================================
@@ -454,6 +480,11 @@ class ExportConfig:
     # Layout calculation preferences
     PREFER_HORIZONTAL = False  # For auto mode: prefer horizontal vs vertical layouts
     ENABLE_ANTIALIASING = True  # Enable antialiasing for scaled sprites
+    MAX_SCALE_WORKERS = 4  # Threads used to pixel-replicate frames for 2x/4x sheet exports
+    SCALE_CHUNK_FRAMES = 32  # Frames scaled at a time while composing a sheet (bounds memory)
+
+    # Export job queue
+    MAX_CONCURRENT_JOBS = 2  # Export workers allowed to run at the same time
 
 
 # =============================================================================
@@ -2,7 +2,13 @@
 Coordinators module - handles cross-component coordination.
 """
 
+from coordinators.frame_update_coalescer import FrameUpdateCoalescer
 from coordinators.signal_coordinator import SignalCoordinator
 from coordinators.sprite_load_coordinator import SpriteLoadCoordinator, SpriteLoadDependencies
 
-__all__ = ["SignalCoordinator", "SpriteLoadCoordinator", "SpriteLoadDependencies"]
+__all__ = [
+    "FrameUpdateCoalescer",
+    "SignalCoordinator",
+    "SpriteLoadCoordinator",
+    "SpriteLoadDependencies",
+]
@@ -0,0 +1,103 @@
+"""Coalesced UI refresh for model frame changes."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QObject, QTimer
+
+from config import Config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["FrameUpdateCoalescer"]
+
+
+class FrameUpdateCoalescer(QObject):
+    """Collapses frame-change notifications into as few UI refreshes as needed.
+
+    Two refreshes are driven from each ``frame_changed(frame, total)`` call:
+
+    - canvas: the displayed frame. While playing, every change made during
+      one event-loop iteration results in a single refresh with the latest
+      frame.
+    - controls: slider and button states. While playing these are skipped
+      when the frame has not changed since the last refresh and capped at
+      ``Config.Animation.CONTROLS_REFRESH_HZ``; the final position is always
+      delivered.
+
+    When not playing, both refreshes happen immediately, so manual navigation
+    stays synchronous. Stopping playback flushes anything pending.
+    """
+
+    def __init__(
+        self,
+        refresh_canvas: Callable[[int, int], None],
+        refresh_controls: Callable[[int, int], None],
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._refresh_canvas = refresh_canvas
+        self._refresh_controls = refresh_controls
+        self._playing = False
+        self._pending: tuple[int, int] | None = None  # Latest (frame, total)
+        self._canvas_dirty = False
+        self._controls_shown: tuple[int, int] | None = None
+        self._controls_refreshed_at = float("-inf")
+
+        self._canvas_timer = QTimer(self)
+        self._canvas_timer.setSingleShot(True)
+        self._canvas_timer.timeout.connect(self._flush_canvas)
+
+        self._controls_timer = QTimer(self)
+        self._controls_timer.setSingleShot(True)
+        self._controls_timer.timeout.connect(self._flush_controls)
+
+    @property
+    def playing(self) -> bool:
+        """True while refreshes are being coalesced."""
+        return self._playing
+
+    def set_playing(self, playing: bool) -> None:
+        """Coalesce while playing; leaving playback flushes pending refreshes."""
+        self._playing = playing
+        if not playing:
+            self.flush()
+
+    def frame_changed(self, frame: int, total: int) -> None:
+        """Record a model frame change and schedule the UI refreshes."""
+        self._pending = (frame, total)
+        self._canvas_dirty = True
+        if not self._playing:
+            self._controls_shown = None  # Idle refreshes always reach the controls
+            self.flush()
+            return
+
+        if not self._canvas_timer.isActive():
+            self._canvas_timer.start(0)  # After the current event-loop iteration
+        if not self._controls_timer.isActive():
+            interval = 1.0 / Config.Animation.CONTROLS_REFRESH_HZ
+            wait = max(0.0, self._controls_refreshed_at + interval - time.perf_counter())
+            self._controls_timer.start(round(wait * 1000))
+
+    def flush(self) -> None:
+        """Apply any pending refreshes now."""
+        self._canvas_timer.stop()
+        self._controls_timer.stop()
+        self._flush_canvas()
+        self._flush_controls()
+
+    def _flush_canvas(self) -> None:
+        if self._canvas_dirty and self._pending is not None:
+            self._canvas_dirty = False
+            self._refresh_canvas(*self._pending)
+
+    def _flush_controls(self) -> None:
+        pending = self._pending
+        if pending is None or pending == self._controls_shown:
+            return
+        self._controls_shown = pending
+        self._controls_refreshed_at = time.perf_counter()
+        self._refresh_controls(*pending)
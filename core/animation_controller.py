@@ -3,13 +3,19 @@
 Animation Controller for Sprite Viewer
 Manages animation timing, state coordination, and UI/Model synchronization.
 Complete MVC Controller implementation for sprite animation.
+
+Playback is driven by a ``PlaybackClock``: each tick advances however many
+frames are due by wall time, and the single-shot precise timer is re-armed
+for the next frame boundary, so timer rounding and late wake-ups never
+accumulate into drift.
 """
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 
 from config import Config
+from core.playback_clock import PlaybackClock, PlaybackStats
 
 if TYPE_CHECKING:
     from sprite_model.core import SpriteModel
@@ -58,7 +64,8 @@ class AnimationController(QObject):
         # ============================================================================
 
         self._animation_timer: QTimer = QTimer(self)
-        self._animation_timer.setSingleShot(False)  # Repeating timer
+        self._animation_timer.setSingleShot(True)  # Re-armed for each frame boundary
+        self._animation_timer.setTimerType(Qt.TimerType.PreciseTimer)
 
         # ============================================================================
         # ANIMATION STATE
@@ -66,10 +73,11 @@ class AnimationController(QObject):
 
         self._is_active: bool = True  # Controller is managing animation
         self._is_playing: bool = False  # Animation is currently playing
-        self._current_fps: int = Config.Animation.DEFAULT_FPS
+        self._current_fps: float = Config.Animation.DEFAULT_FPS
         self._loop_enabled: bool = True
+        self._advancing: bool = False  # Inside a timer tick (frame changes are ours)
 
-        # Timer precision tracking (for get_actual_fps)
+        # Timer precision tracking (nominal rounding error of _calculate_timer_interval)
         self._timer_precision: float = 0.0
 
         # Connect timer
@@ -80,6 +88,7 @@ class AnimationController(QObject):
 
         # Initialize state from model
         self._sync_state_from_model()
+        self._clock = PlaybackClock(self._current_fps)
 
         self.statusChanged.emit("Animation controller initialized")
 
@@ -110,16 +119,15 @@ class AnimationController(QObject):
             self.errorOccurred.emit("No sprite frames available for animation")
             return False
 
-        # Calculate timer interval based on FPS
-        interval_ms = self._calculate_timer_interval()
-
-        # Start animation timer
-        self._animation_timer.start(interval_ms)
+        # Start the wall clock and arm the timer for the first frame boundary
+        self._clock.set_fps(self._current_fps)
+        self._clock.start()
+        self._animation_timer.start(self._clock.ms_until_next_frame())
         self._is_playing = True
 
         # Notify components
         self.animationStarted.emit()
-        self.statusChanged.emit(f"Animation started at {self._current_fps} FPS")
+        self.statusChanged.emit(f"Animation started at {self._current_fps:g} FPS")
 
         return True
 
@@ -127,6 +135,7 @@ class AnimationController(QObject):
         """Pause animation playback, preserving current frame."""
         if self._is_playing:
             self._animation_timer.stop()
+            self._clock.stop()
             self._is_playing = False
 
             # Notify components
@@ -137,6 +146,7 @@ class AnimationController(QObject):
         """Stop animation and reset to first frame."""
         if self._is_playing:
             self._animation_timer.stop()
+            self._clock.stop()
             self._is_playing = False
 
             # Reset to first frame via model
@@ -162,7 +172,8 @@ class AnimationController(QObject):
     def set_fps(self, fps: int | float | None) -> bool:
         """
         Set animation frame rate with validation.
-        Updates timer interval if currently playing.
+        Fractional rates (e.g. 23.976) are kept as given. If playing, the
+        clock re-bases so the next frame is one new period away.
         Returns success status.
         """
         # Validate input type — defensive for untyped callers (Qt signals, etc.)
@@ -175,13 +186,6 @@ class AnimationController(QObject):
             self.errorOccurred.emit(f"FPS must be a valid number, not {fps}")
             return False
 
-        # Convert to int if float
-        try:
-            fps = int(fps)
-        except (ValueError, OverflowError):
-            self.errorOccurred.emit(f"FPS value too large or invalid: {fps}")
-            return False
-
         # Validate FPS range
         if not (Config.Animation.MIN_FPS <= fps <= Config.Animation.MAX_FPS):
             self.errorOccurred.emit(
@@ -194,13 +198,13 @@ class AnimationController(QObject):
         # Sync change to model
         self._sync_state_to_model()
 
-        # Update timer interval if currently playing
+        # Re-base the clock and re-arm the timer if currently playing
+        self._clock.set_fps(fps)
         if self._is_playing:
-            interval_ms = self._calculate_timer_interval()
-            self._animation_timer.setInterval(interval_ms)
+            self._animation_timer.start(self._clock.ms_until_next_frame())
 
         # Notify components
-        self.statusChanged.emit(f"Animation speed set to {fps} FPS")
+        self.statusChanged.emit(f"Animation speed set to {fps:g} FPS")
 
         return True
 
@@ -217,8 +221,10 @@ class AnimationController(QObject):
 
     def _calculate_timer_interval(self) -> int:
         """
-        Calculate precise timer interval in milliseconds for current FPS.
-        Uses integer division with rounding for best timing accuracy.
+        Calculate the nominal frame interval in whole milliseconds for current FPS.
+
+        Playback itself is scheduled by the clock; this is the rounded period,
+        kept for callers that need a single representative interval.
         """
         # Validate FPS to prevent division by zero or invalid intervals
         if self._current_fps <= 0:
@@ -245,11 +251,17 @@ class AnimationController(QObject):
 
     def get_actual_fps(self) -> float:
         """
-        Get the actual FPS based on calculated timer interval.
-        May differ slightly from target FPS due to integer rounding.
+        Get the measured playback FPS.
+
+        While playing this is frames advanced per second of wall time over the
+        recent tick window; before enough ticks are measured, the target FPS.
         """
-        interval_ms = self._calculate_timer_interval()
-        return Config.Animation.TIMER_BASE / interval_ms if interval_ms > 0 else 0.0
+        stats = self._clock.stats()
+        return stats.measured_fps if stats.ticks >= 2 else self._current_fps
+
+    def get_playback_stats(self) -> PlaybackStats:
+        """Get measured FPS, tick jitter, lateness and dropped-frame counts."""
+        return self._clock.stats()
 
     # ============================================================================
     # TIMER EVENT HANDLING
@@ -257,23 +269,36 @@ class AnimationController(QObject):
 
     def _on_timer_timeout(self) -> None:
         """
-        Handle animation timer timeout - advance to next frame.
+        Handle animation timer timeout - advance every frame that is due.
+
+        Normally one frame; when ticks ran late, the skipped frames are
+        jumped over in one model update. The timer is then re-armed for the
+        next frame boundary.
         """
         if not self._sprite_model or not self._is_playing:
             return
 
+        steps = max(1, self._clock.tick())
+        self._advancing = True
         try:
-            _, should_continue = self._sprite_model.next_frame()
+            if steps == 1:
+                _, should_continue = self._sprite_model.next_frame()
+            else:
+                _, should_continue = self._sprite_model.advance_frames(steps)
 
             # Handle animation completion (non-looping)
             if not should_continue:
                 self.pause_animation()
                 self.animationCompleted.emit()
                 self.statusChanged.emit("Animation completed")
+            elif self._is_playing:
+                self._animation_timer.start(self._clock.ms_until_next_frame())
 
         except Exception as e:
             self.errorOccurred.emit(f"Animation error: {e!s}")
             self.pause_animation()
+        finally:
+            self._advancing = False
 
     # ============================================================================
     # SIGNAL COORDINATION
@@ -365,9 +390,10 @@ class AnimationController(QObject):
 
     def _on_model_frame_changed(self, current_frame: int, total_frames: int) -> None:
         """Pause animation when a manual frame change is detected."""
-        # If we think we're playing but the timer is stopped, the frame change
-        # came from outside the timer loop — pause and report.
-        if self._is_playing and not self._animation_timer.isActive():
+        # If we think we're playing but neither a tick is running nor the timer
+        # is armed, the frame change came from outside the playback loop —
+        # pause and report.
+        if self._is_playing and not self._advancing and not self._animation_timer.isActive():
             self.pause_animation()
             self.statusChanged.emit(
                 f"Animation paused - manual frame change to {current_frame + 1}/{total_frames}"
@@ -397,7 +423,7 @@ class AnimationController(QObject):
         return self._is_playing
 
     @property
-    def current_fps(self) -> int:
+    def current_fps(self) -> float:
         """Get current animation FPS setting."""
         return self._current_fps
 
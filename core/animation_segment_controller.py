@@ -19,6 +19,8 @@ from PySide6.QtWidgets import QMessageBox, QTabWidget, QWidget
 
 from config import Config
 from managers import AnimationSegment, AnimationSegmentManager
+from sprite_model.animation_timeline import compile_timeline
+from sprite_model.sprite_segmentation import propose_segments
 
 if TYPE_CHECKING:
     from core.export_coordinator import ExportCoordinator
@@ -39,6 +41,7 @@ class AnimationSegmentController(QObject):
     - Coordinate segment export operations
     - Synchronize segment data between grid view and manager
     - Handle segment selection and preview
+    - Restrict main-canvas playback to one segment's timeline
     """
 
     # Signals for status updates
@@ -80,6 +83,11 @@ class AnimationSegmentController(QObject):
         self._last_sync_frame_count: int = -1
         self._last_sync_sprite_path: str = ""
 
+        # Segment the main canvas plays (None = all frames) and the settings
+        # its timeline was compiled from, to skip recompiling unchanged segments
+        self._canvas_segment: str | None = None
+        self._canvas_timeline_key: tuple[int, int, bool, tuple[tuple[int, int], ...]] | None = None
+
         # Configuration
         self.MAX_NAME_RETRY_ATTEMPTS = 10
 
@@ -91,12 +99,14 @@ class AnimationSegmentController(QObject):
         # Grid view signals
         if self._grid_view:
             self._grid_view.exportRequested.connect(self._on_export_requested)
+            self._grid_view.autoSegmentRequested.connect(self.auto_segment)
 
         # Manager signals
         if self._segment_manager:
             self._segment_manager.segmentRemoved.connect(self._on_manager_segment_removed)
             self._segment_manager.segmentRenamed.connect(self._on_manager_segment_renamed)
             self._segment_manager.segmentsCleared.connect(self._on_manager_segments_cleared)
+            self._segment_manager.segmentsChanged.connect(self._on_manager_segments_changed)
 
         # Preview widget signals
         if self._segment_preview:
@@ -106,6 +116,7 @@ class AnimationSegmentController(QObject):
             self._segment_preview.segmentFrameHoldsChanged.connect(
                 self._on_segment_frame_holds_changed
             )
+            self._segment_preview.segmentCanvasPlaybackRequested.connect(self.toggle_canvas_segment)
 
     # ============================================================================
     # SEGMENT CREATION
@@ -161,6 +172,60 @@ class AnimationSegmentController(QObject):
 
         return True, message
 
+    def create_segments(self, segments: list[AnimationSegment]) -> tuple[bool, str]:
+        """Create several segments at once (all or none). Returns (success, message).
+
+        The manager saves once and emits a single segmentsChanged, which
+        resyncs the grid and preview in one pass.
+        """
+        success, error = self._segment_manager.add_segments(segments)
+        if not success:
+            self.statusMessage.emit(f"Failed to create segments: {error}")
+            return False, error
+
+        count = len(segments)
+        message = f"Created {count} animation segment{'s' if count != 1 else ''}"
+        self.statusMessage.emit(message)
+        return True, message
+
+    def auto_segment(self) -> tuple[bool, str]:
+        """Propose segments from frame similarity and create them in one batch.
+
+        Proposals that overlap an existing segment are skipped, so manual
+        segments are never replaced. Returns (success, message).
+        """
+        frames = self._sprite_model.sprite_frames if self._sprite_model else ()
+        if not frames:
+            message = "No frames to segment"
+            self.statusMessage.emit(message)
+            return False, message
+
+        palette = Config.Colors.SEGMENT_PALETTE
+        segments: list[AnimationSegment] = []
+        name_index = 0
+        metadata = self._sprite_model.frame_metadata
+        proposals = propose_segments(
+            frames,
+            self._sprite_model.frames_per_row,
+            blank=metadata.blank if len(metadata) == len(frames) else None,
+        )
+        for start, end in proposals:
+            if self._segment_manager.segment_overlapping(start, end) is not None:
+                continue
+            name_index += 1
+            while self._segment_manager.get_segment(f"Auto_{name_index}"):
+                name_index += 1
+            segment = AnimationSegment(f"Auto_{name_index}", start, end)
+            segment.set_color(QColor(palette[len(segments) % len(palette)]))
+            segments.append(segment)
+
+        if not segments:
+            message = "Auto-segmentation found no new segments"
+            self.statusMessage.emit(message)
+            return False, message
+
+        return self.create_segments(segments)
+
     def _resolve_name_conflict(
         self, segment: AnimationSegment, original_name: str
     ) -> tuple[bool, str | None]:
@@ -285,6 +350,87 @@ class AnimationSegmentController(QObject):
         )
         self.statusMessage.emit(message)
 
+    # ============================================================================
+    # MAIN CANVAS SEGMENT PLAYBACK
+    # ============================================================================
+
+    @property
+    def canvas_segment(self) -> str | None:
+        """Name of the segment the main canvas plays, or None for all frames."""
+        return self._canvas_segment
+
+    def play_segment_on_canvas(self, segment_name: str) -> tuple[bool, str]:
+        """
+        Restrict main-canvas playback to a segment, honouring its bounce and holds.
+
+        Returns (success, message).
+        """
+        segment = self._segment_manager.get_segment(segment_name)
+        if segment is None:
+            return False, f"Segment '{segment_name}' not found"
+
+        self._canvas_segment = segment_name
+        self._canvas_timeline_key = None
+        if not self._refresh_canvas_timeline():
+            return False, f"Segment '{segment_name}' is outside the loaded frames"
+
+        message = f"Main canvas plays segment '{segment_name}'"
+        self.statusMessage.emit(message)
+        return True, message
+
+    def clear_canvas_segment(self) -> None:
+        """Return main-canvas playback to all frames."""
+        if self._canvas_segment is None:
+            return
+        self._canvas_segment = None
+        self._canvas_timeline_key = None
+        if self._sprite_model:
+            self._sprite_model.set_timeline(None)
+        self.statusMessage.emit("Main canvas plays all frames")
+
+    def toggle_canvas_segment(self, segment_name: str) -> None:
+        """Play segment_name on the main canvas, or all frames if it already is."""
+        if self._canvas_segment == segment_name:
+            self.clear_canvas_segment()
+            return
+        success, message = self.play_segment_on_canvas(segment_name)
+        if not success:
+            self.statusMessage.emit(message)
+
+    def _refresh_canvas_timeline(self) -> bool:
+        """
+        Recompile the canvas timeline if its segment's frames, bounce or holds
+        changed. Drops back to all frames when the segment is gone.
+
+        Returns False if the canvas segment could not be applied.
+        """
+        if self._canvas_segment is None or not self._sprite_model:
+            return True
+        segment = self._segment_manager.get_segment(self._canvas_segment)
+        if segment is None:
+            self.clear_canvas_segment()
+            return False
+
+        holds = segment.frame_holds or {}
+        key = (
+            segment.start_frame,
+            segment.end_frame,
+            segment.bounce_mode,
+            tuple(sorted(holds.items())),
+        )
+        # The model drops its timeline whenever frames are replaced
+        if key == self._canvas_timeline_key and self._sprite_model.timeline is not None:
+            return True
+
+        timeline = compile_timeline(
+            segment.start_frame, segment.end_frame, segment.bounce_mode, holds
+        )
+        if not self._sprite_model.set_timeline(timeline):
+            self.clear_canvas_segment()
+            return False
+        self._canvas_timeline_key = key
+        return True
+
     def _on_preview_playback_changed(self, segment_name: str, is_playing: bool) -> None:
         """Handle playback state change from preview panel."""
         action = "Playing" if is_playing else "Paused"
@@ -296,6 +442,7 @@ class AnimationSegmentController(QObject):
         if success:
             mode_text = "enabled" if bounce_mode else "disabled"
             self.statusMessage.emit(f"Bounce mode {mode_text} for segment '{segment_name}'")
+            self._refresh_canvas_timeline()
         else:
             self.statusMessage.emit(f"Failed to update bounce mode: {error}")
 
@@ -312,6 +459,7 @@ class AnimationSegmentController(QObject):
                 )
             else:
                 self.statusMessage.emit(f"Cleared frame holds for segment '{segment_name}'")
+            self._refresh_canvas_timeline()
         else:
             self.statusMessage.emit(f"Failed to update frame holds: {error}")
 
@@ -376,7 +524,9 @@ class AnimationSegmentController(QObject):
         frames = self._sprite_model.sprite_frames
 
         if frames:
-            self._grid_view.set_frames(frames)
+            metadata = self._sprite_model.frame_metadata
+            digests = metadata.digests if len(metadata) == len(frames) else None
+            self._grid_view.set_frames(frames, digests)
             # Reset per-frame overlays; they will be repopulated from manager state.
             self._grid_view.clear_segments()
 
@@ -422,6 +572,7 @@ class AnimationSegmentController(QObject):
             self.update_grid_view_frames()
         self._segment_manager.set_sprite_context(sprite_path, frame_count)
         self.sync_segments_from_manager()
+        self._refresh_canvas_timeline()
 
     def on_tab_changed(self, index: int) -> None:
         """Handle tab change event to refresh grid view.
@@ -456,13 +607,24 @@ class AnimationSegmentController(QObject):
         """Handle segment removal from manager by resyncing grid to manager state."""
         if self._grid_view:
             self._grid_view.sync_segments_with_manager(self._segment_manager)
+        self._refresh_canvas_timeline()
 
     def _on_manager_segment_renamed(self, old_name: str, new_name: str) -> None:
         """Handle segment rename from manager by resyncing grid to manager state."""
         if self._grid_view:
             self._grid_view.sync_segments_with_manager(self._segment_manager)
+        if self._canvas_segment == old_name:
+            self._canvas_segment = new_name
 
     def _on_manager_segments_cleared(self) -> None:
         """Handle all segments being cleared from manager."""
         if self._grid_view:
             self._grid_view.clear_segments()
+        self.clear_canvas_segment()
+
+    def _on_manager_segments_changed(self, renames: dict[str, str]) -> None:
+        """Handle a committed manager batch with one grid + preview resync."""
+        if self._canvas_segment is not None:
+            self._canvas_segment = renames.get(self._canvas_segment, self._canvas_segment)
+        self.sync_segments_from_manager()
+        self._refresh_canvas_timeline()
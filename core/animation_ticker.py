@@ -0,0 +1,97 @@
+"""
+Animation Ticker - one display-rate timer shared by many small animations.
+
+Giving every segment preview its own ``QTimer`` means one wake-up, frame
+lookup and repaint request per preview per frame. ``AnimationTicker`` runs a
+single precise timer at the display refresh interval and calls every
+subscriber in one pass; subscribers poll their own ``PlaybackClock`` and do
+nothing until a frame is due. Repaints requested during a pass are coalesced
+by Qt into one paint cycle. The timer only runs while someone is subscribed.
+"""
+
+from collections.abc import Callable
+from functools import partial
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QGuiApplication
+
+from config import Config
+
+__all__ = ["AnimationTicker", "shared_animation_ticker"]
+
+
+class AnimationTicker(QObject):
+    """Calls subscribed callbacks once per display refresh."""
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._subscribers: dict[int, Callable[[], None]] = {}  # id(owner) -> callback
+        self._watched: set[int] = set()  # Owners whose destroyed signal is connected
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_tick)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscribers."""
+        return len(self._subscribers)
+
+    @property
+    def is_running(self) -> bool:
+        """True while the shared timer is active."""
+        return self._timer.isActive()
+
+    def subscribe(self, owner: QObject, callback: Callable[[], None]) -> None:
+        """
+        Call callback on every tick until owner unsubscribes or is destroyed.
+
+        Args:
+            owner: Object the subscription belongs to (one callback per owner)
+            callback: Called once per tick on the GUI thread
+        """
+        key = id(owner)
+        self._subscribers[key] = callback
+        if key not in self._watched:
+            self._watched.add(key)
+            owner.destroyed.connect(partial(self._on_owner_destroyed, key))
+        if not self._timer.isActive():
+            self._timer.start(self._tick_interval_ms())
+
+    def unsubscribe(self, owner: QObject) -> None:
+        """Stop calling owner's callback; stops the timer when none remain."""
+        self._subscribers.pop(id(owner), None)
+        if not self._subscribers:
+            self._timer.stop()
+
+    def _on_owner_destroyed(self, key: int, *_args: object) -> None:
+        self._watched.discard(key)
+        self._subscribers.pop(key, None)
+        if not self._subscribers:
+            self._timer.stop()
+
+    def _on_tick(self) -> None:
+        """Advance every subscriber in one pass."""
+        # Snapshot: callbacks may unsubscribe (e.g. a preview that stops itself)
+        for callback in tuple(self._subscribers.values()):
+            callback()
+
+    @staticmethod
+    def _tick_interval_ms() -> int:
+        """Milliseconds per display refresh of the primary screen."""
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0.0
+        if rate <= 0:
+            return Config.Animation.TICKER_FALLBACK_INTERVAL_MS
+        return max(1, round(Config.Animation.TIMER_BASE / rate))
+
+
+_shared_instance: AnimationTicker | None = None
+
+
+def shared_animation_ticker() -> AnimationTicker:
+    """Get the process-wide animation ticker (GUI thread only)."""
+    global _shared_instance
+    if _shared_instance is None:
+        _shared_instance = AnimationTicker()
+    return _shared_instance
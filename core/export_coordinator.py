@@ -10,7 +10,7 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QMessageBox, QWidget
 
 from export.core.export_mode_registry import _get_mode_spec
@@ -36,7 +36,7 @@ class ExportCoordinator(QObject):
     Handles:
     - Individual frame export
     - Sprite sheet export
-    - Segment export (individual and batch)
+    - Segment export (individual, segments-per-row and one-sheet-per-segment batches)
     - Progress dialog management
     - Error/warning/info dialogs
     """
@@ -96,7 +96,7 @@ class ExportCoordinator(QObject):
             contains the warning to show the user.
         """
         # Check segment-specific preconditions
-        if config.mode is ExportMode.SEGMENTS_SHEET:
+        if config.mode in (ExportMode.SEGMENTS_SHEET, ExportMode.SEGMENT_SHEETS):
             if not self._segment_manager:
                 return False, "Segment manager not available."
             segments = self._segment_manager.get_all_segments()
@@ -114,7 +114,7 @@ class ExportCoordinator(QObject):
         return True, ""
 
     def handle_export_request(
-        self, config: ExportConfig, frames: Sequence[QPixmap] | None = None
+        self, config: ExportConfig, frames: Sequence[QImage | QPixmap] | None = None
     ) -> None:
         """Handle unified export request from dialog."""
         # Validate mode-specific preconditions
@@ -125,6 +125,29 @@ class ExportCoordinator(QObject):
 
         spec = _get_mode_spec(config.mode)
 
+        # A request made while a batch is running joins that batch: the exporter
+        # reports aggregate progress, so the batch's dialog keeps tracking it.
+        joins_batch = self._progress_dialog is not None and self._exporter.is_busy
+        if not joins_batch:
+            self._open_progress_dialog(spec.display_name, frames)
+
+        # Route via the registry — segments-sheet uses its own coordinator method
+        # (it ignores the explicit ``frames`` arg and reads from the model).
+        try:
+            spec.coordinator_method(self, config, frames)
+        except Exception:
+            if not joins_batch:
+                self._cleanup_progress_dialog()
+            raise
+
+    def _open_progress_dialog(
+        self,
+        display_name: str,
+        frames: Sequence[QImage | QPixmap] | None,
+    ) -> None:
+        """Replace any previous progress dialog with a new one wired to the exporter."""
+        self._cleanup_progress_dialog()
+
         # Get frame count for progress dialog
         frame_count = (
             len(frames)
@@ -134,7 +157,7 @@ class ExportCoordinator(QObject):
 
         # Create and configure progress dialog
         self._progress_dialog = _ExportProgressDialog(
-            export_type=spec.display_name, total_frames=frame_count, parent=self._parent_widget
+            export_type=display_name, total_frames=frame_count, parent=self._parent_widget
         )
 
         # Disconnect-before-connect: the exporter is a singleton, so previous export
@@ -149,26 +172,20 @@ class ExportCoordinator(QObject):
 
         # Connect exporter signals
         self._exporter.exportProgress.connect(self._progress_dialog.update_progress)
+        self._exporter.exportThroughput.connect(self._progress_dialog.update_throughput)
         self._exporter.exportFinished.connect(self._on_export_finished)
         self._exporter.exportError.connect(self._on_export_error)
         self._progress_dialog.cancelled.connect(self._exporter.cancel_export)
 
-        # Show progress dialog
         self._progress_dialog.show()
 
-        # Route via the registry — segments-sheet uses its own coordinator method
-        # (it ignores the explicit ``frames`` arg and reads from the model).
-        try:
-            spec.coordinator_method(self, config, frames)
-        except Exception:
-            self._cleanup_progress_dialog()
-            raise
-
     # -------------------------------------------------------------------------
     # Export Methods
     # -------------------------------------------------------------------------
 
-    def export_frames(self, config: ExportConfig, frames: Sequence[QPixmap] | None = None) -> None:
+    def export_frames(
+        self, config: ExportConfig, frames: Sequence[QImage | QPixmap] | None = None
+    ) -> None:
         """Handle standard frame export (individual or sheet)."""
         from dataclasses import replace
 
@@ -189,11 +206,38 @@ class ExportCoordinator(QObject):
                     f"{invalid_count} invalid selection(s) skipped."
                 )
 
+        if effective_config.deduplicate:
+            effective_config = replace(
+                effective_config, frame_aliases=self._frame_aliases_for(frames_to_export)
+            )
+
         success = self._exporter.export_frames(frames_to_export, effective_config)
 
         if not success:
             self._show_error("Failed to start export.")
 
+    def _frame_aliases_for(self, frames: Sequence[QImage | QPixmap]) -> list[int] | None:
+        """Map each frame to the first identical frame, reusing the model's aliases.
+
+        Model frames that duplicate each other share one QImage, so exported
+        frames are matched to model frames by cache key instead of re-hashing
+        their pixels. Returns None when a frame is not a model frame.
+        """
+        alias_by_key = {
+            frame.cacheKey(): alias
+            for frame, alias in zip(
+                self._sprite_model.sprite_frames, self._sprite_model.frame_aliases, strict=False
+            )
+        }
+        first_position: dict[int, int] = {}
+        aliases: list[int] = []
+        for position, frame in enumerate(frames):
+            model_alias = alias_by_key.get(frame.cacheKey()) if isinstance(frame, QImage) else None
+            if model_alias is None:
+                return None
+            aliases.append(first_position.setdefault(model_alias, position))
+        return aliases
+
     def export_segments_per_row(self, config: ExportConfig) -> None:
         """Handle segments per row sprite sheet export."""
         if self._segment_manager is None:
@@ -219,7 +263,38 @@ class ExportCoordinator(QObject):
         if not success:
             self._show_error("Failed to start segments per row export.")
 
-    def _export_frames(self, config: ExportConfig, frames: Sequence[QPixmap] | None = None) -> None:
+    def export_segment_sheets(self, config: ExportConfig) -> None:
+        """Queue one sprite sheet per segment as a single export batch."""
+        if self._segment_manager is None:
+            raise RuntimeError("segment_manager is required for segment export")
+        from dataclasses import replace
+
+        all_frames = self._sprite_model.sprite_frames
+        jobs: list[tuple[Sequence[QImage | QPixmap], ExportConfig]] = []
+        for segment in sorted(
+            self._segment_manager.get_all_segments(), key=lambda s: s.start_frame
+        ):
+            segment_frames = all_frames[segment.start_frame : segment.end_frame + 1]
+            if not segment_frames:
+                continue
+            jobs.append(
+                (
+                    segment_frames,
+                    replace(
+                        config,
+                        mode=ExportMode.SPRITE_SHEET,
+                        base_name=f"{config.base_name}_{segment.name}",
+                        selected_indices=None,
+                    ),
+                )
+            )
+
+        if not jobs or not self._exporter.submit_batch(jobs):
+            self._show_error("Failed to start segment sheets export.")
+
+    def _export_frames(
+        self, config: ExportConfig, frames: Sequence[QImage | QPixmap] | None = None
+    ) -> None:
         """Backward-compatible shim for older tests/callers."""
         self.export_frames(config, frames=frames)
 
@@ -249,8 +324,10 @@ class ExportCoordinator(QObject):
             )
 
     def _on_export_error(self, error_message: str) -> None:
-        """Handle export error."""
-        self._cleanup_progress_dialog()
+        """Handle a rejected export request (per-job failures arrive via exportFinished)."""
+        # A request rejected while a batch runs must not tear down that batch's dialog
+        if not self._exporter.is_busy:
+            self._cleanup_progress_dialog()
 
         QMessageBox.critical(
             self._parent_widget,
@@ -263,6 +340,7 @@ class ExportCoordinator(QObject):
         if self._progress_dialog:
             try:
                 self._exporter.exportProgress.disconnect(self._progress_dialog.update_progress)
+                self._exporter.exportThroughput.disconnect(self._progress_dialog.update_throughput)
                 self._exporter.exportFinished.disconnect(self._on_export_finished)
                 self._exporter.exportError.disconnect(self._on_export_error)
             except RuntimeError:
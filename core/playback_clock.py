@@ -0,0 +1,161 @@
+"""
+Playback Clock - wall-clock frame scheduling for animation playback.
+
+A ``QTimer`` that advances one frame per timeout drifts: the interval is
+rounded to whole milliseconds, timer wake-ups are late by a variable amount
+and slow paints push every later frame back. ``PlaybackClock`` instead
+derives the frame that is due from elapsed wall time, so playback stays in
+step with the requested rate (fractional rates included) and catches up by
+skipping frames when rendering falls behind.
+"""
+
+import itertools
+import math
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from config import Config
+
+__all__ = ["PlaybackClock", "PlaybackStats"]
+
+
+@dataclass(frozen=True)
+class PlaybackStats:
+    """Measured playback timing over the recent tick window."""
+
+    target_fps: float = 0.0
+    measured_fps: float = 0.0  # Frames advanced per second of wall time
+    mean_interval_ms: float = 0.0  # Mean time between ticks
+    jitter_ms: float = 0.0  # Standard deviation of the time between ticks
+    max_lateness_ms: float = 0.0  # Worst delay between a frame falling due and its tick
+    dropped_frames: int = 0  # Frames skipped to catch up since start()
+    ticks: int = 0  # Ticks in the window
+
+
+class PlaybackClock:
+    """Maps elapsed wall time to due animation frames.
+
+    Call ``start`` when playback begins, then ``tick`` whenever the driving
+    timer fires: it returns how many frames to advance (more than one when
+    ticks were late). ``ms_until_next_frame`` gives the delay to schedule the
+    next tick at. A timer that fires faster than the frame rate calls
+    ``poll`` instead, which returns 0 until a frame is due. Changing the rate
+    with ``set_fps`` re-bases the clock at the current instant, so the next
+    frame is one new period away.
+    """
+
+    def __init__(self, fps: float, now: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            fps: Target frames per second (must be positive)
+            now: Monotonic time source in seconds (injectable for tests)
+        """
+        self._now = now
+        self._fps = self._validated(fps)
+        self._running = False
+        self._origin = 0.0
+        self._consumed = 0  # Frames advanced since _origin
+        self._dropped = 0
+        self._ticks: deque[tuple[float, int, float]] = deque(
+            maxlen=Config.Animation.CLOCK_STATS_WINDOW
+        )  # (time, frames advanced, lateness)
+
+    @property
+    def fps(self) -> float:
+        """Target frames per second."""
+        return self._fps
+
+    @property
+    def running(self) -> bool:
+        """True between start() and stop()."""
+        return self._running
+
+    def start(self) -> None:
+        """Begin timing from now; the first frame falls due one period later."""
+        self._origin = self._now()
+        self._consumed = 0
+        self._dropped = 0
+        self._ticks.clear()
+        self._running = True
+
+    def stop(self) -> None:
+        """Stop timing; stats remain readable until the next start()."""
+        self._running = False
+
+    def set_fps(self, fps: float) -> None:
+        """Change the target rate, continuing from the current instant."""
+        self._fps = self._validated(fps)
+        if self._running:
+            self._origin = self._now()
+            self._consumed = 0
+
+    def tick(self) -> int:
+        """Return how many frames to advance now (0 when stopped).
+
+        A running clock always advances at least one frame per tick: a wake-up
+        that arrives marginally before the frame boundary still shows the
+        frame, and the following tick is scheduled later to compensate.
+        """
+        if not self._running:
+            return 0
+        now = self._now()
+        return self._consume(now, max(1, self._due(now) - self._consumed))
+
+    def poll(self) -> int:
+        """Return how many frames fell due since the last tick or poll (0 if none).
+
+        For callers woken more often than the frame rate, such as a shared
+        display-rate ticker: wake-ups before the next boundary advance nothing.
+        """
+        if not self._running:
+            return 0
+        now = self._now()
+        steps = self._due(now) - self._consumed
+        return self._consume(now, steps) if steps > 0 else 0
+
+    def ms_until_next_frame(self) -> int:
+        """Milliseconds until the next frame falls due (at least 1)."""
+        next_due = self._origin + (self._consumed + 1) / self._fps
+        return max(1, math.ceil((next_due - self._now()) * 1000 - 1e-6))
+
+    def stats(self) -> PlaybackStats:
+        """Return timing measured over the recent tick window."""
+        if len(self._ticks) < 2:
+            return PlaybackStats(
+                target_fps=self._fps, dropped_frames=self._dropped, ticks=len(self._ticks)
+            )
+        times = [tick_time for tick_time, _, _ in self._ticks]
+        intervals = [later - earlier for earlier, later in itertools.pairwise(times)]
+        span = times[-1] - times[0]
+        # Frames advanced by the first tick in the window happened before its span began
+        frames = sum(steps for _, steps, _ in self._ticks) - self._ticks[0][1]
+        return PlaybackStats(
+            target_fps=self._fps,
+            measured_fps=frames / span if span > 0 else 0.0,
+            mean_interval_ms=statistics.fmean(intervals) * 1000,
+            jitter_ms=statistics.pstdev(intervals) * 1000,
+            max_lateness_ms=max(lateness for _, _, lateness in self._ticks) * 1000,
+            dropped_frames=self._dropped,
+            ticks=len(self._ticks),
+        )
+
+    def _due(self, now: float) -> int:
+        """Frames due since the origin at time now."""
+        return math.floor((now - self._origin) * self._fps + 1e-9)
+
+    def _consume(self, now: float, steps: int) -> int:
+        """Advance steps frames at time now and record the tick."""
+        self._dropped += steps - 1
+        self._consumed += steps
+        lateness = max(0.0, (now - self._origin) - self._consumed / self._fps)
+        self._ticks.append((now, steps, lateness))
+        return steps
+
+    @staticmethod
+    def _validated(fps: float) -> float:
+        if not fps > 0 or math.isinf(fps):
+            raise ValueError(f"FPS must be a positive finite number, got {fps}")
+        return float(fps)
@@ -8,6 +8,7 @@ from .core.frame_exporter import (
     ExportConfig,
     ExportFormat,
     ExportMode,
+    ExportReport,
     FrameExporter,
     LayoutMode,
     SpriteSheetLayout,
@@ -22,6 +23,7 @@ __all__ = [
     "ExportFormat",
     "ExportMode",
     "ExportPreset",
+    "ExportReport",
     "FrameExporter",
     "LayoutMode",
     "SpriteSheetLayout",
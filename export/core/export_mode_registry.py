@@ -15,20 +15,20 @@ from export.core.frame_exporter import ExportMode, _ExportWorker
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    from PySide6.QtGui import QPixmap
+    from PySide6.QtGui import QImage, QPixmap
 
     from core.export_coordinator import ExportCoordinator
     from export.core.frame_exporter import ExportConfig
 
 
 def _coord_export_frames(
-    coord: ExportCoordinator, config: ExportConfig, frames: Sequence[QPixmap] | None
+    coord: ExportCoordinator, config: ExportConfig, frames: Sequence[QImage | QPixmap] | None
 ) -> None:
     coord.export_frames(config, frames=frames)
 
 
 def _coord_export_segments_per_row(
-    coord: ExportCoordinator, config: ExportConfig, frames: Sequence[QPixmap] | None
+    coord: ExportCoordinator, config: ExportConfig, frames: Sequence[QImage | QPixmap] | None
 ) -> None:
     # Segment export reads frames from the model so it can validate segment bounds
     # against the same source of truth used by the segment manager.
@@ -36,6 +36,14 @@ def _coord_export_segments_per_row(
     coord.export_segments_per_row(config)
 
 
+def _coord_export_segment_sheets(
+    coord: ExportCoordinator, config: ExportConfig, frames: Sequence[QImage | QPixmap] | None
+) -> None:
+    # Each segment becomes its own sprite-sheet job, sliced from the model frames.
+    del frames
+    coord.export_segment_sheets(config)
+
+
 __all__: list[str] = []
 
 
@@ -64,6 +72,12 @@ _MODE_SPECS: dict[ExportMode, _ExportModeSpec] = {
         worker_method=_ExportWorker._export_sprite_sheet,
         coordinator_method=_coord_export_segments_per_row,
     ),
+    ExportMode.SEGMENT_SHEETS: _ExportModeSpec(
+        mode=ExportMode.SEGMENT_SHEETS,
+        display_name="Segment Sheets",
+        worker_method=_ExportWorker._export_sprite_sheet,
+        coordinator_method=_coord_export_segment_sheets,
+    ),
 }
 
 
@@ -13,13 +13,15 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
-    from PySide6.QtGui import QPixmap
+    from PySide6.QtGui import QImage, QPixmap
 
     from core.export_coordinator import ExportCoordinator
     from export.core.frame_exporter import ExportConfig, ExportMode, _ExportWorker
 
     _WorkerMethod = Callable[[_ExportWorker], None]
-    _CoordinatorMethod = Callable[[ExportCoordinator, ExportConfig, Sequence[QPixmap] | None], None]
+    _CoordinatorMethod = Callable[
+        [ExportCoordinator, ExportConfig, Sequence[QImage | QPixmap] | None], None
+    ]
 
 __all__: list[str] = []
 
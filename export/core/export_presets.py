@@ -96,6 +96,20 @@ _PRESETS: dict[str, ExportPreset] = {
         ),
         short_description="One row per animation",
     ),
+    "segment_sheets": ExportPreset(
+        name="segment_sheets",
+        display_name="Segment Sheets",
+        icon="🗂️",
+        description="Export every segment as its own sprite sheet in one batch",
+        mode=ExportMode.SEGMENT_SHEETS,
+        format="PNG",
+        scale=1.0,
+        use_cases=["Per-animation atlases", "Character state files", "Batch exports"],
+        sprite_sheet_layout=SpriteSheetLayout(
+            mode=LayoutMode.AUTO, spacing=0, background_mode=BackgroundMode.TRANSPARENT
+        ),
+        short_description="One file per animation",
+    ),
 }
 
 
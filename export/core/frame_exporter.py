@@ -5,20 +5,32 @@ Supports individual frame export and sprite sheet composition.
 
 from __future__ import annotations
 
+import json
 import logging
 import math
 import re
-from dataclasses import dataclass
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from PySide6.QtCore import QObject, Qt, QThread, Signal
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, Qt, QThread, Signal
 from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
 
 from config import Config
+from sprite_model.sprite_extraction import as_image
+from utils.sprite_rendering import (
+    duplicate_frame_map,
+    integer_scale_factor,
+    scale_image_nearest,
+    scale_images_nearest,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Generator, Sequence
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -28,6 +40,7 @@ __all__ = [
     "ExportConfig",
     "ExportFormat",
     "ExportMode",
+    "ExportReport",
     "FrameExporter",
     "LayoutMode",
     "SpriteSheetLayout",
@@ -203,6 +216,7 @@ class ExportMode(Enum):
     SELECTED_FRAMES = "selected"
     SPRITE_SHEET = "sheet"
     SEGMENTS_SHEET = "segments_sheet"
+    SEGMENT_SHEETS = "segment_sheets"  # One sheet per segment, submitted as a batch
 
 
 @dataclass
@@ -217,6 +231,75 @@ class ExportConfig:
     pattern: str = ""
     sprite_sheet_layout: SpriteSheetLayout | None = None
     selected_indices: list[int] | None = None
+    deduplicate: bool = False  # Alias repeated frames instead of re-encoding them
+    # Per frame, the index of the first identical frame (skips hashing when deduplicating)
+    frame_aliases: Sequence[int] | None = None
+
+
+@dataclass
+class ExportReport:
+    """Timing and throughput figures for one export job or a whole batch.
+
+    ``phase_seconds`` maps each worker phase (see ``PHASES``) to the time
+    spent in it. A batch report sums the figures of its ``jobs``; its
+    ``elapsed`` is wall-clock time, so with concurrent jobs it can be shorter
+    than the phase total.
+    """
+
+    PHASES: ClassVar[tuple[str, ...]] = ("scale", "compose", "encode", "write")
+
+    label: str = ""
+    success: bool = False
+    message: str = ""
+    frames: int = 0
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    jobs: list[ExportReport] = field(default_factory=list)
+
+    @property
+    def frames_per_second(self) -> float:
+        """Frames written per wall-clock second (0.0 before any time has elapsed)."""
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Encoded megabytes written per wall-clock second."""
+        return self.bytes_written / 1_000_000 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Accumulate time spent in phase."""
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+    @classmethod
+    def combine(cls, reports: Sequence[ExportReport], elapsed: float) -> ExportReport:
+        """Merge per-job reports into a batch report covering elapsed seconds."""
+        combined = cls(
+            label=f"{len(reports)} jobs",
+            success=bool(reports) and all(report.success for report in reports),
+            frames=sum(report.frames for report in reports),
+            bytes_written=sum(report.bytes_written for report in reports),
+            elapsed=elapsed,
+            jobs=list(reports),
+        )
+        for report in reports:
+            for phase, seconds in report.phase_seconds.items():
+                combined.add_phase(phase, seconds)
+        return combined
+
+    def summary(self) -> str:
+        """One-line human-readable summary, e.g. for logs."""
+        phases = ", ".join(
+            f"{phase} {self.phase_seconds[phase]:.3f}s"
+            for phase in self.PHASES
+            if phase in self.phase_seconds
+        )
+        text = (
+            f"{self.frames} frames, {self.bytes_written / 1_000_000:.2f} MB in "
+            f"{self.elapsed:.2f}s ({self.frames_per_second:.1f} frames/s, "
+            f"{self.megabytes_per_second:.2f} MB/s)"
+        )
+        return f"{text}; {phases}" if phases else text
 
 
 class _ExportTask:
@@ -233,6 +316,8 @@ class _ExportTask:
         pattern: str = "{name}_{index:03d}",
         sprite_sheet_layout: SpriteSheetLayout | None = None,
         segment_info: list[dict[str, Any]] | None = None,
+        deduplicate: bool = False,
+        frame_aliases: Sequence[int] | None = None,
     ):
         """
         Initialize export task.
@@ -247,6 +332,10 @@ class _ExportTask:
             pattern: Naming pattern for individual frames
             sprite_sheet_layout: Layout configuration for sprite sheet export
             segment_info: List of segment dictionaries with 'name', 'start_frame', 'end_frame'
+            deduplicate: Write frames identical to an earlier one as entries in
+                an alias map instead of encoding them again (individual modes)
+            frame_aliases: Precomputed first-identical-frame index per frame;
+                None hashes the frames when deduplicating
         """
         self.frames = frames
         self.output_dir = output_dir
@@ -257,10 +346,14 @@ class _ExportTask:
         self.pattern = pattern
         self.sprite_sheet_layout = sprite_sheet_layout or SpriteSheetLayout()
         self.segment_info = segment_info or []
+        self.deduplicate = deduplicate
+        self.frame_aliases = frame_aliases
 
         # Validate task
         if not frames:
             raise ValueError("No frames to export")
+        if frame_aliases is not None and len(frame_aliases) != len(frames):
+            raise ValueError("Frame aliases do not match the frame count")
         if scale_factor <= 0:
             raise ValueError("Scale factor must be positive")
 
@@ -270,6 +363,7 @@ class _ExportWorker(QThread):
 
     # Signals
     progress = Signal(int, int, str)  # current, total, message
+    throughput = Signal(int, int)  # frames written, bytes written (cumulative)
     taskFinished = Signal(bool, str)  # success, message
     error = Signal(str)  # error message
 
@@ -277,26 +371,77 @@ class _ExportWorker(QThread):
         super().__init__(parent=parent)
         self.task = task
         self._cancelled = False
+        # Filled in on the worker thread; final once taskFinished is emitted
+        self.report = ExportReport(label=task.base_name)
+        self._started = time.perf_counter()
 
     def run(self):
         """Execute the export task."""
         # Lazy import to avoid importing the registry before ExportWorker is defined.
         from export.core.export_mode_registry import _get_mode_spec
 
+        self._started = time.perf_counter()
         try:
             spec = _get_mode_spec(self.task.mode)
             spec.worker_method(self)
         except KeyError:
             self.error.emit(f"Unsupported export mode: {self.task.mode}")
-            self.taskFinished.emit(False, f"Unsupported export mode: {self.task.mode}")
+            self._finish(False, f"Unsupported export mode: {self.task.mode}")
         except Exception as e:
             self.error.emit(str(e))
-            self.taskFinished.emit(False, f"Export failed: {e!s}")
+            self._finish(False, f"Export failed: {e!s}")
 
     def cancel(self):
         """Cancel the export operation."""
         self._cancelled = True
 
+    def _finish(self, success: bool, message: str) -> None:
+        """Stamp the report with the outcome, then emit taskFinished."""
+        self.report.success = success
+        self.report.message = message
+        self.report.elapsed = time.perf_counter() - self._started
+        self.taskFinished.emit(success, message)
+
+    @contextmanager
+    def _phase(self, phase: str) -> Generator[None, None, None]:
+        """Time the enclosed block and add it to the report under phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.report.add_phase(phase, time.perf_counter() - start)
+
+    def _save_image(self, image: QImage, filepath: Path) -> bool:
+        """Encode image in memory, then write it to filepath.
+
+        Encoding and writing are timed as separate phases, and the encoded
+        size is added to the report's bytes written.
+        """
+        with self._phase("encode"):
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            # PySide6 accepts the format name as str at runtime; the stubs only list bytes
+            encoded = image.save(buffer, self.task.format.value)  # pyright: ignore[reportCallIssue, reportArgumentType]
+            buffer.close()
+        if not encoded:
+            return False
+
+        payload = data.data()
+        with self._phase("write"):
+            try:
+                filepath.write_bytes(payload)
+            except OSError as e:
+                logger.debug("Failed to write %s: %s", filepath, e)
+                return False
+        self.report.bytes_written += len(payload)
+        return True
+
+    def _record_written(self, frames: int) -> None:
+        """Count frames as written and publish cumulative throughput."""
+        self.report.frames += frames
+        self.throughput.emit(self.report.frames, self.report.bytes_written)
+
     def _validate_segment_info(self) -> tuple[bool, str]:
         """Validate segment_info structure for segments_per_row mode.
 
@@ -318,14 +463,24 @@ class _ExportWorker(QThread):
         return True, ""
 
     def _export_individual_frames(self) -> None:
-        """Export frames as individual files."""
+        """Export frames as individual files.
+
+        With ``task.deduplicate`` a frame whose pixels match an earlier frame
+        is not encoded; it is recorded in ``<base_name>_aliases.json`` as
+        ``{"aliases": {alias_file: original_file}}`` instead.
+        """
         total_frames = len(self.task.frames)
         exported_count = 0
         failed_frames: list[str] = []
+        originals: Sequence[int] = range(total_frames)
+        if self.task.deduplicate:
+            originals = self.task.frame_aliases or duplicate_frame_map(self.task.frames)
+        written: dict[int, str] = {}
+        aliases: dict[str, str] = {}
 
         for i, frame in enumerate(self.task.frames):
             if self._cancelled:
-                self.taskFinished.emit(False, "Export cancelled")
+                self._finish(False, "Export cancelled")
                 return
 
             # Generate filename
@@ -334,38 +489,72 @@ class _ExportWorker(QThread):
                 + self.task.format.extension
             )
 
+            original = written.get(originals[i]) if originals[i] != i else None
+            if original is not None:
+                aliases[filename] = original
+                self.progress.emit(i + 1, total_frames, f"Aliased {filename} to {original}")
+                continue
+
             filepath = self.task.output_dir / filename
 
             # Scale if needed (frame is QImage, thread-safe)
             if not math.isclose(self.task.scale_factor, 1.0):
-                frame = self._scale_image(frame, self.task.scale_factor)
+                with self._phase("scale"):
+                    frame = self._scale_image(frame, self.task.scale_factor)
 
-            # Save frame - Qt infers format from file extension
-            if frame.save(str(filepath)):
+            if self._save_image(frame, filepath):
                 exported_count += 1
+                written[i] = filename
+                self._record_written(1)
                 self.progress.emit(i + 1, total_frames, f"Exported {filename}")
             else:
                 failed_frames.append(filename)
                 self.error.emit(f"Failed to export {filename}")
 
+        if aliases:
+            if self._write_alias_map(aliases):
+                exported_count += len(aliases)
+            else:
+                failed_frames.extend(aliases)
+                self.error.emit("Failed to write the duplicate-frame alias map")
+
         # Report result — partial success if some frames exported, total failure if none
         if failed_frames:
             failed_summary = ", ".join(failed_frames[:3])
             if len(failed_frames) > 3:
                 failed_summary += f" (and {len(failed_frames) - 3} more)"
             if exported_count > 0:
-                self.taskFinished.emit(
+                self._finish(
                     True,
                     f"Partial export: {exported_count} of {total_frames} frames exported; "
                     f"{len(failed_frames)} failed ({failed_summary})",
                 )
             else:
-                self.taskFinished.emit(
+                self._finish(
                     False,
                     f"Export failed: {len(failed_frames)} of {total_frames} frames failed ({failed_summary})",
                 )
+        elif aliases:
+            self._finish(
+                True,
+                f"Successfully exported {exported_count} frames "
+                f"({len(aliases)} duplicates aliased)",
+            )
         else:
-            self.taskFinished.emit(True, f"Successfully exported {exported_count} frames")
+            self._finish(True, f"Successfully exported {exported_count} frames")
+
+    def _write_alias_map(self, aliases: dict[str, str]) -> bool:
+        """Write the duplicate-frame alias map next to the exported frames."""
+        payload = json.dumps({"aliases": aliases}, indent=2).encode()
+        filepath = self.task.output_dir / f"{self.task.base_name}{Config.Export.ALIAS_MAP_SUFFIX}"
+        with self._phase("write"):
+            try:
+                filepath.write_bytes(payload)
+            except OSError as e:
+                logger.debug("Failed to write %s: %s", filepath, e)
+                return False
+        self.report.bytes_written += len(payload)
+        return True
 
     def _export_sprite_sheet(self):
         """Export all frames as a single sprite sheet with enhanced layout options."""
@@ -382,20 +571,15 @@ class _ExportWorker(QThread):
         if layout.mode is LayoutMode.SEGMENTS_PER_ROW:
             is_valid, error_msg = self._validate_segment_info()
             if not is_valid:
-                self.taskFinished.emit(False, error_msg)
+                self._finish(False, error_msg)
                 return
 
-        # Get original frame dimensions
-        original_frame_width = self.task.frames[0].width()
-        original_frame_height = self.task.frames[0].height()
-
-        # Apply scaling to frame dimensions
-        if not math.isclose(self.task.scale_factor, 1.0):
-            frame_width = int(original_frame_width * self.task.scale_factor)
-            frame_height = int(original_frame_height * self.task.scale_factor)
-        else:
-            frame_width = original_frame_width
-            frame_height = original_frame_height
+        # Frames are scaled chunk by chunk while drawing; the cell size comes
+        # from scaling just the first one
+        with self._phase("scale"):
+            first = self._scaled_frames(self.task.frames[:1])[0]
+        frame_width = first.width()
+        frame_height = first.height()
 
         # Calculate grid dimensions using layout configuration
         cols, rows = self._calculate_grid_layout(layout, frame_count)
@@ -414,10 +598,11 @@ class _ExportWorker(QThread):
                 cols, rows, frame_width, frame_height, layout
             )
 
-        # Create sprite sheet with background
-        sprite_sheet = self._create_background_sheet(
-            sheet_width, sheet_height, layout, self.task.format
-        )
+        with self._phase("compose"):
+            # Create sprite sheet with background
+            sprite_sheet = self._create_background_sheet(
+                sheet_width, sheet_height, layout, self.task.format
+            )
 
         # Draw frames onto sprite sheet with spacing
         if is_segments_mode:
@@ -439,14 +624,15 @@ class _ExportWorker(QThread):
         filename = f"{self.task.base_name}_sheet{self.task.format.extension}"
         filepath = self.task.output_dir / filename
 
-        if sprite_sheet.save(str(filepath)):
+        if self._save_image(sprite_sheet, filepath):
+            self._record_written(frame_count)
             self.progress.emit(3, 3, f"Saved {filename}")
-            self.taskFinished.emit(
+            self._finish(
                 True,
                 f"Successfully exported sprite sheet ({cols}x{rows}, {layout.spacing}px spacing)",
             )
         else:
-            self.taskFinished.emit(False, "Failed to save sprite sheet")
+            self._finish(False, "Failed to save sprite sheet")
 
     def _calculate_grid_layout(
         self, layout: SpriteSheetLayout, frame_count: int
@@ -635,26 +821,15 @@ class _ExportWorker(QThread):
 
         Returns True on success, False if cancelled (caller must emit finished).
         """
-        painter = self._begin_export_painter(sprite_sheet)
-
-        for i, frame in enumerate(self.task.frames):
-            if self._cancelled:
-                painter.end()
-                self.taskFinished.emit(False, "Export cancelled")
-                return False
-
-            # Calculate grid position
-            row = i // cols
-            col = i % cols
-
-            # Calculate pixel position with spacing
-            x = col * (frame_width + layout.spacing)
-            y = row * (frame_height + layout.spacing)
-
-            self._draw_frame(painter, frame, x, y)
-
-        painter.end()
-        return True
+        placements = [
+            (
+                i,
+                (i % cols) * (frame_width + layout.spacing),
+                (i // cols) * (frame_height + layout.spacing),
+            )
+            for i in range(len(self.task.frames))
+        ]
+        return self._draw_placed_frames(sprite_sheet, placements)
 
     def _calculate_segments_per_row_layout(self) -> tuple[int, int]:
         """Calculate layout for segments per row mode.
@@ -686,47 +861,71 @@ class _ExportWorker(QThread):
 
         Returns True on success, False if cancelled (caller must emit finished).
         """
-        painter = self._begin_export_painter(sprite_sheet)
-
-        # Draw each segment on its own row
-        for row_idx, segment in enumerate(self.task.segment_info):
-            start = segment["start_frame"]
-            end = segment["end_frame"]
-
-            frames_drawn = 0
-            # Draw frames for this segment
-            for col_idx, frame_idx in enumerate(range(start, end + 1)):
-                if frame_idx >= len(self.task.frames):
-                    break
-
-                if self._cancelled:
-                    painter.end()
-                    self.taskFinished.emit(False, "Export cancelled")
-                    return False
-
-                frame = self.task.frames[frame_idx]
-
-                # Calculate pixel position with spacing
-                x = col_idx * (frame_width + layout.spacing)
-                y = row_idx * (frame_height + layout.spacing)
+        placements: list[tuple[int, int, int]] = []
+        for row_idx, segment in enumerate(self.task.segment_info or []):
+            end = min(segment["end_frame"] + 1, len(self.task.frames))
+            frame_indices = range(segment["start_frame"], end)
+            placements.extend(
+                (
+                    frame_idx,
+                    col_idx * (frame_width + layout.spacing),
+                    row_idx * (frame_height + layout.spacing),
+                )
+                for col_idx, frame_idx in enumerate(frame_indices)
+            )
+            logger.debug("Placed %d frames for segment '%s'", len(frame_indices), segment["name"])
+        return self._draw_placed_frames(sprite_sheet, placements)
 
-                self._draw_frame(painter, frame, x, y)
-                frames_drawn += 1
+    def _draw_placed_frames(
+        self, sprite_sheet: QImage, placements: Sequence[tuple[int, int, int]]
+    ) -> bool:
+        """Scale and draw (frame_index, x, y) placements a chunk at a time.
 
-            logger.debug("Drew %d frames for segment '%s'", frames_drawn, segment["name"])
+        Only one chunk of scaled copies is alive at once, and cancellation is
+        checked between chunks.
 
+        Returns True on success, False if cancelled (caller must emit finished).
+        """
+        painter = self._begin_export_painter(sprite_sheet)
+        chunk_size = Config.Export.SCALE_CHUNK_FRAMES
+        for start in range(0, len(placements), chunk_size):
+            if self._cancelled:
+                painter.end()
+                self._finish(False, "Export cancelled")
+                return False
+            chunk = placements[start : start + chunk_size]
+            with self._phase("scale"):
+                images = self._scaled_frames([self.task.frames[i] for i, _, _ in chunk])
+            with self._phase("compose"):
+                for (_, x, y), image in zip(chunk, images, strict=True):
+                    painter.drawImage(x, y, image)
         painter.end()
         return True
 
-    def _draw_frame(self, painter: QPainter, frame: QImage, x: int, y: int) -> None:
-        """Scale (if needed) and draw a single frame onto painter at (x, y)."""
-        if not math.isclose(self.task.scale_factor, 1.0):
-            painter.drawImage(x, y, self._scale_image(frame, self.task.scale_factor))
-        else:
-            painter.drawImage(x, y, frame)
+    def _scaled_frames(self, frames: Sequence[QImage]) -> list[QImage]:
+        """Return frames at the export scale factor.
+
+        Integer factors use pixel replication spread across
+        ``Config.Export.MAX_SCALE_WORKERS`` threads; other factors fall back
+        to ``_scale_image`` one frame at a time.
+        """
+        scale_factor = self.task.scale_factor
+        if math.isclose(scale_factor, 1.0):
+            return list(frames)
+        factor = integer_scale_factor(scale_factor)
+        if factor is not None:
+            return scale_images_nearest(frames, factor, max_workers=Config.Export.MAX_SCALE_WORKERS)
+        return [self._scale_image(frame, scale_factor) for frame in frames]
 
     def _scale_image(self, image: QImage, scale_factor: float) -> QImage:
-        """Scale an image by the given factor (thread-safe)."""
+        """Scale an image by the given factor (thread-safe).
+
+        Whole-number factors (the 2x/4x offered by the dialog) replicate
+        pixels exactly; fractional factors use smooth Qt scaling.
+        """
+        factor = integer_scale_factor(scale_factor)
+        if factor is not None:
+            return scale_image_nearest(image, factor)
         new_width = max(1, int(image.width() * scale_factor))
         new_height = max(1, int(image.height() * scale_factor))
         return image.scaled(
@@ -737,34 +936,119 @@ class _ExportWorker(QThread):
         )
 
 
+@dataclass
+class _ExportJob:
+    """Queue bookkeeping for one submitted export task."""
+
+    job_id: int
+    task: _ExportTask
+    total_steps: int
+    completed_steps: int = 0
+    worker: _ExportWorker | None = None
+    result: tuple[bool, str] | None = None
+    frames_written: int = 0
+    bytes_written: int = 0
+    report: ExportReport | None = None
+
+    @property
+    def label(self) -> str:
+        """Human-readable job name used in aggregate progress messages."""
+        return self.task.base_name
+
+
+def _expected_steps(task: _ExportTask) -> int:
+    """Number of progress steps a worker reports for task (matches the worker methods)."""
+    if task.mode in (ExportMode.INDIVIDUAL_FRAMES, ExportMode.SELECTED_FRAMES):
+        return len(task.frames)
+    return 3
+
+
 class FrameExporter(QObject):
     """
     Main frame exporter class.
-    Manages export operations and provides a clean API.
+
+    Export requests are queued as jobs and run on worker threads, at most
+    ``max_concurrent`` at a time. The ``export*`` signals describe the whole
+    queue (aggregate progress, one ``exportFinished`` once every queued job is
+    done); the ``job*`` signals report each job individually.
+
+    Workers time each phase of their export; the merged figures for a batch
+    are published through ``exportReport`` and kept in ``last_report``.
     """
 
-    # Signals
+    # Aggregate signals
     exportStarted = Signal()
-    exportProgress = Signal(int, int, str)  # current, total, message
-    exportFinished = Signal(bool, str)  # success, message
-    exportError = Signal(str)  # error message
-
-    def __init__(self):
+    exportProgress = Signal(int, int, str)  # current, total, message (summed over queued jobs)
+    exportThroughput = Signal(int, int)  # frames written, bytes written (summed over queued jobs)
+    exportReport = Signal(object)  # ExportReport for the batch, emitted just before exportFinished
+    exportFinished = Signal(bool, str)  # success, message (emitted when the queue drains)
+    exportError = Signal(str)  # error message (a request was rejected before it was queued)
+
+    # Per-job signals
+    jobStarted = Signal(int)  # job_id
+    jobProgress = Signal(int, int, int, str)  # job_id, current, total, message
+    jobFinished = Signal(int, bool, str)  # job_id, success, message
+
+    def __init__(self, max_concurrent: int | None = None):
         super().__init__()
-        self._worker: _ExportWorker | None = None
-        self._current_task: _ExportTask | None = None
+        self._max_concurrent = max(1, max_concurrent or Config.Export.MAX_CONCURRENT_JOBS)
+        self._next_job_id = 1
+        self._pending: deque[_ExportJob] = deque()
+        self._running: dict[int, _ExportJob] = {}
+        # Every job submitted since the queue was last idle; drives aggregate progress
+        self._batch: dict[int, _ExportJob] = {}
+        self._batch_started = 0.0
+        self._last_report: ExportReport | None = None
+
+    @property
+    def max_concurrent(self) -> int:
+        """Maximum number of export workers running at the same time."""
+        return self._max_concurrent
+
+    def set_max_concurrent(self, limit: int) -> None:
+        """Change the concurrency limit; extra queued jobs start immediately if allowed."""
+        self._max_concurrent = max(1, limit)
+        self._start_pending_jobs()
+
+    @property
+    def last_report(self) -> ExportReport | None:
+        """Timing report of the most recently completed batch, if any."""
+        return self._last_report
+
+    @property
+    def is_busy(self) -> bool:
+        """True while any job is queued or running."""
+        return bool(self._pending or self._running)
 
     def export_frames(
         self,
-        frames: Sequence[QPixmap],
+        frames: Sequence[QImage | QPixmap],
         config: ExportConfig,
         segment_info: list[dict[str, Any]] | None = None,
     ) -> bool:
         """
         Export frames using a fully-typed ExportConfig.
 
-        Note: If a previous export is still running, this method rejects the new export.
-        This prevents concurrent workers from writing into the same exporter state.
+        If other exports are still running, the request is queued behind them.
+
+        Args:
+            frames: List of frames to export
+            config: Typed export configuration (output dir, format, mode, etc.)
+            segment_info: Optional list of segment dicts for segments_sheet mode
+
+        Returns:
+            True if export was queued successfully
+        """
+        return self.submit_job(frames, config, segment_info) is not None
+
+    def submit_job(
+        self,
+        frames: Sequence[QImage | QPixmap],
+        config: ExportConfig,
+        segment_info: list[dict[str, Any]] | None = None,
+    ) -> int | None:
+        """
+        Queue a single export job.
 
         Args:
             frames: List of frames to export
@@ -772,9 +1056,9 @@ class FrameExporter(QObject):
             segment_info: Optional list of segment dicts for segments_sheet mode
 
         Returns:
-            True if export started successfully
+            The job id, or None if the request was invalid (exportError is emitted)
         """
-        logger.debug("FrameExporter.export_frames called")
+        logger.debug("FrameExporter.submit_job called")
         logger.debug(
             "Mode: %s, Format: %s, Frame count: %d", config.mode, config.format, len(frames)
         )
@@ -782,23 +1066,43 @@ class FrameExporter(QObject):
         if segment_info:
             logger.debug("Segment count: %d", len(segment_info))
 
-        # Reject export if previous worker is still running
-        if self._worker is not None and self._worker.isRunning():
-            logger.debug("Export rejected: already in progress")
-            self.exportError.emit("An export is already in progress")
-            return False
-
         task = self._prepare_export(frames, config, segment_info)
         if task is None:
-            return False
+            return None
 
-        self._current_task = task
-        self._start_worker(task)
-        return True
+        job = _ExportJob(job_id=self._next_job_id, task=task, total_steps=_expected_steps(task))
+        self._next_job_id += 1
+
+        if not self._batch:
+            self._batch_started = time.perf_counter()
+            self.exportStarted.emit()
+        self._batch[job.job_id] = job
+        self._pending.append(job)
+        self._start_pending_jobs()
+        return job.job_id
+
+    def submit_batch(
+        self, jobs: Sequence[tuple[Sequence[QImage | QPixmap], ExportConfig]]
+    ) -> list[int]:
+        """
+        Queue several export jobs in one call.
+
+        Args:
+            jobs: (frames, config) pairs, queued in order
+
+        Returns:
+            Ids of the jobs that were queued (invalid requests are skipped)
+        """
+        job_ids: list[int] = []
+        for frames, config in jobs:
+            job_id = self.submit_job(frames, config)
+            if job_id is not None:
+                job_ids.append(job_id)
+        return job_ids
 
     def _prepare_export(
         self,
-        frames: Sequence[QPixmap],
+        frames: Sequence[QImage | QPixmap],
         config: ExportConfig,
         segment_info: list[dict[str, Any]] | None,
     ) -> _ExportTask | None:
@@ -823,8 +1127,9 @@ class FrameExporter(QObject):
         # Sanitize base_name to remove characters illegal in file paths
         safe_base_name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", config.base_name)
 
-        # Convert QPixmap frames to QImage for thread-safe processing
-        # QPixmap is NOT thread-safe; QImage IS thread-safe for worker threads
+        # Worker threads need QImage (QPixmap is NOT thread-safe). Model frames
+        # are already QImage and are shared as-is; only legacy QPixmap input
+        # is converted here.
         image_frames = self._convert_frames_to_images(frames)
         if image_frames is None:
             return None
@@ -840,54 +1145,164 @@ class FrameExporter(QObject):
                 pattern=pattern,
                 sprite_sheet_layout=config.sprite_sheet_layout,
                 segment_info=segment_info,
+                deduplicate=config.deduplicate,
+                frame_aliases=config.frame_aliases,
             )
         except ValueError as e:
             self.exportError.emit(str(e))
             return None
 
-    def _convert_frames_to_images(self, frames: Sequence[QPixmap]) -> list[QImage] | None:
-        """Convert QPixmap frames to thread-safe QImage list.
+    def _convert_frames_to_images(self, frames: Sequence[QImage | QPixmap]) -> list[QImage] | None:
+        """Return frames as a thread-safe QImage list.
 
-        Returns None (and emits exportError) if any frame fails to convert.
+        QImage frames are reused without copying (implicit sharing); QPixmap
+        frames are converted on the calling (GUI) thread.
+
+        Returns None (and emits exportError) if any frame is null or fails to convert.
         """
         image_frames: list[QImage] = []
         for i, frame in enumerate(frames):
-            image = frame.toImage()
+            image = as_image(frame)
             if image.isNull():
                 self.exportError.emit(f"Failed to convert frame {i} to image")
                 return None
             image_frames.append(image)
         return image_frames
 
-    def _start_worker(self, task: _ExportTask) -> None:
-        """Create, connect, and start the export worker thread."""
-        self._worker = _ExportWorker(task, parent=self)
-        self._worker.progress.connect(self._on_progress)
-        self._worker.taskFinished.connect(self._on_finished)
-        self._worker.error.connect(self._on_error)
-        self.exportStarted.emit()
-        self._worker.start()
+    def _start_pending_jobs(self) -> None:
+        """Start queued jobs until the concurrency limit is reached."""
+        while self._pending and len(self._running) < self._max_concurrent:
+            job = self._pending.popleft()
+            self._running[job.job_id] = job
+            self._start_worker(job)
+
+    def _start_worker(self, job: _ExportJob) -> None:
+        """Create, connect, and start the worker thread for job."""
+        worker = _ExportWorker(job.task, parent=self)
+        job.worker = worker
+        worker.progress.connect(partial(self._on_job_progress, job.job_id))
+        worker.throughput.connect(partial(self._on_job_throughput, job.job_id))
+        worker.taskFinished.connect(partial(self._on_job_finished, job.job_id))
+        worker.error.connect(partial(self._on_job_error, job.job_id))
+        self.jobStarted.emit(job.job_id)
+        worker.start()
+
+    def cancel_job(self, job_id: int) -> bool:
+        """
+        Cancel a single queued or running job.
+
+        Queued jobs are dropped immediately; running jobs stop cooperatively and
+        report through ``jobFinished`` once the worker notices the request.
+
+        Returns:
+            True if the job was found and cancellation was requested
+        """
+        running = self._running.get(job_id)
+        if running is not None:
+            if running.worker is not None:
+                running.worker.cancel()
+            return True
+
+        for job in self._pending:
+            if job.job_id == job_id:
+                self._pending.remove(job)
+                self._complete_job(job, False, "Export cancelled")
+                return True
+        return False
 
     def cancel_export(self):
-        """Cancel the current export operation."""
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-
-    def _on_progress(self, current: int, total: int, message: str):
-        """Handle progress updates from worker."""
-        self.exportProgress.emit(current, total, message)
-
-    def _on_finished(self, success: bool, message: str):
-        """Handle export completion."""
-        if self._worker is not None:
-            self._worker.wait(5000)  # Ensure thread has fully stopped before releasing reference
-        self._worker = None
-        self._current_task = None
-        self.exportFinished.emit(success, message)
-
-    def _on_error(self, error_message: str):
-        """Handle export errors."""
-        self.exportError.emit(error_message)
+        """Cancel every queued and running export job."""
+        while self._pending:
+            self._complete_job(self._pending.popleft(), False, "Export cancelled")
+        for job in list(self._running.values()):
+            if job.worker is not None and job.worker.isRunning():
+                job.worker.cancel()
+
+    def _on_job_progress(self, job_id: int, current: int, total: int, message: str):
+        """Record per-job progress and re-emit it as aggregate queue progress."""
+        job = self._batch.get(job_id)
+        if job is None:
+            return
+        job.completed_steps = current
+        job.total_steps = total
+        self.jobProgress.emit(job_id, current, total, message)
+        self._emit_batch_progress(job, message)
+
+    def _on_job_throughput(self, job_id: int, frames_written: int, bytes_written: int):
+        """Record per-job output totals and re-emit them summed over the queue."""
+        job = self._batch.get(job_id)
+        if job is None:
+            return
+        job.frames_written = frames_written
+        job.bytes_written = bytes_written
+        self.exportThroughput.emit(
+            sum(j.frames_written for j in self._batch.values()),
+            sum(j.bytes_written for j in self._batch.values()),
+        )
+
+    def _on_job_finished(self, job_id: int, success: bool, message: str):
+        """Handle completion of a running job and start the next queued one."""
+        job = self._running.pop(job_id, None)
+        if job is None:
+            return
+        if job.worker is not None:
+            job.report = job.worker.report
+            job.worker.wait(5000)  # Ensure thread has fully stopped before releasing reference
+            job.worker = None
+        self._complete_job(job, success, message)
+        self._start_pending_jobs()
+
+    def _complete_job(self, job: _ExportJob, success: bool, message: str) -> None:
+        """Record a job result and emit exportFinished once the queue is idle."""
+        job.result = (success, message)
+        job.completed_steps = job.total_steps
+        self.jobFinished.emit(job.job_id, success, message)
+
+        if self.is_busy:
+            return
+
+        results = [j.result for j in self._batch.values() if j.result is not None]
+        labels = [j.label for j in self._batch.values()]
+        reports = [
+            j.report or ExportReport(label=j.label, message=j.result[1] if j.result else "")
+            for j in self._batch.values()
+        ]
+        self._batch = {}
+
+        elapsed = time.perf_counter() - self._batch_started
+        report = reports[0] if len(reports) == 1 else ExportReport.combine(reports, elapsed)
+        self._last_report = report
+        logger.debug("Export batch finished: %s", report.summary())
+        self.exportReport.emit(report)
+
+        if len(results) == 1:
+            self.exportFinished.emit(*results[0])
+            return
+
+        succeeded = sum(1 for ok, _ in results if ok)
+        details = "\n".join(
+            f"{label}: {msg}" for label, (_, msg) in zip(labels, results, strict=True)
+        )
+        self.exportFinished.emit(
+            succeeded == len(results),
+            f"{succeeded} of {len(results)} export jobs succeeded\n{details}",
+        )
+
+    def _on_job_error(self, job_id: int, error_message: str):
+        """Surface a job's error as batch progress; the job still reports through jobFinished."""
+        job = self._batch.get(job_id)
+        if job is None:
+            return
+        logger.warning("Export job %s: %s", job.label, error_message)
+        self._emit_batch_progress(job, f"Error: {error_message}")
+
+    def _emit_batch_progress(self, job: _ExportJob, message: str) -> None:
+        """Emit exportProgress summed over the batch, tagging message with job's label."""
+        if len(self._batch) > 1:
+            message = f"[{job.label}] {message}"
+        aggregate_current = sum(j.completed_steps for j in self._batch.values())
+        aggregate_total = sum(j.total_steps for j in self._batch.values())
+        self.exportProgress.emit(aggregate_current, aggregate_total, message)
 
 
 # Singleton instance
@@ -97,6 +97,11 @@ _UI_MODE_SPECS: dict[ExportMode, _ExportModeUiSpec] = {
         panel_factory=_sheet_panel,
         data_extractor=_sheet_data,
     ),
+    ExportMode.SEGMENT_SHEETS: _ExportModeUiSpec(
+        mode=ExportMode.SEGMENT_SHEETS,
+        panel_factory=_sheet_panel,
+        data_extractor=_sheet_data,
+    ),
 }
 
 
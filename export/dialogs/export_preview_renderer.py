@@ -1,14 +1,21 @@
-"""Preview pixmap rendering for export settings."""
+"""Preview image rendering for export settings.
+
+Rendering works on ``QImage`` only, so it is safe to run on
+``_PreviewRenderWorker`` threads; ``_ExportPreviewResult.pixmap`` converts
+back to a ``QPixmap`` on the GUI thread.
+"""
 
 from __future__ import annotations
 
 import logging
 import math
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
+from PySide6.QtCore import QObject, Qt, QThread, Signal
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPixmap
 
 from export.core.frame_exporter import (
     BackgroundMode,
@@ -16,11 +23,14 @@ from export.core.frame_exporter import (
     LayoutMode,
     SpriteSheetLayout,
 )
+from sprite_model.sprite_extraction import as_image
+from utils.sprite_rendering import fit_scaled_image
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from managers.animation_segment_manager import AnimationSegment
+    from sprite_model.frame_metadata import FrameMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +42,7 @@ class _ExportPreviewRequest:
     """Explicit input state needed to render an export preview."""
 
     mode: ExportMode
-    sprites: Sequence[QPixmap]
+    sprites: Sequence[QImage | QPixmap]  # QImage-only when rendered off the GUI thread
     layout_mode: LayoutMode = LayoutMode.AUTO
     columns: int = 8
     rows: int = 8
@@ -42,28 +52,96 @@ class _ExportPreviewRequest:
     selected_indices: Sequence[int] = ()
     segments: Sequence[AnimationSegment] = ()
     segments_available: bool = True
+    scale_factor: int = 1  # export scale; previews replicate pixels like the exporter
+    frame_metadata: FrameMetadata | None = None  # per-sprite sizes, read instead of the images
 
 
 @dataclass(frozen=True)
 class _ExportPreviewResult:
-    """Rendered preview pixmap and optional display metadata."""
+    """Rendered preview image and optional display metadata."""
 
-    pixmap: QPixmap
+    image: QImage
     info_text: str | None = None
 
+    @property
+    def pixmap(self) -> QPixmap:
+        """Preview as a QPixmap (GUI thread only)."""
+        return QPixmap.fromImage(self.image)
+
+
+def _new_image(width: int, height: int) -> QImage:
+    """Create a blank ARGB preview canvas."""
+    return QImage(max(1, width), max(1, height), QImage.Format.Format_ARGB32_Premultiplied)
+
+
+class _ScaledSpriteCache:
+    """Bounded LRU of scaled preview sprites keyed by (source image, target size).
+
+    Keys use ``QImage.cacheKey()`` so an edited or replaced frame never hits a
+    stale entry. Access is locked because the GUI thread and the render worker
+    may share one renderer.
+    """
+
+    MAX_ENTRIES = 2048
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[int, int, int], QImage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: QImage, width: int, height: int) -> QImage:
+        """Return source scaled to fit (width, height), reusing earlier results.
+
+        Upscales use integer pixel replication (see ``fit_scaled_image``).
+        """
+        key = (source.cacheKey(), width, height)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        scaled = fit_scaled_image(source, width, height)
+        with self._lock:
+            self._entries[key] = scaled
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        return scaled
+
+    def clear(self) -> None:
+        """Drop every cached sprite."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
 
 class _ExportPreviewRenderer:
-    """Render export preview pixmaps from explicit request data."""
+    """Render export preview images from explicit request data."""
 
     _MAX_SEGMENT_PREVIEW_WIDTH = 800
     _MAX_SEGMENT_PREVIEW_HEIGHT = 600
+    _MAX_SHEET_PREVIEW_PIXELS = 4096 * 4096
+
+    def __init__(self) -> None:
+        self._scaled_cache = _ScaledSpriteCache()
+
+    @property
+    def scaled_cache(self) -> _ScaledSpriteCache:
+        """Cache of scaled sprites reused across renders."""
+        return self._scaled_cache
 
     def render(self, request: _ExportPreviewRequest) -> _ExportPreviewResult:
         """Render a preview for the requested export mode."""
         if not request.sprites:
-            return _ExportPreviewResult(QPixmap())
+            return _ExportPreviewResult(QImage())
 
-        if request.mode in (ExportMode.SPRITE_SHEET, ExportMode.SEGMENTS_SHEET):
+        if request.mode in (
+            ExportMode.SPRITE_SHEET,
+            ExportMode.SEGMENTS_SHEET,
+            ExportMode.SEGMENT_SHEETS,
+        ):
             return self._render_sheet_preview(request)
 
         return self._render_frames_preview(request)
@@ -85,11 +163,21 @@ class _ExportPreviewRenderer:
         spacing = request.spacing
         fw, fh = self._frame_dimensions(request)
         sheet_w, sheet_h = self._sheet_dimensions(cols, rows, fw, fh, spacing)
+        info = f"Sprite Sheet: {cols}x{rows} grid, {sheet_w}x{sheet_h}px"
 
-        pixmap = QPixmap(sheet_w, sheet_h)
-        self._fill_background(pixmap, request)
+        # Very large scaled sheets are previewed at 1x; the info text still
+        # reports the exported size.
+        scaled = request.scale_factor > 1
+        if scaled and sheet_w * sheet_h > self._MAX_SHEET_PREVIEW_PIXELS:
+            scaled = False
+            fw, fh = self._frame_dimensions(request, scaled=False)
+            sheet_w, sheet_h = self._sheet_dimensions(cols, rows, fw, fh, spacing)
+            info += " (preview at 1x)"
 
-        painter = QPainter(pixmap)
+        image = _new_image(sheet_w, sheet_h)
+        self._fill_background(image, request)
+
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         for i, sprite in enumerate(request.sprites):
             if i >= cols * rows:
@@ -98,22 +186,22 @@ class _ExportPreviewRenderer:
             col = i % cols
             x = col * (fw + spacing)
             y = row * (fh + spacing)
-            painter.drawPixmap(x, y, sprite)
+            source = as_image(sprite)
+            if scaled:
+                source = self._scaled_cache.get(source, fw, fh)
+            painter.drawImage(x, y, source)
         painter.end()
 
-        return _ExportPreviewResult(
-            pixmap,
-            f"Sprite Sheet: {cols}x{rows} grid, {sheet_w}x{sheet_h}px",
-        )
+        return _ExportPreviewResult(image, info)
 
     def _render_segments_preview(self, request: _ExportPreviewRequest) -> _ExportPreviewResult:
         if not request.segments:
             if not request.segments_available:
-                return self._placeholder_pixmap(
+                return self._placeholder_image(
                     "No animation segments available",
                     "Segments Per Row: No segments defined",
                 )
-            return self._placeholder_pixmap(
+            return self._placeholder_image(
                 "No animation segments defined",
                 "Segments Per Row: No segments",
             )
@@ -157,10 +245,10 @@ class _ExportPreviewRenderer:
                 spacing,
             )
 
-        pixmap = QPixmap(sheet_w, sheet_h)
-        self._fill_background(pixmap, request)
+        image = _new_image(sheet_w, sheet_h)
+        self._fill_background(image, request)
 
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         for row_idx, segment in enumerate(request.segments):
             for frame_idx in range(segment.start_frame, segment.end_frame + 1):
@@ -169,38 +257,33 @@ class _ExportPreviewRenderer:
                     x = col_idx * (fw + spacing)
                     y = row_idx * (fh + spacing)
 
-                    if scale < 1.0:
-                        scaled_sprite = request.sprites[frame_idx].scaled(
-                            fw,
-                            fh,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation,
-                        )
-                        painter.drawPixmap(x, y, scaled_sprite)
-                    else:
-                        painter.drawPixmap(x, y, request.sprites[frame_idx])
+                    sprite = as_image(request.sprites[frame_idx])
+                    if (fw, fh) != self._sprite_size(request, frame_idx):
+                        sprite = self._scaled_cache.get(sprite, fw, fh)
+                    painter.drawImage(x, y, sprite)
         painter.end()
 
         info = f"Segments Per Row: {rows} segments"
         if scale < 1.0:
             info += f" (preview scaled {int(scale * 100)}%)"
 
-        return _ExportPreviewResult(pixmap, info)
+        return _ExportPreviewResult(image, info)
 
     def _render_frames_preview(self, request: _ExportPreviewRequest) -> _ExportPreviewResult:
         display_count = min(len(request.sprites), 6)
         cols = min(3, display_count)
         rows = math.ceil(display_count / cols)
-        fw = min(request.sprites[0].width(), 100)
-        fh = min(request.sprites[0].height(), 100)
+        fw, fh = self._frame_dimensions(request)
+        fw = min(fw, 100)
+        fh = min(fh, 100)
         spacing = 10
         width = cols * fw + (cols - 1) * spacing
         height = rows * fh + (rows - 1) * spacing
 
-        pixmap = QPixmap(width, height)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        image = _new_image(width, height)
+        image.fill(Qt.GlobalColor.transparent)
 
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         if request.mode is ExportMode.SELECTED_FRAMES:
@@ -216,13 +299,8 @@ class _ExportPreviewRenderer:
                 x = col * (fw + spacing)
                 y = row * (fh + spacing)
 
-                scaled = request.sprites[frame_idx].scaled(
-                    fw,
-                    fh,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                painter.drawPixmap(x, y, scaled)
+                scaled = self._scaled_cache.get(as_image(request.sprites[frame_idx]), fw, fh)
+                painter.drawImage(x, y, scaled)
         painter.end()
 
         if request.mode is ExportMode.SELECTED_FRAMES:
@@ -233,34 +311,47 @@ class _ExportPreviewRenderer:
         if len(selected_indices) > display_count:
             info += f" (showing {display_count})"
 
-        return _ExportPreviewResult(pixmap, info)
+        return _ExportPreviewResult(image, info)
 
-    def _fill_background(self, pixmap: QPixmap, request: _ExportPreviewRequest) -> None:
-        """Fill pixmap background from explicit preview request settings."""
+    def _fill_background(self, image: QImage, request: _ExportPreviewRequest) -> None:
+        """Fill image background from explicit preview request settings."""
         if request.background_mode is BackgroundMode.SOLID and request.background_color is not None:
-            pixmap.fill(QColor(*request.background_color))
+            image.fill(QColor(*request.background_color))
         else:
-            pixmap.fill(Qt.GlobalColor.transparent)
+            image.fill(Qt.GlobalColor.transparent)
 
-    def _placeholder_pixmap(self, text: str, info: str) -> _ExportPreviewResult:
-        """Create a placeholder preview pixmap."""
-        pixmap = QPixmap(400, 200)
-        pixmap.fill(Qt.GlobalColor.white)
+    def _placeholder_image(self, text: str, info: str) -> _ExportPreviewResult:
+        """Create a placeholder preview image."""
+        image = _new_image(400, 200)
+        image.fill(Qt.GlobalColor.white)
 
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setFont(QFont("Segoe UI", 12))
         painter.setPen(QColor(108, 117, 125))
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, text)
         painter.end()
 
-        return _ExportPreviewResult(pixmap, info)
+        return _ExportPreviewResult(image, info)
 
-    def _frame_dimensions(self, request: _ExportPreviewRequest) -> tuple[int, int]:
-        """Return frame dimensions using the first sprite as the preview source."""
+    def _frame_dimensions(
+        self, request: _ExportPreviewRequest, scaled: bool = True
+    ) -> tuple[int, int]:
+        """Return exported frame dimensions using the first sprite as the preview source."""
+        scale = max(1, request.scale_factor) if scaled else 1
         if request.sprites:
-            return request.sprites[0].width(), request.sprites[0].height()
-        return 32, 32
+            width, height = self._sprite_size(request, 0)
+            return width * scale, height * scale
+        return 32 * scale, 32 * scale
+
+    @staticmethod
+    def _sprite_size(request: _ExportPreviewRequest, index: int) -> tuple[int, int]:
+        """Return sprite index's size, from the metadata table when one is attached."""
+        metadata = request.frame_metadata
+        if metadata is not None and len(metadata) == len(request.sprites):
+            return metadata.size(index)
+        sprite = request.sprites[index]
+        return sprite.width(), sprite.height()
 
     def _sheet_dimensions(
         self,
@@ -294,3 +385,30 @@ class _ExportPreviewRenderer:
             cols = math.ceil(math.sqrt(sprite_count))
             rows = math.ceil(sprite_count / cols)
         return cols, rows
+
+
+class _PreviewRenderWorker(QThread):
+    """Worker thread that renders one preview request off the GUI thread."""
+
+    rendered = Signal(int, object)  # generation, _ExportPreviewResult
+
+    def __init__(
+        self,
+        renderer: _ExportPreviewRenderer,
+        generation: int,
+        request: _ExportPreviewRequest,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent=parent)
+        self._renderer = renderer
+        self.generation = generation
+        self._request = request
+
+    def run(self):
+        """Render the request and emit the tagged result."""
+        try:
+            result = self._renderer.render(self._request)
+        except Exception:
+            logger.exception("Export preview render failed")
+            return
+        self.rendered.emit(self.generation, result)
@@ -85,6 +85,9 @@ class _ExportSettingsDataCollector:
         else:
             data["pattern"] = _NAMING_PATTERNS[0]
 
+        deduplicate = self._parent._settings_widgets.get("deduplicate")
+        data["deduplicate"] = deduplicate is not None and deduplicate.isChecked()
+
         return data
 
     def selected_frames_data(self) -> dict[str, Any]:
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import Signal
-from PySide6.QtGui import QPixmap, QShowEvent
+from PySide6.QtGui import QImage, QPixmap, QShowEvent
 from PySide6.QtWidgets import QDialog, QMessageBox, QVBoxLayout, QWidget
 
 if TYPE_CHECKING:
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
     from managers.animation_segment_manager import AnimationSegmentManager
     from managers.settings_manager import SettingsManager
+    from sprite_model.frame_metadata import FrameMetadata
 
 from config import Config
 
@@ -36,6 +37,9 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["ExportDialog"]
 
+# Modes whose output is one or more sprite sheets rather than loose frame files
+_SHEET_MODES = (ExportMode.SPRITE_SHEET, ExportMode.SEGMENTS_SHEET, ExportMode.SEGMENT_SHEETS)
+
 
 class ExportDialog(QDialog):
     """
@@ -51,17 +55,19 @@ class ExportDialog(QDialog):
         parent: QWidget | None = None,
         frame_count: int = 0,
         current_frame: int = 0,
-        sprites: "Sequence[QPixmap] | None" = None,
+        sprites: "Sequence[QImage | QPixmap] | None" = None,
         segment_manager: "AnimationSegmentManager | None" = None,
         settings_manager: "SettingsManager | None" = None,
+        frame_metadata: "FrameMetadata | None" = None,
     ):
         super().__init__(parent)
 
         self.frame_count = frame_count
         self.current_frame = current_frame
-        self.sprites: list[QPixmap] = list(sprites) if sprites else []
+        self.sprites: list[QImage | QPixmap] = list(sprites) if sprites else []
         self.segment_manager = segment_manager  # Store for compatibility
         self._settings_manager = settings_manager
+        self._frame_metadata = frame_metadata
 
         # Dialog settings
         self.setWindowTitle("Export Sprites")
@@ -105,6 +111,7 @@ class ExportDialog(QDialog):
             segment_manager=self.segment_manager,
             parent=self.wizard,
             settings_manager=self._settings_manager,
+            frame_metadata=self._frame_metadata,
         )
         self.wizard.add_step(self.settings_preview_step)
 
@@ -156,7 +163,7 @@ class ExportDialog(QDialog):
 
         # Build sprite_sheet_layout for sheet modes
         sprite_sheet_layout = None
-        if preset.mode in (ExportMode.SPRITE_SHEET, ExportMode.SEGMENTS_SHEET):
+        if preset.mode in _SHEET_MODES:
             if preset.mode is ExportMode.SEGMENTS_SHEET:
                 sprite_sheet_layout = preset.sprite_sheet_layout
             else:
@@ -181,7 +188,7 @@ class ExportDialog(QDialog):
                 )
 
         # Determine base_name
-        if preset.mode in (ExportMode.SPRITE_SHEET, ExportMode.SEGMENTS_SHEET):
+        if preset.mode in _SHEET_MODES:
             base_name = settings.get("single_filename", "spritesheet")
         else:
             base_name = settings.get("base_name", "frame")
@@ -200,6 +207,7 @@ class ExportDialog(QDialog):
             pattern=settings.get("pattern", Config.Export.DEFAULT_PATTERN),
             sprite_sheet_layout=sprite_sheet_layout,
             selected_indices=selected_indices,
+            deduplicate=bool(settings.get("deduplicate", False)),
         )
 
     def _center_on_screen(self):
@@ -11,12 +11,14 @@ from typing import TYPE_CHECKING, Any, cast
 if TYPE_CHECKING:
     from managers.animation_segment_manager import AnimationSegmentManager
     from managers.settings_manager import SettingsManager
+    from sprite_model.frame_metadata import FrameMetadata
 
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPixmap, QWheelEvent
+from PySide6.QtGui import QBrush, QColor, QFont, QImage, QPainter, QPixmap, QWheelEvent
 from PySide6.QtWidgets import (
     QAbstractButton,
     QButtonGroup,
+    QCheckBox,
     QComboBox,
     QFrame,
     QGraphicsScene,
@@ -41,13 +43,19 @@ from PySide6.QtWidgets import (
 )
 
 from config import Config
+from sprite_model.sprite_extraction import as_image
 from utils.styles import StyleManager
 
 from ..core.export_presets import ExportPreset
 from ..core.frame_exporter import BackgroundMode, ExportFormat, ExportMode, LayoutMode
 from ..dialogs.base.wizard_base import _WizardStep, _WizardWidget
 from .export_mode_ui_registry import _get_ui_mode_spec
-from .export_preview_renderer import _ExportPreviewRenderer, _ExportPreviewRequest
+from .export_preview_renderer import (
+    _ExportPreviewRenderer,
+    _ExportPreviewRequest,
+    _ExportPreviewResult,
+    _PreviewRenderWorker,
+)
 from .export_settings_data import (
     _LAYOUT_MODES,
     _NAMING_PATTERNS,
@@ -372,10 +380,20 @@ class _IndividualSettingsPanel(_SettingsPanelBase):
 
         pattern_group.buttonClicked.connect(self._parent._on_setting_changed)
 
+        # Duplicate frames
+        deduplicate = QCheckBox("Alias duplicate frames")
+        deduplicate.setToolTip(
+            "Write frames identical to an earlier frame once, listing the repeats "
+            "in an aliases JSON file instead of encoding them again"
+        )
+        deduplicate.toggled.connect(self._parent._on_setting_changed)
+        layout.addWidget(deduplicate)
+
         layout.addStretch()
 
         self._parent._settings_widgets["base_name"] = self._parent.base_name
         self._parent._settings_widgets["pattern_group"] = pattern_group
+        self._parent._settings_widgets["deduplicate"] = deduplicate
 
         return widget
 
@@ -495,7 +513,7 @@ class _SettingsValidator:
         preset = parent._current_preset
         if preset is None:
             return True
-        if preset.mode is ExportMode.SPRITE_SHEET:
+        if preset.mode in (ExportMode.SPRITE_SHEET, ExportMode.SEGMENT_SHEETS):
             return self._has_text("sheet_filename")
         if preset.mode is ExportMode.INDIVIDUAL_FRAMES:
             return self._has_text("base_name")
@@ -513,9 +531,11 @@ class _SettingsValidator:
 class _PreviewOrchestrator:
     """Owns preview request wiring and the debounce timer for ModernExportSettings.
 
-    ``schedule_update`` (re)starts the debounce; ``update_now`` runs the
-    renderer immediately and pushes the resulting pixmap into the preview
-    widget.
+    ``schedule_update`` (re)starts the debounce; when it fires the request is
+    rendered on a ``_PreviewRenderWorker`` thread. At most one render runs at a
+    time: requests made meanwhile collapse into a single pending one, and any
+    result whose generation is no longer current is discarded. ``update_now``
+    renders synchronously.
     """
 
     DEBOUNCE_MS = 100
@@ -528,7 +548,15 @@ class _PreviewOrchestrator:
         # if Python GC delays orchestrator collection.
         self._timer = QTimer(parent)
         self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self.update_now)
+        self._timer.timeout.connect(self.request_render)
+
+        self._generation = 0
+        self._worker: _PreviewRenderWorker | None = None
+        self._pending: tuple[int, _ExportPreviewRequest] | None = None
+        self._source_images: tuple[QImage, ...] = ()
+        self._source_key: tuple[int, ...] = ()
+        self._closed = False
+        parent.destroyed.connect(self.shutdown)
 
     @property
     def renderer(self) -> _ExportPreviewRenderer:
@@ -540,6 +568,11 @@ class _PreviewOrchestrator:
         """Public handle on the debounce timer (used by tests / shim)."""
         return self._timer
 
+    @property
+    def is_rendering(self) -> bool:
+        """True while a background render is running or queued."""
+        return self._worker is not None or self._pending is not None
+
     def schedule_update(self) -> None:
         """Restart the debounce timer; the actual update runs ``DEBOUNCE_MS`` later."""
         self._timer.stop()
@@ -547,16 +580,77 @@ class _PreviewOrchestrator:
 
     def update_now(self) -> None:
         """Generate and display the preview synchronously."""
-        parent = self._parent
-        if not parent._current_preset or not parent._sprites:
-            parent.preview_view.update_preview(QPixmap())
+        self._generation += 1  # Anything still rendering in the background is now stale
+        if not self._has_content():
+            self._parent.preview_view.update_preview(QPixmap())
+            return
+        self._apply_result(self._renderer.render(self._build_request()))
+
+    def request_render(self) -> None:
+        """Render the current settings on the worker thread."""
+        if self._closed:
             return
+        self._generation += 1
+        if not self._has_content():
+            self._pending = None
+            self._parent.preview_view.update_preview(QPixmap())
+            return
+        self._pending = (self._generation, self._build_request())
+        self._start_next_render()
+
+    def shutdown(self) -> None:
+        """Discard pending work and wait for an in-flight render to finish."""
+        self._closed = True
+        self._generation += 1
+        self._pending = None
+        if self._worker is not None:
+            self._worker.wait()
+            self._worker = None
+
+    def _has_content(self) -> bool:
+        parent = self._parent
+        return parent._current_preset is not None and bool(parent._sprites)
 
-        result = self._renderer.render(self._build_request())
+    def _start_next_render(self) -> None:
+        if self._worker is not None or self._pending is None:
+            return
+        generation, request = self._pending
+        self._pending = None
+        worker = _PreviewRenderWorker(self._renderer, generation, request)
+        worker.rendered.connect(self._on_rendered)
+        worker.finished.connect(self._on_worker_finished)
+        self._worker = worker
+        worker.start()
+
+    def _on_rendered(self, generation: int, result: _ExportPreviewResult) -> None:
+        if self._closed or generation != self._generation:
+            return  # Settings changed while rendering; a newer request supersedes this one
+        self._apply_result(result)
+
+    def _on_worker_finished(self) -> None:
+        worker = self._worker
+        self._worker = None
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        if not self._closed:
+            self._start_next_render()
+
+    def _apply_result(self, result: _ExportPreviewResult) -> None:
+        parent = self._parent
         if result.info_text:
             parent._update_preview_info(result.info_text)
         parent.preview_view.update_preview(result.pixmap)
 
+    def _sprite_images(self) -> tuple[QImage, ...]:
+        """Thread-safe QImage copies of the dialog sprites, converted once per sprite set."""
+        sprites = self._parent._sprites
+        key = tuple(sprite.cacheKey() for sprite in sprites)
+        if key != self._source_key:
+            self._source_images = tuple(as_image(sprite) for sprite in sprites)
+            self._source_key = key
+        return self._source_images
+
     def _build_request(self) -> _ExportPreviewRequest:
         """Snapshot the current widget state for the preview renderer."""
         parent = self._parent
@@ -586,10 +680,12 @@ class _PreviewOrchestrator:
         cols_widget = parent._settings_widgets.get("cols_spin")
         rows_widget = parent._settings_widgets.get("rows_spin")
         spacing_widget = parent._settings_widgets.get("spacing")
+        scale_group = parent._settings_widgets.get("scale_group")
+        scale_factor = scale_group.checkedId() if scale_group is not None else 1
 
         return _ExportPreviewRequest(
             mode=parent._current_preset.mode,
-            sprites=tuple(parent._sprites),
+            sprites=self._sprite_images(),
             layout_mode=parent._data_collector.layout_mode(),
             columns=cols_widget.value() if cols_widget is not None else 8,
             rows=rows_widget.value() if rows_widget is not None else 8,
@@ -599,6 +695,8 @@ class _PreviewOrchestrator:
             selected_indices=tuple(selected_indices),
             segments=tuple(segments),
             segments_available=parent._segment_manager is not None,
+            scale_factor=max(1, scale_factor),
+            frame_metadata=parent._frame_metadata,
         )
 
 
@@ -611,15 +709,22 @@ class _ModernExportSettings(_WizardStep):
         self,
         frame_count: int = 0,
         current_frame: int = 0,
-        sprites: list[QPixmap] | None = None,
+        sprites: list[QImage | QPixmap] | None = None,
         segment_manager: "AnimationSegmentManager | None" = None,
         parent: QWidget | None = None,
         settings_manager: "SettingsManager | None" = None,
+        frame_metadata: "FrameMetadata | None" = None,
     ):
         super().__init__(title="Export Settings", subtitle="Configure your export", parent=parent)
         self.frame_count = frame_count
         self.current_frame = current_frame
         self._sprites = sprites or []
+        # Per-sprite metadata (SpriteModel.frame_metadata); None falls back to the pixels
+        self._frame_metadata = (
+            frame_metadata
+            if frame_metadata is not None and len(frame_metadata) == len(self._sprites)
+            else None
+        )
         self._segment_manager = segment_manager
         # Constructor-injected settings manager (singleton fallback for tests
         # that build the wizard standalone without going through SpriteViewer).
@@ -969,10 +1074,16 @@ class _ModernExportSettings(_WizardStep):
             export_format = ExportFormat.from_string(format)
         except ValueError:
             export_format = None
-        show_warning = export_format is ExportFormat.JPG and any(
+        show_warning = export_format is ExportFormat.JPG and self._sprites_have_alpha()
+        self._transparency_warning.setVisible(show_warning)
+
+    def _sprites_have_alpha(self) -> bool:
+        """True if any sprite has translucent pixels (read from metadata when available)."""
+        if self._frame_metadata is not None:
+            return self._frame_metadata.any_alpha
+        return any(
             sprite and not sprite.isNull() and sprite.hasAlphaChannel() for sprite in self._sprites
         )
-        self._transparency_warning.setVisible(show_warning)
 
     def _on_scale_changed(self, button: QAbstractButton):
         """Handle scale change."""
@@ -1,8 +1,10 @@
 """
 Export Progress Dialog.
-Simple progress dialog for export operations.
+Simple progress dialog for export operations, with live throughput figures.
 """
 
+import time
+
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QDialog, QLabel, QProgressBar, QPushButton, QVBoxLayout, QWidget
 
@@ -19,10 +21,13 @@ class _ExportProgressDialog(QDialog):
 
         self.total_frames = total_frames
         self.current_frame = 0
+        self.frames_written = 0
+        self.bytes_written = 0
+        self._started = time.perf_counter()
 
         self.setWindowTitle("Exporting...")
         self.setModal(True)
-        self.setFixedSize(400, 150)
+        self.setFixedSize(400, 175)
 
         # Setup UI
         layout = QVBoxLayout(self)
@@ -47,6 +52,10 @@ class _ExportProgressDialog(QDialog):
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
 
+        # Throughput label (frames/s, MB/s, ETA)
+        self.stats_label = QLabel("")
+        layout.addWidget(self.stats_label)
+
         # Cancel button
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.clicked.connect(self._on_cancel)
@@ -62,6 +71,30 @@ class _ExportProgressDialog(QDialog):
             self.progress_label.setText(message)
         else:
             self.progress_label.setText(f"Processing frame {current} of {total}")
+        self._update_stats()
+
+    def update_throughput(self, frames_written: int, bytes_written: int):
+        """Update the cumulative output totals used for the throughput figures."""
+        self.frames_written = frames_written
+        self.bytes_written = bytes_written
+        self._update_stats()
+
+    def _update_stats(self):
+        """Refresh frames/s, MB/s and ETA from the totals seen so far."""
+        elapsed = time.perf_counter() - self._started
+        if elapsed <= 0:
+            return
+
+        parts = [
+            f"{self.frames_written / elapsed:.1f} frames/s",
+            f"{self.bytes_written / 1_000_000 / elapsed:.2f} MB/s",
+        ]
+        total = self.progress_bar.maximum()
+        if 0 < self.current_frame < total:
+            remaining = round(elapsed * (total - self.current_frame) / self.current_frame)
+            minutes, seconds = divmod(remaining, 60)
+            parts.append(f"ETA {minutes}:{seconds:02d}")
+        self.stats_label.setText(", ".join(parts))
 
     def _on_cancel(self):
         """Handle cancel button."""
@@ -178,6 +178,7 @@ class _ExportTypeStep(_WizardStep):
             # Put segments_per_row first when segments exist
             preset_names = [
                 "segments_per_row",
+                "segment_sheets",
                 "sprite_sheet",
                 "individual_frames",
                 "selected_frames",
@@ -189,6 +190,7 @@ class _ExportTypeStep(_WizardStep):
                 "sprite_sheet",
                 "selected_frames",
                 "segments_per_row",
+                "segment_sheets",
             ]
 
         # Create option widgets
@@ -11,13 +11,20 @@ import logging
 import os
 import re
 import tempfile
-from collections.abc import Sequence
+import threading
+from bisect import bisect_right
+from collections.abc import Generator, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QColor, QImage, QPixmap
+
+from config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +156,98 @@ class AnimationSegment:
         return True, ""
 
 
+class _SegmentIntervalIndex:
+    """Sorted interval index over segment frame ranges.
+
+    Entries are kept sorted by start frame. The manager never lets ranges
+    overlap, so end frames rise with start frames and a query only has to
+    look at the entry bisected for its end frame (or the one before it, when
+    that entry is the excluded one). A legacy segments file can still load
+    overlapping ranges; until they are gone, queries fall back to walking a
+    running maximum of end frames.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[int, int, str]] = []  # (start, end, name), sorted
+        self._starts: list[int] = []
+        self._disjoint = True  # No two ranges overlap
+        self._max_ends: list[int] | None = None  # Overlap fallback, rebuilt after a mutation
+
+    def rebuild(self, segments: Iterable[AnimationSegment]) -> None:
+        """Replace the index contents with segments."""
+        self._entries = sorted((s.start_frame, s.end_frame, s.name) for s in segments)
+        self._starts = [start for start, _, _ in self._entries]
+        self._disjoint = all(
+            previous[1] < current[0]
+            for previous, current in zip(self._entries, self._entries[1:], strict=False)
+        )
+        self._max_ends = None
+
+    def add(self, segment: AnimationSegment) -> None:
+        entry = (segment.start_frame, segment.end_frame, segment.name)
+        position = bisect_right(self._entries, entry)
+        self._entries.insert(position, entry)
+        self._starts.insert(position, segment.start_frame)
+        if self._disjoint:
+            before = self._entries[position - 1] if position > 0 else None
+            after = self._entries[position + 1] if position + 1 < len(self._entries) else None
+            self._disjoint = (before is None or before[1] < entry[0]) and (
+                after is None or entry[1] < after[0]
+            )
+        self._max_ends = None
+
+    def remove(self, segment: AnimationSegment) -> None:
+        entry = (segment.start_frame, segment.end_frame, segment.name)
+        position = bisect_right(self._entries, entry) - 1
+        if position >= 0 and self._entries[position] == entry:
+            del self._entries[position]
+            del self._starts[position]
+            self._max_ends = None
+
+    def find_overlap(self, start: int, end: int, exclude: str | None = None) -> str | None:
+        """Return the name of a segment overlapping [start, end], or None.
+
+        Args:
+            start: First frame of the range (inclusive)
+            end: Last frame of the range (inclusive)
+            exclude: Segment name to ignore (the segment being edited)
+        """
+        # Only entries starting at or before ``end`` can overlap
+        position = bisect_right(self._starts, end) - 1
+        if self._disjoint:
+            # Their end frames rise with their starts, so the last of them
+            # reaches furthest; skip it only if it is the excluded segment
+            for candidate in (position, position - 1):
+                if candidate < 0:
+                    return None
+                _, entry_end, name = self._entries[candidate]
+                if name != exclude:
+                    return name if entry_end >= start else None
+            return None
+        return self._walk_overlap(position, start, exclude)
+
+    def segment_at(self, frame: int) -> str | None:
+        """Return the name of the segment containing frame, or None."""
+        return self.find_overlap(frame, frame)
+
+    def _walk_overlap(self, position: int, start: int, exclude: str | None) -> str | None:
+        """Overlapping-ranges fallback: walk back while a running max end reaches start."""
+        max_ends = self._max_ends
+        if max_ends is None:
+            max_ends = self._max_ends = list(accumulate((e for _, e, _ in self._entries), max))
+            # Removals may have cleared the last overlap; take the fast path from now on
+            self._disjoint = all(
+                max_end < next_start
+                for max_end, next_start in zip(max_ends, self._starts[1:], strict=False)
+            )
+        while position >= 0 and max_ends[position] >= start:
+            _, entry_end, name = self._entries[position]
+            if entry_end >= start and name != exclude:
+                return name
+            position -= 1
+        return None
+
+
 class AnimationSegmentManager(QObject):
     """Manages animation segments with persistence and validation."""
 
@@ -156,13 +255,27 @@ class AnimationSegmentManager(QObject):
     segmentRemoved = Signal(str)  # segment_name
     segmentRenamed = Signal(str, str)  # (old_name, new_name)
     segmentsCleared = Signal()
+    segmentsChanged = Signal(dict)  # Once per committed batch: {old_name: new_name} net renames
 
     def __init__(self):
         super().__init__()
         self._segments: dict[str, AnimationSegment] = {}
+        self._index = _SegmentIntervalIndex()
         self._sprite_sheet_path: str = ""
         self._max_frames: int = 0
         self._auto_save_enabled: bool = True
+        # batch_update() nesting depth and the work deferred to its end
+        self._batch_depth: int = 0
+        self._batch_changed: bool = False
+        self._batch_save: bool = False
+        self._batch_renames: dict[str, str] = {}  # Name before the batch -> current name
+
+        # Debounced background auto-save (see _auto_save)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._submit_pending_save)
+        self._save_pending: bool = False
+        self._pending_write: Future[tuple[bool, str]] | None = None
 
     def set_sprite_context(self, sprite_sheet_path: str, frame_count: int):
         """
@@ -181,6 +294,8 @@ class AnimationSegmentManager(QObject):
         sprite_path_changed = sprite_sheet_path != self._sprite_sheet_path
 
         if sprite_path_changed:
+            # Queue any debounced save while it still targets the old sprite's file
+            self._submit_pending_save()
             # Clear existing segments when switching sprite sheets
             # Temporarily disable auto-save to prevent saving empty segments to old file
             was_auto_save_enabled = self._auto_save_enabled
@@ -214,11 +329,45 @@ class AnimationSegmentManager(QObject):
         self._auto_save_enabled = False
         try:
             for name in invalid_segment_names:
-                del self._segments[name]
+                self._index.remove(self._segments.pop(name))
                 self.segmentRemoved.emit(name)
         finally:
             self._auto_save_enabled = was_auto_save_enabled
 
+    @contextmanager
+    def batch_update(self) -> Generator[None, None, None]:
+        """
+        Group several segment mutations into one save and one notification.
+
+        Inside the block, the per-segment signals (segmentRemoved,
+        segmentRenamed, segmentsCleared) are suppressed and auto-save is
+        deferred. When the outermost block exits, segments are saved once and
+        segmentsChanged is emitted once, provided anything changed. It carries
+        the batch's net renames as one {old_name: new_name} mapping, so a
+        listener holding a segment name follows it with a single lookup (swaps
+        included). Changes are not rolled back if the block raises; they are
+        still saved.
+
+        Example:
+            with manager.batch_update():
+                for name in stale_names:
+                    manager.remove_segment(name)
+                manager.set_bounce_mode("Walk", True)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                changed, save = self._batch_changed, self._batch_save
+                renames, self._batch_renames = self._batch_renames, {}
+                self._batch_changed = self._batch_save = False
+                if save:
+                    self._auto_save()
+                if changed:
+                    self.segmentsChanged.emit(renames)
+
     def add_segment(
         self,
         name: str,
@@ -268,10 +417,59 @@ class AnimationSegmentManager(QObject):
 
         # Add segment
         self._segments[name] = segment
+        self._index.add(segment)
 
-        # Auto-save if enabled
-        if self._auto_save_enabled:
-            self._auto_save()
+        self._commit_change()
+
+        return True, ""
+
+    def add_segments(self, segments: Iterable[AnimationSegment]) -> tuple[bool, str]:
+        """
+        Add a batch of segments, validating the whole batch up front.
+
+        The batch is checked in one sorted sweep: each segment is validated,
+        names must be unique, and ranges may overlap neither each other nor
+        existing segments. Either every segment is added (with a single
+        auto-save and one segmentsChanged) or none are.
+
+        Args:
+            segments: Segments to add; they are stored as given
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        batch = sorted(segments, key=lambda segment: (segment.start_frame, segment.end_frame))
+        if not batch:
+            return True, ""
+
+        names: set[str] = set()
+        previous: AnimationSegment | None = None
+        for segment in batch:
+            if segment.name in self._segments or segment.name in names:
+                return False, f"Segment '{segment.name}' already exists"
+            names.add(segment.name)
+
+            is_valid, error = segment.validate(self._max_frames)
+            if not is_valid:
+                return False, f"Segment '{segment.name}': {error}"
+
+            if previous is not None and segment.start_frame <= previous.end_frame:
+                overlapping = previous.name
+            else:
+                overlapping = self._index.find_overlap(segment.start_frame, segment.end_frame)
+            if overlapping:
+                return (
+                    False,
+                    f"Frames {segment.start_frame}-{segment.end_frame} "
+                    f"overlap with segment '{overlapping}'",
+                )
+            previous = segment
+
+        with self.batch_update():
+            for segment in batch:
+                self._segments[segment.name] = segment
+            self._index.rebuild(self._segments.values())
+            self._commit_change()
 
         return True, ""
 
@@ -286,12 +484,11 @@ class AnimationSegmentManager(QObject):
             True if segment was removed, False if not found
         """
         if name in self._segments:
-            del self._segments[name]
-            self.segmentRemoved.emit(name)
+            self._index.remove(self._segments.pop(name))
+            if not self._batch_depth:
+                self.segmentRemoved.emit(name)
 
-            # Auto-save if enabled
-            if self._auto_save_enabled:
-                self._auto_save()
+            self._commit_change()
 
             return True
         return False
@@ -340,16 +537,15 @@ class AnimationSegmentManager(QObject):
         effective_end = end_frame if end_frame is not None else original_end
 
         # Check overlaps BEFORE mutation (excluding self)
-        for other in self._segments.values():
-            if other.name == name:
-                continue
-            if effective_start <= other.end_frame and other.start_frame <= effective_end:
-                return (
-                    False,
-                    f"Frames {effective_start}-{effective_end} overlap with segment '{other.name}'",
-                )
+        overlapping = self._index.find_overlap(effective_start, effective_end, exclude=name)
+        if overlapping:
+            return (
+                False,
+                f"Frames {effective_start}-{effective_end} overlap with segment '{overlapping}'",
+            )
 
         # Now mutate
+        self._index.remove(segment)
         segment.start_frame = effective_start
         segment.end_frame = effective_end
         if new_name is not None:
@@ -368,17 +564,21 @@ class AnimationSegmentManager(QObject):
             segment.name = original_name
             segment.color_rgb = original_color
             segment.description = original_description
+            self._index.add(segment)
             return False, error
 
+        self._index.add(segment)
+
         # Handle name change
         if new_name and new_name != name:
             del self._segments[name]
             self._segments[new_name] = segment
-            self.segmentRenamed.emit(name, new_name)
+            if self._batch_depth:
+                self._record_batch_rename(name, new_name)
+            else:
+                self.segmentRenamed.emit(name, new_name)
 
-        # Auto-save if enabled
-        if self._auto_save_enabled:
-            self._auto_save()
+        self._commit_change()
 
         return True, ""
 
@@ -398,9 +598,7 @@ class AnimationSegmentManager(QObject):
 
         self._segments[segment_name].bounce_mode = bounce_mode
 
-        # Auto-save if enabled
-        if self._auto_save_enabled:
-            self._auto_save()
+        self._commit_change()
 
         return True, ""
 
@@ -426,9 +624,7 @@ class AnimationSegmentManager(QObject):
 
         segment.frame_holds = frame_holds
 
-        # Auto-save if enabled
-        if self._auto_save_enabled:
-            self._auto_save()
+        self._commit_change()
 
         return True, ""
 
@@ -440,13 +636,24 @@ class AnimationSegmentManager(QObject):
         """Get all segments as a list."""
         return list(self._segments.values())
 
+    def segment_at(self, frame: int) -> AnimationSegment | None:
+        """Get the segment containing frame, if any."""
+        name = self._index.segment_at(frame)
+        return self._segments.get(name) if name is not None else None
+
+    def segment_overlapping(self, start_frame: int, end_frame: int) -> AnimationSegment | None:
+        """Get a segment overlapping frames start_frame..end_frame (inclusive), if any."""
+        name = self._index.find_overlap(start_frame, end_frame)
+        return self._segments.get(name) if name is not None else None
+
     def clear_segments(self):
         """Clear all segments."""
         self._segments.clear()
-        self.segmentsCleared.emit()
+        self._index.rebuild(())
+        if not self._batch_depth:
+            self.segmentsCleared.emit()
 
-        if self._auto_save_enabled:
-            self._auto_save()
+        self._commit_change()
 
     def _find_overlapping_segment(self, start_frame: int, end_frame: int) -> str | None:
         """
@@ -457,17 +664,13 @@ class AnimationSegmentManager(QObject):
             end_frame: End of the range to check
 
         Returns:
-            Name of the first overlapping segment, or None if no overlap
+            Name of an overlapping segment, or None if no overlap
         """
-        for segment in self._segments.values():
-            # Check if ranges overlap using interval overlap logic
-            if start_frame <= segment.end_frame and segment.start_frame <= end_frame:
-                return segment.name
-        return None
+        return self._index.find_overlap(start_frame, end_frame)
 
     def extract_frames_for_segment(
-        self, segment_name: str, all_frames: Sequence[QPixmap]
-    ) -> list[QPixmap]:
+        self, segment_name: str, all_frames: Sequence[QImage | QPixmap]
+    ) -> list[QImage | QPixmap]:
         """
         Extract frames for a specific segment.
 
@@ -507,20 +710,18 @@ class AnimationSegmentManager(QObject):
 
     def _get_segments_file_path(self) -> str:
         """Get the file path for saving segments (new format with extension)."""
-        segments_dir = self._get_segments_dir()
-        if segments_dir is None:
+        if self._get_segments_dir() is None:
             return ""
-
-        sprite_path = Path(self._sprite_sheet_path)
-        # New format: {stem}_{ext}_segments.json (e.g., hero_png_segments.json)
-        ext = sprite_path.suffix.lstrip(".")
-        segments_file = segments_dir / f"{sprite_path.stem}_{ext}_segments.json"
-        return str(segments_file)
+        return str(_segments_file_for(self._sprite_sheet_path))
 
     def save_segments_to_file(self, file_path: str | None = None) -> tuple[bool, str]:
         """
         Save segments to JSON file using atomic write pattern.
 
+        Writes synchronously; a pending debounced auto-save is superseded and
+        any in-flight background write finishes first, so it cannot overwrite
+        this newer state.
+
         Args:
             file_path: Custom file path (uses auto-generated if None)
 
@@ -533,34 +734,18 @@ class AnimationSegmentManager(QObject):
         if not file_path:
             return False, "No sprite sheet loaded"
 
-        temp_path: str | None = None
-        try:
-            data = {
-                "sprite_sheet_path": self._sprite_sheet_path,
-                "max_frames": self._max_frames,
-                "segments": [segment.to_dict() for segment in self._segments.values()],
-            }
-
-            # Atomic write: write to temp file, then rename
-            dir_path = os.path.dirname(file_path)
-            with tempfile.NamedTemporaryFile(
-                mode="w", dir=dir_path, delete=False, suffix=".tmp"
-            ) as f:
-                json.dump(data, f, indent=2)
-                temp_path = f.name
-
-            # Atomic rename (works on POSIX and Windows)
-            os.replace(temp_path, file_path)
+        self._save_timer.stop()
+        self._save_pending = False
+        self._wait_for_pending_write()
+        return _write_segments_file(file_path, self._snapshot())
 
-            return True, ""
+    def flush_pending_saves(self) -> None:
+        """Write any debounced auto-save now and wait for background writes.
 
-        except (OSError, TypeError) as e:
-            # Clean up temp file if it exists
-            if temp_path is not None:
-                # SIM105: Use contextlib.suppress instead of try/except/pass
-                with contextlib.suppress(OSError):
-                    os.unlink(temp_path)
-            return False, f"Failed to save segments: {e!s}"
+        Call before the application exits so no segment edits are lost.
+        """
+        self._submit_pending_save()
+        self._wait_for_pending_write()
 
     def load_segments_from_file(self, file_path: str) -> tuple[bool, str]:
         """
@@ -572,6 +757,10 @@ class AnimationSegmentManager(QObject):
         Returns:
             Tuple of (success, error_message)
         """
+        # Pending edits belong to the state being replaced; write them first so
+        # reloading the same file (or switching straight back to it) reads them
+        self._submit_pending_save()
+        self._wait_for_pending_write()
         try:
             with open(file_path) as f:
                 data = json.load(f)
@@ -601,6 +790,7 @@ class AnimationSegmentManager(QObject):
                     loaded_count += 1
                 else:
                     skipped_segments.append((segment.name, error))
+            self._index.rebuild(self._segments.values())
 
             # Report results including any skipped segments
             if skipped_segments:
@@ -629,12 +819,64 @@ class AnimationSegmentManager(QObject):
             elif message:  # Partial success with skipped segments
                 logger.info("Segment load: %s", message)
 
+    def _record_batch_rename(self, name: str, new_name: str) -> None:
+        """Fold a rename made inside a batch into the net renames reported at its end."""
+        original = next(
+            (before for before, current in self._batch_renames.items() if current == name), name
+        )
+        if original == new_name:
+            del self._batch_renames[original]  # Renamed back: nothing to report
+        else:
+            self._batch_renames[original] = new_name
+
+    def _commit_change(self) -> None:
+        """Auto-save a mutation now, or defer it to the end of the current batch."""
+        if self._batch_depth:
+            self._batch_changed = True
+            self._batch_save = self._batch_save or self._auto_save_enabled
+        elif self._auto_save_enabled:
+            self._auto_save()
+
     def _auto_save(self):
-        """Auto-save segments if enabled and sprite sheet is loaded."""
+        """Schedule a debounced background save if enabled and a sprite sheet is loaded.
+
+        Rapid edits restart the timer, so a burst of changes costs one write.
+        """
         if self._auto_save_enabled and self._sprite_sheet_path:
-            success, error_msg = self.save_segments_to_file()
-            if not success:
-                logger.warning("Auto-save failed: %s", error_msg)
+            self._save_pending = True
+            self._save_timer.start(Config.Settings.SEGMENT_SAVE_DELAY_MS)
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Build the JSON document for the current segments."""
+        return {
+            "sprite_sheet_path": self._sprite_sheet_path,
+            "max_frames": self._max_frames,
+            "segments": [segment.to_dict() for segment in self._segments.values()],
+        }
+
+    def _submit_pending_save(self) -> None:
+        """Hand a pending debounced save to the background writer.
+
+        The segment data is captured here, on the GUI thread; serialization and
+        disk I/O run on the writer thread.
+        """
+        self._save_timer.stop()
+        if not self._save_pending:
+            return
+        self._save_pending = False
+        self._pending_write = _segment_writer().submit(
+            _write_segments_file,
+            str(_segments_file_for(self._sprite_sheet_path)),
+            self._snapshot(),
+            create_dir=True,
+        )
+        self._pending_write.add_done_callback(_log_write_failure)
+
+    def _wait_for_pending_write(self) -> None:
+        """Block until the last submitted background write has finished."""
+        if self._pending_write is not None:
+            self._pending_write.result()
+            self._pending_write = None
 
     def set_auto_save_enabled(self, enabled: bool):
         """Enable or disable auto-save (test-only hook).
@@ -643,3 +885,74 @@ class AnimationSegmentManager(QObject):
         suppress disk I/O when exercising in-memory segment behavior.
         """
         self._auto_save_enabled = enabled
+
+
+def _segments_file_for(sprite_sheet_path: str) -> Path:
+    """Return the segments file path for a sprite sheet (directory not created)."""
+    sprite_path = Path(sprite_sheet_path)
+    # New format: {stem}_{ext}_segments.json (e.g., hero_png_segments.json)
+    ext = sprite_path.suffix.lstrip(".")
+    return sprite_path.parent / ".sprite_segments" / f"{sprite_path.stem}_{ext}_segments.json"
+
+
+def _write_segments_file(
+    file_path: str, data: dict[str, Any], create_dir: bool = False
+) -> tuple[bool, str]:
+    """
+    Atomically write a segments document: dump to a temp file, then rename.
+
+    A crash mid-write leaves the previous file intact. Safe to call from the
+    background writer thread.
+
+    Args:
+        file_path: Destination JSON file
+        data: Document to serialize
+        create_dir: Create the parent directory first if it is missing
+
+    Returns:
+        Tuple of (success, error_message)
+    """
+    temp_path: str | None = None
+    try:
+        dir_path = os.path.dirname(file_path)
+        if create_dir:
+            os.makedirs(dir_path, exist_ok=True)
+
+        # Atomic write: write to temp file, then rename
+        with tempfile.NamedTemporaryFile(mode="w", dir=dir_path, delete=False, suffix=".tmp") as f:
+            json.dump(data, f, indent=2)
+            temp_path = f.name
+
+        # Atomic rename (works on POSIX and Windows)
+        os.replace(temp_path, file_path)
+
+        return True, ""
+
+    except (OSError, TypeError) as e:
+        # Clean up temp file if it exists
+        if temp_path is not None:
+            # SIM105: Use contextlib.suppress instead of try/except/pass
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+        return False, f"Failed to save segments: {e!s}"
+
+
+def _log_write_failure(future: "Future[tuple[bool, str]]") -> None:
+    """Log a failed background segment write (runs on the writer thread)."""
+    success, error_msg = future.result()
+    if not success:
+        logger.warning("Auto-save failed: %s", error_msg)
+
+
+_writer: ThreadPoolExecutor | None = None
+_writer_lock = threading.Lock()
+
+
+def _segment_writer() -> ThreadPoolExecutor:
+    """Get the shared single-thread executor that performs segment writes in order."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-writer")
+    return _writer
@@ -13,6 +13,8 @@ Refactored from a 2,530-line monolithic file into clean, testable modules:
 
 from .core import SpriteModel
 from .extraction_mode import ExtractionMode, extraction_mode_label
+from .pixel_inspector import PixelSample
+from .spatial_index import SpatialIndex
 from .sprite_detection import DetectionResult
 from .sprite_extraction import CCLDetectionResult, GridConfig
 
@@ -21,6 +23,8 @@ __all__ = [
     "DetectionResult",
     "ExtractionMode",
     "GridConfig",
+    "PixelSample",
+    "SpatialIndex",
     "SpriteModel",
     "extraction_mode_label",
 ]
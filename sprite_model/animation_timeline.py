@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Animation Timeline Module
+=========================
+
+Precompiled playback order for a frame range:
+- Bounce (ping-pong) expansion: 0..n-1 then n-2..1
+- Frame holds: extra ticks a frame stays on screen
+- O(1) frame lookup by tick or by elapsed time
+
+A tick is one period of the playback rate, so a timeline is independent of
+FPS; ``frame_at_time`` converts elapsed seconds with the rate in use. The
+main canvas (via ``SpriteModel.set_timeline``) and the segment previews both
+step through the same compiled structure, so a segment plays identically in
+either place.
+"""
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import numpy as np
+
+__all__ = ["AnimationTimeline", "compile_timeline"]
+
+
+@dataclass(frozen=True)
+class AnimationTimeline:
+    """Frame indices with durations (in ticks) for one playback cycle."""
+
+    frames: np.ndarray  # (entries,) frame index shown by each entry, in playback order
+    durations: np.ndarray  # (entries,) ticks each entry stays on screen (>= 1)
+    _tick_frames: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # One slot per tick makes every lookup a single index
+        object.__setattr__(self, "_tick_frames", np.repeat(self.frames, self.durations))
+
+    @classmethod
+    def linear(cls, frame_count: int) -> "AnimationTimeline":
+        """Return the plain 0..frame_count-1 timeline, one tick per frame."""
+        return compile_timeline(0, frame_count - 1)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def tick_count(self) -> int:
+        """Ticks in one cycle."""
+        return len(self._tick_frames)
+
+    @property
+    def first_frame(self) -> int:
+        """Lowest frame index the timeline shows."""
+        return int(self.frames.min()) if len(self.frames) else 0
+
+    @property
+    def last_frame(self) -> int:
+        """Highest frame index the timeline shows."""
+        return int(self.frames.max()) if len(self.frames) else -1
+
+    def frame_at(self, tick: int, loop: bool = True) -> int:
+        """Return the frame shown at tick.
+
+        Ticks past the end wrap when loop is True and stay on the final
+        entry otherwise.
+        """
+        if not self.tick_count:
+            return 0
+        tick = tick % self.tick_count if loop else min(max(tick, 0), self.tick_count - 1)
+        return int(self._tick_frames[tick])
+
+    def frame_at_time(self, elapsed: float, fps: float, loop: bool = True) -> int:
+        """Return the frame shown elapsed seconds after the start at fps."""
+        return self.frame_at(math.floor(elapsed * fps + 1e-9), loop)
+
+    def first_tick_of(self, frame: int) -> int:
+        """Return the first tick that shows frame (0 if it never does)."""
+        matches = np.flatnonzero(self._tick_frames == frame)
+        return int(matches[0]) if len(matches) else 0
+
+
+def compile_timeline(
+    start_frame: int,
+    end_frame: int,
+    bounce: bool = False,
+    frame_holds: Mapping[int, int] | None = None,
+) -> AnimationTimeline:
+    """
+    Compile the playback order for frames start_frame..end_frame.
+
+    Args:
+        start_frame: First frame index of the range (inclusive)
+        end_frame: Last frame index of the range (inclusive)
+        bounce: Play forward then backward, without repeating either end
+        frame_holds: Extra ticks per frame, keyed by offset from start_frame
+            (the ``AnimationSegment.frame_holds`` convention)
+
+    Returns:
+        AnimationTimeline for one cycle (empty if end_frame < start_frame)
+    """
+    count = max(0, end_frame - start_frame + 1)
+    offsets = np.arange(count, dtype=np.int64)
+    if bounce and count > 2:
+        offsets = np.concatenate([offsets, offsets[-2:0:-1]])
+
+    durations = np.ones(count, dtype=np.int64)
+    for offset, hold in (frame_holds or {}).items():
+        if 0 <= offset < count and hold > 0:
+            durations[offset] += hold
+
+    return AnimationTimeline(frames=offsets + start_frame, durations=durations[offsets])
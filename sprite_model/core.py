@@ -7,11 +7,16 @@ and CCL extraction to CCLOperations.
 import os
 from collections.abc import Sequence
 
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtGui import QPixmap
+import numpy as np
+from PySide6.QtCore import QObject, QRect, Signal
+from PySide6.QtGui import QImage, QPixmap
 
+from sprite_model.animation_timeline import AnimationTimeline
 from sprite_model.extraction_mode import ExtractionMode
 from sprite_model.extraction_strategies import ExtractionContext, get_extraction_strategy
+from sprite_model.frame_metadata import FrameMetadata, compute_frame_metadata
+from sprite_model.pixel_inspector import PixelSample, _PixelInspector
+from sprite_model.spatial_index import SpatialIndex
 from sprite_model.sprite_animation import _AnimationStateManager
 from sprite_model.sprite_ccl import _CCLOperations
 from sprite_model.sprite_detection import (
@@ -23,6 +28,8 @@ from sprite_model.sprite_detection import (
 )
 from sprite_model.sprite_extraction import (
     GridConfig,
+    _calculate_grid_layout,
+    as_image,
     detect_background_color,
     detect_sprites_ccl_enhanced,
 )
@@ -56,13 +63,18 @@ class SpriteModel(QObject):
 
         # Core sprite sheet state
         self._original_sprite_sheet: QPixmap | None = None
-        self._sprite_frames: list[QPixmap] = []
+        # The decoded sheet, offered to dataLoaded handlers once (see take_loaded_sheet_image)
+        self._loaded_sheet_image: QImage | None = None
+        self._sprite_frames: list[QImage] = []
+        self._frame_aliases: tuple[int, ...] = ()
+        self._frame_metadata = FrameMetadata.empty()
         self._file_path: str = ""
 
         # Initialize refactored modules (pass dependencies directly)
         self._file_loader = _FileLoader()
         self._animation_state = _AnimationStateManager(self._sprite_frames)  # Pass frames reference
         self._ccl_operations = _CCLOperations()
+        self._pixel_inspector = _PixelInspector()
 
         # Frame extraction settings (for backward compatibility)
         self._frame_width: int = 0
@@ -93,21 +105,30 @@ class SpriteModel(QObject):
             Tuple of (success, message)
         """
         try:
-            success, pixmap, message = self._file_loader.load_sprite_sheet(file_path)
+            success, image, message = self._file_loader.load_sprite_sheet_image(file_path)
 
-            if not success:
+            if not success or image is None:
                 return False, message
 
             # Store state
-            self._original_sprite_sheet = pixmap
+            self._original_sprite_sheet = QPixmap.fromImage(image)
             self._file_path = file_path
 
             # Clear previous frames and reset animation
             self._sprite_frames.clear()
+            self._frame_aliases = ()
+            self._frame_metadata = FrameMetadata.empty()
             self._animation_state.reset_state()
             self._ccl_operations.clear_ccl_data()
-
-            self.dataLoaded.emit(file_path)
+            self._pixel_inspector.reset_sheet(image)
+
+            # Offer the decoded image to dataLoaded handlers only; holding it
+            # beyond that would keep a second full copy of the sheet alive
+            self._loaded_sheet_image = image
+            try:
+                self.dataLoaded.emit(file_path)
+            finally:
+                self._loaded_sheet_image = None
             return True, "Sprite sheet loaded successfully"
 
         except Exception as e:
@@ -236,6 +257,100 @@ class SpriteModel(QObject):
         """Get bounding boxes of detected sprites."""
         return self._ccl_operations.get_ccl_sprite_bounds()
 
+    def get_ccl_sprite_index(self) -> SpatialIndex:
+        """
+        Get a spatial index over the detected sprite boxes.
+
+        Built once per CCL detection and shared, so hit-testing and
+        rubber-band selection can query it on every mouse event. Result
+        indices match get_ccl_sprite_bounds().
+        """
+        return self._ccl_operations.get_ccl_sprite_index()
+
+    def frame_source_rect(self, index: int) -> QRect | None:
+        """Get the sheet rectangle frame index was cut from (None if unknown)."""
+        if not 0 <= index < len(self._sprite_frames):
+            return None
+        if self.get_extraction_mode() is ExtractionMode.CCL:
+            frame_bounds = self._ccl_operations.get_ccl_frame_bounds()
+            if len(frame_bounds) != len(self._sprite_frames):
+                return None
+            return QRect(*frame_bounds[index])
+        frames_per_row = self.frames_per_row
+        if frames_per_row is None:
+            return None
+        row, column = divmod(index, frames_per_row)
+        return QRect(
+            self._offset_x + column * (self._frame_width + self._spacing_x),
+            self._offset_y + row * (self._frame_height + self._spacing_y),
+            self._frame_width,
+            self._frame_height,
+        )
+
+    def sheet_regions(self) -> np.ndarray:
+        """
+        Get the sheet areas the current extraction works from.
+
+        Returns:
+            (n, 4) int array of x, y, width, height: every CCL sprite bound in
+            CCL mode (the read-only array behind get_ccl_sprite_index()), every
+            extracted grid cell (in frame order) in grid mode
+        """
+        if self.get_extraction_mode() is ExtractionMode.CCL:
+            return self._ccl_operations.get_ccl_sprite_index().boxes
+        frames_per_row = self.frames_per_row
+        if not frames_per_row or not self._sprite_frames:
+            return np.zeros((0, 4), dtype=np.int64)
+        rows, columns = np.divmod(np.arange(len(self._sprite_frames)), frames_per_row)
+        return np.column_stack(
+            [
+                self._offset_x + columns * (self._frame_width + self._spacing_x),
+                self._offset_y + rows * (self._frame_height + self._spacing_y),
+                np.full(len(rows), self._frame_width),
+                np.full(len(rows), self._frame_height),
+            ]
+        ).astype(np.int64)
+
+    def inspect_pixel(self, x: int, y: int) -> PixelSample | None:
+        """
+        Describe pixel (x, y) of the current frame.
+
+        Lookups read cached arrays built on first use, so this is cheap
+        enough to call on every mouse move.
+
+        Returns:
+            PixelSample, or None if no frame is shown or (x, y) is outside it
+        """
+        index = self.current_frame
+        if not 0 <= index < len(self._sprite_frames):
+            return None
+        rgba = self._pixel_inspector.rgba_at(self._sprite_frames[index], x, y)
+        if rgba is None:
+            return None
+
+        source = self.frame_source_rect(index)
+        if source is None or self._original_sprite_sheet is None:
+            return PixelSample(x, y, rgba)
+        sheet_x, sheet_y = source.x() + x, source.y() + y
+
+        ccl_sprite = None
+        grid_cell = None
+        if self.get_extraction_mode() is ExtractionMode.CCL:
+            hits = self.get_ccl_sprite_index().query_point(sheet_x, sheet_y)
+            ccl_sprite = int(hits[0]) if len(hits) else None
+        else:
+            grid_cell = divmod(index, self.frames_per_row or 1)
+
+        return PixelSample(
+            x,
+            y,
+            rgba,
+            sheet_point=(sheet_x, sheet_y),
+            palette_index=self._pixel_inspector.palette_index_at(sheet_x, sheet_y),
+            ccl_sprite=ccl_sprite,
+            grid_cell=grid_cell,
+        )
+
     # Auto-Detection Methods
     def auto_detect_rectangular_frames(self) -> tuple[bool, int, int, str]:
         """Detect uniform frame dimensions from the loaded sprite sheet."""
@@ -335,6 +450,10 @@ class SpriteModel(QObject):
         """Move to next frame."""
         return self._animation_state.next_frame()
 
+    def advance_frames(self, count: int) -> tuple[int, bool]:
+        """Move count frames forward in one step (frameChanged fires once)."""
+        return self._animation_state.advance_frames(count)
+
     def previous_frame(self) -> int:
         """Move to previous frame."""
         return self._animation_state.previous_frame()
@@ -347,7 +466,11 @@ class SpriteModel(QObject):
         """Move to last frame."""
         return self._animation_state.last_frame()
 
-    def set_fps(self, fps: int) -> bool:
+    def set_timeline(self, timeline: AnimationTimeline | None) -> bool:
+        """Play frames in timeline order (None for every frame in sequence)."""
+        return self._animation_state.set_timeline(timeline)
+
+    def set_fps(self, fps: float) -> bool:
         """Set frames per second."""
         return self._animation_state.set_fps(fps)
 
@@ -356,6 +479,11 @@ class SpriteModel(QObject):
         self._animation_state.set_loop_enabled(enabled)
 
     # Properties (backward compatibility)
+    @property
+    def timeline(self) -> AnimationTimeline | None:
+        """Get the active playback timeline (None for sequential playback)."""
+        return self._animation_state.timeline
+
     @property
     def current_frame_pixmap(self) -> QPixmap | None:
         """Get current frame pixmap."""
@@ -400,9 +528,13 @@ class SpriteModel(QObject):
         return self._original_sprite_sheet is not None
 
     @property
-    def sprite_frames(self) -> tuple[QPixmap, ...]:
+    def sprite_frames(self) -> tuple[QImage, ...]:
         """Read-only snapshot of the extracted frames.
 
+        Frames are stored as QImage so exports can hand them to worker
+        threads without a GUI-thread conversion pass; QImage is implicitly
+        shared, so the snapshot does not copy pixel data.
+
         Mutate frames via ``set_frames`` / ``clear_frames``. Returning a tuple
         prevents callers from accidentally appending or clearing through the
         public surface (the underlying list is shared with
@@ -410,6 +542,46 @@ class SpriteModel(QObject):
         """
         return tuple(self._sprite_frames)
 
+    @property
+    def frame_metadata(self) -> FrameMetadata:
+        """Per-frame metadata table computed when the frames were set.
+
+        Sizes, content boxes, alpha usage, blank flags and content digests
+        are read from here instead of re-scanning frame pixels.
+        """
+        return self._frame_metadata
+
+    @property
+    def frame_aliases(self) -> tuple[int, ...]:
+        """For each frame, the index of the first frame with identical pixels.
+
+        A frame that is the first of its content maps to itself. Duplicates
+        share the QImage of the frame they alias (see ``set_frames``).
+        """
+        return self._frame_aliases
+
+    @property
+    def duplicate_frame_count(self) -> int:
+        """Number of frames that duplicate an earlier frame."""
+        return sum(alias != index for index, alias in enumerate(self._frame_aliases))
+
+    @property
+    def frames_per_row(self) -> int | None:
+        """Columns of the extraction grid, or None outside grid mode.
+
+        Frames are stored row by row, so frame i sits in grid row
+        ``i // frames_per_row``.
+        """
+        sheet = self._original_sprite_sheet
+        if sheet is None or self.get_extraction_mode() is not ExtractionMode.GRID:
+            return None
+        layout = _calculate_grid_layout(
+            sheet.width() - self._offset_x,
+            sheet.height() - self._offset_y,
+            self._current_grid_config(),
+        )
+        return layout.frames_per_row or None
+
     @property
     def frame_width(self) -> int:
         """Get configured frame width."""
@@ -445,6 +617,16 @@ class SpriteModel(QObject):
         """Get original sprite sheet pixmap."""
         return self._original_sprite_sheet
 
+    def take_loaded_sheet_image(self) -> QImage | None:
+        """Hand over the sheet as decoded by the current load, as a QImage.
+
+        Only available while ``dataLoaded`` is being emitted, and only once;
+        the model itself keeps just the pixmap. The image may be used off the
+        GUI thread.
+        """
+        image, self._loaded_sheet_image = self._loaded_sheet_image, None
+        return image
+
     @property
     def current_frame(self) -> int:
         """Get current frame index."""
@@ -456,7 +638,7 @@ class SpriteModel(QObject):
         return self._animation_state.is_playing
 
     @property
-    def fps(self) -> int:
+    def fps(self) -> float:
         """Get frames per second."""
         return self._animation_state.fps
 
@@ -506,18 +688,35 @@ class SpriteModel(QObject):
             detect_background_color=detect_background_color,
         )
 
-    def set_frames(self, frames: Sequence[QPixmap]) -> None:
+    def set_frames(self, frames: Sequence[QImage | QPixmap]) -> None:
         """Replace the extracted frames in-place.
 
         The underlying list is mutated in place to preserve the long-lived
-        reference held by ``AnimationStateManager``. Does NOT emit
+        reference held by ``AnimationStateManager``. QPixmap frames are
+        converted to QImage here, once, and measured into ``frame_metadata``.
+        Frames with identical pixels are detected by their content digest and
+        stored as one shared QImage, so repeated poses cost no extra memory
+        and downstream caches see equal cache keys. Does NOT emit
         ``extractionCompleted`` — callers handle signal emission individually.
         """
+        images = [as_image(frame) for frame in frames]
+        metadata = compute_frame_metadata(images)
+        first_by_digest: dict[bytes, int] = {}
+        aliases = [
+            first_by_digest.setdefault(digest, index)
+            for index, digest in enumerate(metadata.digests)
+        ]
         self._sprite_frames.clear()
-        self._sprite_frames.extend(frames)
+        self._sprite_frames.extend(images[alias] for alias in aliases)
+        self._frame_aliases = tuple(aliases)
+        self._frame_metadata = metadata
+        self._pixel_inspector.reset_frames()
         self._animation_state.update_frame_count(len(self._sprite_frames))
 
     def clear_frames(self) -> None:
         """Remove all extracted frames in-place and reset animation state."""
         self._sprite_frames.clear()
+        self._frame_aliases = ()
+        self._frame_metadata = FrameMetadata.empty()
+        self._pixel_inspector.reset_frames()
         self._animation_state.update_frame_count(0)
@@ -16,7 +16,7 @@ from sprite_model.sprite_extraction import (
 )
 
 if TYPE_CHECKING:
-    from PySide6.QtGui import QPixmap
+    from PySide6.QtGui import QImage, QPixmap
 
     from sprite_model.sprite_ccl import _CCLOperations
 
@@ -35,7 +35,7 @@ class ExtractionResult:
     success: bool
     message: str
     frame_count: int
-    frames: list[QPixmap]
+    frames: list[QImage]
 
 
 @dataclass(frozen=True)
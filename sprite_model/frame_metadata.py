@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Frame Metadata Module
+=====================
+
+Per-frame facts computed once when frames are extracted:
+- Frame width and height
+- Tight content bounding box
+- Opaque-pixel count and whether any pixel is translucent
+- Blank flag (fully transparent or a single flat color)
+- Content digest (see ``utils.sprite_rendering.frame_digest``)
+
+The table is columnar: each fact is one NumPy array indexed by frame, so
+consumers answer questions such as "does any frame need alpha?" without
+touching pixels again.
+"""
+
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QImage
+
+from utils.sprite_rendering import _as_word_image, frame_digest
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["FrameMetadata", "compute_frame_metadata"]
+
+# Frames stacked per vectorized pass; bounds the temporary copy for huge sheets
+_CHUNK_FRAMES = 256
+
+
+@dataclass(frozen=True)
+class FrameMetadata:
+    """Columnar per-frame metadata table (one row per frame)."""
+
+    widths: np.ndarray  # (n,) int32
+    heights: np.ndarray  # (n,) int32
+    content_boxes: np.ndarray  # (n, 4) int32 x, y, width, height; zeros for blank frames
+    opaque_pixels: np.ndarray  # (n,) int64 pixels with alpha 255
+    has_alpha: np.ndarray  # (n,) True where some pixel is not fully opaque
+    blank: np.ndarray  # (n,) True where the frame is one flat color
+    digests: tuple[bytes, ...]  # (n,) frame_digest of each frame
+
+    @classmethod
+    def empty(cls) -> "FrameMetadata":
+        """Return a table with no rows."""
+        return _allocate(0)
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    @property
+    def any_alpha(self) -> bool:
+        """True if any frame has a pixel that is not fully opaque."""
+        return bool(self.has_alpha.any())
+
+    def size(self, index: int) -> tuple[int, int]:
+        """Return (width, height) of frame index."""
+        return int(self.widths[index]), int(self.heights[index])
+
+    def content_rect(self, index: int) -> QRect:
+        """Return the tight content box of frame index (empty for blank frames)."""
+        x, y, width, height = (int(value) for value in self.content_boxes[index])
+        return QRect(x, y, width, height)
+
+    def select(self, indices: Sequence[int]) -> "FrameMetadata":
+        """Return the rows for indices, in that order."""
+        rows = np.asarray(indices, dtype=np.intp)
+        return FrameMetadata(
+            widths=self.widths[rows],
+            heights=self.heights[rows],
+            content_boxes=self.content_boxes[rows],
+            opaque_pixels=self.opaque_pixels[rows],
+            has_alpha=self.has_alpha[rows],
+            blank=self.blank[rows],
+            digests=tuple(self.digests[row] for row in rows.tolist()),
+        )
+
+
+def compute_frame_metadata(frames: Sequence[QImage]) -> FrameMetadata:
+    """
+    Build the metadata table for frames.
+
+    Frames of equal size (every frame in grid mode) are stacked and measured
+    together, so each fact is one vectorized reduction per chunk of frames
+    rather than a per-frame pixel walk.
+
+    Content is every pixel with non-zero alpha when the frame has fully
+    transparent pixels, otherwise every pixel that differs from the top-left
+    one (the sheet background color). A frame without content is blank.
+
+    Args:
+        frames: Extracted frames, in playback order
+
+    Returns:
+        FrameMetadata with one row per frame
+    """
+    started = time.perf_counter()
+    count = len(frames)
+    table = _allocate(count)
+    images = [_as_word_image(frame) for frame in frames]
+
+    by_size: dict[tuple[int, int], list[int]] = {}
+    for index, image in enumerate(images):
+        table.widths[index] = image.width()
+        table.heights[index] = image.height()
+        if image.isNull():
+            table.blank[index] = True
+        else:
+            by_size.setdefault((image.width(), image.height()), []).append(index)
+
+    for (width, height), indices in by_size.items():
+        for chunk_start in range(0, len(indices), _CHUNK_FRAMES):
+            chunk = indices[chunk_start : chunk_start + _CHUNK_FRAMES]
+            words = np.stack([_pixel_words(images[index], width, height) for index in chunk])
+            _measure(table, np.asarray(chunk, dtype=np.intp), words)
+
+    metadata = FrameMetadata(
+        widths=table.widths,
+        heights=table.heights,
+        content_boxes=table.content_boxes,
+        opaque_pixels=table.opaque_pixels,
+        has_alpha=table.has_alpha,
+        blank=table.blank,
+        digests=tuple(frame_digest(image) for image in images),
+    )
+    logger.debug(
+        "Computed metadata for %d frames in %.1f ms",
+        count,
+        (time.perf_counter() - started) * 1000,
+    )
+    return metadata
+
+
+def _allocate(count: int) -> FrameMetadata:
+    return FrameMetadata(
+        widths=np.zeros(count, dtype=np.int32),
+        heights=np.zeros(count, dtype=np.int32),
+        content_boxes=np.zeros((count, 4), dtype=np.int32),
+        opaque_pixels=np.zeros(count, dtype=np.int64),
+        has_alpha=np.zeros(count, dtype=bool),
+        blank=np.zeros(count, dtype=bool),
+        digests=(),
+    )
+
+
+def _pixel_words(image: QImage, width: int, height: int) -> np.ndarray:
+    """Return a (height, width) uint32 view of a 32-bit image's pixels."""
+    words_per_line = image.bytesPerLine() // 4
+    return np.frombuffer(image.constBits(), dtype=np.uint32, count=height * words_per_line).reshape(
+        height, words_per_line
+    )[:, :width]
+
+
+def _measure(table: FrameMetadata, rows: np.ndarray, words: np.ndarray) -> None:
+    """Fill table rows from a (frames, height, width) stack of pixel words."""
+    alpha = words >> 24
+    opaque = alpha == 0xFF
+    transparent = alpha == 0
+    table.opaque_pixels[rows] = opaque.sum(axis=(1, 2))
+    table.has_alpha[rows] = ~opaque.all(axis=(1, 2))
+
+    has_transparent = transparent.any(axis=(1, 2))[:, None, None]
+    content = np.where(has_transparent, ~transparent, words != words[:, :1, :1])
+
+    content_rows = content.any(axis=2)  # (frames, height)
+    content_cols = content.any(axis=1)  # (frames, width)
+    blank = ~content_rows.any(axis=1)
+    table.blank[rows] = blank
+
+    height, width = content.shape[1:]
+    top = content_rows.argmax(axis=1)
+    bottom = height - content_rows[:, ::-1].argmax(axis=1)
+    left = content_cols.argmax(axis=1)
+    right = width - content_cols[:, ::-1].argmax(axis=1)
+    boxes = np.stack([left, top, right - left, bottom - top], axis=1)
+    boxes[blank] = 0
+    table.content_boxes[rows] = boxes
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Pixel Inspector Module
+======================
+
+Per-pixel lookups for the canvas hover readout:
+- RGBA of the displayed frame, from a cached NumPy copy of that frame
+- Palette index, from the sheet's index buffer (palette images only)
+
+The frame cache is built on the first lookup that needs it and the index
+buffer is captured from the decoded sheet at load, so hovering at full mouse
+rate is a handful of array reads and never decodes the file. ``SpriteModel``
+drops the frame cache when frames change and everything when a sheet is loaded. The CCL
+sprite under the cursor comes from ``SpriteModel.get_ccl_sprite_index()``.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+__all__ = ["PixelSample"]
+
+
+@dataclass(frozen=True)
+class PixelSample:
+    """What lies under one pixel of the displayed frame."""
+
+    x: int  # Position in the frame
+    y: int
+    rgba: tuple[int, int, int, int]  # Straight (not premultiplied) alpha
+    sheet_point: tuple[int, int] | None = None  # Position in the sprite sheet, if known
+    palette_index: int | None = None  # Sheet color-table index (palette images only)
+    ccl_sprite: int | None = None  # Index into get_ccl_sprite_bounds() (CCL mode only)
+    grid_cell: tuple[int, int] | None = None  # (row, column) of the frame (grid mode only)
+
+    def describe(self) -> str:
+        """One-line summary for the status bar."""
+        parts = [f"RGBA({', '.join(str(channel) for channel in self.rgba)})"]
+        if self.sheet_point is not None:
+            parts.append(f"Sheet ({self.sheet_point[0]}, {self.sheet_point[1]})")
+        if self.palette_index is not None:
+            parts.append(f"Index {self.palette_index}")
+        if self.ccl_sprite is not None:
+            parts.append(f"Sprite {self.ccl_sprite}")
+        if self.grid_cell is not None:
+            parts.append(f"Cell ({self.grid_cell[0]}, {self.grid_cell[1]})")
+        return " | ".join(parts)
+
+
+class _PixelInspector:
+    """Lazily built lookup tables behind ``SpriteModel.inspect_pixel``."""
+
+    def __init__(self):
+        self._frame_key: int | None = None  # QImage.cacheKey() of the cached frame
+        self._frame_pixels: np.ndarray | None = None  # (h, w, 4) RGBA
+        self._palette_indices: np.ndarray | None = None  # (h, w) sheet color-table indices
+
+    def reset_sheet(self, sheet: QImage | None = None) -> None:
+        """Forget everything (a new sheet was loaded); keep sheet's index buffer if it has one."""
+        self.reset_frames()
+        self._palette_indices = _palette_indices(sheet) if sheet is not None else None
+
+    def reset_frames(self) -> None:
+        """Forget the frame view (frames were re-extracted)."""
+        self._frame_key = None
+        self._frame_pixels = None
+
+    def rgba_at(self, frame: QImage, x: int, y: int) -> tuple[int, int, int, int] | None:
+        """Return the RGBA of frame at (x, y), or None outside the frame."""
+        if not (0 <= x < frame.width() and 0 <= y < frame.height()):
+            return None
+        if frame.cacheKey() != self._frame_key:
+            self._frame_pixels = _rgba_pixels(frame)
+            self._frame_key = frame.cacheKey()
+        pixels = self._frame_pixels
+        if pixels is None:
+            return None
+        red, green, blue, alpha = pixels[y, x].tolist()
+        return red, green, blue, alpha
+
+    def palette_index_at(self, x: int, y: int) -> int | None:
+        """Return the sheet's color-table index at (x, y), or None if not a palette image."""
+        indices = self._palette_indices
+        if indices is None or not (0 <= y < indices.shape[0] and 0 <= x < indices.shape[1]):
+            return None
+        return int(indices[y, x])
+
+
+def _rgba_pixels(frame: QImage) -> np.ndarray:
+    """Copy frame into an (h, w, 4) uint8 RGBA array."""
+    image = frame.convertToFormat(QImage.Format.Format_RGBA8888)
+    width, height = image.width(), image.height()
+    buffer = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.sizeInBytes())
+    scanlines = buffer.reshape((height, image.bytesPerLine()))
+    return scanlines[:, : width * 4].reshape((height, width, 4)).copy()
+
+
+def _palette_indices(image: QImage) -> np.ndarray | None:
+    """Copy the decoded sheet's color-table indices, or None if it is not a palette image."""
+    if image.isNull() or image.format() != QImage.Format.Format_Indexed8:
+        return None
+    width, height = image.width(), image.height()
+    buffer = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.sizeInBytes())
+    return buffer.reshape((height, image.bytesPerLine()))[:, :width].copy()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Spatial Index Module
+====================
+
+Uniform-grid index over axis-aligned boxes on the sprite sheet:
+- Built once from an (n, 4) array of (x, y, width, height) boxes
+- Point, rectangle and nearest-box queries return box indices without
+  copying the boxes
+
+Each box is recorded in every grid cell it overlaps, with the cell size
+taken from the typical box size, so a query only looks at the boxes filed
+under the cells it covers. Boxes spanning many cells (a background-sized
+component, say) are kept aside and tested directly instead of being
+written into all of their cells.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+__all__ = ["SpatialIndex"]
+
+# Boxes covering more cells than this are tested on every query instead of being filed
+_LARGE_BOX_CELLS = 64
+# Upper bound on grid cells per indexed box; the cell size grows to respect it
+_CELLS_PER_BOX = 4
+
+
+class SpatialIndex:
+    """Boxes filed under the uniform grid cells they overlap.
+
+    Boxes are half-open: (x, y, w, h) covers x <= px < x + w and
+    y <= py < y + h. Query results are ascending box indices.
+    """
+
+    def __init__(
+        self,
+        boxes: Sequence[tuple[int, int, int, int]] | np.ndarray,
+        cell_size: int | None = None,
+    ):
+        """
+        Args:
+            boxes: (x, y, width, height) per box; the index keeps its own copy
+            cell_size: Grid cell edge in pixels (default: median box edge)
+        """
+        array = np.array(boxes, dtype=np.int64).reshape(-1, 4)
+        array[:, 2:] = np.maximum(array[:, 2:], 1)  # Degenerate boxes still cover a pixel
+        array.setflags(write=False)
+        self._boxes = array
+        self._origin = (0, 0)
+        self._cell = 1
+        self._columns = 0
+        self._rows = 0
+        self._cell_starts = np.zeros(1, dtype=np.int64)  # CSR offsets into _cell_boxes
+        self._cell_boxes = np.zeros(0, dtype=np.int64)
+        self._large_boxes = np.zeros(0, dtype=np.int64)
+        if len(array):
+            self._build(cell_size)
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """Read-only (n, 4) array of the indexed (x, y, width, height) boxes."""
+        return self._boxes
+
+    @property
+    def cell_size(self) -> int:
+        """Edge length of a grid cell in pixels."""
+        return self._cell
+
+    def query_rect(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """Return indices of the boxes that overlap the given rectangle."""
+        if not len(self._boxes) or width <= 0 or height <= 0:
+            return np.zeros(0, dtype=np.int64)
+        candidates = self._candidates(x, y, x + width - 1, y + height - 1)
+        boxes = self._boxes[candidates]
+        overlaps = (
+            (boxes[:, 0] < x + width)
+            & (boxes[:, 0] + boxes[:, 2] > x)
+            & (boxes[:, 1] < y + height)
+            & (boxes[:, 1] + boxes[:, 3] > y)
+        )
+        return candidates[overlaps]
+
+    def query_point(self, x: int, y: int) -> np.ndarray:
+        """Return indices of the boxes containing pixel (x, y)."""
+        return self.query_rect(x, y, 1, 1)
+
+    def nearest(self, x: int, y: int, max_distance: float | None = None) -> int | None:
+        """
+        Return the index of the box closest to pixel (x, y).
+
+        Distance is measured from the pixel to the nearest pixel of each box,
+        so a box containing (x, y) is at distance 0. Ties go to the lower index.
+
+        Args:
+            x: Query x coordinate
+            y: Query y coordinate
+            max_distance: Ignore boxes farther away than this (default: no limit)
+
+        Returns:
+            Box index, or None if the index is empty or no box is close enough
+        """
+        if not len(self._boxes):
+            return None
+        left, top = self._origin
+        right = left + self._columns * self._cell
+        bottom = top + self._rows * self._cell
+        # Any box outside the searched square is farther than its half-width, so
+        # grow the square until the best hit lies within it or it covers everything
+        reach = self._cell
+        while True:
+            candidates = self._candidates(x - reach, y - reach, x + reach, y + reach)
+            best, distance = self._closest(candidates, x, y)
+            covers_all = (
+                x - reach <= left
+                and y - reach <= top
+                and x + reach >= right
+                and y + reach >= bottom
+            )
+            if best is not None and (distance <= reach or covers_all):
+                break
+            if covers_all or (max_distance is not None and reach > max_distance):
+                return None
+            reach *= 2
+        if max_distance is not None and distance > max_distance:
+            return None
+        return best
+
+    def _closest(self, candidates: np.ndarray, x: int, y: int) -> tuple[int | None, float]:
+        """Lowest-index nearest candidate to (x, y) and its distance."""
+        if not len(candidates):
+            return None, float("inf")
+        boxes = self._boxes[candidates]
+        dx = np.maximum(np.maximum(boxes[:, 0] - x, x - (boxes[:, 0] + boxes[:, 2] - 1)), 0)
+        dy = np.maximum(np.maximum(boxes[:, 1] - y, y - (boxes[:, 1] + boxes[:, 3] - 1)), 0)
+        squared = dx * dx + dy * dy
+        position = int(np.argmin(squared))  # Candidates are ascending, so argmin keeps the lowest
+        return int(candidates[position]), float(np.sqrt(squared[position]))
+
+    def _build(self, cell_size: int | None) -> None:
+        boxes = self._boxes
+        left, top = int(boxes[:, 0].min()), int(boxes[:, 1].min())
+        right = int((boxes[:, 0] + boxes[:, 2]).max())
+        bottom = int((boxes[:, 1] + boxes[:, 3]).max())
+        if cell_size is None:
+            cell_size = int(np.median(np.maximum(boxes[:, 2], boxes[:, 3])))
+        # Keep the cell count proportional to the box count for sparse layouts
+        extent = (right - left) * (bottom - top)
+        min_cell = int(np.ceil(np.sqrt(extent / (_CELLS_PER_BOX * len(boxes)))))
+        cell = max(1, cell_size, min_cell)
+
+        self._origin = (left, top)
+        self._cell = cell
+        self._columns = (right - left + cell - 1) // cell
+        self._rows = (bottom - top + cell - 1) // cell
+
+        first_col = (boxes[:, 0] - left) // cell
+        first_row = (boxes[:, 1] - top) // cell
+        span_x = (boxes[:, 0] + boxes[:, 2] - 1 - left) // cell - first_col + 1
+        span_y = (boxes[:, 1] + boxes[:, 3] - 1 - top) // cell - first_row + 1
+        spans = span_x * span_y
+
+        large = spans > _LARGE_BOX_CELLS
+        self._large_boxes = np.flatnonzero(large)
+        filed = np.flatnonzero(~large)
+
+        # Expand each filed box into one (cell, box) entry per cell it covers
+        counts = spans[filed]
+        box_ids = np.repeat(filed, counts)
+        step = np.arange(len(box_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        columns = first_col[box_ids] + step % span_x[box_ids]
+        rows = first_row[box_ids] + step // span_x[box_ids]
+        cell_ids = rows * self._columns + columns
+
+        order = np.argsort(cell_ids, kind="stable")  # Stable keeps box ids ascending per cell
+        self._cell_boxes = box_ids[order]
+        self._cell_starts = np.searchsorted(
+            cell_ids[order], np.arange(self._rows * self._columns + 1)
+        )
+
+    def _candidates(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """Unique indices of boxes filed under cells touching [x0, x1] x [y0, y1]."""
+        left, top = self._origin
+        first_col = max((x0 - left) // self._cell, 0)
+        last_col = min((x1 - left) // self._cell, self._columns - 1)
+        first_row = max((y0 - top) // self._cell, 0)
+        last_row = min((y1 - top) // self._cell, self._rows - 1)
+
+        parts = [self._large_boxes]
+        if first_col <= last_col:
+            starts = self._cell_starts
+            for row in range(first_row, last_row + 1):
+                # A row's cells are contiguous in the CSR layout, so one slice per row
+                begin = starts[row * self._columns + first_col]
+                end = starts[row * self._columns + last_col + 1]
+                parts.append(self._cell_boxes[begin:end])
+        return np.unique(np.concatenate(parts))
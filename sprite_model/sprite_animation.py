@@ -8,9 +8,10 @@ Extracted from monolithic SpriteModel for better separation of concerns and test
 """
 
 from PySide6.QtCore import QObject, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap
 
 from config import Config
+from sprite_model.animation_timeline import AnimationTimeline
 
 __all__: list[str] = []
 
@@ -29,7 +30,7 @@ class _AnimationStateManager(QObject):
     frameChanged = Signal(int, int)  # (current_frame, total_frames)
     playbackStateChanged = Signal(bool)  # is_playing
 
-    def __init__(self, sprite_frames: list[QPixmap]):
+    def __init__(self, sprite_frames: list[QImage]):
         """
         Initialize animation state manager.
 
@@ -44,13 +45,22 @@ class _AnimationStateManager(QObject):
         # Store reference to sprite frames (managed by parent SpriteModel)
         self._sprite_frames = sprite_frames
 
+        # Display conversion of the last requested frame, keyed by QImage.cacheKey()
+        self._display_pixmap: QPixmap | None = None
+        self._display_key: int | None = None
+
         # Animation state
         self._current_frame: int = 0
         self._is_playing: bool = False
         self._loop_enabled: bool = True
-        self._fps: int = Config.Animation.DEFAULT_FPS
+        self._fps: float = Config.Animation.DEFAULT_FPS
+
+        # Optional playback order (e.g. a segment with bounce/holds); None plays
+        # every frame in sequence
+        self._timeline: AnimationTimeline | None = None
+        self._timeline_tick: int = 0
 
-    def _get_frames(self) -> list[QPixmap]:
+    def _get_frames(self) -> list[QImage]:
         """Observation-only access to the underlying sprite frames list.
 
         AnimationStateManager holds a long-lived reference to the parent
@@ -69,11 +79,48 @@ class _AnimationStateManager(QObject):
 
         Note: The actual frame count is computed dynamically via the total_frames
         property. This method just ensures the current frame stays in bounds.
+        Any timeline is dropped, since it indexes the frames that were replaced.
         """
+        self._timeline = None
         if self._current_frame >= total_frames:
             self._current_frame = 0
             self.frameChanged.emit(self._current_frame, self.total_frames)
 
+    # ============================================================================
+    # TIMELINE
+    # ============================================================================
+
+    def set_timeline(self, timeline: AnimationTimeline | None) -> bool:
+        """
+        Play frames in the order of timeline instead of in sequence.
+
+        Playback restarts at the timeline's first tick. Pass None to return to
+        sequential playback of every frame.
+
+        Args:
+            timeline: Compiled timeline whose frames all exist, or None
+
+        Returns:
+            True if the timeline was applied, False if it is empty or refers
+            to frames that do not exist
+        """
+        if timeline is None:
+            self._timeline = None
+            return True
+        if not len(timeline) or timeline.last_frame >= self.total_frames:
+            return False
+
+        self._timeline = timeline
+        self._timeline_tick = 0
+        self._current_frame = timeline.frame_at(0)
+        self.frameChanged.emit(self._current_frame, self.total_frames)
+        return True
+
+    def _sync_timeline_tick(self) -> None:
+        """Re-align the timeline position after manual navigation."""
+        if self._timeline is not None:
+            self._timeline_tick = self._timeline.first_tick_of(self._current_frame)
+
     # ============================================================================
     # FRAME NAVIGATION
     # ============================================================================
@@ -94,6 +141,7 @@ class _AnimationStateManager(QObject):
 
         if 0 <= frame < len(frames):
             self._current_frame = frame
+            self._sync_timeline_tick()
             self.frameChanged.emit(self._current_frame, self.total_frames)
             return True
         return False
@@ -102,6 +150,19 @@ class _AnimationStateManager(QObject):
         """
         Advance to next frame, handling looping.
 
+        Returns:
+            Tuple of (new_frame_index, should_continue_playing)
+        """
+        return self.advance_frames(1)
+
+    def advance_frames(self, count: int) -> tuple[int, bool]:
+        """
+        Advance count frames at once, handling looping.
+
+        Used by playback to skip frames it fell behind on; frameChanged is
+        emitted once for the final frame. With a timeline set, count is in
+        timeline ticks, so held frames stay on screen for their duration.
+
         Returns:
             Tuple of (new_frame_index, should_continue_playing)
         """
@@ -109,12 +170,15 @@ class _AnimationStateManager(QObject):
         if not frames:
             return 0, False
 
+        if self._timeline is not None:
+            return self._advance_timeline(self._timeline, count)
+
         # Core animation advancement logic
-        self._current_frame += 1
+        self._current_frame += count
 
         if self._current_frame >= len(frames):
             if self._loop_enabled:
-                self._current_frame = 0
+                self._current_frame %= len(frames)
                 should_continue = True
             else:
                 self._current_frame = len(frames) - 1
@@ -127,6 +191,21 @@ class _AnimationStateManager(QObject):
 
         return self._current_frame, should_continue
 
+    def _advance_timeline(self, timeline: AnimationTimeline, count: int) -> tuple[int, bool]:
+        """advance_frames along the active timeline."""
+        self._timeline_tick += count
+        should_continue = True
+        if self._timeline_tick >= timeline.tick_count:
+            if self._loop_enabled:
+                self._timeline_tick %= timeline.tick_count
+            else:
+                self._timeline_tick = timeline.tick_count - 1
+                should_continue = False
+
+        self._current_frame = timeline.frame_at(self._timeline_tick)
+        self.frameChanged.emit(self._current_frame, self.total_frames)
+        return self._current_frame, should_continue
+
     def previous_frame(self) -> int:
         """
         Go to previous frame with bounds checking.
@@ -137,6 +216,7 @@ class _AnimationStateManager(QObject):
         frames = self._get_frames()
         if frames and self._current_frame > 0:
             self._current_frame -= 1
+            self._sync_timeline_tick()
             self.frameChanged.emit(self._current_frame, self.total_frames)
         return self._current_frame
 
@@ -150,6 +230,7 @@ class _AnimationStateManager(QObject):
         frames = self._get_frames()
         if frames:
             self._current_frame = 0
+            self._sync_timeline_tick()
             self.frameChanged.emit(self._current_frame, self.total_frames)
         return self._current_frame
 
@@ -163,6 +244,7 @@ class _AnimationStateManager(QObject):
         frames = self._get_frames()
         if frames:
             self._current_frame = len(frames) - 1
+            self._sync_timeline_tick()
             self.frameChanged.emit(self._current_frame, self.total_frames)
         return self._current_frame
 
@@ -191,11 +273,12 @@ class _AnimationStateManager(QObject):
         self.playbackStateChanged.emit(False)
 
     def stop(self) -> None:
-        """Stop animation and reset to first frame."""
+        """Stop animation and reset to first frame (of the timeline, if set)."""
         self._is_playing = False
         frames = self._get_frames()
         if frames:
-            self._current_frame = 0
+            self._timeline_tick = 0
+            self._current_frame = self._timeline.frame_at(0) if self._timeline is not None else 0
             self.frameChanged.emit(self._current_frame, self.total_frames)
         self.playbackStateChanged.emit(False)
 
@@ -216,12 +299,12 @@ class _AnimationStateManager(QObject):
     # ANIMATION SETTINGS
     # ============================================================================
 
-    def set_fps(self, fps: int) -> bool:
+    def set_fps(self, fps: float) -> bool:
         """
         Set animation speed with validation.
 
         Args:
-            fps: Frames per second (must be within valid range)
+            fps: Frames per second, fractional rates allowed (must be within valid range)
 
         Returns:
             True if FPS was set successfully, False otherwise
@@ -271,22 +354,35 @@ class _AnimationStateManager(QObject):
         return self._loop_enabled
 
     @property
-    def fps(self) -> int:
+    def fps(self) -> float:
         """Get current FPS setting."""
         return self._fps
 
+    @property
+    def timeline(self) -> AnimationTimeline | None:
+        """Get the active playback timeline (None for sequential playback)."""
+        return self._timeline
+
     @property
     def current_frame_pixmap(self) -> QPixmap | None:
         """
         Get the currently selected frame as QPixmap.
 
+        Frames are stored as QImage; the display conversion of the most
+        recently requested frame is reused until that frame changes.
+
         Returns:
             Current frame pixmap, or None if no frames available
         """
         frames = self._get_frames()
-        if 0 <= self._current_frame < len(frames):
-            return frames[self._current_frame]
-        return None
+        if not 0 <= self._current_frame < len(frames):
+            return None
+        frame = frames[self._current_frame]
+        key = frame.cacheKey()
+        if self._display_pixmap is None or self._display_key != key:
+            self._display_pixmap = QPixmap.fromImage(frame)
+            self._display_key = key
+        return self._display_pixmap
 
     # ============================================================================
     # UTILITY METHODS
@@ -298,3 +394,5 @@ class _AnimationStateManager(QObject):
         self._is_playing = False
         self._loop_enabled = True
         self._fps = Config.Animation.DEFAULT_FPS
+        self._timeline = None
+        self._timeline_tick = 0
@@ -21,7 +21,8 @@ from PySide6.QtCore import QRect
 from PySide6.QtGui import QImage, QPixmap
 
 from sprite_model.extraction_mode import ExtractionMode
-from sprite_model.sprite_extraction import CCLDetectionResult
+from sprite_model.spatial_index import SpatialIndex
+from sprite_model.sprite_extraction import CCLDetectionResult, as_image
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,10 @@ class _CCLOperations:
         self._ccl_sprite_bounds: list[
             tuple[int, int, int, int]
         ] = []  # (x, y, w, h) for each sprite
+        self._ccl_frame_bounds: tuple[
+            tuple[int, int, int, int], ...
+        ] = ()  # Sheet box of each extracted frame, in frame order
+        self._ccl_sprite_index: SpatialIndex | None = None  # Built on first query per CCL run
         self._ccl_background_color: tuple[int, int, int] | None = (
             None  # RGB background color for transparency
         )
@@ -57,12 +62,12 @@ class _CCLOperations:
         sprite_sheet_path: str,
         detect_sprites_ccl_enhanced: Callable[[str], CCLDetectionResult | None],
         detect_background_color: Callable[[str], tuple[tuple[int, int, int], int] | None],
-    ) -> tuple[bool, str, int, list[QPixmap]]:
+    ) -> tuple[bool, str, int, list[QImage]]:
         """
         Extract frames using CCL-detected sprite boundaries (for irregular sprite collections).
 
         Args:
-            sprite_sheet: The original sprite sheet QPixmap
+            sprite_sheet: The original sprite sheet QPixmap (converted to QImage once)
             sprite_sheet_path: Path to the sprite sheet file
             detect_sprites_ccl_enhanced: Function to detect sprites using CCL
             detect_background_color: Function to detect background color
@@ -95,6 +100,7 @@ class _CCLOperations:
                     # Store CCL sprite boundaries
                     if ccl_result.ccl_sprite_bounds:
                         self._ccl_sprite_bounds = ccl_result.ccl_sprite_bounds
+                        self._ccl_sprite_index = None
 
                         # Store background color info if available
                         bg_color_info = detect_background_color(sprite_sheet_path)
@@ -123,12 +129,14 @@ class _CCLOperations:
 
         try:
             # Extract individual sprites using exact CCL boundaries
-            sprite_frames = []
+            sprite_frames: list[QImage] = []
+            frame_bounds: list[tuple[int, int, int, int]] = []
             filtered_count = 0
             null_frame_count = 0
 
-            sheet_width = sprite_sheet.width()
-            sheet_height = sprite_sheet.height()
+            sheet_image = as_image(sprite_sheet)
+            sheet_width = sheet_image.width()
+            sheet_height = sheet_image.height()
             logger.debug("CCL sheet dimensions: %dx%d", sheet_width, sheet_height)
             logger.debug("CCL processing %d detected sprite bounds", len(self._ccl_sprite_bounds))
 
@@ -136,7 +144,7 @@ class _CCLOperations:
                 # Ensure bounds are within sheet dimensions
                 if x >= 0 and y >= 0 and x + width <= sheet_width and y + height <= sheet_height:
                     frame_rect = QRect(x, y, width, height)
-                    frame = sprite_sheet.copy(frame_rect)
+                    frame = sheet_image.copy(frame_rect)
 
                     if not frame.isNull():
                         # Apply background color transparency if available
@@ -146,6 +154,7 @@ class _CCLOperations:
                             )
 
                         sprite_frames.append(frame)
+                        frame_bounds.append((x, y, width, height))
                     else:
                         null_frame_count += 1
                         if null_frame_count <= 5:  # Only log first few
@@ -183,6 +192,7 @@ class _CCLOperations:
             if null_frame_count > 0:
                 logger.debug("CCL had %d null sprite frames", null_frame_count)
 
+            self._ccl_frame_bounds = tuple(frame_bounds)
             return True, "", len(sprite_frames), sprite_frames
 
         except Exception as e:
@@ -203,31 +213,41 @@ class _CCLOperations:
         """Get the CCL-detected sprite boundaries."""
         return self._ccl_sprite_bounds.copy()
 
+    def get_ccl_sprite_index(self) -> SpatialIndex:
+        """Get a spatial index over the CCL sprite boundaries (index i is sprite i)."""
+        if self._ccl_sprite_index is None:
+            self._ccl_sprite_index = SpatialIndex(self._ccl_sprite_bounds)
+        return self._ccl_sprite_index
+
+    def get_ccl_frame_bounds(self) -> tuple[tuple[int, int, int, int], ...]:
+        """Get the sheet box of each frame from the last CCL extraction, in frame order."""
+        return self._ccl_frame_bounds
+
     def clear_ccl_data(self) -> None:
         """Clear all CCL-related data and reset to defaults."""
         self._ccl_sprite_bounds.clear()
+        self._ccl_frame_bounds = ()
+        self._ccl_sprite_index = None
         self._ccl_background_color = None
         self._ccl_color_tolerance = 10
         self._extraction_mode = ExtractionMode.GRID
 
     def _apply_background_transparency(
-        self, pixmap: QPixmap, background_color: tuple[int, int, int], tolerance: int
-    ) -> QPixmap:
+        self, frame: QImage | QPixmap, background_color: tuple[int, int, int], tolerance: int
+    ) -> QImage:
         """
-        Apply background color transparency to a QPixmap.
+        Apply background color transparency to a frame.
 
         Args:
-            pixmap: Source QPixmap to process
+            frame: Source QImage (or QPixmap) to process
             background_color: RGB background color to make transparent
             tolerance: Color matching tolerance (0-255)
 
         Returns:
-            QPixmap with background transparency applied
+            QImage with background transparency applied
         """
+        image = as_image(frame)
         try:
-            # Convert QPixmap to QImage for pixel manipulation
-            image = pixmap.toImage()
-
             # Convert to ARGB format for transparency support
             if image.format() != QImage.Format.Format_ARGB32:
                 image = image.convertToFormat(QImage.Format.Format_ARGB32)
@@ -247,9 +267,8 @@ class _CCLOperations:
             background_mask = np.all(color_delta <= tolerance, axis=2)
             pixels[background_mask] = 0
 
-            # Convert back to QPixmap
-            return QPixmap.fromImage(image)
+            return image
 
         except Exception as e:
             logger.warning("Failed to apply background transparency: %s", e)
-            return pixmap  # Return original if processing fails
+            return as_image(frame)  # Return original if processing fails
@@ -18,7 +18,7 @@ from typing import NamedTuple, cast
 import numpy as np
 from PIL import Image
 from PySide6.QtCore import QRect
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap
 from scipy import ndimage
 
 from config import Config
@@ -29,6 +29,7 @@ __all__ = [
     "CCLDetectionResult",
     "GridConfig",
     "GridLayout",
+    "as_image",
     "detect_background_color",
     "detect_sprites_ccl_enhanced",
     "extract_grid_frames",
@@ -103,13 +104,16 @@ class GridLayout(NamedTuple):
 
 
 def extract_grid_frames(
-    sprite_sheet: QPixmap, config: GridConfig
-) -> tuple[bool, str, list[QPixmap], int]:
+    sprite_sheet: QPixmap | QImage, config: GridConfig
+) -> tuple[bool, str, list[QImage], int]:
     """
     Extract frames from sprite sheet using grid-based extraction.
 
+    Frames are returned as QImage so they can be handed to export worker
+    threads as-is; the sheet is converted once rather than per frame.
+
     Args:
-        sprite_sheet: Source sprite sheet pixmap
+        sprite_sheet: Source sprite sheet pixmap or image
         config: Grid configuration (frame size, offsets, spacing)
 
     Returns:
@@ -125,8 +129,9 @@ def extract_grid_frames(
         return False, error_msg, [], 0
 
     try:
-        sheet_width = sprite_sheet.width()
-        sheet_height = sprite_sheet.height()
+        sheet_image = as_image(sprite_sheet)
+        sheet_width = sheet_image.width()
+        sheet_height = sheet_image.height()
 
         # Calculate available area after margins
         available_width = sheet_width - config.offset_x
@@ -136,7 +141,7 @@ def extract_grid_frames(
         layout = _calculate_grid_layout(available_width, available_height, config)
 
         # Extract individual frames with spacing, tracking skipped frames
-        frames = []
+        frames: list[QImage] = []
         skipped_count = 0
         for row in range(layout.frames_per_col):
             for col in range(layout.frames_per_row):
@@ -146,7 +151,7 @@ def extract_grid_frames(
                 # Ensure we don't exceed sheet boundaries
                 if x + config.width <= sheet_width and y + config.height <= sheet_height:
                     frame_rect = QRect(x, y, config.width, config.height)
-                    frame = sprite_sheet.copy(frame_rect)
+                    frame = sheet_image.copy(frame_rect)
 
                     if not frame.isNull():
                         frames.append(frame)
@@ -162,7 +167,14 @@ def extract_grid_frames(
         return False, f"Error extracting frames: {e!s}", [], 0
 
 
-def validate_frame_settings(sprite_sheet: QPixmap, config: GridConfig) -> tuple[bool, str]:
+def as_image(source: QPixmap | QImage) -> QImage:
+    """Return a sheet or frame as a QImage, converting QPixmap sources."""
+    if isinstance(source, QImage):
+        return source
+    return source.toImage()
+
+
+def validate_frame_settings(sprite_sheet: QPixmap | QImage, config: GridConfig) -> tuple[bool, str]:
     """
     Validate frame extraction parameters including offsets and spacing.
 
@@ -10,7 +10,7 @@ Consolidated from file_operations/ subpackage.
 import os
 from pathlib import Path
 
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap
 
 from config import Config
 
@@ -119,18 +119,32 @@ class _FileLoader:
             - pixmap: Loaded QPixmap or None if failed
             - error_message: Error description if failed, empty string if succeeded
         """
+        success, image, message = self.load_sprite_sheet_image(file_path)
+        if image is None:
+            return success, None, message
+        return success, QPixmap.fromImage(image), message
+
+    def load_sprite_sheet_image(self, file_path: str) -> tuple[bool, QImage | None, str]:
+        """
+        Load and validate sprite sheet from file path as a QImage.
+
+        Unlike a QPixmap, the image may be handed to worker threads.
+
+        Returns:
+            Tuple of (success, image, error_message), as for ``load_sprite_sheet``
+        """
         try:
             # Validate file path first
             is_valid, validation_error = self.validator.validate_file_path(file_path)
             if not is_valid:
                 return False, None, validation_error
 
-            # Load pixmap from file
-            pixmap = QPixmap(file_path)
-            if pixmap.isNull():
+            # Load image from file
+            image = QImage(file_path)
+            if image.isNull():
                 return False, None, "Failed to load image file"
 
-            return True, pixmap, ""
+            return True, image, ""
 
         except OSError as e:
             return False, None, f"Error loading sprite sheet: {e!s}"
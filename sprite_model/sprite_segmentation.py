@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Sprite Segmentation Module
+==========================
+
+Automatic animation segmentation for extracted frames:
+- Frame-to-frame difference metrics (one batched NumPy pass)
+- Blank-frame detection (fully transparent or a single flat color)
+- Segment proposals split at blank frames, grid row breaks and animation
+  cycle closures
+
+Proposals are plain (start_frame, end_frame) ranges; naming, coloring and
+committing them is left to the caller.
+"""
+
+import logging
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtGui import QImage, QPixmap
+
+from config import Config
+from sprite_model.sprite_extraction import as_image
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["FrameMetrics", "compute_frame_metrics", "propose_segments"]
+
+
+@dataclass(frozen=True)
+class FrameMetrics:
+    """Similarity measurements for a frame sequence."""
+
+    differences: np.ndarray  # (n - 1,) change from frame i to i + 1, in 0..1
+    blank: np.ndarray  # (n,) True where the frame is one flat color
+    samples: np.ndarray  # (n, h, w, 4) subsampled premultiplied pixels
+    coverage: np.ndarray  # (n, h, w) True where a sample differs from the frame background
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames measured."""
+        return len(self.blank)
+
+    def distances_from(self, frame: int, others: slice) -> np.ndarray:
+        """Return the difference between frame and each frame in others."""
+        return _difference(
+            self.samples[frame], self.samples[others], self.coverage[frame], self.coverage[others]
+        )
+
+
+def compute_frame_metrics(
+    frames: Sequence[QImage | QPixmap], blank: np.ndarray | None = None
+) -> FrameMetrics:
+    """
+    Measure how much each frame differs from the next and which frames are blank.
+
+    Frames are subsampled to at most ``Config.Detection.SEGMENT_SAMPLE_SIZE``
+    pixels per side and stacked, so all consecutive differences come from a
+    single vectorized subtraction. A difference is the mean absolute channel
+    change over the pixels either frame covers, so a small sprite on a large
+    transparent cell scores the same as a large one.
+
+    Blank detection uses full-resolution pixels, so a sprite smaller than the
+    sample step is never mistaken for an empty frame. Pass the blank column
+    of ``SpriteModel.frame_metadata`` to skip that full-resolution check.
+
+    Args:
+        frames: Extracted frames, in playback order
+        blank: Precomputed per-frame blank flags (measured if None)
+
+    Returns:
+        FrameMetrics for the sequence
+    """
+    samples, coverage, measured_blank = _sample_frames(
+        frames, Config.Detection.SEGMENT_SAMPLE_SIZE, check_blank=blank is None
+    )
+    if blank is None:
+        blank = measured_blank
+    differences = _difference(samples[1:], samples[:-1], coverage[1:], coverage[:-1])
+    return FrameMetrics(differences=differences, blank=blank, samples=samples, coverage=coverage)
+
+
+def propose_segments(
+    frames: Sequence[QImage | QPixmap],
+    frames_per_row: int | None = None,
+    metrics: FrameMetrics | None = None,
+    blank: np.ndarray | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Propose animation segment boundaries for a frame sequence.
+
+    Blank frames separate segments and are never part of one. A new segment
+    also starts at every grid row break when frames_per_row is known. Each
+    remaining run is then split into animation cycles wherever it returns to
+    its first pose after moving away from it.
+
+    Args:
+        frames: Extracted frames, in playback order
+        frames_per_row: Columns of the source grid, or None if unknown
+        metrics: Precomputed metrics for frames (computed if None)
+        blank: Precomputed blank flags, used when computing metrics
+
+    Returns:
+        Sorted, non-overlapping (start_frame, end_frame) ranges
+    """
+    started = time.perf_counter()
+    if metrics is None:
+        metrics = compute_frame_metrics(frames, blank)
+
+    count = metrics.frame_count
+    row_starts = np.zeros(count, dtype=bool)
+    if frames_per_row and frames_per_row > 0:
+        row_starts[::frames_per_row] = True
+
+    runs: list[tuple[int, int]] = []
+    run_start: int | None = None
+    for index in range(count):
+        if metrics.blank[index]:
+            if run_start is not None:
+                runs.append((run_start, index - 1))
+                run_start = None
+        elif run_start is None:
+            run_start = index
+        elif row_starts[index]:
+            runs.append((run_start, index - 1))
+            run_start = index
+    if run_start is not None:
+        runs.append((run_start, count - 1))
+
+    proposals = [cycle for first, last in runs for cycle in _split_cycles(metrics, first, last)]
+    logger.debug(
+        "Proposed %d segments for %d frames in %.1f ms",
+        len(proposals),
+        count,
+        (time.perf_counter() - started) * 1000,
+    )
+    return proposals
+
+
+def _sample_frames(
+    frames: Sequence[QImage | QPixmap], size: int, check_blank: bool = True
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (samples, coverage, blank) for frames; see compute_frame_metrics."""
+    count = len(frames)
+    blank = np.ones(count, dtype=bool)
+    views: list[np.ndarray | None] = []
+    images: list[QImage] = []  # Keep pixel buffers alive while views reference them
+
+    for index, frame in enumerate(frames):
+        image = as_image(frame)
+        if image.isNull():
+            views.append(None)
+            continue
+        # Premultiplied so fully transparent pixels compare equal whatever their RGB
+        image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        images.append(image)
+        width, height = image.width(), image.height()
+        words_per_line = image.bytesPerLine() // 4
+        words = np.frombuffer(
+            image.constBits(), dtype=np.uint32, count=height * words_per_line
+        ).reshape(height, words_per_line)[:, :width]
+        if check_blank:
+            blank[index] = bool((words == words[0, 0]).all())
+        step = max(1, math.ceil(max(width, height) / size))
+        views.append(words[::step, ::step])
+
+    shapes = [view.shape for view in views if view is not None]
+    height = max((shape[0] for shape in shapes), default=0)
+    width = max((shape[1] for shape in shapes), default=0)
+    # Frames of different sizes (CCL extraction) are compared top-left aligned
+    stacked = np.zeros((count, height, width), dtype=np.uint32)
+    for index, view in enumerate(views):
+        if view is not None:
+            stacked[index, : view.shape[0], : view.shape[1]] = view
+
+    # The top-left pixel stands in for the background (transparent or sheet color)
+    background = stacked[:, :1, :1] if height and width else np.zeros((count, 1, 1), np.uint32)
+    coverage = stacked != background
+    samples = stacked.view(np.uint8).reshape(count, height, width, 4)
+    return samples, coverage, blank
+
+
+def _difference(
+    first: np.ndarray, second: np.ndarray, first_coverage: np.ndarray, second_coverage: np.ndarray
+) -> np.ndarray:
+    """Mean absolute channel change over the pixels either side covers, in 0..1.
+
+    Arguments broadcast, so one frame can be compared against a stack.
+    """
+    change = np.abs(first.astype(np.int16) - second.astype(np.int16)).sum(axis=(-3, -2, -1))
+    covered = (first_coverage | second_coverage).sum(axis=(-2, -1))
+    return change / (255.0 * 4 * np.maximum(covered, 1))
+
+
+def _split_cycles(metrics: FrameMetrics, first: int, last: int) -> list[tuple[int, int]]:
+    """Split frames first..last wherever the animation returns to its first pose."""
+    min_length = Config.Detection.SEGMENT_MIN_CYCLE_LENGTH
+    threshold = Config.Detection.SEGMENT_LOOP_THRESHOLD
+    if last - first + 1 < 2 * min_length:
+        return [(first, last)]
+
+    # distance[frame - first - 1] is how far frame is from the run's first pose
+    distance = metrics.distances_from(first, slice(first + 1, last + 1))
+
+    cycles: list[tuple[int, int]] = []
+    cycle_start = first
+    for closure in (first + 1 + np.flatnonzero(distance < threshold)).tolist():
+        if closure - cycle_start < min_length:
+            continue
+        if last - closure + 1 < min_length:
+            break  # A trailing repeat of the first pose closes the last cycle
+        # A held pose is not a cycle: some frame in between has to move
+        if metrics.differences[cycle_start : closure - 1].max() < threshold:
+            continue
+        cycles.append((cycle_start, closure - 1))
+        cycle_start = closure
+    cycles.append((cycle_start, last))
+    return cycles
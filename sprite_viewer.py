@@ -14,6 +14,7 @@ from PySide6.QtGui import (
     QDragEnterEvent,
     QDragLeaveEvent,
     QDropEvent,
+    QImage,
     QKeyEvent,
     QKeySequence,
     QPixmap,
@@ -33,7 +34,12 @@ from PySide6.QtWidgets import (
 )
 
 from config import Config
-from coordinators import SignalCoordinator, SpriteLoadCoordinator, SpriteLoadDependencies
+from coordinators import (
+    FrameUpdateCoalescer,
+    SignalCoordinator,
+    SpriteLoadCoordinator,
+    SpriteLoadDependencies,
+)
 from core import (
     AnimationController,
     AnimationSegmentController,
@@ -49,15 +55,18 @@ from managers import (
 )
 from sprite_model import SpriteModel
 from sprite_model.extraction_mode import ExtractionMode
+from sprite_model.frame_metadata import FrameMetadata
 from ui import (
     AnimationGridView,
     EnhancedStatusBar,
     FrameExtractor,
     PlaybackControls,
+    SheetOverview,
     SpriteCanvas,
 )
 from ui.animation_segment_preview import AnimationSegmentPreview
 from utils.styles import StyleManager
+from utils.thumbnail_cache import shared_thumbnail_cache
 
 __all__ = ["SpriteViewer", "main"]
 
@@ -125,6 +134,7 @@ _SHORTCUTS = {
     "view_zoom_fit": ("Ctrl+0", "Fit to window"),
     "view_zoom_reset": ("Ctrl+1", "Reset zoom (100%)"),
     "view_toggle_grid": ("G", "Toggle grid overlay"),
+    "view_pixel_inspector": ("I", "Toggle pixel inspector"),
     # Animation actions
     "animation_toggle": ("Space", "Play/Pause animation"),
     "animation_prev_frame": ("Left", "Previous frame"),
@@ -326,6 +336,11 @@ class SpriteViewer(QMainWindow):
 
     def _init_signal_coordinator(self):
         """Create signal coordinator and connect all signals."""
+        self._frame_updates = FrameUpdateCoalescer(
+            refresh_canvas=self._refresh_canvas_frame,
+            refresh_controls=self._refresh_frame_controls,
+            parent=self,
+        )
         self._signal_coordinator = SignalCoordinator(
             sprite_model=self._sprite_model,
             animation_controller=self._animation_controller,
@@ -377,6 +392,9 @@ class SpriteViewer(QMainWindow):
         self._create_action("view_zoom_fit", "🔍⇄ Fit to Window", None)
         self._create_action("view_zoom_reset", "🔍1:1 Reset Zoom", None)
         self._create_action("view_toggle_grid", "Toggle Grid", self._toggle_grid)
+        self._create_action("view_pixel_inspector", "Pixel Inspector", None)
+        self._actions["view_pixel_inspector"].setCheckable(True)
+        self._actions["view_pixel_inspector"].toggled.connect(self._set_pixel_inspector)
 
         # Animation actions (some callbacks connected later)
         self._create_action("animation_toggle", "Play/Pause", None, requires_frames=True)
@@ -474,6 +492,7 @@ class SpriteViewer(QMainWindow):
         view_menu.addAction(self._actions["view_zoom_reset"])
         view_menu.addSeparator()
         view_menu.addAction(self._actions["view_toggle_grid"])
+        view_menu.addAction(self._actions["view_pixel_inspector"])
 
         # Help menu
         help_menu = menubar.addMenu("Help")
@@ -533,6 +552,10 @@ class SpriteViewer(QMainWindow):
         grid_tab = self._create_grid_tab()
         self._tab_widget.addTab(grid_tab, "Animation Splitting")
 
+        # Sheet overview tab (index must match Config.App.TAB_INDEX_SHEET_OVERVIEW)
+        self._sheet_overview = SheetOverview()
+        self._tab_widget.addTab(self._sheet_overview, "Sheet Overview")
+
         # Info label at bottom
         self._info_label = QLabel(Config.App.WELCOME_MESSAGE)
         self._info_label.setWordWrap(True)
@@ -680,6 +703,20 @@ class SpriteViewer(QMainWindow):
         self._grid_enabled = not self._grid_enabled
         self._canvas.set_grid_overlay(self._grid_enabled)
 
+    def _set_pixel_inspector(self, enabled: bool):
+        """Show what lies under the mouse (RGBA, palette index, sprite or cell)."""
+        if enabled:
+            self._canvas.mouseMoved.connect(self._inspect_pixel)
+            self._status_bar.update_pixel_info("Pixel: -")
+        else:
+            self._canvas.mouseMoved.disconnect(self._inspect_pixel)
+            self._status_bar.update_pixel_info(None)
+
+    def _inspect_pixel(self, x: int, y: int):
+        """Update the pixel inspector readout for sprite coordinates (x, y)."""
+        sample = self._sprite_model.inspect_pixel(x, y)
+        self._status_bar.update_pixel_info(sample.describe() if sample else "Pixel: -")
+
     def _on_zoom_changed(self, zoom_factor: float):
         """Handle zoom change from canvas."""
         percentage = int(zoom_factor * 100)
@@ -718,12 +755,16 @@ class SpriteViewer(QMainWindow):
     # ============================================================================
 
     def _on_frame_changed(self, frame_index: int, total_frames: int):
-        """Handle frame change."""
-        # Update canvas frame info
+        """Handle frame change (refreshes are coalesced during playback)."""
+        self._frame_updates.frame_changed(frame_index, total_frames)
+
+    def _refresh_canvas_frame(self, frame_index: int, total_frames: int):
+        """Show the current frame and its frame info on the canvas."""
         self._canvas.set_frame_info(frame_index, total_frames)
         self._push_current_frame_to_canvas()
 
-        # Update playback controls
+    def _refresh_frame_controls(self, frame_index: int, total_frames: int):
+        """Sync the frame slider and navigation buttons with the current frame."""
         self._playback_controls.set_current_frame(frame_index)
 
         # Update button states based on current position
@@ -737,15 +778,20 @@ class SpriteViewer(QMainWindow):
     def _on_sprite_loaded(self, file_path: str):
         """Sprite loaded — handler wired by SignalCoordinator (delegated)."""
         self._load_coordinator.on_sprite_loaded(file_path)
+        self._sheet_overview.set_sheet(
+            self._sprite_model.original_sprite_sheet, self._sprite_model.take_loaded_sheet_image()
+        )
 
     def _on_playback_started(self):
         """Handle playback start."""
+        self._frame_updates.set_playing(True)
         # Disable nav buttons during active playback. at_start=True/at_end=True disables
-        # both prev and next; _on_frame_changed will update to accurate position each tick.
+        # both prev and next; _refresh_frame_controls will update to accurate position each tick.
         self._playback_controls.update_button_states(has_frames=True, at_start=True, at_end=True)
 
     def _on_playback_paused(self):
         """Handle playback pause."""
+        self._frame_updates.set_playing(False)
         # Compute actual position so prev/next are correctly enabled after pausing.
         frame_count = self._sprite_model.frame_count
         current = self._sprite_model.current_frame
@@ -757,6 +803,7 @@ class SpriteViewer(QMainWindow):
 
     def _on_playback_ended(self):
         """Handle playback stop and completion."""
+        self._frame_updates.set_playing(False)
         self._playback_controls.update_button_states(has_frames=True, at_start=True, at_end=False)
 
     def _on_animation_error(self, error_message: str):
@@ -779,6 +826,11 @@ class SpriteViewer(QMainWindow):
     def _on_extraction_completed(self, frame_count: int):
         """Extraction completed — handler wired by SignalCoordinator (delegated)."""
         self._load_coordinator.on_extraction_completed(frame_count)
+        model = self._sprite_model
+        if model.get_extraction_mode() is ExtractionMode.CCL:
+            self._sheet_overview.set_regions(model.get_ccl_sprite_index())
+        else:
+            self._sheet_overview.set_regions(model.sheet_regions())
 
     def _on_frame_settings_detected(self, width: int, height: int):
         """Frame settings detected — handler wired by SignalCoordinator (delegated)."""
@@ -859,6 +911,7 @@ class SpriteViewer(QMainWindow):
                 "view_zoom_fit",
                 "view_zoom_reset",
                 "view_toggle_grid",
+                "view_pixel_inspector",
             ],
             "Animation": [
                 "animation_toggle",
@@ -980,7 +1033,11 @@ class SpriteViewer(QMainWindow):
 
     def _on_export_frames_requested(self) -> None:
         """Show export dialog for exporting all frames and animation segments."""
-        self._show_export_dialog(self._sprite_model.sprite_frames, self._sprite_model.current_frame)
+        self._show_export_dialog(
+            self._sprite_model.sprite_frames,
+            self._sprite_model.current_frame,
+            self._sprite_model.frame_metadata,
+        )
 
     def _on_export_current_frame_requested(self) -> None:
         """Export only the current frame."""
@@ -988,10 +1045,17 @@ class SpriteViewer(QMainWindow):
         frames = self._sprite_model.sprite_frames
         if not frames or current_idx >= len(frames):
             return
-        self._show_export_dialog([frames[current_idx]], 0)
+        self._show_export_dialog(
+            [frames[current_idx]], 0, self._sprite_model.frame_metadata.select([current_idx])
+        )
 
-    def _show_export_dialog(self, sprites: Sequence[QPixmap], current_frame: int) -> None:
-        """Show export dialog with the given sprites."""
+    def _show_export_dialog(
+        self,
+        sprites: Sequence[QImage | QPixmap],
+        current_frame: int,
+        frame_metadata: FrameMetadata | None = None,
+    ) -> None:
+        """Show export dialog with the given sprites and their metadata rows."""
         if not self._export_coordinator.validate_export():
             return
         dialog = ExportDialog(
@@ -1001,6 +1065,7 @@ class SpriteViewer(QMainWindow):
             sprites=sprites,
             segment_manager=self._segment_manager,
             settings_manager=self._settings_manager,
+            frame_metadata=frame_metadata,
         )
         dialog.exportRequested.connect(self._export_coordinator.handle_export_request)
         dialog.exec()
@@ -1014,6 +1079,10 @@ class SpriteViewer(QMainWindow):
         if getattr(self, "_segment_preview", None):
             self._segment_preview.clear_segments()
 
+        # Cancel sheet overview tile generation so its pool does not hold up exit
+        if getattr(self, "_sheet_overview", None):
+            self._sheet_overview.clear()
+
         # Clean up signal coordinator
         if getattr(self, "_signal_coordinator", None):
             self._signal_coordinator.disconnect_all()
@@ -1022,6 +1091,13 @@ class SpriteViewer(QMainWindow):
         if getattr(self, "_animation_controller", None):
             self._animation_controller.shutdown()
 
+        # Write debounced segment edits before the process exits
+        if getattr(self, "_segment_manager", None):
+            self._segment_manager.flush_pending_saves()
+
+        # Persist thumbnail last-used times and release the cache database
+        shared_thumbnail_cache().close()
+
         # Force settings sync to ensure all pending changes are saved
         self._settings_manager.sync()
 
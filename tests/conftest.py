@@ -67,6 +67,19 @@ def _isolate_qsettings(tmp_path_factory) -> Generator[None, None, None]:
     yield
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_thumbnail_cache(tmp_path_factory) -> Generator[None, None, None]:
+    """Point the shared thumbnail cache at a session-local database."""
+    import utils.thumbnail_cache as thumbnail_cache
+
+    cache_dir = tmp_path_factory.mktemp("thumbnails")
+    cache = thumbnail_cache.ThumbnailCache(cache_dir / "thumbnails.sqlite")
+    thumbnail_cache._shared_instance = cache
+    yield
+    thumbnail_cache._shared_instance = None
+    cache.close()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def _qt_message_handler() -> Generator[list[str], None, None]:
     """Fail tests on Qt critical/fatal messages and on cross-thread/object warnings."""
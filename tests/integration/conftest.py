@@ -20,10 +20,10 @@ def _reset_singletons():
 
     inst = _fe_mod._exporter_instance
     if inst is not None:
-        worker = inst._worker
-        if worker is not None and worker.isRunning():
-            worker.cancel()
-            if not worker.wait(2000):
+        inst.cancel_export()
+        for job in list(inst._running.values()):
+            worker = job.worker
+            if worker is not None and worker.isRunning() and not worker.wait(2000):
                 raise AssertionError(
                     "ExportWorker did not finish within 2s during teardown — "
                     "test left a real thread running"
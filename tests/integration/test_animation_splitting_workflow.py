@@ -10,7 +10,7 @@ import pytest
 # Mark all tests as slow integration tests - they create full SpriteViewer windows
 pytestmark = [pytest.mark.integration, pytest.mark.slow]
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtGui import QColor, QImage, QPixmap
 from PySide6.QtWidgets import QApplication, QTabWidget
 
 from managers import AnimationSegment
@@ -96,10 +96,7 @@ class TestAnimationSplittingWorkflow:
 
         # Create first segment (Walk cycle)
         # Select frames using the grid's selection methods
-        for i in [0, 1, 2, 3]:
-            if i < len(animation_grid._thumbnails):
-                animation_grid._thumbnails[i]._is_selected = True
-                animation_grid._selected_frames.add(i)
+        animation_grid._selected_frames.update([0, 1, 2, 3])
 
         # Create segment directly (bypass dialog)
         walk_segment = AnimationSegment("Walk", 0, 3, color_rgb=(233, 30, 99))
@@ -113,10 +110,7 @@ class TestAnimationSplittingWorkflow:
         animation_grid._clear_selection()
 
         # Select frames for attack segment
-        for i in [4, 5, 6, 7]:
-            if i < len(animation_grid._thumbnails):
-                animation_grid._thumbnails[i]._is_selected = True
-                animation_grid._selected_frames.add(i)
+        animation_grid._selected_frames.update([4, 5, 6, 7])
 
         # Create segment directly
         attack_segment = AnimationSegment("Attack", 4, 7, color_rgb=(76, 175, 80))
@@ -248,15 +242,19 @@ class TestAnimationSplittingWorkflow:
         segment = AnimationSegment("Visual_Test", 2, 5, color_rgb=(156, 39, 176))
         animation_grid.sync_segments_with_manager(_mock_manager(segment))
 
-        # Check that thumbnails have segment markers
+        # Check that frame cells carry segment markers
+        model = animation_grid._frame_model
         for i in range(2, 6):  # Frames 2-5
-            thumbnail = animation_grid._thumbnails[i]
-            assert thumbnail._segment_color is not None
+            marker = model.segment_marker(i)
+            assert marker is not None
+            assert marker.color.isValid()
 
             if i == 2:  # Start frame
-                assert thumbnail._is_segment_start
+                assert marker.is_start
             elif i == 5:  # End frame
-                assert thumbnail._is_segment_end
+                assert marker.is_end
+        assert model.segment_marker(1) is None
+        assert model.segment_marker(6) is None
 
     def test_noncontiguous_selection_warning(self, qtbot):
         """Test warning dialog for non-contiguous frame selections."""
@@ -382,7 +380,7 @@ class TestAnimationSplittingPerformance:
         animation_grid.set_frames(test_frames)
 
         assert len(animation_grid._frames) == large_frame_count
-        assert len(animation_grid._thumbnails) == large_frame_count
+        assert animation_grid._frame_model.rowCount() == large_frame_count
 
         # Test selection on large dataset
         animation_grid._selected_frames.update(range(50))  # Select first 50 frames
@@ -548,7 +546,7 @@ class TestRealAnimationSplittingIntegration:
         frames = viewer._sprite_model.sprite_frames
         assert len(frames) == 8
         for frame in frames:
-            assert isinstance(frame, QPixmap)
+            assert isinstance(frame, QImage)
             assert frame.width() == 32
             assert frame.height() == 32
             assert not frame.isNull()
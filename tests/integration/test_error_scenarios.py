@@ -127,10 +127,10 @@ class TestInvalidDataHandling:
             )
             assert controller._current_fps > 0, "FPS should remain positive"
 
-        # Test that valid floats are converted to int
+        # Test that valid fractional rates are kept as given
         result = controller.set_fps(24.7)
         assert result is True, "Valid float should be accepted"
-        assert controller._current_fps == 24, "Float should be converted to int"
+        assert controller._current_fps == 24.7, "Fractional FPS should be preserved"
 
     def test_segment_manager_invalid_segments(self):
         """Test segment manager with invalid segment data."""
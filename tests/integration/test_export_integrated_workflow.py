@@ -46,6 +46,7 @@ class TestIntegratedExportWorkflow:
         # Wait for any pending updates to process
         if hasattr(settings_step, "_preview_timer") and settings_step._preview_timer.isActive():
             qtbot.waitUntil(lambda: not settings_step._preview_timer.isActive(), timeout=timeout)
+        qtbot.waitUntil(lambda: not settings_step._preview.is_rendering, timeout=timeout)
         QApplication.processEvents()
 
     @pytest.mark.integration
@@ -55,6 +55,9 @@ class TestSegmentPersistence:
         segments = viewer1._segment_manager.get_all_segments()
         assert len(segments) == 2
 
+        # Auto-save is debounced; flush it before inspecting the file
+        viewer1._segment_manager.flush_pending_saves()
+
         # Check segments file was created (new format: {stem}_{ext}_segments.json)
         segments_dir = sprite_path.parent / ".sprite_segments"
         ext = sprite_path.suffix.lstrip(".")
@@ -112,7 +115,8 @@ class TestSegmentPersistence:
         manager1.add_segment("Attack", 0, 4)
         manager1.add_segment("Defend", 5, 9)
 
-        # Verify save
+        # Verify save (auto-save is debounced, so flush it first)
+        manager1.flush_pending_saves()
         segments_file = Path(manager1._get_segments_file_path())
         assert segments_file.exists()
 
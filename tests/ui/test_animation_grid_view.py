@@ -6,207 +6,328 @@ Tests the multi-frame selection behavior that was recently fixed.
 from unittest.mock import patch
 
 from PySide6.QtCore import QPoint, Qt
-from PySide6.QtGui import QColor, QMouseEvent, QPixmap
+from PySide6.QtGui import QColor, QImage, QPixmap
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QAbstractItemView
 
 from managers import AnimationSegment
-from ui.animation_grid_view import AnimationGridView, _FrameThumbnail
-
-
-class TestFrameThumbnail:
-    """Test FrameThumbnail component functionality."""
-
-    def test_thumbnail_creation(self, qtbot):
-        """Test basic thumbnail creation and setup."""
+from ui.animation_grid_view import (
+    _DUPLICATE_ROLE,
+    _SELECTED_ROLE,
+    AnimationGridView,
+    _FrameListModel,
+    _FrameListView,
+    _FrameThumbnailDelegate,
+    _SegmentMarker,
+)
+from utils.styles import StyleManager
+from utils.thumbnail_cache import ThumbnailCache, shared_thumbnail_cache
+
+
+def _frame_list_view(qtbot, count: int = 8, columns: int = 4) -> _FrameListView:
+    """Build a shown list view over ``count`` solid frames."""
+    cell_size = 80 + 8
+    model = _FrameListModel(80)
+    frames = []
+    for _ in range(count):
         pixmap = QPixmap(32, 32)
-        thumbnail = _FrameThumbnail(5, pixmap)
-        qtbot.addWidget(thumbnail)
+        pixmap.fill(QColor("red"))
+        frames.append(pixmap)
+    model.set_frames(frames)
+    view = _FrameListView(cell_size, columns)
+    view.setModel(model)
+    view.setItemDelegate(_FrameThumbnailDelegate(cell_size, view))
+    qtbot.addWidget(view)
+    view.resize(400, 300)
+    view.show()
+    qtbot.waitExposed(view)
+    return view
+
+
+def _cell_center(view: _FrameListView, row: int) -> QPoint:
+    return view.visualRect(view.model().index(row, 0)).center()
+
+
+class TestFrameListView:
+    """Test the virtualized frame list view, model and delegate."""
+
+    def test_list_view_creation(self, qtbot):
+        """Test basic list view setup."""
+        view = _frame_list_view(qtbot)
+
+        assert view.model().rowCount() == 8
+        assert view.uniformItemSizes()
+        assert view.selectionMode() == QAbstractItemView.SelectionMode.NoSelection
+        assert view._drag_threshold == 8  # Fixed value (was 3)
+
+    def test_columns_fill_viewport_width(self, qtbot):
+        """Frames wrap after the configured number of columns."""
+        view = _frame_list_view(qtbot, count=8, columns=4)
+
+        row_tops = {view.visualRect(view.model().index(i, 0)).top() for i in range(8)}
+        assert len(row_tops) == 2
+
+        view.set_columns(2)
+        row_tops = {view.visualRect(view.model().index(i, 0)).top() for i in range(8)}
+        assert len(row_tops) == 4
+
+    def test_model_selection_and_marker_roles(self, qtbot):
+        """Test selection and segment state served through model roles."""
+        view = _frame_list_view(qtbot)
+        model = view.model()
+        assert isinstance(model, _FrameListModel)
+
+        model.set_selection({1, 2})
+        model.set_segments([AnimationSegment("Walk", 3, 5, color_rgb=(0, 0, 255))])
+
+        assert model.data(model.index(1), _SELECTED_ROLE)
+        assert not model.data(model.index(0), _SELECTED_ROLE)
+        assert model.segment_at(4) == "Walk"
+        assert model.segment_marker(3) == _SegmentMarker(QColor(0, 0, 255), is_start=True)
+        assert model.segment_marker(4) == _SegmentMarker(QColor(0, 0, 255))
+        assert model.segment_marker(5) == _SegmentMarker(QColor(0, 0, 255), is_end=True)
+        assert model.segment_marker(6) is None
+        assert model.data(model.index(5), Qt.ItemDataRole.ToolTipRole) == "Frame 5"
+
+    def test_segment_edits_only_notify_affected_rows(self, qtbot):
+        """Editing one segment repaints its own rows, not the whole grid."""
+        model = _FrameListModel(80)
+        model.set_frames([QPixmap(8, 8) for _ in range(5000)])
+        walk = AnimationSegment("Walk", 10, 19)
+        idle = AnimationSegment("Idle", 4000, 4099)
+        model.set_segments([walk, idle])
+
+        changed: list[tuple[int, int]] = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: changed.append((top.row(), bottom.row()))
+        )
+        model.set_segments([AnimationSegment("Walk", 10, 24), idle])
 
-        assert thumbnail.frame_index == 5
-        assert thumbnail._thumbnail_size == 80  # Default size
-        assert not thumbnail._selected
-        assert thumbnail._drag_threshold == 8  # Fixed value (was 3)
+        assert changed == [(10, 24)]
 
-    def test_selection_state_management(self, qtbot):
-        """Test selection state changes."""
-        pixmap = QPixmap(32, 32)
-        thumbnail = _FrameThumbnail(0, pixmap)
-        qtbot.addWidget(thumbnail)
+        changed.clear()
+        model.set_segments([AnimationSegment("Walk", 10, 24), idle])
+        assert changed == []
+
+    def test_selection_changes_only_notify_flipped_rows(self, qtbot):
+        """Selection repaints are limited to rows whose state flipped."""
+        model = _FrameListModel(80)
+        model.set_frames([QPixmap(8, 8) for _ in range(100)])
+        model.set_selection({1, 2, 3})
 
-        # Test initial state
-        assert not thumbnail._selected
+        changed: list[tuple[int, int]] = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: changed.append((top.row(), bottom.row()))
+        )
+        model.set_selection({2, 3, 4, 5, 50})
 
-        # Test selection
-        thumbnail.set_selected(True)
-        assert thumbnail._selected
+        assert changed == [(1, 1), (4, 5), (50, 50)]
 
-        # Test deselection
-        thumbnail.set_selected(False)
-        assert not thumbnail._selected
+    def test_shared_frames_are_marked_as_duplicates(self, qtbot):
+        """Rows sharing an earlier row's image report it through the duplicate role."""
+        walk, idle = (
+            QImage(8, 8, QImage.Format.Format_ARGB32),
+            QImage(8, 8, QImage.Format.Format_ARGB32),
+        )
+        walk.fill(QColor("red"))
+        idle.fill(QColor("blue"))
+        model = _FrameListModel(80)
+        model.set_frames([walk, idle, walk, idle, walk])
+
+        assert [model.data(model.index(row), _DUPLICATE_ROLE) for row in range(5)] == [
+            None,
+            None,
+            0,
+            1,
+            0,
+        ]
+        assert model.data(model.index(3), Qt.ItemDataRole.ToolTipRole) == (
+            "Frame 3 (duplicate of frame 1)"
+        )
 
-    def test_keyboard_modifier_conversion(self, qtbot):
+    def test_duplicate_badge_is_painted(self, qtbot):
+        """The delegate paints duplicate rows without errors."""
+        view = _frame_list_view(qtbot, count=2)
+        frame = QImage(32, 32, QImage.Format.Format_ARGB32)
+        frame.fill(QColor("red"))
+        view.model().set_frames([frame, frame])
+
+        assert not view.viewport().grab().isNull()
+
+    def test_thumbnails_are_generated_on_demand(self, qtbot):
+        """Only painted rows request thumbnails; tiles arrive asynchronously."""
+        model = _FrameListModel(80)
+        model.set_frames([QPixmap(32, 32) for _ in range(3000)])
+
+        assert model.rowCount() == 3000
+        assert not model._thumbnails
+        assert not model._pending
+
+        changed: list[int] = []
+        model.dataChanged.connect(lambda top, bottom, roles: changed.append(top.row()))
+        assert model.data(model.index(10), Qt.ItemDataRole.DecorationRole) is None
+
+        qtbot.waitUntil(lambda: 10 in model._thumbnails, timeout=2000)
+        assert changed[0] == 10
+        thumbnail = model.data(model.index(10), Qt.ItemDataRole.DecorationRole)
+        assert isinstance(thumbnail, QPixmap)
+        assert thumbnail.width() == 64  # 32px frame replicated 2x into a 76px box
+        # Background fill stays bounded instead of queueing every frame
+        assert len(model._pending) <= _FrameListModel._PREFETCH_DEPTH
+        model.set_frames([])
+
+    def test_thumbnails_are_stored_in_shared_cache(self, qtbot):
+        """Generated tiles land in the persistent cache the segment previews also use."""
+        frame = QImage(20, 20, QImage.Format.Format_ARGB32)
+        frame.fill(QColor("teal"))
+        model = _FrameListModel(80)
+        model.set_frames([frame])
+
+        model.data(model.index(0), Qt.ItemDataRole.DecorationRole)
+        qtbot.waitUntil(lambda: 0 in model._thumbnails, timeout=2000)
+
+        key = ThumbnailCache.frame_key(frame, 76, 76)
+        assert shared_thumbnail_cache().get(key) is not None
+
+    def test_stale_thumbnails_are_dropped(self, qtbot):
+        """Results requested for a previous frame list never reach the new one."""
+        model = _FrameListModel(80)
+        model.set_frames([QPixmap(32, 32) for _ in range(4)])
+        stale_generation = model._loader._generation
+        model.set_frames([QPixmap(16, 16) for _ in range(4)])
+
+        model._loader._on_finished(stale_generation, 0, QImage(64, 64, QImage.Format.Format_ARGB32))
+
+        assert not model._thumbnails
+
+    def test_delegate_paints_selection_highlight(self, qtbot):
+        """Selected cells are filled with the selection background."""
+        view = _frame_list_view(qtbot)
+        model = view.model()
+        assert isinstance(model, _FrameListModel)
+        rect = view.visualRect(model.index(0))
+        probe = QPoint(rect.center().x(), rect.top() + 8)  # inside border, above thumbnail
+
+        before = view.viewport().grab().toImage().pixelColor(probe)
+        model.set_selection({0})
+        after = view.viewport().grab().toImage().pixelColor(probe)
+
+        assert before != after
+        assert after == QColor(StyleManager.Colors.SUCCESS_LIGHT)
+
+    def test_keyboard_modifier_conversion(self, qtbot, real_event_helpers):
         """Test safe keyboard modifier conversion across PySide6 versions."""
-        pixmap = QPixmap(32, 32)
-        thumbnail = _FrameThumbnail(0, pixmap)
-        qtbot.addWidget(thumbnail)
+        view = _frame_list_view(qtbot)
 
         signal_received = []
-        thumbnail.clicked.connect(lambda idx, mods: signal_received.append((idx, mods)))
-
-        # Test the modifier conversion logic directly by simulating the actual event handling
-        # Create a real QMouseEvent (this tests the actual PySide6 behavior)
-        from PySide6.QtCore import QPointF
-
-        pos = QPointF(10, 10)
-        event = QMouseEvent(
-            QMouseEvent.Type.MouseButtonPress,
-            pos,
-            pos,
-            pos,
-            Qt.LeftButton,
-            Qt.LeftButton,
-            Qt.ControlModifier,  # Include Ctrl modifier
-        )
+        view.frameClicked.connect(lambda idx, mods: signal_received.append((idx, mods)))
 
-        # This should work with the actual modifier conversion logic
-        thumbnail.mousePressEvent(event)
+        pos = _cell_center(view, 0)
+        event = real_event_helpers.create_mouse_press(
+            pos.x(), pos.y(), Qt.LeftButton, Qt.ControlModifier
+        )
+        view.mousePressEvent(event)
 
         assert len(signal_received) == 1
         assert signal_received[0][0] == 0  # frame_index
         # Should have extracted the Ctrl modifier correctly
         assert signal_received[0][1] != 0  # Should not be empty
 
-    def test_drag_threshold_behavior_real_events(self, qtbot, real_event_helpers):
-        """Test drag detection threshold with REAL Qt events (key fix - was 3, now 8 pixels)."""
-        pixmap = QPixmap(32, 32)
-        thumbnail = _FrameThumbnail(0, pixmap)
-        qtbot.addWidget(thumbnail)
-
-        drag_signals = []
-        thumbnail.dragStarted.connect(lambda idx: drag_signals.append(idx))
-
-        # Test 1: Movement UNDER threshold (should NOT trigger drag)
-        # Create real mouse press event
-        press_event = real_event_helpers.create_mouse_press(10, 10, Qt.LeftButton)
-        thumbnail.mousePressEvent(press_event)
+    def test_click_outside_frames_is_ignored(self, qtbot, real_event_helpers):
+        """Clicks on empty viewport space do not select anything."""
+        view = _frame_list_view(qtbot, count=2)
 
-        # Create real mouse move event - under 8 pixel threshold
-        move_event_small = real_event_helpers.create_mouse_move(13, 13, Qt.LeftButton)
-        thumbnail.mouseMoveEvent(move_event_small)
-
-        # Calculate distance: |13-10| + |13-10| = 6 pixels (< 8 threshold)
-        distance = real_event_helpers.calculate_manhattan_distance(QPoint(10, 10), QPoint(13, 13))
-        assert distance == 6  # Verify our calculation
-        assert len(drag_signals) == 0  # Should NOT trigger drag
-
-        # Test 2: Movement OVER threshold (SHOULD trigger drag)
-        drag_signals.clear()
-
-        # Reset for new test
-        press_event = real_event_helpers.create_mouse_press(10, 10, Qt.LeftButton)
-        thumbnail.mousePressEvent(press_event)
-
-        # Create real mouse move event - over 8 pixel threshold
-        move_event_large = real_event_helpers.create_mouse_move(19, 19, Qt.LeftButton)
-        thumbnail.mouseMoveEvent(move_event_large)
-
-        # Calculate distance: |19-10| + |19-10| = 18 pixels (> 8 threshold)
-        distance = real_event_helpers.calculate_manhattan_distance(QPoint(10, 10), QPoint(19, 19))
-        assert distance == 18  # Verify our calculation
-        assert len(drag_signals) == 1  # SHOULD trigger drag
-        assert drag_signals[0] == 0  # Correct frame_index
+        signal_received = []
+        view.frameClicked.connect(lambda idx, mods: signal_received.append(idx))
+        view.mousePressEvent(real_event_helpers.create_mouse_press(390, 290))
 
-        # Test 3: Edge case - exactly at threshold boundary
-        drag_signals.clear()
+        assert signal_received == []
 
-        press_event = real_event_helpers.create_mouse_press(10, 10, Qt.LeftButton)
-        thumbnail.mousePressEvent(press_event)
+    def test_drag_threshold_behavior_real_events(self, qtbot, real_event_helpers):
+        """Test drag detection threshold with REAL Qt events (8 pixels)."""
+        view = _frame_list_view(qtbot)
+        start = _cell_center(view, 0)
+        x, y = start.x(), start.y()
 
-        # Move exactly 8 pixels (should trigger since > threshold)
-        move_event_boundary = real_event_helpers.create_mouse_move(14, 14, Qt.LeftButton)
-        thumbnail.mouseMoveEvent(move_event_boundary)
+        drag_signals = []
+        view.dragStarted.connect(lambda idx: drag_signals.append(idx))
 
-        # Distance: |14-10| + |14-10| = 8 pixels (= threshold, should NOT trigger)
-        distance = real_event_helpers.calculate_manhattan_distance(QPoint(10, 10), QPoint(14, 14))
-        assert distance == 8
-        assert len(drag_signals) == 0  # Should not trigger at exactly threshold
+        def press_and_move(dx: int, dy: int) -> None:
+            view.mousePressEvent(real_event_helpers.create_mouse_press(x, y, Qt.LeftButton))
+            view.mouseMoveEvent(real_event_helpers.create_mouse_move(x + dx, y + dy, Qt.LeftButton))
 
-        # Test 4: Boundary + 1 (should trigger)
-        drag_signals.clear()
+        # Movement under threshold (6 pixels) should NOT trigger drag
+        press_and_move(3, 3)
+        assert drag_signals == []
 
-        press_event = real_event_helpers.create_mouse_press(10, 10, Qt.LeftButton)
-        thumbnail.mousePressEvent(press_event)
+        # Exactly at threshold (8 pixels) should NOT trigger drag
+        press_and_move(4, 4)
+        assert drag_signals == []
 
-        # Move 9 pixels (should trigger since > 8 threshold)
-        move_event_over = real_event_helpers.create_mouse_move(14, 15, Qt.LeftButton)
-        thumbnail.mouseMoveEvent(move_event_over)
+        # Boundary + 1 (9 pixels) should trigger
+        press_and_move(4, 5)
+        assert drag_signals == [0]
 
-        distance = real_event_helpers.calculate_manhattan_distance(QPoint(10, 10), QPoint(14, 15))
-        assert distance == 9
-        assert len(drag_signals) == 1  # Should trigger
+        # Over threshold after a fresh press triggers again
+        press_and_move(9, 9)
+        assert drag_signals == [0, 0]
 
     def test_real_click_behavior_with_modifiers(
         self, qtbot, real_event_helpers, real_signal_tester
     ):
         """Test real mouse click behavior with keyboard modifiers using real Qt events."""
-        pixmap = QPixmap(32, 32)
-        thumbnail = _FrameThumbnail(2, pixmap)
-        qtbot.addWidget(thumbnail)
+        view = _frame_list_view(qtbot)
 
-        # Test 1: Normal click (no modifiers)
-        click_spy = real_signal_tester.connect_spy(thumbnail.clicked, "thumbnail_clicked")
+        real_signal_tester.connect_spy(view.frameClicked, "frame_clicked")
+        real_event_helpers.simulate_real_click(view.viewport(), _cell_center(view, 2), qtbot)
 
-        real_event_helpers.simulate_real_click(thumbnail, QPoint(16, 16), qtbot)
-
-        # Verify real signal emission
-        assert real_signal_tester.verify_emission("thumbnail_clicked", count=1)
-        args = real_signal_tester.get_signal_args("thumbnail_clicked", 0)
-        assert len(args) >= 1  # Should have at least frame_index
+        assert real_signal_tester.verify_emission("frame_clicked", count=1)
+        args = real_signal_tester.get_signal_args("frame_clicked", 0)
         assert args[0] == 2  # frame_index
 
-        # Test 2: Ctrl+click on separate thumbnail
-        pixmap2 = QPixmap(32, 32)
-        thumbnail2 = _FrameThumbnail(3, pixmap2)
-        qtbot.addWidget(thumbnail2)
-
-        ctrl_click_spy = real_signal_tester.connect_spy(thumbnail2.clicked, "ctrl_clicked")
-
-        ctrl_event = real_event_helpers.create_mouse_press(
-            16, 16, Qt.LeftButton, Qt.ControlModifier
+        real_signal_tester.connect_spy(view.frameClicked, "ctrl_clicked")
+        real_event_helpers.simulate_real_click(
+            view.viewport(), _cell_center(view, 3), qtbot, modifiers=Qt.ControlModifier
         )
-        thumbnail2.mousePressEvent(ctrl_event)
 
         assert real_signal_tester.verify_emission("ctrl_clicked", count=1)
         ctrl_args = real_signal_tester.get_signal_args("ctrl_clicked", 0)
-        assert len(ctrl_args) >= 1
         assert ctrl_args[0] == 3  # frame_index
-        if len(ctrl_args) > 1:
-            assert ctrl_args[1] != 0  # Should have Ctrl modifier
+        assert ctrl_args[1] != 0  # Should have Ctrl modifier
 
-    def test_real_drag_sequence_complete(self, qtbot, real_event_helpers, real_signal_tester):
+    def test_real_drag_sequence_complete(self, qtbot, real_signal_tester):
         """Test complete drag sequence with real Qt events."""
-        pixmap = QPixmap(32, 32)
-        thumbnail = _FrameThumbnail(4, pixmap)
-        qtbot.addWidget(thumbnail)
-
-        # Connect real signal spies
-        drag_spy = real_signal_tester.connect_spy(thumbnail.dragStarted, "drag_started")
+        view = _frame_list_view(qtbot)
+        viewport = view.viewport()
 
-        # Simulate complete real drag sequence
-        start_pos = QPoint(10, 10)
-        end_pos = QPoint(25, 25)  # 30 pixel Manhattan distance > 8 threshold
+        real_signal_tester.connect_spy(view.dragStarted, "drag_started")
+        moved: list[int] = []
+        finished: list[bool] = []
+        view.dragMoved.connect(moved.append)
+        view.dragFinished.connect(lambda: finished.append(True))
 
-        real_event_helpers.simulate_real_drag(thumbnail, start_pos, end_pos, qtbot)
+        qtbot.mousePress(viewport, Qt.LeftButton, Qt.NoModifier, _cell_center(view, 0))
+        QTest.mouseMove(viewport, _cell_center(view, 2))
+        qtbot.mouseRelease(viewport, Qt.LeftButton, Qt.NoModifier, _cell_center(view, 2))
 
-        # Verify drag signal was emitted
         assert real_signal_tester.verify_emission("drag_started", count=1, timeout=500)
-        args = real_signal_tester.get_signal_args("drag_started", 0)
-        assert len(args) == 1
-        assert args[0] == 4  # frame_index
+        assert real_signal_tester.get_signal_args("drag_started", 0)[0] == 0
+        assert moved[-1] == 2
+        assert finished == [True]
 
 
 class TestRealImageIntegration:
     """Test AnimationGridView with real image data instead of mock pixmaps."""
 
+    def test_grid_repopulates_before_frames_are_set(self, qtbot):
+        """A fresh grid can be populated before set_frames supplies any digests."""
+        grid_view = AnimationGridView()
+        qtbot.addWidget(grid_view)
+
+        grid_view._populate_grid()
+
+        assert grid_view._frame_model.rowCount() == 0
+
     def test_grid_with_real_sprite_frames(self, qtbot, real_image_factory):
         """Test grid view with real animated sprite frames."""
         grid_view = AnimationGridView()
@@ -222,7 +343,7 @@ class TestRealImageIntegration:
 
         # Verify real frames are loaded
         assert len(grid_view._frames) == 8
-        assert len(grid_view._thumbnails) == 8
+        assert grid_view._frame_model.rowCount() == 8
 
         # Verify frames are real QPixmap objects
         for frame in grid_view._frames:
@@ -330,7 +451,7 @@ class TestAnimationGridView:
         grid_view.set_frames(test_frames)
 
         assert len(grid_view._frames) == 6
-        assert len(grid_view._thumbnails) == 6
+        assert grid_view._frame_model.rowCount() == 6
 
     def test_set_frames_clears_stale_selection(self, qtbot):
         """Replacing frame data should not keep selection from the previous frame list."""
@@ -409,6 +530,22 @@ class TestAnimationGridView:
         expected_frames = {1, 3, 4, 5, 8}  # Pre-drag {1,3,8} + drag range {3,4,5}
         assert grid_view._selected_frames == expected_frames
 
+    def test_drag_signals_drive_selection(self, qtbot):
+        """List-view drag signals extend the selection and end the drag on release."""
+        grid_view = AnimationGridView()
+        qtbot.addWidget(grid_view)
+        grid_view.set_frames([QPixmap(32, 32) for _ in range(10)])
+
+        list_view = grid_view._list_view
+        list_view.dragStarted.emit(2)
+        list_view.dragMoved.emit(5)
+        list_view.dragFinished.emit()
+
+        assert grid_view._selected_frames == {2, 3, 4, 5}
+        assert not grid_view._is_dragging
+        assert all(grid_view._frame_model.is_selected(i) for i in range(2, 6))
+        assert grid_view._create_segment_btn.isEnabled()
+
     def test_segment_creation(self, qtbot):
         """Test creating animation segments from selection."""
         grid_view = AnimationGridView()
@@ -514,6 +651,14 @@ class TestSelectionUIInteraction:
 
         assert "frames 2-4" in grid_view._create_segment_btn.text()
 
+    def test_auto_segment_button_emits_request(self, qtbot):
+        """The Auto-Segment button asks the controller to propose segments."""
+        grid_view = AnimationGridView()
+        qtbot.addWidget(grid_view)
+
+        with qtbot.waitSignal(grid_view.autoSegmentRequested, timeout=1000):
+            grid_view._auto_segment_btn.click()
+
     def test_clear_selection_cleanup(self, qtbot):
         """Test selection clearing cleans up all state properly."""
         grid_view = AnimationGridView()
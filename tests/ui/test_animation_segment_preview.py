@@ -3,12 +3,17 @@ Tests for Animation Segment Preview Widget
 Tests the visual preview panel for animation segments with individual playback controls.
 """
 
+import threading
+from unittest.mock import patch
+
 import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QPixmap
 from PySide6.QtWidgets import QSpinBox
 
+from core.playback_clock import PlaybackClock
 from ui.animation_segment_preview import AnimationSegmentPreview, _SegmentPreviewItem
+from utils.thumbnail_cache import ThumbnailCache
 
 
 class TestSegmentPreviewItem:
@@ -47,7 +52,7 @@ class TestSegmentPreviewItem:
         assert fps_spinner.maximum() == 60
 
     def test_fps_spinner_functionality(self, qtbot):
-        """Test FPS spinner changes timer interval."""
+        """Test FPS spinner changes the preview's playback clock rate."""
         frames = [QPixmap(32, 32) for _ in range(3)]
         item = _SegmentPreviewItem("Test", QColor(0, 0, 255), frames)
         qtbot.addWidget(item)
@@ -55,16 +60,16 @@ class TestSegmentPreviewItem:
         # Test FPS change
         item.fps_spinner.setValue(30)
         assert item._fps == 30
-        assert item._timer.interval() == 1000 // 30  # ~33ms
+        assert item._clock.fps == 30
 
         # Test edge cases
         item.fps_spinner.setValue(1)
         assert item._fps == 1
-        assert item._timer.interval() == 1000  # 1000ms
+        assert item._clock.fps == 1
 
         item.fps_spinner.setValue(60)
         assert item._fps == 60
-        assert item._timer.interval() == 1000 // 60  # ~16ms
+        assert item._clock.fps == 60
 
     def test_play_pause_toggle(self, qtbot):
         """Test play/pause button functionality."""
@@ -124,6 +129,119 @@ class TestSegmentPreviewItem:
         assert item._current_frame == 0
         assert item.frame_counter.text() == "1 / 3"
 
+    def test_playing_previews_share_one_ticker(self, qtbot):
+        """Playing previews subscribe to the shared ticker instead of owning timers."""
+        frames = [QPixmap(16, 16) for _ in range(3)]
+        items = [_SegmentPreviewItem(f"S{i}", QColor(0, 0, 255), frames) for i in range(3)]
+        for item in items:
+            qtbot.addWidget(item)
+            item.show()
+        ticker = items[0]._ticker
+        baseline = ticker.subscriber_count
+
+        for item in items:
+            item.set_playing(True)
+        assert ticker.subscriber_count == baseline + 3
+        assert ticker.is_running
+
+        # A pass before the next frame boundary advances nothing
+        ticker._on_tick()
+        assert all(item._current_frame == 0 for item in items)
+
+        for item in items:
+            item.stop_playback()
+        assert ticker.subscriber_count == baseline
+
+    def test_hidden_preview_suspends_and_resumes_in_position(self, qtbot):
+        """Hidden or scrolled-away previews stop waking and catch up on return."""
+        frames = [QPixmap(16, 16) for _ in range(4)]
+        item = _SegmentPreviewItem("Test", QColor(0, 0, 255), frames)
+        qtbot.addWidget(item)
+        now = [0.0]
+        item._clock = PlaybackClock(10, now=lambda: now[0])
+        ticker = item._ticker
+        baseline = ticker.subscriber_count
+
+        item.show()
+        item.set_playing(True)
+        assert ticker.subscriber_count == baseline + 1
+
+        item.hide()
+        assert item.is_suspended
+        assert ticker.subscriber_count == baseline
+        now[0] = 0.25  # Two frames fall due while hidden
+        assert item._current_frame == 0
+
+        item.show()
+        assert not item.is_suspended
+        assert item._current_frame == 2
+
+        item.set_in_viewport(False)
+        assert item.is_suspended
+        assert ticker.subscriber_count == baseline
+        item.stop_playback()
+
+    def test_bounce_and_holds_follow_the_timeline(self, qtbot):
+        """Bounce and hold settings shape the frame order via the compiled timeline."""
+        frames = [QPixmap(16, 16) for _ in range(3)]
+        item = _SegmentPreviewItem(
+            "Test", QColor(128, 128, 128), frames, bounce_mode=True, frame_holds={2: 1}
+        )
+        qtbot.addWidget(item)
+
+        visited = []
+        for _ in range(6):
+            item._update_frame()
+            visited.append(item._current_frame)
+        assert visited == [1, 2, 2, 1, 0, 1]
+
+        # Toggling bounce off keeps the shown frame and continues forward
+        item.bounce_checkbox.setChecked(False)
+        item._update_frame()
+        assert item._current_frame == 2
+
+    def test_display_pixmaps_are_requested_once_per_zoom(self, qtbot):
+        """Steady-state playback reuses pixmaps until the zoom changes."""
+        frames = [QPixmap(16, 16) for _ in range(3)]
+        for frame in frames:
+            frame.fill(QColor("red"))
+        item = _SegmentPreviewItem("Test", QColor(128, 128, 128), frames)
+        qtbot.addWidget(item)
+        qtbot.waitUntil(lambda: len(item._display_pixmaps) == 3, timeout=5000)
+
+        width_before = item.preview_label.pixmap().width()
+
+        with patch.object(item._thumbnails, "request", wraps=item._thumbnails.request) as request:
+            for _ in range(9):
+                item._update_frame()
+            request.assert_not_called()
+
+            item.set_zoom_factor(1.5)
+            assert request.call_count == 3  # Every frame again at the new size
+            assert request.call_args_list[0].args[0] == item._current_frame  # Shown frame first
+
+        qtbot.waitUntil(lambda: len(item._display_pixmaps) == 3, timeout=5000)
+        assert item.preview_label.pixmap().width() > width_before
+
+    def test_thumbnails_come_from_the_shared_cache_off_the_gui_thread(self, qtbot):
+        """Preview frames are looked up in the persistent cache by a worker, not the GUI thread."""
+        frames = [QPixmap(16, 16) for _ in range(2)]
+        threads = []
+        original = ThumbnailCache.thumbnail
+
+        def record_thread(cache, image, width, height):
+            threads.append(threading.current_thread())
+            return original(cache, image, width, height)
+
+        with patch.object(ThumbnailCache, "thumbnail", autospec=True, side_effect=record_thread):
+            item = _SegmentPreviewItem("Test", QColor(128, 128, 128), frames)
+            qtbot.addWidget(item)
+            qtbot.waitUntil(lambda: len(item._display_pixmaps) == 2, timeout=5000)
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+        assert not item.preview_label.pixmap().isNull()
+
     def test_remove_button_signal(self, qtbot):
         """Test remove button emits correct signal."""
         frames = [QPixmap(32, 32) for _ in range(2)]
@@ -310,6 +428,32 @@ class TestAnimationSegmentPreview:
         assert len(remove_spy) == 1
         assert remove_spy[0] == ["TestSeg"]
 
+    def test_previews_outside_scroll_viewport_are_suspended(self, qtbot):
+        """Only previews intersecting the scroll viewport keep animating."""
+        widget = AnimationSegmentPreview()
+        qtbot.addWidget(widget)
+        widget.set_frames([QPixmap(16, 16) for _ in range(40)])
+        for index in range(20):
+            widget.add_segment(f"S{index}", index * 2, index * 2 + 1, QColor(255, 0, 0))
+        widget.resize(400, 300)
+        widget.show()
+        qtbot.waitExposed(widget)
+
+        first, last = widget._preview_items["S0"], widget._preview_items["S19"]
+        qtbot.waitUntil(lambda: not last._in_viewport)
+        assert first._in_viewport
+
+        widget._toggle_all_playback()
+        assert not first.is_suspended
+        assert last.is_suspended
+
+        widget.scroll_area.verticalScrollBar().setValue(
+            widget.scroll_area.verticalScrollBar().maximum()
+        )
+        assert not last.is_suspended
+        assert first.is_suspended
+        widget._stop_all_playback()
+
     def test_clear_segments(self, qtbot):
         """Test clearing all segments."""
         widget = AnimationSegmentPreview()
@@ -0,0 +1,106 @@
+"""UI tests for the tiled sheet overview."""
+
+import pytest
+from PySide6.QtCore import QRect, QRectF
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+
+from config import Config
+from sprite_model.spatial_index import SpatialIndex
+from ui.sheet_overview import SheetOverview, _visible_regions
+
+pytestmark = pytest.mark.requires_qt
+
+
+def _two_tone_sheet(width: int = 4096, height: int = 2048) -> QPixmap:
+    """Red left half, blue right half."""
+    sheet = QPixmap(width, height)
+    sheet.fill(QColor("red"))
+    painter = QPainter(sheet)
+    painter.fillRect(width // 2, 0, width // 2, height, QColor("blue"))
+    painter.end()
+    return sheet
+
+
+@pytest.fixture
+def overview(qtbot):
+    widget = SheetOverview()
+    qtbot.addWidget(widget)
+    widget.resize(400, 300)
+    yield widget
+    widget.clear()
+
+
+@pytest.mark.ui
+def test_pyramid_is_deferred_until_shown(overview, qtbot):
+    overview.set_sheet(_two_tone_sheet())
+    assert overview.pyramid is None
+
+    overview.show()
+    qtbot.waitExposed(overview)
+
+    assert overview.pyramid is not None
+    assert overview.get_zoom_factor() < 0.1  # Fitted to the widget
+
+
+@pytest.mark.ui
+def test_zoomed_out_view_draws_from_pyramid_tiles(overview, qtbot):
+    overview.show()
+    qtbot.waitExposed(overview)
+    overview.set_sheet(_two_tone_sheet())
+    pyramid = overview.pyramid
+    assert pyramid is not None
+    level = pyramid.level_for_zoom(overview.get_zoom_factor())
+    assert level > 0
+
+    qtbot.waitUntil(lambda: pyramid.tile(level, 0, 0) is not None, timeout=5000)
+    image = overview.grab().toImage()
+
+    assert image.pixelColor(overview.width() // 4, overview.height() // 2) == QColor("red")
+    assert image.pixelColor(overview.width() * 3 // 4, overview.height() // 2) == QColor("blue")
+
+
+@pytest.mark.ui
+def test_pyramid_is_built_from_the_loaded_image(overview, qtbot):
+    sheet = _two_tone_sheet()
+    loaded = QImage(sheet.size(), QImage.Format.Format_ARGB32)
+    loaded.fill(QColor("green"))  # Differs from the pixmap so the tile shows its source
+    overview.show()
+    qtbot.waitExposed(overview)
+
+    overview.set_sheet(sheet, loaded)
+    pyramid = overview.pyramid
+    assert pyramid is not None
+    assert overview._sheet_image is None  # Handed to the build, not kept
+    qtbot.waitUntil(lambda: pyramid.tile(1, 0, 0) is not None, timeout=5000)
+
+    tile = pyramid.tile(1, 0, 0)
+    assert tile is not None
+    assert tile.pixelColor(0, 0) == QColor("green")
+
+
+@pytest.mark.ui
+def test_zoom_keeps_anchor_point_fixed(overview, qtbot):
+    overview.show()
+    qtbot.waitExposed(overview)
+    overview.set_sheet(_two_tone_sheet())
+    anchor = QRectF(100, 80, 1, 1)
+    before = overview.visible_sheet_rect()
+    under_anchor = overview.visible_sheet_rect(anchor).topLeft()
+
+    overview.set_zoom(overview.get_zoom_factor() * 4, anchor.topLeft())
+
+    assert overview.visible_sheet_rect().width() < before.width()
+    assert overview.visible_sheet_rect(anchor).topLeft() == under_anchor
+
+
+def test_region_culling_skips_offscreen_and_tiny_boxes():
+    tiny = [(x * 8, 0, 8, 8) for x in range(100)]
+    large = [(0, 100, 400, 400), (5000, 100, 400, 400)]
+    regions = SpatialIndex(tiny + large)
+    min_px = Config.Canvas.OVERVIEW_MIN_OVERLAY_PX
+
+    zoomed_out = _visible_regions(regions, QRect(0, 0, 1000, 1000), zoom=(min_px - 1) / 8)
+    zoomed_in = _visible_regions(regions, QRect(0, 0, 40, 40), zoom=1.0)
+
+    assert zoomed_out.tolist() == [100]
+    assert zoomed_in.tolist() == [0, 1, 2, 3, 4]
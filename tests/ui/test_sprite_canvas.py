@@ -6,11 +6,12 @@ Tests canvas display, zoom, pan functionality with Qt.
 from unittest.mock import patch
 
 import pytest
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QPointF, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
 from PySide6.QtTest import QSignalSpy
 
 from config import Config
-from ui.sprite_canvas import SpriteCanvas
+from ui.sprite_canvas import SpriteCanvas, _grid_positions, _visible_source_rect
 
 
 class TestSpriteCanvasInitialization:
@@ -211,6 +212,48 @@ class TestSpriteCanvasRenderingIntegration:
         # Should not crash.
         assert canvas.get_zoom_factor() == pytest.approx(1.0)
 
+    @pytest.mark.ui
+    def test_high_zoom_draws_only_visible_source_pixels(self, qapp):
+        """At high zoom only the source pixels under the viewport are drawn, in place."""
+        sprite = QImage(2048, 2048, QImage.Format.Format_ARGB32)
+        sprite.fill(QColor("red"))
+        painter = QPainter(sprite)
+        painter.fillRect(1024, 0, 1024, 2048, QColor("blue"))
+        painter.end()
+
+        canvas = SpriteCanvas()
+        canvas.resize(400, 300)
+        canvas.set_pixmap(QPixmap.fromImage(sprite), auto_fit=False)
+        canvas.set_zoom(Config.Canvas.ZOOM_MAX)
+        canvas.set_grid_overlay(True, 16)
+
+        drawn: list[QRect] = []
+
+        def spy(*args):
+            drawn.append(_visible_source_rect(*args))
+            return drawn[-1]
+
+        with patch("ui.sprite_canvas._visible_source_rect", side_effect=spy):
+            image = canvas.grab().toImage()
+        assert drawn
+        assert drawn[-1].width() <= canvas.width() / Config.Canvas.ZOOM_MAX + 2
+        assert drawn[-1].height() <= canvas.height() / Config.Canvas.ZOOM_MAX + 2
+
+        # The sprite's center column boundary sits at the canvas center (off the grid lines)
+        center_x, center_y = canvas.width() // 2, canvas.height() // 2
+        assert image.pixelColor(center_x - 5, center_y + 5) == QColor("red")
+        assert image.pixelColor(center_x + 5, center_y + 5) == QColor("blue")
+
+    def test_visible_source_rect_and_grid_positions(self):
+        """Clipping maths maps the viewport back to source pixels and grid lines."""
+        source = _visible_source_rect(
+            QPointF(-10000, -10000), 10.0, QRect(0, 0, 2050, 2050), QRectF(0, 0, 400, 300)
+        )
+        assert source == QRect(1000, 1000, 40, 30)
+
+        assert _grid_positions(-95.0, 10.0, 0.0, 30.0) == [5.0, 15.0, 25.0]
+        assert _grid_positions(50.0, 10.0, 0.0, 75.0) == [50.0, 60.0, 70.0]
+
 
 class TestSpriteCanvasErrorHandling:
     """Test error handling and edge cases."""
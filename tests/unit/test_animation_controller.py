@@ -6,7 +6,7 @@ Tests animation timing, state management, and signal coordination.
 from unittest.mock import Mock, patch
 
 import pytest
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtTest import QSignalSpy
 
 from config import Config
@@ -26,7 +26,8 @@ class TestAnimationControllerInitialization:
     def test_timer_initialization(self, animation_controller):
         """Test animation timer is properly initialized."""
         assert isinstance(animation_controller._animation_timer, QTimer)
-        assert not animation_controller._animation_timer.isSingleShot()
+        assert animation_controller._animation_timer.isSingleShot()
+        assert animation_controller._animation_timer.timerType() == Qt.TimerType.PreciseTimer
 
     def test_signals_exist(self, animation_controller):
         """Test all required signals are defined."""
@@ -9,10 +9,11 @@ import tempfile
 import unittest
 from unittest.mock import Mock, patch
 
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QImage
 
 from core.animation_segment_controller import AnimationSegmentController
 from managers import AnimationSegment, AnimationSegmentManager
+from sprite_model.frame_metadata import FrameMetadata, compute_frame_metadata
 
 
 class TestAnimationSegmentController(unittest.TestCase):
@@ -28,6 +29,7 @@ class TestAnimationSegmentController(unittest.TestCase):
         self.mock_grid_view._segments = {}  # Initialize as empty dict
         self.mock_grid_view._segment_list = Mock()
         self.mock_sprite_model = Mock()
+        self.mock_sprite_model.frame_metadata = FrameMetadata.empty()
         self.mock_tab_widget = Mock()
 
         # Create mock export coordinator
@@ -155,6 +157,82 @@ class TestAnimationSegmentController(unittest.TestCase):
             mock_segment_manager.add_segment.call_count, self.controller.MAX_NAME_RETRY_ATTEMPTS + 1
         )
 
+    def test_create_segments_resyncs_once(self):
+        """Bulk creation refreshes the grid once via segmentsChanged."""
+        with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+            self.segment_manager.set_sprite_context(tmp.name, 20)
+            segments = [AnimationSegment(f"Seg{i}", i * 2, i * 2 + 1) for i in range(10)]
+
+            with patch.object(self.segment_manager, "_auto_save") as auto_save:
+                success, message = self.controller.create_segments(segments)
+
+            self.assertTrue(success)
+            self.assertEqual(message, "Created 10 animation segments")
+            auto_save.assert_called_once()
+            self.mock_grid_view.sync_segments_with_manager.assert_called_once_with(
+                self.segment_manager
+            )
+            self.assertEqual(len(self.segment_manager.get_all_segments()), 10)
+
+    def test_create_segments_failure_adds_nothing(self):
+        """A rejected batch leaves the manager and grid untouched."""
+        with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+            self.segment_manager.set_sprite_context(tmp.name, 20)
+
+            success, error = self.controller.create_segments(
+                [AnimationSegment("A", 0, 5), AnimationSegment("B", 5, 8)]
+            )
+
+            self.assertFalse(success)
+            self.assertIn("overlap", error)
+            self.assertEqual(self.segment_manager.get_all_segments(), [])
+            self.mock_grid_view.sync_segments_with_manager.assert_not_called()
+
+    def test_auto_segment_skips_frames_already_segmented(self):
+        """Auto-segmentation fills gaps in one batch and leaves manual segments alone."""
+        with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+            self.segment_manager.set_sprite_context(tmp.name, 12)
+            self.segment_manager.add_segment("Manual", 0, 3)
+            self.mock_sprite_model.sprite_frames = tuple(QImage() for _ in range(12))
+            self.mock_sprite_model.frames_per_row = 4
+            self.mock_sprite_model.frame_metadata = compute_frame_metadata(
+                self.mock_sprite_model.sprite_frames
+            )
+
+            with (
+                patch(
+                    "core.animation_segment_controller.propose_segments",
+                    return_value=[(0, 3), (4, 7), (8, 11)],
+                ) as propose,
+                patch.object(
+                    self.segment_manager,
+                    "segment_overlapping",
+                    wraps=self.segment_manager.segment_overlapping,
+                ) as overlapping,
+            ):
+                success, message = self.controller.auto_segment()
+
+            self.assertEqual(overlapping.call_count, 3)  # One range query per proposal
+
+            propose.assert_called_once_with(
+                self.mock_sprite_model.sprite_frames,
+                4,
+                blank=self.mock_sprite_model.frame_metadata.blank,
+            )
+            self.assertTrue(success)
+            self.assertEqual(message, "Created 2 animation segments")
+            names = [s.name for s in self.segment_manager.get_all_segments()]
+            self.assertEqual(names, ["Manual", "Auto_1", "Auto_2"])
+
+    def test_auto_segment_without_frames(self):
+        """Nothing is proposed when no frames are extracted."""
+        self.mock_sprite_model.sprite_frames = ()
+
+        success, message = self.controller.auto_segment()
+
+        self.assertFalse(success)
+        self.assertEqual(message, "No frames to segment")
+
     # ============================================================================
     # SEGMENT OPERATIONS TESTS
     # ============================================================================
@@ -230,6 +308,68 @@ class TestAnimationSegmentController(unittest.TestCase):
         args = signal_spy.call_args[0]
         self.assertIn("Segment 'TestSegment' selected", args[0])
 
+    def test_play_segment_on_canvas_sets_timeline(self):
+        """Canvas segment playback compiles the segment's bounce and holds."""
+        with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+            self.segment_manager.set_sprite_context(tmp.name, 20)
+            self.segment_manager.add_segment("Walk", 4, 7)
+            self.segment_manager.set_bounce_mode("Walk", True)
+
+            success, message = self.controller.play_segment_on_canvas("Walk")
+
+            self.assertTrue(success)
+            self.assertEqual(self.controller.canvas_segment, "Walk")
+            timeline = self.mock_sprite_model.set_timeline.call_args[0][0]
+            self.assertEqual(timeline.frames.tolist(), [4, 5, 6, 7, 6, 5])
+
+            # Toggling the same segment returns the canvas to all frames
+            self.controller.toggle_canvas_segment("Walk")
+            self.assertIsNone(self.controller.canvas_segment)
+            self.mock_sprite_model.set_timeline.assert_called_with(None)
+
+    def test_batched_rename_keeps_canvas_playback(self):
+        """Renaming the playing segment inside batch_update follows the new name."""
+        with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+            self.segment_manager.set_sprite_context(tmp.name, 20)
+            self.segment_manager.add_segment("Walk", 4, 7)
+            self.controller.play_segment_on_canvas("Walk")
+
+            with self.segment_manager.batch_update():
+                self.segment_manager.update_segment("Walk", 4, 8, new_name="Stroll")
+
+            self.assertEqual(self.controller.canvas_segment, "Stroll")
+            timeline = self.mock_sprite_model.set_timeline.call_args[0][0]
+            self.assertEqual(timeline.frames.tolist(), [4, 5, 6, 7, 8])
+
+    def test_batched_swap_keeps_canvas_on_the_same_segment(self):
+        """Swapping names inside batch_update keeps playing the segment that was renamed."""
+        with tempfile.NamedTemporaryFile(suffix=".png") as tmp:
+            self.segment_manager.set_sprite_context(tmp.name, 20)
+            self.segment_manager.add_segment("a", 0, 3)
+            self.segment_manager.add_segment("b", 4, 7)
+            self.controller.play_segment_on_canvas("a")
+
+            with (
+                patch.object(self.controller, "sync_segments_from_manager") as sync,
+                self.segment_manager.batch_update(),
+            ):
+                self.segment_manager.update_segment("a", 0, 3, new_name="t")
+                self.segment_manager.update_segment("b", 4, 7, new_name="a")
+                self.segment_manager.update_segment("t", 0, 3, new_name="b")
+
+            self.assertEqual(self.controller.canvas_segment, "b")
+            sync.assert_called_once()  # One UI refresh for the whole batch
+            timeline = self.mock_sprite_model.set_timeline.call_args[0][0]
+            self.assertEqual(timeline.frames.tolist(), [0, 1, 2, 3])
+
+    def test_play_unknown_segment_on_canvas_fails(self):
+        """Unknown segments leave canvas playback unchanged."""
+        success, message = self.controller.play_segment_on_canvas("Missing")
+
+        self.assertFalse(success)
+        self.assertIn("not found", message)
+        self.mock_sprite_model.set_timeline.assert_not_called()
+
     # ============================================================================
     # SEGMENT EXPORT TESTS
     # ============================================================================
@@ -306,7 +446,7 @@ class TestAnimationSegmentController(unittest.TestCase):
             self.controller.update_grid_view_frames()
 
             # Assert
-            self.mock_grid_view.set_frames.assert_called_once_with(frames)
+            self.mock_grid_view.set_frames.assert_called_once_with(frames, None)
             # Context changes are handled by set_sprite_context_and_sync().
             assert self.segment_manager._sprite_sheet_path == ""
 
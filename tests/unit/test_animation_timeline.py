@@ -0,0 +1,52 @@
+"""Tests for compiled animation timelines."""
+
+from __future__ import annotations
+
+from sprite_model.animation_timeline import AnimationTimeline, compile_timeline
+
+
+def _ticks(timeline: AnimationTimeline) -> list[int]:
+    return [timeline.frame_at(tick) for tick in range(timeline.tick_count)]
+
+
+def test_linear_timeline_shows_each_frame_once():
+    timeline = compile_timeline(4, 7)
+
+    assert _ticks(timeline) == [4, 5, 6, 7]
+    assert timeline.frame_at(5) == 5  # Wraps
+    assert timeline.frame_at(5, loop=False) == 7
+
+
+def test_bounce_plays_back_without_repeating_ends():
+    assert _ticks(compile_timeline(0, 3, bounce=True)) == [0, 1, 2, 3, 2, 1]
+    assert _ticks(compile_timeline(0, 1, bounce=True)) == [0, 1]
+
+
+def test_holds_extend_frames_by_their_offset_in_the_range():
+    timeline = compile_timeline(10, 12, frame_holds={1: 2})
+
+    assert _ticks(timeline) == [10, 11, 11, 11, 12]
+    assert timeline.first_tick_of(12) == 4
+
+
+def test_holds_apply_on_both_bounce_passes():
+    timeline = compile_timeline(0, 2, bounce=True, frame_holds={1: 1})
+
+    assert _ticks(timeline) == [0, 1, 1, 2, 1, 1]
+
+
+def test_lookup_by_elapsed_time():
+    timeline = compile_timeline(0, 3, frame_holds={0: 1})
+
+    assert timeline.frame_at_time(0.0, fps=10) == 0
+    assert timeline.frame_at_time(0.15, fps=10) == 0  # Held for two ticks
+    assert timeline.frame_at_time(0.2, fps=10) == 1
+    assert timeline.frame_at_time(0.5, fps=10) == 0  # Next cycle
+
+
+def test_empty_range_yields_empty_timeline():
+    timeline = compile_timeline(3, 2)
+
+    assert len(timeline) == 0
+    assert timeline.tick_count == 0
+    assert AnimationTimeline.linear(3).tick_count == 3
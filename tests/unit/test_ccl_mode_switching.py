@@ -476,10 +476,9 @@ class TestCCLOperationsUnit:
         painter.fillRect(3, 0, 1, 1, QColor(200, 20, 20))  # Sprite content
         painter.end()
 
-        result = ccl_ops._apply_background_transparency(
+        image = ccl_ops._apply_background_transparency(
             pixmap, background_color=(250, 250, 250), tolerance=5
         )
-        image = result.toImage()
 
         assert image.pixel(0, 0) == 0
         assert image.pixel(1, 0) == 0
@@ -56,6 +56,7 @@ def mock_exporter():
     exporter.exportError.connect = MagicMock()
     exporter.exportError.disconnect = MagicMock()
     exporter.export_frames = MagicMock(return_value=True)
+    exporter.is_busy = False
     return exporter
 
 
@@ -291,6 +292,47 @@ def test_handle_export_request_cleanup_on_error(
     mock_dialog.close.assert_called_once()
 
 
+@patch("core.export_coordinator._ExportProgressDialog")
+def test_second_request_during_batch_reuses_progress_dialog(
+    mock_dialog_class, mock_sprite_model, mock_exporter, basic_settings
+):
+    """A request made while a batch runs joins it instead of opening a second dialog."""
+    mock_dialog = MagicMock()
+    mock_dialog_class.return_value = mock_dialog
+    coordinator = ExportCoordinator(mock_sprite_model, None, mock_exporter)
+
+    coordinator.handle_export_request(basic_settings)
+    mock_exporter.is_busy = True
+    coordinator.handle_export_request(basic_settings)
+
+    mock_dialog_class.assert_called_once()
+    mock_dialog.close.assert_not_called()
+    assert coordinator._progress_dialog is mock_dialog
+    assert mock_exporter.export_frames.call_count == 2
+    assert mock_exporter.exportFinished.connect.call_count == 1
+
+    # A rejected request while the batch runs leaves the batch's dialog open
+    with patch("core.export_coordinator.QMessageBox"):
+        coordinator._on_export_error("No frames to export")
+    mock_dialog.close.assert_not_called()
+
+
+@patch("core.export_coordinator._ExportProgressDialog")
+def test_new_batch_replaces_finished_dialog(
+    mock_dialog_class, mock_sprite_model, mock_exporter, basic_settings
+):
+    """A stale dialog left from an idle exporter is closed before a new one opens."""
+    first, second = MagicMock(), MagicMock()
+    mock_dialog_class.side_effect = [first, second]
+    coordinator = ExportCoordinator(mock_sprite_model, None, mock_exporter)
+
+    coordinator.handle_export_request(basic_settings)
+    coordinator.handle_export_request(basic_settings)
+
+    first.close.assert_called_once()
+    assert coordinator._progress_dialog is second
+
+
 @patch("core.export_coordinator._ExportProgressDialog")
 def test_cleanup_progress_dialog_idempotent(
     mock_dialog_class, mock_sprite_model, mock_exporter, basic_settings
@@ -428,6 +470,42 @@ def test_export_segments_per_row_calls_exporter(
     assert segment_info[0]["name"] == "Walk"
 
 
+@patch("core.export_coordinator._ExportProgressDialog")
+def test_export_segment_sheets_submits_one_batch(
+    mock_dialog_class, mock_sprite_model, mock_exporter
+):
+    """segment_sheets mode queues one sprite-sheet job per segment in a single call."""
+    mock_dialog_class.return_value = MagicMock()
+    manager = MagicMock()
+    segments = []
+    for name, start, end in (("Run", 3, 4), ("Walk", 0, 2)):
+        segment = MagicMock()
+        segment.name = name
+        segment.start_frame = start
+        segment.end_frame = end
+        segments.append(segment)
+    manager.get_all_segments.return_value = segments
+    mock_exporter.submit_batch = MagicMock(return_value=[1, 2])
+
+    coordinator = ExportCoordinator(mock_sprite_model, manager, mock_exporter)
+    config = ExportConfig(
+        output_dir=Path("/tmp/export"),
+        base_name="hero",
+        format=ExportFormat.PNG,
+        mode=ExportMode.SEGMENT_SHEETS,
+        scale_factor=1.0,
+    )
+
+    coordinator.handle_export_request(config)
+
+    mock_exporter.submit_batch.assert_called_once()
+    jobs = mock_exporter.submit_batch.call_args[0][0]
+    assert [job_config.base_name for _, job_config in jobs] == ["hero_Walk", "hero_Run"]
+    assert [len(frames) for frames, _ in jobs] == [3, 2]
+    assert all(job_config.mode is ExportMode.SPRITE_SHEET for _, job_config in jobs)
+    mock_exporter.export_frames.assert_not_called()
+
+
 @patch("core.export_coordinator._ExportProgressDialog")
 def test_export_frames_with_selected_indices(mock_dialog_class, mock_sprite_model, mock_exporter):
     """_export_frames handles selected_indices correctly."""
@@ -456,6 +534,38 @@ def test_export_frames_with_selected_indices(mock_dialog_class, mock_sprite_mode
     assert forwarded_config.mode is ExportMode.INDIVIDUAL_FRAMES
 
 
+@patch("core.export_coordinator._ExportProgressDialog")
+def test_deduplicated_export_forwards_model_aliases(
+    mock_dialog_class, mock_sprite_model, mock_exporter
+):
+    """Deduplication reuses the model's aliases, renumbered for the exported frames."""
+    first, second = mock_sprite_model.sprite_frames[:2]
+    # Duplicates share the QImage of the frame they alias, as SpriteModel.set_frames does
+    mock_sprite_model.sprite_frames = [first, second, first, second, first]
+    mock_sprite_model.frame_aliases = (0, 1, 0, 1, 0)
+    coordinator = ExportCoordinator(mock_sprite_model, None, mock_exporter)
+
+    config = ExportConfig(
+        output_dir=Path("/tmp/export"),
+        base_name="test",
+        format=ExportFormat.PNG,
+        mode=ExportMode.INDIVIDUAL_FRAMES,
+        scale_factor=1.0,
+        selected_indices=[1, 2, 3, 4],
+        deduplicate=True,
+    )
+
+    coordinator.handle_export_request(config)
+
+    forwarded_config = mock_exporter.export_frames.call_args[0][1]
+    assert forwarded_config.frame_aliases == [0, 1, 0, 1]
+
+    # Frames the model does not own leave deduplication to the exporter
+    config.selected_indices = None
+    coordinator.export_frames(config, frames=[QImage(first), first.copy()])
+    assert mock_exporter.export_frames.call_args[0][1].frame_aliases is None
+
+
 @patch("core.export_coordinator._ExportProgressDialog")
 @patch("core.export_coordinator.QMessageBox")
 def test_export_frames_shows_info_on_invalid_indices(
@@ -18,6 +18,7 @@ EXPECTED_PRESET_NAMES = frozenset(
         "sprite_sheet",
         "selected_frames",
         "segments_per_row",
+        "segment_sheets",
     }
 )
 
@@ -51,7 +52,11 @@ class TestPresetRegistryShape:
 
     def test_sprite_sheet_modes_have_layout(self):
         for preset in _PRESETS.values():
-            if preset.mode in (ExportMode.SPRITE_SHEET, ExportMode.SEGMENTS_SHEET):
+            if preset.mode in (
+                ExportMode.SPRITE_SHEET,
+                ExportMode.SEGMENTS_SHEET,
+                ExportMode.SEGMENT_SHEETS,
+            ):
                 assert preset.sprite_sheet_layout is not None, (
                     f"{preset.name}: sprite-sheet style preset must define layout"
                 )
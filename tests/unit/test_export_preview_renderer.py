@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import pytest
-from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtGui import QColor, QImage, QPixmap
 
+from export.core.export_presets import get_preset
 from export.core.frame_exporter import BackgroundMode, ExportMode, LayoutMode
 from export.dialogs.export_preview_renderer import (
     _ExportPreviewRenderer,
     _ExportPreviewRequest,
+    _ExportPreviewResult,
+    _PreviewRenderWorker,
 )
+from export.dialogs.modern_settings_preview import _ModernExportSettings
 from managers import AnimationSegment
+from sprite_model.frame_metadata import compute_frame_metadata
 
 pytestmark = pytest.mark.requires_qt
 
@@ -44,6 +49,25 @@ def test_sheet_preview_renders_from_explicit_request(qapp):
     assert result.info_text == "Sprite Sheet: 2x2 grid, 21x17px"
 
 
+def test_sheet_preview_applies_integer_export_scale(qapp):
+    renderer = _ExportPreviewRenderer()
+
+    result = renderer.render(
+        _ExportPreviewRequest(
+            mode=ExportMode.SPRITE_SHEET,
+            sprites=_sprites(4),
+            layout_mode=LayoutMode.COLUMNS,
+            columns=2,
+            spacing=1,
+            scale_factor=2,
+        )
+    )
+
+    assert result.image.size().toTuple() == (41, 33)
+    assert result.info_text == "Sprite Sheet: 2x2 grid, 41x33px"
+    assert result.image.pixel(19, 15) == result.image.pixel(0, 0)
+
+
 def test_segments_preview_uses_supplied_segments(qapp):
     renderer = _ExportPreviewRenderer()
 
@@ -106,3 +130,75 @@ def test_selected_frames_preview_reports_selection_count(qapp):
     )
 
     assert result.info_text == "Selected: 3 frames"
+
+
+def test_frames_preview_reuses_scaled_sprites_across_renders(qapp):
+    renderer = _ExportPreviewRenderer()
+    request = _ExportPreviewRequest(
+        mode=ExportMode.INDIVIDUAL_FRAMES,
+        sprites=[pixmap.toImage() for pixmap in _sprites(4, width=200, height=150)],
+    )
+
+    renderer.render(request)
+    cached = len(renderer.scaled_cache)
+    renderer.render(request)
+
+    assert cached == 4
+    assert len(renderer.scaled_cache) == cached
+
+
+def test_render_worker_produces_result_off_gui_thread(qapp, qtbot):
+    renderer = _ExportPreviewRenderer()
+    request = _ExportPreviewRequest(
+        mode=ExportMode.SPRITE_SHEET,
+        sprites=[pixmap.toImage() for pixmap in _sprites(4)],
+        layout_mode=LayoutMode.COLUMNS,
+        columns=2,
+        spacing=1,
+    )
+    worker = _PreviewRenderWorker(renderer, 7, request)
+
+    with qtbot.waitSignal(worker.rendered, timeout=2000) as blocker:
+        worker.start()
+    worker.wait()
+
+    generation, result = blocker.args
+    assert generation == 7
+    assert result.image.size().toTuple() == (21, 17)
+
+
+def test_transparency_warning_reads_frame_metadata(qapp):
+    opaque = [QImage(8, 8, QImage.Format.Format_ARGB32) for _ in range(2)]
+    for image in opaque:
+        image.fill(QColor("red"))
+    step = _ModernExportSettings(
+        frame_count=2,
+        current_frame=0,
+        sprites=list(opaque),
+        frame_metadata=compute_frame_metadata(opaque),
+    )
+
+    step._update_transparency_warning("JPG")
+
+    # ARGB32 frames whose pixels are all opaque do not need the warning
+    assert step._transparency_warning.isHidden()
+    step._preview.shutdown()
+
+
+def test_orchestrator_discards_stale_background_render(qapp, qtbot):
+    step = _ModernExportSettings(frame_count=4, current_frame=0, sprites=_sprites(4))
+    step._setup_for_preset(get_preset("sprite_sheet"))
+    orchestrator = step._preview
+    qtbot.waitUntil(lambda: not orchestrator.is_rendering, timeout=2000)
+    applied: list[str | None] = []
+    orchestrator._apply_result = lambda result: applied.append(result.info_text)
+
+    orchestrator.request_render()
+    stale_generation = orchestrator._generation
+    orchestrator.request_render()
+    orchestrator._on_rendered(stale_generation, _ExportPreviewResult(QImage(), "stale"))
+    qtbot.waitUntil(lambda: not orchestrator.is_rendering, timeout=2000)
+
+    assert applied
+    assert "stale" not in applied
+    orchestrator.shutdown()
@@ -13,13 +13,17 @@ Covers:
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from PySide6.QtGui import QColor, QImage, QPixmap
 
 from export.core.frame_exporter import (
+    ExportConfig,
     ExportFormat,
     ExportMode,
+    ExportReport,
+    FrameExporter,
     LayoutMode,
     SpriteSheetLayout,
     _ExportTask,
@@ -45,10 +49,10 @@ def reset_exporter():
     def _do_reset():
         inst = _fe_mod._exporter_instance
         if inst is not None:
-            worker = inst._worker
-            if worker is not None and worker.isRunning():
-                worker.cancel()
-                if not worker.wait(2000):
+            inst.cancel_export()
+            for job in list(inst._running.values()):
+                worker = job.worker
+                if worker is not None and worker.isRunning() and not worker.wait(2000):
                     raise AssertionError(
                         "ExportWorker did not finish within 2s during teardown — "
                         "test left a real thread running"
@@ -188,10 +192,7 @@ class TestConcurrentExportPrevention:
         assert result is True
 
         # Wait for the worker thread to finish before teardown
-        qtbot.waitUntil(
-            lambda: exporter._worker is None or not exporter._worker.isRunning(),
-            timeout=2000,
-        )
+        qtbot.waitUntil(lambda: not exporter.is_busy, timeout=2000)
 
 
 class TestExportSignalSafety:
@@ -315,6 +316,180 @@ class TestResourceCleanup:
         assert not invalid_path.exists()
 
 
+# ============================================================================
+# Export Queue Tests
+# ============================================================================
+
+
+def _queue_config(export_dir: Path, base_name: str, mode: ExportMode) -> ExportConfig:
+    return ExportConfig(
+        output_dir=export_dir,
+        base_name=base_name,
+        format=ExportFormat.PNG,
+        mode=mode,
+        scale_factor=1.0,
+    )
+
+
+class TestExportQueue:
+    """Tests for queued, concurrent export jobs."""
+
+    def test_second_export_is_queued_not_rejected(
+        self, qapp, qtbot, sample_pixmaps: list[QPixmap], export_dir: Path
+    ) -> None:
+        """A request made while another export runs should queue and complete."""
+        exporter = FrameExporter(max_concurrent=1)
+        job_results: list[tuple[int, bool, str]] = []
+        exporter.jobFinished.connect(lambda *args: job_results.append(args))
+
+        with qtbot.waitSignal(exporter.exportFinished, timeout=5000) as blocker:
+            first = exporter.submit_job(
+                sample_pixmaps, _queue_config(export_dir, "a", ExportMode.INDIVIDUAL_FRAMES)
+            )
+            second = exporter.submit_job(
+                sample_pixmaps, _queue_config(export_dir, "b", ExportMode.SPRITE_SHEET)
+            )
+            assert first is not None and second is not None
+            assert len(exporter._running) == 1
+            assert len(exporter._pending) == 1
+
+        success, message = blocker.args
+        assert success is True
+        assert message.startswith("2 of 2 export jobs succeeded")
+        assert [job_id for job_id, _, _ in job_results] == [first, second]
+        assert len(list(export_dir.glob("a_*.png"))) == 8
+        assert (export_dir / "b_sheet.png").exists()
+        assert not exporter.is_busy
+
+    def test_batch_report_merges_job_timings(
+        self, qapp, qtbot, sample_pixmaps: list[QPixmap], export_dir: Path
+    ) -> None:
+        """The batch report should sum per-job frames, bytes and phase timings."""
+        exporter = FrameExporter(max_concurrent=2)
+        throughput: list[tuple[int, int]] = []
+        exporter.exportThroughput.connect(lambda *args: throughput.append(args))
+
+        with qtbot.waitSignal(exporter.exportReport, timeout=5000) as blocker:
+            exporter.submit_batch(
+                [
+                    (sample_pixmaps, _queue_config(export_dir, "a", ExportMode.INDIVIDUAL_FRAMES)),
+                    (sample_pixmaps, _queue_config(export_dir, "b", ExportMode.SPRITE_SHEET)),
+                ]
+            )
+
+        report = blocker.args[0]
+        assert isinstance(report, ExportReport)
+        assert exporter.last_report is report
+        assert [job.label for job in report.jobs] == ["a", "b"]
+        assert report.success is True
+        assert report.frames == 16
+        assert report.bytes_written == sum(path.stat().st_size for path in export_dir.iterdir())
+        assert {"encode", "write", "compose"} <= report.phase_seconds.keys()
+        assert report.elapsed > 0
+        assert throughput[-1] == (report.frames, report.bytes_written)
+
+    def test_concurrency_limit_caps_running_workers(
+        self, qapp, qtbot, sample_pixmaps: list[QPixmap], export_dir: Path
+    ) -> None:
+        """No more than max_concurrent workers should be started at once."""
+        exporter = FrameExporter(max_concurrent=2)
+
+        with qtbot.waitSignal(exporter.exportFinished, timeout=5000):
+            job_ids = exporter.submit_batch(
+                [
+                    (sample_pixmaps, _queue_config(export_dir, f"job{i}", ExportMode.SPRITE_SHEET))
+                    for i in range(4)
+                ]
+            )
+            assert len(job_ids) == 4
+            assert len(exporter._running) == 2
+            assert len(exporter._pending) == 2
+
+        assert len(list(export_dir.glob("job*_sheet.png"))) == 4
+
+    def test_cancel_job_drops_only_that_pending_job(
+        self, qapp, qtbot, sample_pixmaps: list[QPixmap], export_dir: Path
+    ) -> None:
+        """Cancelling a queued job should leave the other jobs running."""
+        exporter = FrameExporter(max_concurrent=1)
+
+        with qtbot.waitSignal(exporter.exportFinished, timeout=5000) as blocker:
+            keep, drop = exporter.submit_batch(
+                [
+                    (sample_pixmaps, _queue_config(export_dir, "keep", ExportMode.SPRITE_SHEET)),
+                    (sample_pixmaps, _queue_config(export_dir, "drop", ExportMode.SPRITE_SHEET)),
+                ]
+            )
+            assert exporter.cancel_job(drop) is True
+
+        success, message = blocker.args
+        assert success is False
+        assert "1 of 2 export jobs succeeded" in message
+        assert "drop: Export cancelled" in message
+        assert (export_dir / "keep_sheet.png").exists()
+        assert not (export_dir / "drop_sheet.png").exists()
+        assert exporter.cancel_job(keep) is False
+
+    def test_aggregate_progress_spans_all_jobs(
+        self, qapp, qtbot, sample_pixmaps: list[QPixmap], export_dir: Path
+    ) -> None:
+        """exportProgress totals should cover the steps of every queued job."""
+        exporter = FrameExporter(max_concurrent=1)
+        progress: list[tuple[int, int, str]] = []
+        exporter.exportProgress.connect(lambda *args: progress.append(args))
+
+        with qtbot.waitSignal(exporter.exportFinished, timeout=5000):
+            exporter.submit_batch(
+                [
+                    (
+                        sample_pixmaps,
+                        _queue_config(export_dir, "frames", ExportMode.INDIVIDUAL_FRAMES),
+                    ),
+                    (sample_pixmaps, _queue_config(export_dir, "sheet", ExportMode.SPRITE_SHEET)),
+                ]
+            )
+
+        assert progress
+        assert {total for _, total, _ in progress} == {len(sample_pixmaps) + 3}
+        assert progress[-1][0] == len(sample_pixmaps) + 3
+        assert progress[-1][2].startswith("[sheet] ")
+
+    def test_job_error_is_reported_per_job_not_as_batch_error(
+        self, qapp, qtbot, sample_pixmaps: list[QPixmap], export_dir: Path
+    ) -> None:
+        """A failing job should not end the batch; the summary reports each job."""
+        exporter = FrameExporter(max_concurrent=1)
+        errors: list[str] = []
+        progress: list[str] = []
+        exporter.exportError.connect(errors.append)
+        exporter.exportProgress.connect(lambda *args: progress.append(args[2]))
+        save_image = _ExportWorker._save_image
+
+        def fail_bad_files(worker: _ExportWorker, image: QImage, filepath: Path) -> bool:
+            return not filepath.name.startswith("bad") and save_image(worker, image, filepath)
+
+        with (
+            patch.object(_ExportWorker, "_save_image", fail_bad_files),
+            qtbot.waitSignal(exporter.exportFinished, timeout=5000) as blocker,
+        ):
+            exporter.submit_batch(
+                [
+                    (
+                        sample_pixmaps,
+                        _queue_config(export_dir, "bad", ExportMode.INDIVIDUAL_FRAMES),
+                    ),
+                    (sample_pixmaps, _queue_config(export_dir, "good", ExportMode.SPRITE_SHEET)),
+                ]
+            )
+
+        success, message = blocker.args
+        assert errors == []
+        assert any(line.startswith("[bad] Error: Failed to export") for line in progress)
+        assert success is False
+        assert message.startswith("1 of 2 export jobs succeeded")
+        assert (export_dir / "good_sheet.png").exists()
+
+
 # ============================================================================
 # State Consistency Tests
 # ============================================================================
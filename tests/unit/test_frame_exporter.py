@@ -15,6 +15,7 @@ from export.core.frame_exporter import (
     ExportFormat,
     ExportMode,
     FrameExporter,
+    _ExportJob,
     _ExportTask,
     get_frame_exporter,
 )
@@ -152,12 +153,34 @@ class TestFrameExporter:
         mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
         mock_worker.start.assert_called_once()
 
+    @patch("export.core.frame_exporter._ExportWorker")
+    @patch("pathlib.Path.mkdir")
+    def test_export_frames_shares_qimage_frames(self, mock_mkdir, mock_worker_class):
+        """QImage frames are handed to the worker as-is, without a conversion pass."""
+        exporter = FrameExporter()
+        image = QImage(4, 4, QImage.Format.Format_ARGB32)
+        image.fill(0xFF336699)
+        config = ExportConfig(
+            output_dir=Path("/tmp/test_export"),
+            base_name="test",
+            format=ExportFormat.PNG,
+            mode=ExportMode.INDIVIDUAL_FRAMES,
+            scale_factor=1.0,
+        )
+
+        assert exporter.export_frames(frames=[image], config=config)
+
+        task = mock_worker_class.call_args.args[0]
+        assert task.frames[0].cacheKey() == image.cacheKey()
+
     def test_cancel_export_is_cooperative_and_non_blocking(self):
         """Cancellation should not block the UI thread waiting for worker shutdown."""
         exporter = FrameExporter()
         mock_worker = MagicMock()
         mock_worker.isRunning.return_value = True
-        exporter._worker = mock_worker
+        exporter._running[1] = _ExportJob(
+            job_id=1, task=MagicMock(), total_steps=1, worker=mock_worker
+        )
 
         exporter.cancel_export()
 
@@ -203,14 +226,77 @@ class TestExportWorker:
         # Run the export (directly call the method for testing)
         worker._export_individual_frames()
 
-        # Check that save was called for each frame (Qt infers format from extension)
+        # Each frame is encoded in memory, then written to its own file
         for i, frame in enumerate(mock_frames):
             expected_filename = f"frame_{i:03d}.png"
-            frame.save.assert_called_with(str(tmp_path / expected_filename))
+            frame.save.assert_called_once_with(ANY, "PNG")
+            assert (tmp_path / expected_filename).exists()
 
         # Check progress signals
         assert len(progress_calls) == len(mock_frames)
 
+    def test_individual_export_aliases_duplicates(self, tmp_path):
+        """Repeated frames are listed in an alias map instead of being re-encoded."""
+        import json
+
+        from export.core.frame_exporter import _ExportWorker
+
+        red, blue = (
+            QImage(4, 4, QImage.Format.Format_ARGB32),
+            QImage(4, 4, QImage.Format.Format_ARGB32),
+        )
+        red.fill(0xFFFF0000)
+        blue.fill(0xFF0000FF)
+        task = _ExportTask(
+            frames=[red, blue, red.copy(), blue],
+            output_dir=tmp_path,
+            base_name="frame",
+            format=ExportFormat.PNG,
+            mode=ExportMode.INDIVIDUAL_FRAMES,
+            deduplicate=True,
+        )
+        worker = _ExportWorker(task)
+
+        worker._export_individual_frames()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "frame_000.png",
+            "frame_001.png",
+            "frame_aliases.json",
+        ]
+        aliases = json.loads((tmp_path / "frame_aliases.json").read_text())["aliases"]
+        assert aliases == {"frame_002.png": "frame_000.png", "frame_003.png": "frame_001.png"}
+        assert worker.report.success
+        assert worker.report.frames == 2
+        assert "2 duplicates aliased" in worker.report.message
+
+    def test_individual_export_uses_given_aliases_without_hashing(self, tmp_path):
+        """Precomputed aliases (from the model) replace hashing the frames again."""
+        from export.core.frame_exporter import _ExportWorker
+
+        frame = QImage(4, 4, QImage.Format.Format_ARGB32)
+        frame.fill(0xFFFF0000)
+        task = _ExportTask(
+            frames=[frame, frame.copy(), frame.copy()],
+            output_dir=tmp_path,
+            base_name="frame",
+            format=ExportFormat.PNG,
+            mode=ExportMode.INDIVIDUAL_FRAMES,
+            deduplicate=True,
+            frame_aliases=[0, 1, 0],
+        )
+        worker = _ExportWorker(task)
+
+        with patch("export.core.frame_exporter.duplicate_frame_map") as duplicate_frame_map:
+            worker._export_individual_frames()
+
+        duplicate_frame_map.assert_not_called()
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "frame_000.png",
+            "frame_001.png",
+            "frame_aliases.json",
+        ]
+
     def test_sprite_sheet_export(self, mock_frames, tmp_path):
         """Test exporting as sprite sheet."""
         from export.core.frame_exporter import _ExportWorker
@@ -241,9 +327,10 @@ class TestExportWorker:
                 # Use ANY for format since patching QImage also patches Format enum
                 mock_image_class.assert_called_with(64, 192, ANY)
 
-                # Verify save was called (Qt infers format from extension)
+                # Verify the sheet was encoded and written
                 expected_filename = "sprites_sheet.png"
-                mock_sheet.save.assert_called_with(str(tmp_path / expected_filename))
+                mock_sheet.save.assert_called_with(ANY, "PNG")
+                assert (tmp_path / expected_filename).exists()
 
     def test_scale_factor_application(self, mock_frames, tmp_path):
         """Test that scale factor is applied correctly."""
@@ -261,22 +348,97 @@ class TestExportWorker:
             base_name="scaled",
             format=ExportFormat.PNG,
             mode=ExportMode.INDIVIDUAL_FRAMES,
-            scale_factor=2.0,
+            scale_factor=1.5,
         )
 
         worker = _ExportWorker(task)
         worker._export_individual_frames()
 
-        # Check that scaling was called with correct parameters
+        # Fractional factors use smooth Qt scaling
         # Use Qt enum values instead of integers
         for frame in mock_frames:
             frame.scaled.assert_called_once_with(
-                128,
-                128,  # 64 * 2.0
+                96,
+                96,  # 64 * 1.5
                 aspectMode=Qt.AspectRatioMode.KeepAspectRatio,
                 mode=Qt.TransformationMode.SmoothTransformation,
             )
 
+    def test_integer_scale_replicates_pixels(self, tmp_path):
+        """Whole-number scale factors produce exact nearest-neighbour output."""
+        from export.core.frame_exporter import _ExportWorker
+
+        frame = QImage(2, 1, QImage.Format.Format_ARGB32)
+        frame.setPixel(0, 0, 0xFFFF0000)
+        frame.setPixel(1, 0, 0x800000FF)
+        task = _ExportTask(
+            frames=[frame],
+            output_dir=tmp_path,
+            base_name="crisp",
+            format=ExportFormat.PNG,
+            mode=ExportMode.INDIVIDUAL_FRAMES,
+            scale_factor=2.0,
+        )
+
+        scaled = _ExportWorker(task)._scale_image(frame, 2.0)
+
+        assert scaled.size().toTuple() == (4, 2)
+        assert [scaled.pixel(x, y) for y in range(2) for x in range(4)] == [
+            0xFFFF0000,
+            0xFFFF0000,
+            0x800000FF,
+            0x800000FF,
+        ] * 2
+
+    def test_sheet_scales_frames_chunk_by_chunk(self, tmp_path):
+        """Sheet export scales one chunk at a time and stops scaling once cancelled."""
+        from export.core.frame_exporter import _ExportWorker
+
+        frames = [QImage(4, 4, QImage.Format.Format_ARGB32) for _ in range(7)]
+        for frame in frames:
+            frame.fill(0xFF00FF00)
+        task = _ExportTask(
+            frames=frames,
+            output_dir=tmp_path,
+            base_name="chunked",
+            format=ExportFormat.PNG,
+            mode=ExportMode.SPRITE_SHEET,
+            scale_factor=2.0,
+        )
+        worker = _ExportWorker(task)
+        chunk_sizes: list[int] = []
+        scaled_frames = worker._scaled_frames
+
+        def record(chunk):
+            chunk_sizes.append(len(chunk))
+            return scaled_frames(chunk)
+
+        with (
+            patch("export.core.frame_exporter.Config.Export.SCALE_CHUNK_FRAMES", 3),
+            patch.object(worker, "_scaled_frames", side_effect=record),
+        ):
+            worker.run()
+        assert chunk_sizes == [1, 3, 3, 1]  # First frame sizes the cells, then chunks
+        assert worker.report.success is True
+
+        cancelled = _ExportWorker(task)
+        chunk_sizes.clear()
+        scaled_frames = cancelled._scaled_frames
+
+        def cancel_after_first_chunk(chunk):
+            if len(chunk_sizes) == 1:
+                cancelled.cancel()
+            return record(chunk)
+
+        with (
+            patch("export.core.frame_exporter.Config.Export.SCALE_CHUNK_FRAMES", 3),
+            patch.object(cancelled, "_scaled_frames", side_effect=cancel_after_first_chunk),
+        ):
+            cancelled.run()
+        assert chunk_sizes == [1, 3]
+        assert cancelled.report.success is False
+        assert cancelled.report.message == "Export cancelled"
+
     def test_export_cancellation(self, mock_frames, tmp_path):
         """Test export cancellation."""
         from export.core.frame_exporter import _ExportWorker
@@ -0,0 +1,70 @@
+"""Tests for the per-frame metadata table."""
+
+from __future__ import annotations
+
+import pytest
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from sprite_model.frame_metadata import FrameMetadata, compute_frame_metadata
+from utils.sprite_rendering import frame_digest
+
+pytestmark = pytest.mark.requires_qt
+
+
+def _frame(box: tuple[int, int, int, int] | None, size: int = 16) -> QImage:
+    """Transparent frame with an opaque red box (None for a blank frame)."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    if box is not None:
+        painter = QPainter(image)
+        painter.fillRect(*box, QColor("red"))
+        painter.end()
+    return image
+
+
+def test_metadata_measures_sizes_boxes_and_opacity(qapp):
+    frames = [_frame((2, 3, 4, 5)), _frame(None), _frame((0, 0, 4, 8), size=8)]
+
+    metadata = compute_frame_metadata(frames)
+
+    assert len(metadata) == 3
+    assert metadata.size(0) == (16, 16)
+    assert metadata.size(2) == (8, 8)
+    assert metadata.content_rect(0) == QRect(2, 3, 4, 5)
+    assert metadata.content_rect(1).isEmpty()
+    assert metadata.content_rect(2) == QRect(0, 0, 4, 8)
+    assert metadata.opaque_pixels.tolist() == [20, 0, 32]
+    assert metadata.has_alpha.tolist() == [True, True, True]
+    assert metadata.blank.tolist() == [False, True, False]
+    assert metadata.digests == tuple(frame_digest(frame) for frame in frames)
+
+
+def test_opaque_sheet_background_is_not_content(qapp):
+    image = QImage(10, 10, QImage.Format.Format_RGB32)
+    image.fill(QColor("magenta"))
+    flat = image.copy()
+    painter = QPainter(image)
+    painter.fillRect(4, 5, 3, 2, QColor("black"))
+    painter.end()
+
+    metadata = compute_frame_metadata([image, flat])
+
+    assert metadata.content_rect(0) == QRect(4, 5, 3, 2)
+    assert metadata.blank.tolist() == [False, True]
+    assert not metadata.any_alpha
+
+
+def test_select_returns_rows_in_order(qapp):
+    metadata = compute_frame_metadata([_frame((0, 0, 1, 1)), _frame(None), _frame((1, 1, 2, 2))])
+
+    subset = metadata.select([2, 0])
+
+    assert subset.content_boxes.tolist() == [[1, 1, 2, 2], [0, 0, 1, 1]]
+    assert subset.digests == (metadata.digests[2], metadata.digests[0])
+
+
+def test_empty_table(qapp):
+    assert len(compute_frame_metadata([])) == 0
+    assert len(FrameMetadata.empty()) == 0
+    assert not FrameMetadata.empty().any_alpha
@@ -0,0 +1,70 @@
+"""Unit tests for coordinators/frame_update_coalescer.py."""
+
+import pytest
+
+from coordinators.frame_update_coalescer import FrameUpdateCoalescer
+
+pytestmark = pytest.mark.requires_qt
+
+
+@pytest.fixture
+def recorded(qapp):
+    """Coalescer whose refreshes are recorded as (frame, total) tuples."""
+    canvas: list[tuple[int, int]] = []
+    controls: list[tuple[int, int]] = []
+    coalescer = FrameUpdateCoalescer(
+        refresh_canvas=lambda frame, total: canvas.append((frame, total)),
+        refresh_controls=lambda frame, total: controls.append((frame, total)),
+    )
+    yield coalescer, canvas, controls
+    coalescer.deleteLater()
+
+
+def test_idle_changes_refresh_immediately(recorded):
+    coalescer, canvas, controls = recorded
+
+    coalescer.frame_changed(1, 4)
+    coalescer.frame_changed(1, 4)
+
+    assert canvas == [(1, 4), (1, 4)]
+    assert controls == [(1, 4), (1, 4)]
+
+
+def test_changes_in_one_iteration_collapse_during_playback(recorded, qtbot):
+    coalescer, canvas, controls = recorded
+    coalescer.set_playing(True)
+
+    for frame in range(3):
+        coalescer.frame_changed(frame, 4)
+    assert canvas == []
+
+    qtbot.waitUntil(lambda: bool(canvas) and bool(controls), timeout=1000)
+    assert canvas == [(2, 4)]
+    assert controls == [(2, 4)]
+
+
+def test_controls_are_throttled_and_skip_unchanged_frames(recorded, qtbot):
+    coalescer, canvas, controls = recorded
+    coalescer.set_playing(True)
+    coalescer.frame_changed(0, 4)
+    qtbot.waitUntil(lambda: bool(controls), timeout=1000)
+
+    coalescer.frame_changed(1, 4)
+    qtbot.waitUntil(lambda: len(canvas) == 2, timeout=1000)
+    assert controls == [(0, 4)]  # Still inside the refresh interval
+
+    coalescer.frame_changed(0, 4)
+    qtbot.wait(200)
+    assert controls == [(0, 4)]  # Back where the controls already are
+
+
+def test_leaving_playback_flushes_pending_refreshes(recorded):
+    coalescer, canvas, controls = recorded
+    coalescer.set_playing(True)
+    coalescer.frame_changed(3, 4)
+
+    coalescer.set_playing(False)
+
+    assert canvas == [(3, 4)]
+    assert controls == [(3, 4)]
+    assert not coalescer.playing
@@ -0,0 +1,140 @@
+"""Tests for the pixel inspector behind SpriteModel.inspect_pixel."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from sprite_model import SpriteModel, pixel_inspector
+from sprite_model.extraction_mode import ExtractionMode
+from sprite_model.pixel_inspector import PixelSample
+
+pytestmark = pytest.mark.requires_qt
+
+
+def _grid_sheet() -> QImage:
+    """64x32 sheet of two 32x32 frames: red left, translucent blue right."""
+    image = QImage(64, 32, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.fillRect(0, 0, 32, 32, QColor(255, 0, 0))
+    painter.fillRect(32, 0, 32, 32, QColor(0, 0, 255, 128))
+    painter.end()
+    return image
+
+
+@pytest.fixture
+def grid_model(qapp, tmp_path) -> SpriteModel:
+    path = tmp_path / "sheet.png"
+    assert _grid_sheet().save(str(path))
+    model = SpriteModel()
+    assert model.load_sprite_sheet(str(path))[0]
+    assert model.extract_frames(32, 32)[0]
+    return model
+
+
+def test_grid_sample_reports_rgba_sheet_point_and_cell(grid_model):
+    grid_model.set_current_frame(1)
+
+    sample = grid_model.inspect_pixel(3, 4)
+
+    assert sample == PixelSample(3, 4, (0, 0, 255, 128), sheet_point=(35, 4), grid_cell=(0, 1))
+    assert sample.describe() == "RGBA(0, 0, 255, 128) | Sheet (35, 4) | Cell (0, 1)"
+    assert grid_model.inspect_pixel(32, 0) is None
+
+
+def test_frame_view_is_built_once_per_frame(grid_model):
+    with patch.object(
+        pixel_inspector, "_rgba_pixels", wraps=pixel_inspector._rgba_pixels
+    ) as rgba_pixels:
+        for x in range(32):
+            grid_model.inspect_pixel(x, x)
+        grid_model.set_current_frame(1)
+        grid_model.inspect_pixel(0, 0)
+
+    assert rgba_pixels.call_count == 2
+
+
+def test_palette_image_reports_color_table_index(qapp, tmp_path):
+    image = QImage(4, 2, QImage.Format.Format_Indexed8)
+    image.setColorTable([QColor(color).rgb() for color in ("black", "red", "lime", "blue")])
+    for x in range(4):
+        for y in range(2):
+            image.setPixel(x, y, x)
+    path = tmp_path / "indexed.png"
+    assert image.save(str(path))
+    model = SpriteModel()
+    assert model.load_sprite_sheet(str(path))[0]
+    assert model.extract_frames(2, 2)[0]
+    model.set_current_frame(1)
+
+    # The index buffer was captured at load; hovering never decodes the file again
+    with patch.object(pixel_inspector, "_palette_indices") as palette_indices:
+        sample = model.inspect_pixel(1, 0)
+    palette_indices.assert_not_called()
+
+    assert sample is not None
+    assert sample.sheet_point == (3, 0)
+    assert sample.palette_index == 3
+    assert sample.rgba == (0, 0, 255, 255)
+
+
+def test_ccl_sample_reports_sprite_under_cursor(qapp, tmp_path):
+    image = QImage(64, 32, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.fillRect(4, 4, 10, 10, QColor("red"))
+    painter.fillRect(40, 8, 12, 12, QColor("green"))
+    painter.end()
+    path = tmp_path / "ccl.png"
+    assert image.save(str(path))
+    model = SpriteModel()
+    assert model.load_sprite_sheet(str(path))[0]
+    assert model.set_extraction_mode(ExtractionMode.CCL)
+    bounds = model.get_ccl_sprite_bounds()
+    target = next(i for i, (x, _, _, _) in enumerate(bounds) if x >= 32)
+
+    model.set_current_frame(target)
+    source = model.frame_source_rect(target)
+    sample = model.inspect_pixel(2, 2)
+
+    assert source == QRect(*bounds[target])
+    assert sample is not None
+    assert sample.sheet_point == (source.x() + 2, source.y() + 2)
+    assert sample.ccl_sprite == target
+    assert sample.grid_cell is None
+
+
+def test_no_sample_without_frames(qapp):
+    assert SpriteModel().inspect_pixel(0, 0) is None
+
+
+def test_ccl_sprite_index_is_shared_until_detection_reruns(qapp, tmp_path):
+    image = QImage(64, 32, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.fillRect(4, 4, 10, 10, QColor("red"))
+    painter.fillRect(40, 8, 12, 12, QColor("green"))
+    painter.end()
+    path = tmp_path / "ccl.png"
+    assert image.save(str(path))
+    model = SpriteModel()
+    assert model.load_sprite_sheet(str(path))[0]
+    assert model.set_extraction_mode(ExtractionMode.CCL)
+
+    index = model.get_ccl_sprite_index()
+    bounds = model.get_ccl_sprite_bounds()
+
+    assert model.get_ccl_sprite_index() is index
+    assert model.sheet_regions() is index.boxes
+    assert index.boxes.tolist() == [list(box) for box in bounds]
+    target = index.query_point(45, 12).tolist()
+    assert len(target) == 1
+    assert bounds[target[0]][0] >= 32
+    assert index.nearest(30, 12) == target[0]
+
+    assert model.load_sprite_sheet(str(path))[0]
+    assert model.get_ccl_sprite_index() is not index
@@ -0,0 +1,118 @@
+"""Tests for the wall-clock playback scheduler."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.playback_clock import PlaybackClock
+
+
+class _FakeTime:
+    """Manually advanced time source, in seconds."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_time() -> _FakeTime:
+    return _FakeTime()
+
+
+def test_on_time_ticks_advance_one_frame(fake_time):
+    clock = PlaybackClock(10, now=fake_time)
+    clock.start()
+
+    assert clock.ms_until_next_frame() == 100
+    for _ in range(5):
+        fake_time.now += 0.1
+        assert clock.tick() == 1
+
+    assert clock.stats().dropped_frames == 0
+
+
+def test_late_tick_skips_missed_frames(fake_time):
+    clock = PlaybackClock(10, now=fake_time)
+    clock.start()
+
+    fake_time.now += 0.35  # Frames 1-3 are due
+    assert clock.tick() == 3
+    assert clock.stats().dropped_frames == 2
+    assert clock.ms_until_next_frame() == 50  # Still aligned to the original grid
+
+
+def test_early_wakeup_does_not_accumulate_drift(fake_time):
+    clock = PlaybackClock(10, now=fake_time)
+    clock.start()
+
+    fake_time.now += 0.098  # Timer fired 2 ms early
+    assert clock.tick() == 1
+    assert clock.ms_until_next_frame() == 102  # Next boundary stays at 200 ms
+
+
+def test_fractional_rate_keeps_long_run_accuracy(fake_time):
+    fps = 23.976
+    clock = PlaybackClock(fps, now=fake_time)
+    clock.start()
+
+    frames = 0
+    for _ in range(1000):
+        fake_time.now += clock.ms_until_next_frame() / 1000
+        frames += clock.tick()
+
+    assert frames == 1000
+    assert (fake_time.now - 100.0) == pytest.approx(1000 / fps, abs=0.002)
+
+
+def test_set_fps_rebases_at_current_instant(fake_time):
+    clock = PlaybackClock(10, now=fake_time)
+    clock.start()
+    fake_time.now += 0.15
+
+    clock.set_fps(4)
+
+    assert clock.fps == 4.0
+    assert clock.ms_until_next_frame() == 250
+
+
+def test_stats_report_measured_rate_and_jitter(fake_time):
+    clock = PlaybackClock(10, now=fake_time)
+    clock.start()
+    for interval in (0.1, 0.1, 0.1, 0.1):
+        fake_time.now += interval
+        clock.tick()
+
+    stats = clock.stats()
+    assert stats.ticks == 4
+    assert stats.measured_fps == pytest.approx(10.0)
+    assert stats.mean_interval_ms == pytest.approx(100.0)
+    assert stats.jitter_ms == pytest.approx(0.0, abs=1e-6)
+
+
+def test_stopped_clock_does_not_advance(fake_time):
+    clock = PlaybackClock(10, now=fake_time)
+    fake_time.now += 1.0
+
+    assert clock.tick() == 0
+
+
+@pytest.mark.parametrize("fps", [0, -1, float("inf"), float("nan")])
+def test_invalid_rate_is_rejected(fps):
+    with pytest.raises(ValueError):
+        PlaybackClock(fps)
+
+
+def test_poll_advances_only_when_a_frame_is_due(fake_time):
+    clock = PlaybackClock(10, now=fake_time)
+    clock.start()
+
+    fake_time.now += 0.016  # Display-rate wake-up before the first boundary
+    assert clock.poll() == 0
+    fake_time.now += 0.09
+    assert clock.poll() == 1
+    fake_time.now += 0.25
+    assert clock.poll() == 2
+    assert clock.stats().dropped_frames == 1
@@ -0,0 +1,31 @@
+"""Tests for the export progress dialog throughput display."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from export.dialogs.progress_dialog import _ExportProgressDialog
+
+pytestmark = pytest.mark.requires_qt
+
+
+def test_stats_show_frame_rate_throughput_and_eta(qtbot):
+    dialog = _ExportProgressDialog("Individual Frames", total_frames=10)
+    qtbot.addWidget(dialog)
+    dialog._started = time.perf_counter() - 2.0
+
+    dialog.update_progress(5, 10, "Exported frame_004.png")
+    dialog.update_throughput(10, 4_000_000)
+
+    assert dialog.stats_label.text() == "5.0 frames/s, 2.00 MB/s, ETA 0:02"
+
+
+def test_stats_omit_eta_until_progress_is_reported(qtbot):
+    dialog = _ExportProgressDialog("Sprite Sheet", total_frames=3)
+    qtbot.addWidget(dialog)
+
+    dialog.update_throughput(0, 0)
+
+    assert "ETA" not in dialog.stats_label.text()
@@ -3,6 +3,7 @@ Tests for segment persistence edge cases in AnimationSegmentManager.
 
 Covers:
 - Atomic write patterns (success, disk full, permission errors)
+- Debounced background auto-save
 - JSON load edge cases (truncated, missing fields, partial success)
 - Overlap detection boundary conditions
 - Frame holds validation
@@ -11,13 +12,16 @@ Covers:
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from PySide6.QtGui import QColor
 
-from managers import AnimationSegmentManager
+from managers import AnimationSegment, AnimationSegmentManager
+from managers.animation_segment_manager import _write_segments_file
 
 # ============================================================================
 # Fixtures
@@ -141,6 +145,101 @@ class TestSaveSegmentsAtomicWrite:
         assert segments_dir.exists()
 
 
+# ============================================================================
+# Debounced Auto-Save Tests
+# ============================================================================
+
+
+class TestDebouncedAutoSave:
+    """Tests for the debounced background segment writer."""
+
+    def test_rapid_edits_coalesce_into_one_write(
+        self, configured_manager: AnimationSegmentManager
+    ) -> None:
+        """Edits only restart the timer; the flush writes the latest state once."""
+        segments_file = Path(configured_manager._get_segments_file_path())
+
+        with patch(
+            "managers.animation_segment_manager._write_segments_file",
+            wraps=_write_segments_file,
+        ) as write:
+            for i in range(5):
+                configured_manager.add_segment(f"Seg{i}", i, i)
+            assert not segments_file.exists()  # Nothing written on the GUI thread yet
+
+            configured_manager.flush_pending_saves()
+
+        write.assert_called_once()
+        data = json.loads(segments_file.read_text())
+        assert [s["name"] for s in data["segments"]] == [f"Seg{i}" for i in range(5)]
+
+    def test_timer_writes_in_background(
+        self, qtbot, configured_manager: AnimationSegmentManager
+    ) -> None:
+        """Once the debounce delay passes the file is written off the GUI thread."""
+        segments_file = Path(configured_manager._get_segments_file_path())
+        threads: list[str] = []
+        original_dump = json.dump
+
+        def recording_dump(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original_dump(*args, **kwargs)
+
+        with patch("managers.animation_segment_manager.json.dump", recording_dump):
+            configured_manager.add_segment("Walk", 0, 3)
+            qtbot.waitUntil(segments_file.exists, timeout=2000)
+            configured_manager.flush_pending_saves()
+
+        assert threads and threads[0].startswith("segment-writer")
+
+    def test_context_switch_saves_pending_edits_to_old_file(
+        self, configured_manager: AnimationSegmentManager, tmp_path: Path
+    ) -> None:
+        """A debounced save still targets the sprite it was made for."""
+        old_file = Path(configured_manager._get_segments_file_path())
+        configured_manager.add_segment("Walk", 0, 3)
+        other_sprite = tmp_path / "other.png"
+        other_sprite.touch()
+
+        configured_manager.set_sprite_context(str(other_sprite), 10)
+        configured_manager.flush_pending_saves()
+
+        data = json.loads(old_file.read_text())
+        assert [s["name"] for s in data["segments"]] == ["Walk"]
+        assert configured_manager.get_all_segments() == []
+
+    def test_load_waits_for_pending_write_of_the_same_file(
+        self, configured_manager: AnimationSegmentManager
+    ) -> None:
+        """Reloading while a background write is in flight reads the written edits."""
+        segments_file = configured_manager._get_segments_file_path()
+
+        def slow_write(*args, **kwargs):
+            time.sleep(0.2)
+            return _write_segments_file(*args, **kwargs)
+
+        with patch("managers.animation_segment_manager._write_segments_file", slow_write):
+            configured_manager.add_segment("Walk", 0, 3)
+            success, error = configured_manager.load_segments_from_file(segments_file)
+
+        assert success, error
+        assert [s.name for s in configured_manager.get_all_segments()] == ["Walk"]
+
+    def test_explicit_save_supersedes_pending_auto_save(
+        self, configured_manager: AnimationSegmentManager
+    ) -> None:
+        """A synchronous save cancels the queued write for the same state."""
+        configured_manager.add_segment("Walk", 0, 3)
+
+        success, _ = configured_manager.save_segments_to_file()
+
+        assert success
+        assert not configured_manager._save_timer.isActive()
+        with patch("managers.animation_segment_manager._write_segments_file") as write:
+            configured_manager.flush_pending_saves()
+        write.assert_not_called()
+
+
 # ============================================================================
 # JSON Load Edge Cases
 # ============================================================================
@@ -369,6 +468,271 @@ class TestFindOverlappingSegment:
         assert overlap == "Middle"
 
 
+class TestSegmentIntervalIndex:
+    """Tests for the sorted interval index behind overlap and frame lookups."""
+
+    def test_segment_at_frame(self, manager_with_segments: AnimationSegmentManager) -> None:
+        """Point lookups resolve to the containing segment."""
+        walk = manager_with_segments.segment_at(3)
+        run = manager_with_segments.segment_at(4)
+
+        assert walk is not None and walk.name == "Walk"
+        assert run is not None and run.name == "Run"
+        assert manager_with_segments.segment_at(8) is None
+
+    def test_segment_overlapping_range(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Range lookups return a segment overlapping any frame of the range."""
+        walk = manager_with_segments.segment_overlapping(2, 2)
+        run = manager_with_segments.segment_overlapping(6, 9)
+
+        assert walk is not None and walk.name == "Walk"
+        assert run is not None and run.name == "Run"
+        assert manager_with_segments.segment_overlapping(8, 9) is None
+
+    def test_index_follows_updates_and_removal(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Moving, renaming and removing segments keeps lookups in sync."""
+        success, _ = manager_with_segments.update_segment("Run", 5, 9, new_name="Sprint")
+        assert success
+
+        assert manager_with_segments.segment_at(4) is None
+        sprint = manager_with_segments.segment_at(9)
+        assert sprint is not None and sprint.name == "Sprint"
+        assert manager_with_segments._find_overlapping_segment(4, 4) is None
+
+        manager_with_segments.remove_segment("Walk")
+        assert manager_with_segments.segment_at(0) is None
+        assert manager_with_segments._find_overlapping_segment(0, 4) is None
+
+    def test_failed_update_keeps_index(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """A rejected update leaves the original range indexed."""
+        success, _ = manager_with_segments.update_segment("Walk", 0, 12)
+
+        assert not success
+        walk = manager_with_segments.segment_at(3)
+        assert walk is not None and walk.name == "Walk"
+
+    def test_overlapping_legacy_file_is_still_detected(
+        self, configured_manager: AnimationSegmentManager, tmp_path: Path
+    ) -> None:
+        """Overlaps are found even when a loaded file already overlaps itself."""
+        segments_file = tmp_path / "legacy.json"
+        segments_file.write_text(
+            json.dumps(
+                {
+                    "segments": [
+                        {"name": "Long", "start_frame": 0, "end_frame": 8},
+                        {"name": "Short", "start_frame": 2, "end_frame": 3},
+                    ]
+                }
+            )
+        )
+        configured_manager.load_segments_from_file(str(segments_file))
+
+        # The latest-starting candidate (Short) misses frame 6; Long still matches
+        assert configured_manager._find_overlapping_segment(6, 6) == "Long"
+        assert configured_manager._find_overlapping_segment(9, 9) is None
+
+        # Removing the overlap puts the index back on the bisect-only path
+        assert configured_manager.remove_segment("Short")
+        assert configured_manager._find_overlapping_segment(6, 6) == "Long"
+        assert configured_manager._index._disjoint
+
+    def test_edits_never_rebuild_the_running_maximum(
+        self, configured_manager: AnimationSegmentManager
+    ) -> None:
+        """Non-overlapping segments are checked by bisection alone, without O(n) rebuilds."""
+        configured_manager.set_sprite_context(configured_manager._sprite_sheet_path, 100)
+        with patch("managers.animation_segment_manager.accumulate") as accumulate:
+            for i in range(20):
+                assert configured_manager.add_segment(f"S{i}", i * 5, i * 5 + 3)[0]
+            assert configured_manager.update_segment("S3", 15, 19)[0]
+            assert not configured_manager.update_segment("S4", 19, 21)[0]
+            assert configured_manager._find_overlapping_segment(17, 24) == "S4"
+            assert configured_manager._find_overlapping_segment(19, 19) == "S3"
+            assert configured_manager._index.find_overlap(19, 19, exclude="S3") is None
+
+        accumulate.assert_not_called()
+
+
+class TestAddSegmentsBatch:
+    """Tests for bulk add_segments validation."""
+
+    def test_batch_is_added_in_one_save(self, configured_manager: AnimationSegmentManager) -> None:
+        """A valid batch is stored completely with a single auto-save."""
+        batch = [
+            AnimationSegment("C", 6, 7),
+            AnimationSegment("A", 0, 1),
+            AnimationSegment("B", 2, 5),
+        ]
+
+        with patch.object(configured_manager, "_auto_save") as auto_save:
+            success, error = configured_manager.add_segments(batch)
+
+        assert success, error
+        auto_save.assert_called_once()
+        assert [s.name for s in configured_manager.get_all_segments()] == ["A", "B", "C"]
+        b = configured_manager.segment_at(4)
+        assert b is not None and b.name == "B"
+
+    def test_overlap_within_batch_rejects_everything(
+        self, configured_manager: AnimationSegmentManager
+    ) -> None:
+        """Ranges overlapping each other inside the batch fail atomically."""
+        success, error = configured_manager.add_segments(
+            [AnimationSegment("A", 0, 4), AnimationSegment("B", 4, 6)]
+        )
+
+        assert not success
+        assert "overlap with segment 'A'" in error
+        assert configured_manager.get_all_segments() == []
+
+    def test_overlap_with_existing_segment_rejects_batch(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Batch entries may not overlap segments already stored."""
+        success, error = manager_with_segments.add_segments(
+            [AnimationSegment("Idle", 8, 9), AnimationSegment("Jump", 7, 7)]
+        )
+
+        assert not success
+        assert "overlap with segment 'Run'" in error
+        assert manager_with_segments.get_segment("Idle") is None
+
+    def test_duplicate_and_invalid_entries_reject_batch(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Name clashes and out-of-range frames are reported per segment."""
+        duplicate = manager_with_segments.add_segments([AnimationSegment("Walk", 8, 9)])
+        out_of_range = manager_with_segments.add_segments([AnimationSegment("Far", 8, 12)])
+
+        assert duplicate == (False, "Segment 'Walk' already exists")
+        assert not out_of_range[0]
+        assert "Far" in out_of_range[1]
+
+
+class TestBatchUpdate:
+    """Tests for grouping mutations into one save and one notification."""
+
+    def test_batch_saves_and_notifies_once(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Many mutations inside a batch cost one save and one segmentsChanged."""
+        changed: list[None] = []
+        removed: list[str] = []
+        manager_with_segments.segmentsChanged.connect(lambda: changed.append(None))
+        manager_with_segments.segmentRemoved.connect(removed.append)
+
+        with (
+            patch.object(manager_with_segments, "_auto_save") as auto_save,
+            manager_with_segments.batch_update(),
+        ):
+            manager_with_segments.remove_segment("Walk")
+            manager_with_segments.add_segment("Idle", 0, 1)
+            manager_with_segments.set_bounce_mode("Run", True)
+            manager_with_segments.set_frame_holds("Run", {0: 2})
+            auto_save.assert_not_called()
+
+        auto_save.assert_called_once()
+        assert changed == [None]
+        assert removed == []  # Per-segment signals are folded into segmentsChanged
+        run = manager_with_segments.get_segment("Run")
+        assert run is not None and run.bounce_mode and run.frame_holds == {0: 2}
+
+    def test_batch_reports_net_renames_at_commit(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Renames inside a batch arrive collapsed, as one mapping on segmentsChanged."""
+        renamed: list[tuple[str, str]] = []
+        changes: list[dict[str, str]] = []
+        manager_with_segments.segmentRenamed.connect(lambda *names: renamed.append(names))
+        manager_with_segments.segmentsChanged.connect(changes.append)
+
+        with manager_with_segments.batch_update():
+            manager_with_segments.update_segment("Walk", 0, 3, new_name="Stroll")
+            manager_with_segments.update_segment("Stroll", 0, 3, new_name="Amble")
+            manager_with_segments.update_segment("Run", 4, 7, new_name="Sprint")
+            manager_with_segments.update_segment("Sprint", 4, 7, new_name="Run")
+            assert changes == []
+
+        assert changes == [{"Walk": "Amble"}]
+        assert renamed == []
+
+    def test_batch_reports_swapped_names_as_one_mapping(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Swapping two names through a temporary one maps each old name to the other."""
+        changes: list[dict[str, str]] = []
+        manager_with_segments.segmentsChanged.connect(changes.append)
+
+        with manager_with_segments.batch_update():
+            manager_with_segments.update_segment("Walk", 0, 3, new_name="Temp")
+            manager_with_segments.update_segment("Run", 4, 7, new_name="Walk")
+            manager_with_segments.update_segment("Temp", 0, 3, new_name="Run")
+
+        assert changes == [{"Walk": "Run", "Run": "Walk"}]
+        run = manager_with_segments.get_segment("Run")
+        assert run is not None and (run.start_frame, run.end_frame) == (0, 3)
+
+    def test_nested_batches_flush_at_outermost_exit(
+        self, configured_manager: AnimationSegmentManager
+    ) -> None:
+        """Inner blocks defer to the outermost one."""
+        changed: list[None] = []
+        configured_manager.segmentsChanged.connect(lambda: changed.append(None))
+
+        with (
+            patch.object(configured_manager, "_auto_save") as auto_save,
+            configured_manager.batch_update(),
+        ):
+            with configured_manager.batch_update():
+                configured_manager.add_segment("A", 0, 1)
+            assert changed == []
+            configured_manager.add_segments([AnimationSegment("B", 2, 3)])
+
+        auto_save.assert_called_once()
+        assert changed == [None]
+
+    def test_batch_without_changes_is_silent(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Failed or no-op mutations neither save nor notify."""
+        changed: list[None] = []
+        manager_with_segments.segmentsChanged.connect(lambda: changed.append(None))
+
+        with (
+            patch.object(manager_with_segments, "_auto_save") as auto_save,
+            manager_with_segments.batch_update(),
+        ):
+            manager_with_segments.add_segment("Clash", 2, 5)
+            manager_with_segments.remove_segment("Missing")
+
+        auto_save.assert_not_called()
+        assert changed == []
+
+    def test_batch_respects_disabled_auto_save(
+        self, manager_with_segments: AnimationSegmentManager
+    ) -> None:
+        """Changes still notify when auto-save is off, but nothing is written."""
+        changed: list[None] = []
+        manager_with_segments.segmentsChanged.connect(lambda: changed.append(None))
+        manager_with_segments.set_auto_save_enabled(False)
+
+        with (
+            patch.object(manager_with_segments, "save_segments_to_file") as save,
+            manager_with_segments.batch_update(),
+        ):
+            manager_with_segments.remove_segment("Run")
+
+        save.assert_not_called()
+        assert changed == [None]
+
+
 # ============================================================================
 # Frame Holds Validation Tests
 # ============================================================================
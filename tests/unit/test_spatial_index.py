@@ -0,0 +1,106 @@
+"""Tests for the uniform-grid spatial index over sheet boxes."""
+
+import numpy as np
+import pytest
+
+from sprite_model.spatial_index import SpatialIndex
+
+
+def _brute_force(boxes: np.ndarray, x: int, y: int, width: int, height: int) -> list[int]:
+    return [
+        i
+        for i, (bx, by, bw, bh) in enumerate(boxes.tolist())
+        if bx < x + width and bx + max(bw, 1) > x and by < y + height and by + max(bh, 1) > y
+    ]
+
+
+@pytest.fixture
+def random_boxes() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    boxes = np.column_stack(
+        [
+            rng.integers(0, 4000, 3000),
+            rng.integers(0, 3000, 3000),
+            rng.integers(1, 80, 3000),
+            rng.integers(1, 80, 3000),
+        ]
+    )
+    return np.vstack([boxes, [[0, 0, 4000, 3000]]])  # One background-sized box
+
+
+def test_rect_queries_match_brute_force(random_boxes):
+    index = SpatialIndex(random_boxes)
+    rng = np.random.default_rng(11)
+
+    for x, y, width, height in zip(
+        rng.integers(-100, 4000, 50),
+        rng.integers(-100, 3000, 50),
+        rng.integers(1, 600, 50),
+        rng.integers(1, 600, 50),
+        strict=True,
+    ):
+        expected = _brute_force(random_boxes, int(x), int(y), int(width), int(height))
+        assert index.query_rect(int(x), int(y), int(width), int(height)).tolist() == expected
+
+
+def test_boxes_are_read_only_and_not_shared(random_boxes):
+    index = SpatialIndex(random_boxes)
+    random_boxes[0] = (-1, -1, 1, 1)
+
+    assert index.boxes[0].tolist() != [-1, -1, 1, 1]
+    assert not index.boxes.flags.writeable
+    assert len(index) == len(random_boxes)
+
+
+def test_regular_grid_uses_cell_sized_buckets():
+    boxes = [(x * 32, y * 32, 32, 32) for y in range(50) for x in range(50)]
+    index = SpatialIndex(boxes)
+
+    assert index.cell_size == 32
+    assert index.query_rect(64, 64, 1, 1).tolist() == [2 * 50 + 2]
+    assert index.query_rect(60, 0, 10, 1).tolist() == [1, 2]
+
+
+def test_empty_index_and_empty_queries():
+    assert SpatialIndex([]).query_rect(0, 0, 10, 10).tolist() == []
+    assert SpatialIndex([(0, 0, 4, 4)]).query_rect(0, 0, 0, 5).tolist() == []
+
+
+def test_point_queries_match_brute_force(random_boxes):
+    index = SpatialIndex(random_boxes)
+    rng = np.random.default_rng(13)
+
+    for x, y in zip(rng.integers(-10, 4010, 100), rng.integers(-10, 3010, 100), strict=True):
+        expected = _brute_force(random_boxes, int(x), int(y), 1, 1)
+        assert index.query_point(int(x), int(y)).tolist() == expected
+
+
+def test_nearest_matches_brute_force():
+    rng = np.random.default_rng(17)
+    boxes = np.column_stack(
+        [
+            rng.integers(0, 2000, 500),
+            rng.integers(0, 2000, 500),
+            rng.integers(1, 40, 500),
+            rng.integers(1, 40, 500),
+        ]
+    )
+    index = SpatialIndex(boxes)
+    x0, y0 = boxes[:, 0], boxes[:, 1]
+    x1, y1 = x0 + boxes[:, 2] - 1, y0 + boxes[:, 3] - 1
+
+    for x, y in zip(rng.integers(-500, 2500, 100), rng.integers(-500, 2500, 100), strict=True):
+        dx = np.maximum(np.maximum(x0 - x, x - x1), 0)
+        dy = np.maximum(np.maximum(y0 - y, y - y1), 0)
+        assert index.nearest(int(x), int(y)) == int(np.argmin(dx * dx + dy * dy))
+
+
+def test_nearest_respects_max_distance_and_ties():
+    index = SpatialIndex([(0, 0, 10, 10), (21, 0, 10, 10)])
+
+    assert index.nearest(5, 5) == 0
+    assert index.nearest(15, 5) == 0  # Equidistant: lower index wins
+    assert index.nearest(30, 39) == 1
+    assert index.nearest(30, 39, max_distance=10) is None
+    assert index.nearest(30, 39, max_distance=30) == 1
+    assert SpatialIndex([]).nearest(0, 0) is None
@@ -6,10 +6,11 @@ Tests the main model class and its modular components.
 from unittest.mock import patch
 
 import pytest
-from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
 from PySide6.QtTest import QSignalSpy
 
 from sprite_model import SpriteModel
+from sprite_model.animation_timeline import compile_timeline
 from sprite_model.extraction_mode import ExtractionMode
 from sprite_model.sprite_extraction import CCLDetectionResult
 
@@ -129,7 +130,7 @@ class TestSpriteModelFrameManagement:
         frames = configured_sprite_model.sprite_frames
         assert len(frames) > 0
         frame = frames[0]
-        assert isinstance(frame, QPixmap)
+        assert isinstance(frame, QImage)
         assert not frame.isNull()
 
     def test_get_frame_invalid_index(self, configured_sprite_model):
@@ -154,6 +155,50 @@ class TestSpriteModelFrameManagement:
         _clear_sprite_data(configured_sprite_model)
         assert configured_sprite_model.frame_count == 0
 
+    def test_duplicate_frames_share_storage(self, sprite_model):
+        """Frames with identical pixels are stored once and reported as aliases."""
+        frames = []
+        for color in ("red", "blue", "red", "red"):
+            image = QImage(8, 8, QImage.Format.Format_ARGB32)
+            image.fill(QColor(color))
+            frames.append(image)
+
+        sprite_model.set_frames(frames)
+
+        stored = sprite_model.sprite_frames
+        assert sprite_model.frame_aliases == (0, 1, 0, 0)
+        assert sprite_model.duplicate_frame_count == 2
+        assert stored[2].cacheKey() == stored[0].cacheKey()
+        assert stored[1].cacheKey() != stored[0].cacheKey()
+
+        assert sprite_model.frame_metadata.digests[2] == sprite_model.frame_metadata.digests[0]
+
+        sprite_model.clear_frames()
+        assert sprite_model.frame_aliases == ()
+        assert len(sprite_model.frame_metadata) == 0
+
+    def test_timeline_drives_playback_order(self, sprite_model):
+        """A segment timeline plays its range with bounce and holds on the model."""
+        frames = [QImage(4, 4, QImage.Format.Format_ARGB32) for _ in range(6)]
+        for index, image in enumerate(frames):
+            image.fill(QColor(index * 40, 0, 0))
+        sprite_model.set_frames(frames)
+
+        assert sprite_model.set_timeline(compile_timeline(2, 4, bounce=True, frame_holds={2: 1}))
+        assert sprite_model.current_frame == 2
+
+        visited = [sprite_model.next_frame()[0] for _ in range(6)]
+        assert visited == [3, 4, 4, 3, 2, 3]
+        assert sprite_model.advance_frames(2)[0] == 4
+
+        sprite_model.set_loop_enabled(False)
+        assert sprite_model.advance_frames(10) == (3, False)  # Stops on the last tick
+
+        # Timelines outside the frames are refused; replacing frames drops the timeline
+        assert not sprite_model.set_timeline(compile_timeline(4, 9))
+        sprite_model.set_frames(frames)
+        assert sprite_model.timeline is None
+
 
 class TestSpriteModelProperties:
     """Test SpriteModel property accessors."""
@@ -191,6 +236,47 @@ class TestSpriteModelProperties:
         assert success, error
         assert sprite_model.file_path == str(sprite_path)
 
+    def test_loaded_sheet_image_is_handed_over_once(self, sprite_model, tmp_path):
+        """dataLoaded handlers can take the decoded image; the model does not keep it."""
+        sprite_path = tmp_path / "sprite.png"
+        pixmap = QPixmap(16, 8)
+        pixmap.fill(QColor(255, 0, 0))
+        pixmap.save(str(sprite_path), "PNG")
+        taken = []
+        sprite_model.dataLoaded.connect(
+            lambda _path: taken.extend(
+                [sprite_model.take_loaded_sheet_image(), sprite_model.take_loaded_sheet_image()]
+            )
+        )
+
+        success, error = sprite_model.load_sprite_sheet(str(sprite_path))
+
+        assert success, error
+        image, second = taken
+        assert image is not None and image.size().toTuple() == (16, 8)
+        assert second is None
+        assert sprite_model.take_loaded_sheet_image() is None
+
+    def test_sheet_regions_follow_grid_layout(self, sprite_model, tmp_path):
+        """Grid regions are the extracted cells, in frame order."""
+        sprite_path = tmp_path / "sheet.png"
+        pixmap = QPixmap(50, 30)
+        pixmap.fill(QColor(255, 0, 0))
+        pixmap.save(str(sprite_path), "PNG")
+        sprite_model.load_sprite_sheet(str(sprite_path))
+
+        success, _message, _count = sprite_model.extract_frames(10, 10, 2, 1, 4, 2)
+
+        assert success
+        assert sprite_model.sheet_regions().tolist() == [
+            [2, 1, 10, 10],
+            [16, 1, 10, 10],
+            [30, 1, 10, 10],
+            [2, 13, 10, 10],
+            [16, 13, 10, 10],
+            [30, 13, 10, 10],
+        ]
+
 
 class TestSpriteModelSignals:
     """Test SpriteModel signal emission."""
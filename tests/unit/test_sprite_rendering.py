@@ -0,0 +1,107 @@
+"""Tests for sprite rendering helpers."""
+
+from __future__ import annotations
+
+import pytest
+from PySide6.QtGui import QImage
+
+from utils.sprite_rendering import (
+    duplicate_frame_map,
+    fit_scaled_image,
+    frame_digest,
+    integer_scale_factor,
+    scale_image_nearest,
+    scale_images_nearest,
+)
+
+pytestmark = pytest.mark.requires_qt
+
+
+def _checker(width: int, height: int, fmt: QImage.Format = QImage.Format.Format_ARGB32) -> QImage:
+    image = QImage(width, height, fmt)
+    for y in range(height):
+        for x in range(width):
+            image.setPixel(x, y, 0xFF000000 | (x * 37 << 16) | (y * 53 << 8) | 0x7F)
+    return image
+
+
+@pytest.mark.parametrize(
+    ("scale", "expected"), [(1.0, 1), (2.0, 2), (4.0, 4), (1.5, None), (0.5, None)]
+)
+def test_integer_scale_factor(scale, expected):
+    assert integer_scale_factor(scale) == expected
+
+
+@pytest.mark.parametrize("factor", [2, 3, 4])
+def test_scale_image_nearest_replicates_every_pixel(qapp, factor):
+    source = _checker(5, 3)
+
+    scaled = scale_image_nearest(source, factor)
+
+    assert scaled.size().toTuple() == (5 * factor, 3 * factor)
+    assert all(
+        scaled.pixel(x, y) == source.pixel(x // factor, y // factor)
+        for y in range(scaled.height())
+        for x in range(scaled.width())
+    )
+
+
+def test_scale_image_nearest_converts_non_32bit_formats(qapp):
+    source = _checker(3, 2).convertToFormat(QImage.Format.Format_RGB888)
+
+    scaled = scale_image_nearest(source, 2)
+
+    assert scaled.size().toTuple() == (6, 4)
+    assert scaled.pixelColor(5, 3) == source.pixelColor(2, 1)
+
+
+def test_scale_images_nearest_parallel_matches_serial(qapp):
+    frames = [_checker(4, 4) for _ in range(6)]
+
+    serial = scale_images_nearest(frames, 2)
+    parallel = scale_images_nearest(frames, 2, max_workers=3)
+
+    assert [image == other for image, other in zip(serial, parallel, strict=True)] == [True] * 6
+
+
+def test_fit_scaled_image_uses_whole_pixel_factor(qapp):
+    source = _checker(10, 8)
+
+    assert fit_scaled_image(source, 35, 35).size().toTuple() == (30, 24)
+    assert fit_scaled_image(source, 5, 5).size().toTuple() == (5, 4)
+
+
+def test_duplicate_frame_map_points_repeats_at_first_occurrence(qapp):
+    first, second = _checker(4, 4), _checker(5, 4)
+    frames = [first, second, _checker(4, 4), first, _checker(5, 4)]
+
+    assert duplicate_frame_map(frames) == [0, 1, 0, 0, 1]
+
+
+def test_frame_digest_depends_on_size_and_pixels(qapp):
+    wide, tall = (
+        QImage(4, 2, QImage.Format.Format_ARGB32),
+        QImage(2, 4, QImage.Format.Format_ARGB32),
+    )
+    wide.fill(0xFF336699)
+    tall.fill(0xFF336699)
+    changed = _checker(4, 4)
+    changed.setPixel(0, 0, 0xFFFFFFFF)
+
+    assert frame_digest(wide) != frame_digest(tall)
+    assert frame_digest(_checker(4, 4)) == frame_digest(_checker(4, 4).copy())
+    assert frame_digest(changed) != frame_digest(_checker(4, 4))
+
+
+@pytest.mark.parametrize(
+    "image_format",
+    [
+        QImage.Format.Format_RGB32,
+        QImage.Format.Format_ARGB32_Premultiplied,
+        QImage.Format.Format_RGB888,
+    ],
+)
+def test_frame_digest_ignores_the_storage_format(qapp, image_format):
+    opaque = _checker(4, 4).convertToFormat(QImage.Format.Format_ARGB32)
+
+    assert frame_digest(opaque.convertToFormat(image_format)) == frame_digest(opaque)
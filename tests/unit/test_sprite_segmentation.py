@@ -0,0 +1,106 @@
+"""Tests for automatic animation segmentation."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from sprite_model.sprite_segmentation import compute_frame_metrics, propose_segments
+
+pytestmark = pytest.mark.requires_qt
+
+
+def _frame(x: int | None, color: str = "red", size: int = 32) -> QImage:
+    """Transparent frame with a square at column x (None for a blank frame)."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    if x is not None:
+        painter = QPainter(image)
+        painter.fillRect(x, 8, 8, 8, QColor(color))
+        painter.end()
+    return image
+
+
+def test_metrics_measure_change_and_blank_frames(qapp):
+    frames = [_frame(0), _frame(0), _frame(16), _frame(None)]
+
+    metrics = compute_frame_metrics(frames)
+
+    assert metrics.differences.shape == (3,)
+    assert metrics.differences[0] == 0.0
+    assert metrics.differences[1] > 0.0
+    assert metrics.blank.tolist() == [False, False, False, True]
+
+
+def test_flat_colored_frame_counts_as_blank(qapp):
+    solid = QImage(16, 16, QImage.Format.Format_RGB32)
+    solid.fill(QColor("magenta"))
+
+    assert compute_frame_metrics([solid]).blank.tolist() == [True]
+
+
+def test_tiny_sprite_is_not_blank_despite_subsampling(qapp):
+    image = QImage(512, 512, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    image.setPixel(3, 3, 0xFFFFFFFF)  # Falls between sample points
+
+    assert compute_frame_metrics([image]).blank.tolist() == [False]
+
+
+def test_blank_frames_separate_segments(qapp):
+    frames = [_frame(0), _frame(4), _frame(None), _frame(None), _frame(8), _frame(12)]
+
+    assert propose_segments(frames) == [(0, 1), (4, 5)]
+
+
+def test_row_breaks_start_new_segments(qapp):
+    frames = [_frame(x) for x in (0, 2, 4, 6, 0, 2, 4, 6)]
+
+    assert propose_segments(frames, frames_per_row=4) == [(0, 3), (4, 7)]
+
+
+def test_repeating_cycle_is_split_at_each_return(qapp):
+    frames = [_frame(x) for x in (0, 8, 16, 0, 8, 16, 0, 8, 16)]
+
+    assert propose_segments(frames) == [(0, 2), (3, 5), (6, 8)]
+
+
+def test_closing_repeat_of_first_pose_stays_in_cycle(qapp):
+    frames = [_frame(x) for x in (0, 8, 16, 0)]
+
+    assert propose_segments(frames) == [(0, 3)]
+
+
+def test_held_pose_is_not_split(qapp):
+    frames = [_frame(0)] * 4 + [_frame(8)]
+
+    assert propose_segments(frames) == [(0, 4)]
+
+
+def test_small_sprites_on_large_cells_still_split(qapp):
+    frames = [_frame(x, size=256) for x in (0, 40, 80, 0, 40, 80)]
+
+    assert propose_segments(frames) == [(0, 2), (3, 5)]
+
+
+def test_no_frames_yields_no_proposals(qapp):
+    assert propose_segments([]) == []
+
+
+def test_mixed_frame_sizes_are_supported(qapp):
+    frames = [_frame(0, size=16), _frame(4, size=32), _frame(8, size=24)]
+
+    assert propose_segments(frames) == [(0, 2)]
+
+
+def test_large_sheet_segments_quickly(qapp):
+    frames = [_frame((index % 8) * 12, size=128) for index in range(400)]
+
+    started = time.perf_counter()
+    proposals = propose_segments(frames, frames_per_row=16)
+    elapsed = time.perf_counter() - started
+
+    assert len(proposals) == 50
+    assert elapsed < 1.0
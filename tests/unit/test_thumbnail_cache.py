@@ -0,0 +1,141 @@
+"""Tests for the persistent thumbnail cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QImage
+
+from utils.thumbnail_cache import ThumbnailCache
+
+pytestmark = pytest.mark.requires_qt
+
+
+def _frame(seed: int, width: int = 16, height: int = 16) -> QImage:
+    # Built from an array: thousands of setPixel calls trip a PySide refcount bug on None
+    y, x = np.mgrid[0:height, 0:width]
+    pixels = (0xFF000000 | ((x * 31 + seed) % 256 << 16) | (y * 17 << 8)).astype(np.uint32)
+    return QImage(pixels.tobytes(), width, height, width * 4, QImage.Format.Format_ARGB32).copy()
+
+
+def test_thumbnail_roundtrips_exact_pixels(qapp, tmp_path):
+    cache = ThumbnailCache(tmp_path / "thumbs.sqlite")
+    source = _frame(1)
+
+    first = cache.thumbnail(source, 40, 40)
+    second = cache.thumbnail(source, 40, 40)
+
+    assert first.size().toTuple() == (32, 32)
+    assert second.size().toTuple() == (32, 32)
+    assert second.convertToFormat(first.format()) == first
+    cache.close()
+
+
+def test_hit_skips_rescaling(qapp, tmp_path):
+    cache = ThumbnailCache(tmp_path / "thumbs.sqlite")
+    cache.thumbnail(_frame(2), 40, 40)
+
+    with patch("utils.thumbnail_cache.fit_scaled_image") as scale:
+        cache.thumbnail(_frame(2), 40, 40)
+
+    scale.assert_not_called()
+    cache.close()
+
+
+def test_cache_persists_across_instances(qapp, tmp_path):
+    path = tmp_path / "thumbs.sqlite"
+    cache = ThumbnailCache(path)
+    key = ThumbnailCache.frame_key(_frame(3), 40, 40)
+    cache.thumbnail(_frame(3), 40, 40)
+    cache.close()
+
+    reopened = ThumbnailCache(path)
+
+    assert reopened.get(key) is not None
+    assert reopened.total_bytes > 0
+    reopened.close()
+
+
+def test_closed_cache_reopens_on_next_use(qapp, tmp_path):
+    cache = ThumbnailCache(tmp_path / "thumbs.sqlite")
+    key = ThumbnailCache.frame_key(_frame(4), 40, 40)
+    cache.thumbnail(_frame(4), 40, 40)
+    cache.close()
+    cache.close()  # Idempotent
+
+    assert cache.get(key) is not None
+    assert cache.total_bytes > 0
+    cache.close()
+
+
+def test_key_depends_on_pixels_and_box(qapp):
+    key = ThumbnailCache.frame_key(_frame(4), 40, 40)
+
+    assert ThumbnailCache.frame_key(_frame(4), 40, 40) == key
+    assert ThumbnailCache.frame_key(_frame(5), 40, 40) != key
+    assert ThumbnailCache.frame_key(_frame(4), 80, 80) != key
+
+
+def test_eviction_keeps_cache_within_budget(qapp):
+    cache = ThumbnailCache(max_bytes=4096)
+    keys = []
+    for seed in range(40):
+        keys.append(ThumbnailCache.frame_key(_frame(seed * 7), 64, 64))
+        cache.thumbnail(_frame(seed * 7), 64, 64)
+
+    assert 0 < cache.total_bytes <= 4096
+    # Oldest entries go first, the most recent one survives
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[-1]) is not None
+
+
+def test_unusable_path_falls_back_to_memory(qapp, tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("file in the way")
+
+    cache = ThumbnailCache(blocker / "thumbs.sqlite")
+    cache.thumbnail(_frame(6), 40, 40)
+
+    assert cache.get(ThumbnailCache.frame_key(_frame(6), 40, 40)) is not None
+
+
+def test_remembered_digests_skip_hashing(qapp):
+    cache = ThumbnailCache()
+    frame = _frame(7)
+    cache.remember_digests([frame], [b"\x01" * 32])
+
+    with patch("utils.thumbnail_cache.frame_digest") as digest:
+        cache.thumbnail(frame, 40, 40)
+
+    digest.assert_not_called()
+
+
+def test_digest_memo_evicts_least_recently_used(qapp):
+    cache = ThumbnailCache()
+    frames = [_frame(i) for i in range(4)]
+    with patch.object(ThumbnailCache, "_KEY_MEMO_LIMIT", 3):
+        cache.remember_digests(frames[:3], [bytes([i]) * 32 for i in range(3)])
+        cache.thumbnail(frames[0], 40, 40)  # Most recently used now
+        cache.thumbnail(frames[3], 40, 40)  # Evicts frames[1], the oldest
+
+        with patch("utils.thumbnail_cache.frame_digest", return_value=b"\x09" * 32) as digest:
+            cache.thumbnail(frames[0], 40, 40)
+            cache.thumbnail(frames[2], 40, 40)
+            digest.assert_not_called()
+            cache.thumbnail(frames[1], 40, 40)
+            digest.assert_called_once()
+
+
+def test_digest_memo_grows_to_hold_every_remembered_frame(qapp):
+    cache = ThumbnailCache()
+    frames = [_frame(i) for i in range(5)]
+    with patch.object(ThumbnailCache, "_KEY_MEMO_LIMIT", 2):
+        cache.remember_digests(frames, [bytes([i]) * 32 for i in range(5)])
+
+        with patch("utils.thumbnail_cache.frame_digest") as digest:
+            for frame in frames:
+                cache.thumbnail(frame, 40, 40)
+
+    digest.assert_not_called()
@@ -0,0 +1,57 @@
+"""Tests for the sprite sheet tile pyramid."""
+
+import pytest
+from PySide6.QtCore import QRect, QSize
+from PySide6.QtGui import QColor, QImage
+
+from utils.tile_pyramid import TilePyramid, generate_pyramid_tiles, pyramid_level_count
+
+pytestmark = pytest.mark.requires_qt
+
+
+def test_level_geometry():
+    pyramid = TilePyramid(QSize(1000, 300), 128)
+
+    assert pyramid.level_count == pyramid_level_count(QSize(1000, 300), 128) == 4
+    assert [pyramid.level_for_zoom(zoom) for zoom in (2.0, 1.0, 0.6, 0.5, 0.2, 0.01)] == [
+        0,
+        0,
+        0,
+        1,
+        2,
+        3,
+    ]
+    assert pyramid.tile_rect(1, 3, 1) == QRect(768, 256, 232, 44)
+    assert list(pyramid.tiles_in(2, QRect(500, 0, 100, 100))) == [(0, 0), (1, 0)]
+
+
+def test_generated_tiles_cover_every_level_coarsest_first(qapp):
+    image = QImage(600, 200, QImage.Format.Format_ARGB32)
+    image.fill(QColor(10, 200, 30))
+    pyramid = TilePyramid(image.size(), 128)
+    order: list[int] = []
+
+    def on_tile(level: int, column: int, row: int, tile: QImage) -> None:
+        order.append(level)
+        pyramid.add(level, column, row, tile)
+
+    generate_pyramid_tiles(image, 128, on_tile)
+
+    assert order == sorted(order, reverse=True)
+    for level in range(1, pyramid.level_count):
+        for column, row in pyramid.tiles_in(level, QRect(0, 0, 600, 200)):
+            tile = pyramid.tile(level, column, row)
+            assert tile is not None
+            assert tile.pixelColor(0, 0).green() == 200
+    assert pyramid.tile(1, 2, 0).size() == QSize(44, 100)  # Edge tile is cropped
+    assert pyramid.tile(0, 0, 0) is None  # Level 0 is the source itself
+
+
+def test_generation_stops_when_cancelled(qapp):
+    image = QImage(2048, 2048, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    tiles: list[int] = []
+
+    generate_pyramid_tiles(image, 128, lambda *tile: tiles.append(1), lambda: len(tiles) >= 3)
+
+    assert len(tiles) == 3
@@ -3,7 +3,7 @@ UI package - User interface components.
 
 Contains all UI widgets and visual components:
 - Core display widgets (canvas, playback controls)
-- Specialized widgets (frame extractor, animation grid)
+- Specialized widgets (frame extractor, animation grid, sheet overview)
 - Segment preview/selection and status bar components
 - Status bar and progress indicators
 """
@@ -14,6 +14,7 @@ from .animation_segment_preview import AnimationSegmentPreview
 from .enhanced_status_bar import EnhancedStatusBar
 from .frame_extractor import FrameExtractor
 from .playback_controls import PlaybackControls
+from .sheet_overview import SheetOverview
 from .sprite_canvas import SpriteCanvas
 
 __all__ = [
@@ -22,5 +23,6 @@ __all__ = [
     "EnhancedStatusBar",
     "FrameExtractor",
     "PlaybackControls",
+    "SheetOverview",
     "SpriteCanvas",
 ]
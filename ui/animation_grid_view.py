@@ -2,171 +2,592 @@
 Animation Grid View - Frame selection and animation splitting component
 Provides a grid view of all sprite frames with selection capabilities for animation splitting.
 Part of Animation Splitting Feature implementation.
+
+The grid is a virtualized model/view: ``_FrameListModel`` exposes the frames,
+``_FrameThumbnailDelegate`` paints thumbnails, selection and segment markers,
+and ``_FrameListView`` translates mouse input into frame-level signals. Only
+rows that are actually painted build a thumbnail, so sheets with thousands of
+frames populate instantly. Thumbnails themselves are scaled on a private
+thread pool (``_ThumbnailLoader``); cells show a placeholder until their tile
+arrives.
 """
 
 import copy
-from collections.abc import Sequence
-
-from PySide6.QtCore import QPoint, QPointF, Qt, Signal
-from PySide6.QtGui import QColor, QMouseEvent, QPixmap
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QPointF,
+    QRect,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    Signal,
+)
+from PySide6.QtGui import QColor, QImage, QMouseEvent, QPainter, QPen, QPixmap, QResizeEvent
 from PySide6.QtWidgets import (
-    QGridLayout,
+    QAbstractItemView,
     QHBoxLayout,
     QInputDialog,
     QLabel,
+    QListView,
     QMenu,
     QMessageBox,
     QPushButton,
-    QScrollArea,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
 
 from config import Config
 from managers import AnimationSegment, AnimationSegmentManager
-from utils.sprite_rendering import create_padded_pixmap
+from sprite_model.sprite_extraction import as_image
 from utils.styles import StyleManager
+from utils.thumbnail_cache import ThumbnailCache, shared_thumbnail_cache
 
 __all__ = ["AnimationGridView"]
 
+logger = logging.getLogger(__name__)
 
-class _FrameThumbnail(QLabel):
-    """Individual frame thumbnail widget with advanced selection capabilities."""
+# Custom item-data roles served by _FrameListModel
+_SELECTED_ROLE = Qt.ItemDataRole.UserRole + 1
+_SEGMENT_ROLE = Qt.ItemDataRole.UserRole + 2
+_DUPLICATE_ROLE = Qt.ItemDataRole.UserRole + 3
 
-    clicked = Signal(int, int)  # frame_index, modifiers (Qt.KeyboardModifiers as int)
-    doubleClicked = Signal(int)  # frame_index
-    rightClicked = Signal(int, QPoint)  # frame_index, global_position
-    dragStarted = Signal(int)  # frame_index
 
-    def __init__(self, frame_index: int, pixmap: QPixmap, thumbnail_size: int = 80):
+@dataclass(frozen=True)
+class _SegmentMarker:
+    """Segment membership of a single frame cell."""
+
+    color: QColor
+    is_start: bool = False
+    is_end: bool = False
+
+
+class _ThumbnailSignals(QObject):
+    """Signal carrier for _ThumbnailTask (QRunnable cannot emit signals itself)."""
+
+    finished = Signal(int, int, QImage)  # generation, row, thumbnail
+
+
+class _ThumbnailTask(QRunnable):
+    """Fetches or scales one frame thumbnail on a pool thread."""
+
+    def __init__(self, generation: int, row: int, image: QImage, size: int, cache: ThumbnailCache):
         super().__init__()
-        self.frame_index = frame_index
+        self.signals = _ThumbnailSignals()
+        self._generation = generation
+        self._row = row
+        self._image = image
+        self._size = size
+        self._cache = cache
+
+    def run(self):
+        """Produce the thumbnail and emit it tagged with its generation."""
+        try:
+            thumbnail = self._cache.thumbnail(self._image, self._size, self._size)
+        except Exception:
+            logger.exception("Thumbnail generation failed for frame %d", self._row)
+            return
+        self.signals.finished.emit(self._generation, self._row, thumbnail)
+
+
+class _ThumbnailLoader(QObject):
+    """Generates frame thumbnails on a private thread pool.
+
+    Workers consult the persistent ``ThumbnailCache`` first, so reopening a
+    sheet only scales frames whose pixels changed. Each request is tagged
+    with the current generation; ``reset`` bumps it and drops queued work so
+    results for a previous frame list are discarded.
+    Later requests get higher pool priority, so rows painted most recently
+    (the ones on screen) jump ahead of an older backlog.
+    """
+
+    thumbnailReady = Signal(int, QImage)  # row, thumbnail
+
+    def __init__(
+        self, size: int, parent: QObject | None = None, cache: ThumbnailCache | None = None
+    ):
+        super().__init__(parent)
+        self._size = size
+        self._cache = cache if cache is not None else shared_thumbnail_cache()
+        self._generation = 0
+        self._priority = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(Config.UI.THUMBNAIL_WORKERS)
+
+    def request(self, row: int, frame: QImage | QPixmap, urgent: bool = True) -> None:
+        """Queue row for scaling; urgent requests run before background fill."""
+        # QPixmap is GUI-thread only, so hand the pool a QImage
+        image = as_image(frame)
+        task = _ThumbnailTask(self._generation, row, image, self._size, self._cache)
+        task.signals.finished.connect(self._on_finished)
+        priority = 0
+        if urgent:
+            self._priority += 1
+            priority = self._priority
+        self._pool.start(task, priority)
+
+    def remember_digests(
+        self, frames: Sequence[QImage | QPixmap], digests: Sequence[bytes]
+    ) -> None:
+        """Seed the thumbnail cache with known frame digests (QImage frames only)."""
+        pairs = [
+            (frame, digest)
+            for frame, digest in zip(frames, digests, strict=True)
+            if isinstance(frame, QImage)
+        ]
+        self._cache.remember_digests([frame for frame, _ in pairs], [d for _, d in pairs])
+
+    def set_size(self, size: int) -> None:
+        """Produce thumbnails fitting a new box size; pending requests are dropped."""
+        self._size = size
+        self.reset()
+
+    def reset(self) -> None:
+        """Invalidate outstanding requests and drop any still queued."""
+        self._generation += 1
+        self._priority = 0
+        self._pool.clear()
+
+    def _on_finished(self, generation: int, row: int, thumbnail: QImage) -> None:
+        if generation == self._generation:
+            self.thumbnailReady.emit(row, thumbnail)
+
+
+class _FrameListModel(QAbstractListModel):
+    """List model exposing one row per frame.
+
+    Thumbnails are requested from ``_ThumbnailLoader`` the first time a row is
+    painted, so on-screen rows are generated first; a bounded background fill
+    then works through the remaining rows. Until its tile arrives a row has
+    no decoration and the delegate draws a placeholder. Selection and segment
+    markers are plain lookups served through custom roles so the delegate
+    never touches the owning view.
+
+    Segment membership is held as a per-frame index (segment name or None per
+    row) plus each segment's span, so "segment at frame" is O(1) and a
+    segment edit only notifies the rows whose membership or segment changed.
+    """
+
+    # Background-fill requests kept in flight at once
+    _PREFETCH_DEPTH = 8
+
+    def __init__(self, thumbnail_size: int, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
         self._thumbnail_size = thumbnail_size
-        self._selected = False
-        self._is_segment_start = False
-        self._is_segment_end = False
-        self._segment_color = None
+        self._frames: list[QImage | QPixmap] = []
+        self._duplicate_of: list[int | None] = []
+        self._thumbnails: dict[int, QPixmap] = {}
+        self._pending: set[int] = set()
+        self._prefetch_row = 0
+        self._selected: frozenset[int] = frozenset()
+        self._frame_segments: list[str | None] = []
+        self._segment_spans: dict[str, tuple[int, int, QColor]] = {}
+        self._loader = _ThumbnailLoader(thumbnail_size - Config.UI.THUMBNAIL_PADDING, self)
+        self._loader.thumbnailReady.connect(self._on_thumbnail_ready)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._frames)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = 0) -> object:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.thumbnail(row)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            original = self._duplicate_of[row]
+            if original is not None:
+                return f"Frame {row} (duplicate of frame {original})"
+            return f"Frame {row}"
+        if role == _SELECTED_ROLE:
+            return row in self._selected
+        if role == _SEGMENT_ROLE:
+            return self.segment_marker(row)
+        if role == _DUPLICATE_ROLE:
+            return self._duplicate_of[row]
+        return None
 
-        # Mouse interaction tracking
-        self._mouse_press_pos = None
-        self._drag_threshold = Config.UI.DRAG_THRESHOLD
+    def set_frames(
+        self, frames: Sequence[QImage | QPixmap], digests: Sequence[bytes] | None = None
+    ) -> None:
+        """Replace all frames, dropping cached thumbnails and per-row state.
 
-        # Set up the thumbnail
-        self._setup_thumbnail(pixmap)
-        self._update_style()
-
-    def _setup_thumbnail(self, pixmap: QPixmap):
-        """Set up the thumbnail display."""
-        if pixmap and not pixmap.isNull():
-            # Create padded pixmap to prevent edge cutoff
-            padded = create_padded_pixmap(pixmap, padding=1)
-
-            # Scale to fit available space
-            padding = Config.UI.THUMBNAIL_PADDING
-            available_size = self._thumbnail_size - padding
-            scaled_pixmap = padded.scaled(
-                available_size,
-                available_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.setPixmap(scaled_pixmap)
-
-        border_space = Config.UI.THUMBNAIL_PADDING * 2
-        self.setFixedSize(self._thumbnail_size + border_space, self._thumbnail_size + border_space)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setToolTip(f"Frame {self.frame_index}")
-
-    def _update_style(self):
-        """Update visual style based on selection state."""
-        segment_color = None
-        segment_bg = None
-        if self._segment_color is not None and self._segment_color.isValid():
-            segment_color = self._segment_color.name()
-            segment_bg = self._segment_color.lighter(180).name()
-
-        self.setStyleSheet(
-            StyleManager.thumbnail_style(
-                selected=self._selected,
-                segment_color=segment_color,
-                segment_bg=segment_bg,
-                is_segment_start=self._is_segment_start,
-                is_segment_end=self._is_segment_end,
+        digests, when given, are the frames' precomputed content digests
+        (``SpriteModel.frame_metadata.digests``) and spare the thumbnail cache
+        from hashing pixels again.
+        """
+        self.beginResetModel()
+        self._loader.reset()
+        self._frames = list(frames)
+        if digests is not None:
+            self._loader.remember_digests(self._frames, digests)
+        self._duplicate_of = self._find_duplicates(self._frames)
+        self._thumbnails.clear()
+        self._pending.clear()
+        self._prefetch_row = 0
+        self._selected = frozenset()
+        self._frame_segments = [None] * len(self._frames)
+        self._segment_spans = {}
+        self.endResetModel()
+
+    @staticmethod
+    def _find_duplicates(frames: Sequence[QImage | QPixmap]) -> list[int | None]:
+        """Return, per row, the earlier row whose frame shares its pixel data.
+
+        SpriteModel stores exact duplicates as one shared image, so equal
+        cache keys identify them without hashing pixels again.
+        """
+        first_row: dict[int, int] = {}
+        duplicate_of: list[int | None] = []
+        for row, frame in enumerate(frames):
+            original = first_row.setdefault(frame.cacheKey(), row)
+            duplicate_of.append(original if original != row else None)
+        return duplicate_of
+
+    def duplicate_of(self, row: int) -> int | None:
+        """Return the earlier row row duplicates, or None if it is unique."""
+        if 0 <= row < len(self._duplicate_of):
+            return self._duplicate_of[row]
+        return None
+
+    def thumbnail(self, row: int) -> QPixmap | None:
+        """Return the thumbnail for row, or None while it is being generated."""
+        cached = self._thumbnails.get(row)
+        if cached is None and row not in self._pending:
+            self._pending.add(row)
+            self._loader.request(row, self._frames[row])
+        return cached
+
+    def _fill_background(self) -> None:
+        """Keep a few off-screen rows generating so scrolling finds tiles ready."""
+        while len(self._pending) < self._PREFETCH_DEPTH and self._prefetch_row < len(self._frames):
+            row = self._prefetch_row
+            self._prefetch_row += 1
+            if row not in self._thumbnails and row not in self._pending:
+                self._pending.add(row)
+                self._loader.request(row, self._frames[row], urgent=False)
+
+    def _on_thumbnail_ready(self, row: int, thumbnail: QImage) -> None:
+        self._pending.discard(row)
+        if row < len(self._frames):
+            self._thumbnails[row] = QPixmap.fromImage(thumbnail)
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+        self._fill_background()
+
+    def is_selected(self, row: int) -> bool:
+        return row in self._selected
+
+    def segment_at(self, row: int) -> str | None:
+        """Return the name of the segment containing row, if any."""
+        if 0 <= row < len(self._frame_segments):
+            return self._frame_segments[row]
+        return None
+
+    def segment_marker(self, row: int) -> _SegmentMarker | None:
+        name = self.segment_at(row)
+        if name is None:
+            return None
+        start, end, color = self._segment_spans[name]
+        return _SegmentMarker(color=color, is_start=row == start, is_end=row == end)
+
+    def set_selection(self, selected: set[int]) -> None:
+        """Replace the highlighted frame set, repainting only rows that flipped."""
+        previous = self._selected
+        self._selected = frozenset(selected)
+        changed = self._selected ^ previous
+        self._notify_rows(changed, _SELECTED_ROLE)
+
+    def set_segments(self, segments: Iterable[AnimationSegment]) -> None:
+        """Rebuild the frame-to-segment index, repainting only affected rows.
+
+        A row is repainted when its segment membership changed or when the
+        segment it belongs to was recolored or resized (start/end markers).
+        """
+        frame_count = len(self._frames)
+        frame_segments: list[str | None] = [None] * frame_count
+        spans: dict[str, tuple[int, int, QColor]] = {}
+        for segment in segments:
+            start = max(0, segment.start_frame)
+            end = min(segment.end_frame, frame_count - 1)
+            spans[segment.name] = (segment.start_frame, segment.end_frame, segment.color)
+            if start <= end:
+                frame_segments[start : end + 1] = [segment.name] * (end - start + 1)
+
+        edited = {
+            name
+            for name in spans.keys() | self._segment_spans.keys()
+            if spans.get(name) != self._segment_spans.get(name)
+        }
+        previous = self._frame_segments
+        changed = [
+            row
+            for row, (old, new) in enumerate(zip(previous, frame_segments, strict=True))
+            if old != new or (new is not None and new in edited)
+        ]
+        self._frame_segments = frame_segments
+        self._segment_spans = spans
+        self._notify_rows(changed, _SEGMENT_ROLE)
+
+    def _notify_rows(self, rows: Iterable[int], role: int) -> None:
+        """Emit dataChanged once per contiguous run of rows."""
+        run_start = run_end = -2
+        for row in sorted(rows):
+            if row == run_end + 1:
+                run_end = row
+                continue
+            if run_start >= 0:
+                self.dataChanged.emit(self.index(run_start), self.index(run_end), [role])
+            run_start = run_end = row
+        if run_start >= 0:
+            self.dataChanged.emit(self.index(run_start), self.index(run_end), [role])
+
+
+class _FrameThumbnailDelegate(QStyledItemDelegate):
+    """Paints a frame cell: thumbnail, selection highlight, segment markers
+    and a badge naming the frame a duplicate repeats."""
+
+    _MARGIN = 2
+    _RADIUS = 4
+    _MARKER_WIDTH = 5
+    _BADGE_HEIGHT = 14
+
+    def __init__(self, cell_size: int, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._cell_size = cell_size
+
+    def sizeHint(
+        self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> QSize:
+        return QSize(self._cell_size, self._cell_size)
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        rect: QRect = option.rect
+        state: QStyle.StateFlag = option.state
+        selected = bool(index.data(_SELECTED_ROLE))
+        marker = index.data(_SEGMENT_ROLE)
+        hovered = bool(state & QStyle.StateFlag.State_MouseOver)
+
+        colors = StyleManager.Colors
+        if selected:
+            border, background, border_width = (
+                QColor(colors.SUCCESS),
+                QColor(colors.SUCCESS_LIGHT),
+                3,
             )
+        elif isinstance(marker, _SegmentMarker) and marker.color.isValid():
+            border, background, border_width = marker.color, marker.color.lighter(180), 3
+        else:
+            border, background, border_width = QColor(colors.DISABLED_BG), QColor("white"), 1
+        if hovered and not selected:
+            border, background = QColor(colors.SELECTION_BORDER), QColor("#F0F8FF")
+
+        # Center a fixed-size cell inside the (possibly wider) grid slot
+        side = min(self._cell_size, rect.width(), rect.height()) - self._MARGIN * 2
+        cell = QRect(0, 0, side, side)
+        cell.moveCenter(rect.center())
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(border, border_width))
+        painter.setBrush(background)
+        inset = border_width // 2
+        painter.drawRoundedRect(
+            cell.adjusted(inset, inset, -inset, -inset), self._RADIUS, self._RADIUS
         )
 
-    def set_selected(self, selected: bool):
-        """Set selection state."""
-        self._selected = selected
-        self._update_style()
+        if isinstance(marker, _SegmentMarker) and (marker.is_start or marker.is_end):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(border)
+            if marker.is_start:
+                painter.drawRect(cell.left(), cell.top(), self._MARKER_WIDTH, cell.height())
+            if marker.is_end:
+                painter.drawRect(
+                    cell.right() - self._MARKER_WIDTH + 1,
+                    cell.top(),
+                    self._MARKER_WIDTH,
+                    cell.height(),
+                )
 
-    def set_segment_markers(
-        self, is_start: bool = False, is_end: bool = False, color: QColor | None = None
-    ):
-        """Set segment start/end markers."""
-        self._is_segment_start = is_start
-        self._is_segment_end = is_end
-        self._segment_color = color
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(pixmap, QPixmap):
+            if not pixmap.isNull():
+                target = QRect(QPoint(0, 0), pixmap.size())
+                target.moveCenter(cell.center())
+                painter.drawPixmap(target.topLeft(), pixmap)
+        else:
+            # Thumbnail still generating: draw a lightweight placeholder tile
+            placeholder = QRect(0, 0, side // 3, side // 3)
+            placeholder.moveCenter(cell.center())
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(colors.BG_HOVER))
+            painter.drawRoundedRect(placeholder, self._RADIUS, self._RADIUS)
+
+        duplicate_of = index.data(_DUPLICATE_ROLE)
+        if isinstance(duplicate_of, int):
+            self._paint_duplicate_badge(painter, cell, duplicate_of)
+        painter.restore()
+
+    def _paint_duplicate_badge(self, painter: QPainter, cell: QRect, original: int) -> None:
+        """Draw a small "=N" tag in the cell's top-right corner."""
+        text = f"={original}"
+        font = painter.font()
+        font.setPixelSize(self._BADGE_HEIGHT - 4)
+        painter.setFont(font)
+        width = painter.fontMetrics().horizontalAdvance(text) + 6
+        badge = QRect(
+            cell.right() - width - self._MARGIN,
+            cell.top() + self._MARGIN,
+            width,
+            self._BADGE_HEIGHT,
+        )
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(StyleManager.Colors.PRIMARY))
+        painter.drawRoundedRect(badge, self._RADIUS, self._RADIUS)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, text)
 
-        # Update the visual style
-        self._update_style()
 
-        # Schedule visual update (Qt batches efficiently)
-        self.update()
+class _FrameListView(QListView):
+    """Wrapping list view translating mouse input into frame-level signals."""
 
-    def force_clear_style(self):
-        """Forcefully clear all styles and reset to default."""
-        # Reset all state
-        self._is_segment_start = False
-        self._is_segment_end = False
-        self._segment_color = None
-        self._selected = False
+    frameClicked = Signal(int, int)  # frame_index, modifiers (Qt.KeyboardModifiers as int)
+    frameDoubleClicked = Signal(int)  # frame_index
+    frameRightClicked = Signal(int, QPoint)  # frame_index, global_position
+    dragStarted = Signal(int)  # frame_index
+    dragMoved = Signal(int)  # frame_index under the cursor
+    dragFinished = Signal()
 
-        # Use the same style path as _update_style() for the unselected, no-segment state
-        self.setStyleSheet(StyleManager.thumbnail_style())
+    def __init__(self, cell_size: int, columns: int, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._cell_size = cell_size
+        self._columns = columns
 
-        # Schedule visual update (Qt batches efficiently)
-        self.update()
+        # Mouse interaction tracking
+        self._press_pos: QPointF | None = None
+        self._press_row: int | None = None
+        self._dragging = False
+        self._drag_threshold = Config.UI.DRAG_THRESHOLD
 
-    def mousePressEvent(self, event: QMouseEvent):
+        self.setViewMode(QListView.ViewMode.ListMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self._update_grid_size()
+
+    def set_columns(self, columns: int) -> None:
+        """Set the number of columns to lay frames out in."""
+        self._columns = columns
+        self._update_grid_size()
+
+    def _layout_width(self) -> int:
+        # Mirror QListView's wrapping bounds: with an as-needed vertical scroll
+        # bar it always reserves the bar's extent, visible or not.
+        width = self.maximumViewportSize().width()
+        style = self.style()
+        scroll_bar = self.verticalScrollBar()
+        if self.verticalScrollBarPolicy() == Qt.ScrollBarPolicy.ScrollBarAsNeeded and not (
+            style.pixelMetric(QStyle.PixelMetric.PM_ScrollView_ScrollBarOverlap, None, scroll_bar)
+        ):
+            width -= style.pixelMetric(QStyle.PixelMetric.PM_ScrollBarExtent, None, scroll_bar)
+        return width
+
+    def _update_grid_size(self) -> None:
+        # Stretch slots to fill the width with ``columns`` cells, but never
+        # below the cell size; narrower viewports simply wrap earlier. Qt wraps
+        # once a row reaches the bound, hence the spare pixel.
+        slot_width = max(self._cell_size, (self._layout_width() - 1) // max(1, self._columns))
+        size = QSize(slot_width, self._cell_size)
+        if size != self.gridSize():
+            self.setGridSize(size)
+
+    def _row_at(self, position: QPointF) -> int | None:
+        index = self.indexAt(position.toPoint())
+        return index.row() if index.isValid() else None
+
+    def resizeEvent(self, e: QResizeEvent) -> None:
+        super().resizeEvent(e)
+        self._update_grid_size()
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle mouse press events with modifier support."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self._mouse_press_pos = event.position()
-            # Convert modifiers to integer via .value attribute
-            modifiers_value = event.modifiers().value
-            self.clicked.emit(self.frame_index, modifiers_value)
-        elif event.button() == Qt.MouseButton.RightButton:
-            self.rightClicked.emit(self.frame_index, event.globalPosition().toPoint())
+        row = self._row_at(event.position())
+        if row is not None:
+            if event.button() == Qt.MouseButton.LeftButton:
+                self._press_pos = event.position()
+                self._press_row = row
+                self._dragging = False
+                # Convert modifiers to integer via .value attribute
+                self.frameClicked.emit(row, event.modifiers().value)
+            elif event.button() == Qt.MouseButton.RightButton:
+                self.frameRightClicked.emit(row, event.globalPosition().toPoint())
         super().mousePressEvent(event)
 
-    def mouseDoubleClickEvent(self, event: QMouseEvent):
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """Handle double-click for frame preview."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.doubleClicked.emit(self.frame_index)
+        row = self._row_at(event.position())
+        if row is not None and event.button() == Qt.MouseButton.LeftButton:
+            self.frameDoubleClicked.emit(row)
         super().mouseDoubleClickEvent(event)
 
-    def mouseMoveEvent(self, event: QMouseEvent):
-        """Handle mouse move for drag detection."""
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """Detect drag start past the threshold, then track the frame under the cursor."""
         if (
             event.buttons() & Qt.MouseButton.LeftButton
-            and self._mouse_press_pos
-            and (event.position() - self._mouse_press_pos).manhattanLength() > self._drag_threshold
+            and self._press_pos is not None
+            and self._press_row is not None
         ):
-            self.dragStarted.emit(self.frame_index)
-            self._mouse_press_pos = None  # Prevent multiple drag signals
+            if (
+                not self._dragging
+                and (event.position() - self._press_pos).manhattanLength() > self._drag_threshold
+            ):
+                self._dragging = True
+                self.dragStarted.emit(self._press_row)
+            if self._dragging:
+                row = self._row_at(event.position())
+                if row is not None:
+                    self.dragMoved.emit(row)
         super().mouseMoveEvent(event)
 
-    def mouseReleaseEvent(self, event: QMouseEvent):
-        """Handle mouse release."""
-        self._mouse_press_pos = None
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """Handle mouse release to end drag selection."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            if self._dragging:
+                self.dragFinished.emit()
+            self._press_pos = None
+            self._press_row = None
+            self._dragging = False
         super().mouseReleaseEvent(event)
 
 
 class _GridViewBuilder:
-    """Widget construction + thumbnail population helper for AnimationGridView.
+    """Widget construction + frame population helper for AnimationGridView.
 
     Holds no state of its own beyond a back-reference to the view; all attributes
-    it builds (``_scroll_area``, ``_grid_layout``, ``_columns_display``, etc.)
+    it builds (``_list_view``, ``_frame_model``, ``_columns_display``, etc.)
     live on the view so existing tests and signal wiring keep working.
     """
 
@@ -174,7 +595,7 @@ class _GridViewBuilder:
         self._view = view
 
     def setup_grid_area(self, parent_layout: QVBoxLayout) -> None:
-        """Build the controls row, instructions, and scroll-area chrome."""
+        """Build the controls row, instructions, and the frame list view."""
         view = self._view
 
         controls_layout = QHBoxLayout()
@@ -199,6 +620,13 @@ class _GridViewBuilder:
 
         controls_layout.addStretch()
 
+        view._auto_segment_btn = QPushButton("Auto-Segment")
+        view._auto_segment_btn.setToolTip(
+            "Propose segments from frame similarity (blank frames, row breaks, cycles)"
+        )
+        view._auto_segment_btn.clicked.connect(lambda: view.autoSegmentRequested.emit())
+        controls_layout.addWidget(view._auto_segment_btn)
+
         view._create_segment_btn = QPushButton("Create Animation Segment")
         view._create_segment_btn.setEnabled(False)
         view._create_segment_btn.clicked.connect(view._create_segment_from_selection)
@@ -219,60 +647,36 @@ class _GridViewBuilder:
         instructions.setWordWrap(True)
         parent_layout.addWidget(instructions)
 
-        view._scroll_area = QScrollArea()
-        view._scroll_area.setWidgetResizable(True)
-        view._scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        view._scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-        view._grid_container = QWidget()
-        view._grid_layout = QGridLayout(view._grid_container)
-        view._grid_layout.setSpacing(2)
+        cell_size = view._thumbnail_size + Config.UI.THUMBNAIL_PADDING * 2
+        view._frame_model = _FrameListModel(view._thumbnail_size, view)
+        view._list_view = _FrameListView(cell_size, view._grid_columns)
+        view._list_view.setModel(view._frame_model)
+        view._list_view.setItemDelegate(_FrameThumbnailDelegate(cell_size, view._list_view))
 
-        view._scroll_area.setWidget(view._grid_container)
-        parent_layout.addWidget(view._scroll_area)
+        view._list_view.frameClicked.connect(view._on_frame_clicked)
+        view._list_view.frameDoubleClicked.connect(view._on_frame_double_clicked)
+        view._list_view.frameRightClicked.connect(view._on_frame_right_clicked)
+        view._list_view.dragStarted.connect(view._on_drag_started)
+        view._list_view.dragMoved.connect(view._on_drag_moved)
+        view._list_view.dragFinished.connect(view._on_drag_finished)
 
-    def clear(self) -> None:
-        """Tear down current thumbnails and grid items."""
-        view = self._view
-        for thumbnail in view._thumbnails:
-            thumbnail.deleteLater()
-        view._thumbnails.clear()
-
-        while view._grid_layout.count():
-            item = view._grid_layout.takeAt(0)
-            if item is not None and (widget := item.widget()) is not None:
-                widget.deleteLater()
+        parent_layout.addWidget(view._list_view)
 
     def populate(self) -> None:
-        """Recreate thumbnails for the current ``view._frames``."""
+        """Load ``view._frames`` into the model and restore per-frame state."""
         view = self._view
-        for i, frame in enumerate(view._frames):
-            thumbnail = _FrameThumbnail(i, frame, view._thumbnail_size)
-
-            thumbnail.clicked.connect(view._on_frame_clicked)
-            thumbnail.doubleClicked.connect(view._on_frame_double_clicked)
-            thumbnail.rightClicked.connect(view._on_frame_right_clicked)
-            thumbnail.dragStarted.connect(view._on_drag_started)
-
-            row = i // view._grid_columns
-            col = i % view._grid_columns
-            view._grid_layout.addWidget(thumbnail, row, col)
-
-            view._thumbnails.append(thumbnail)
-
+        view._frame_model.set_frames(view._frames, view._frame_digests)
         view._update_segment_visualization()
         view._update_selection_display()
 
     def adjust_columns(self, delta: int) -> None:
-        """Change column count; rebuild grid if it actually changed."""
+        """Change column count; re-layout the list if it actually changed."""
         view = self._view
         new_columns = max(1, min(20, view._grid_columns + delta))
         if new_columns != view._grid_columns:
             view._grid_columns = new_columns
             view._columns_display.setText(str(view._grid_columns))
-            if view._frames:
-                self.clear()
-                self.populate()
+            view._list_view.set_columns(new_columns)
 
 
 class _SegmentFactory:
@@ -375,13 +779,14 @@ class AnimationGridView(QWidget):
     segmentSelected = Signal(AnimationSegment)  # selected_segment
     segmentPreviewRequested = Signal(AnimationSegment)  # segment_to_preview (double-click)
     exportRequested = Signal(str)  # segment_name
+    autoSegmentRequested = Signal()
 
     def __init__(self):
         super().__init__()
 
         # State
-        self._frames: list[QPixmap] = []
-        self._thumbnails: list[_FrameThumbnail] = []
+        self._frames: list[QImage | QPixmap] = []
+        self._frame_digests: Sequence[bytes] | None = None  # Content digest per frame, if known
         self._segments: dict[str, AnimationSegment] = {}
 
         # Enhanced selection state
@@ -399,11 +804,11 @@ class AnimationGridView(QWidget):
         # setup_grid_area; declared here so type-checkers see them as members.
         self._columns_label: QLabel
         self._columns_display: QLabel
+        self._auto_segment_btn: QPushButton
         self._create_segment_btn: QPushButton
         self._clear_selection_btn: QPushButton
-        self._scroll_area: QScrollArea
-        self._grid_container: QWidget
-        self._grid_layout: QGridLayout
+        self._frame_model: _FrameListModel
+        self._list_view: _FrameListView
 
         # Construction + segment-creation collaborators (created before _setup_ui
         # so the builder can wire button signals into self).
@@ -412,9 +817,6 @@ class AnimationGridView(QWidget):
 
         self._setup_ui()
 
-        # Enable mouse tracking for drag selection
-        self.setMouseTracking(True)
-
     def _setup_ui(self):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
@@ -426,17 +828,20 @@ class AnimationGridView(QWidget):
         """Set up the main grid area (delegated to GridViewBuilder)."""
         self._builder.setup_grid_area(parent_layout)
 
-    def set_frames(self, frames: Sequence[QPixmap]):
-        """Set the frames to display in the grid."""
+    def set_frames(
+        self, frames: Sequence[QImage | QPixmap], digests: Sequence[bytes] | None = None
+    ):
+        """Set the frames to display in the grid.
+
+        Args:
+            frames: Frames in display order
+            digests: Precomputed content digest per frame, if known
+        """
         self._clear_selection()
         self._frames = list(frames)
-        self._builder.clear()
+        self._frame_digests = digests
         self._builder.populate()
 
-    def _clear_grid(self):
-        """Clear the current grid (delegated to GridViewBuilder)."""
-        self._builder.clear()
-
     def _populate_grid(self):
         """Populate the grid with frame thumbnails (delegated to GridViewBuilder)."""
         self._builder.populate()
@@ -504,16 +909,12 @@ class AnimationGridView(QWidget):
         start = min(start_frame, end_frame)
         end = max(start_frame, end_frame)
 
-        for i in range(start, end + 1):
-            if i < len(self._thumbnails):
-                self._selected_frames.add(i)
+        self._selected_frames.update(range(start, min(end + 1, len(self._frames))))
 
     def _get_segment_at_frame(self, frame_index: int) -> AnimationSegment | None:
         """Get the segment that contains the given frame index."""
-        for segment in self._segments.values():
-            if segment.start_frame <= frame_index <= segment.end_frame:
-                return segment
-        return None
+        name = self._frame_model.segment_at(frame_index)
+        return self._segments.get(name) if name is not None else None
 
     def _on_frame_right_clicked(self, frame_index: int, position: QPoint):
         """Handle frame thumbnail right-click."""
@@ -575,10 +976,8 @@ class AnimationGridView(QWidget):
             menu.exec(position)
 
     def _update_selection_display(self):
-        """Update visual state of all thumbnails based on current selection."""
-        for i, thumbnail in enumerate(self._thumbnails):
-            selected = i in self._selected_frames
-            thumbnail.set_selected(selected)
+        """Push the current selection to the frame model for repainting."""
+        self._frame_model.set_selection(self._selected_frames)
 
     def _update_selection_controls(self):
         """Update state of selection control buttons."""
@@ -692,21 +1091,8 @@ class AnimationGridView(QWidget):
     # ============================================================================
 
     def _update_segment_visualization(self):
-        """Update visual markers for all segments."""
-        # Clear all thumbnails to default state
-        for thumbnail in self._thumbnails:
-            thumbnail.force_clear_style()
-
-        # Apply segment markers
-        for segment in self._segments.values():
-            for i in range(segment.start_frame, segment.end_frame + 1):
-                if i < len(self._thumbnails):
-                    is_start = i == segment.start_frame
-                    is_end = i == segment.end_frame
-                    self._thumbnails[i].set_segment_markers(is_start, is_end, segment.color)
-
-        # Single update call is sufficient - Qt will batch repaints
-        self.update()
+        """Update visual markers for all segments (only changed frames repaint)."""
+        self._frame_model.set_segments(self._segments.values())
 
     def _preview_selection(self):
         """Preview the currently selected frames as an animation."""
@@ -734,42 +1120,19 @@ class AnimationGridView(QWidget):
         self._segment_factory.reset()
         self._update_segment_visualization()
 
-    def mouseMoveEvent(self, event: QMouseEvent):
-        """Handle mouse move for drag selection."""
+    def _on_drag_moved(self, frame_index: int):
+        """Extend the drag selection to the frame under the cursor."""
         if self._is_dragging and self._drag_start_frame is not None:
-            # Find the frame under the mouse cursor
-            frame_under_mouse = self._get_frame_at_position(event.position())
+            self._update_drag_selection(self._drag_start_frame, frame_index)
 
-            if frame_under_mouse is not None:
-                # Update drag selection
-                self._update_drag_selection(self._drag_start_frame, frame_under_mouse)
-
-        super().mouseMoveEvent(event)
-
-    def mouseReleaseEvent(self, event: QMouseEvent):
+    def _on_drag_finished(self):
         """Handle mouse release to end drag selection."""
-        if event.button() == Qt.MouseButton.LeftButton and self._is_dragging:
+        if self._is_dragging:
             self._is_dragging = False
             self._drag_start_frame = None
             self._pre_drag_selection.clear()
             self._update_selection_controls()
 
-        super().mouseReleaseEvent(event)
-
-    def _get_frame_at_position(self, position: QPointF) -> int | None:
-        """Get the frame index at the given position."""
-        # Find which thumbnail widget is at this position
-        widget = self.childAt(position.toPoint())
-
-        # Look for FrameThumbnail in the widget hierarchy
-        while widget and not isinstance(widget, _FrameThumbnail):
-            widget = widget.parent()
-
-        if isinstance(widget, _FrameThumbnail):
-            return widget.frame_index
-
-        return None
-
     def _update_drag_selection(self, start_frame: int, end_frame: int):
         """Update selection during drag operation."""
         start = min(start_frame, end_frame)
@@ -777,5 +1140,5 @@ class AnimationGridView(QWidget):
 
         # Start with pre-drag selection and add drag range
         self._selected_frames = self._pre_drag_selection.copy()
-        self._selected_frames.update(range(start, min(end + 1, len(self._thumbnails))))
+        self._selected_frames.update(range(start, min(end + 1, len(self._frames))))
         self._update_selection_display()
@@ -7,8 +7,8 @@ Part of Animation Segment System Enhancement.
 import contextlib
 from collections.abc import Sequence
 
-from PySide6.QtCore import QPoint, Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QKeySequence, QPixmap, QShortcut
+from PySide6.QtCore import QEvent, QObject, QPoint, Qt, Signal
+from PySide6.QtGui import QColor, QHideEvent, QImage, QKeySequence, QPixmap, QShortcut, QShowEvent
 from PySide6.QtWidgets import (
     QCheckBox,
     QFrame,
@@ -25,6 +25,10 @@ from PySide6.QtWidgets import (
 )
 
 from config import Config
+from core.animation_ticker import shared_animation_ticker
+from core.playback_clock import PlaybackClock
+from sprite_model.animation_timeline import compile_timeline
+from ui.animation_grid_view import _ThumbnailLoader
 from utils.sprite_rendering import create_padded_pixmap
 from utils.styles import StyleManager
 
@@ -40,7 +44,10 @@ class _SegmentPreviewItem(QFrame):
     - Frame holds: Pause on specific frames for a set duration
     - Hold management: Add, edit, clear individual holds or apply to all frames
     - Visual preview of current frame
-    - Export options via context menu
+    - Export and main-canvas playback options via context menu
+    - Playback suspends while the preview cannot be seen (hidden tab,
+      minimized window, scrolled out of view) and resumes at the timeline
+      position wall time has reached
     """
 
     # Signals
@@ -49,12 +56,13 @@ class _SegmentPreviewItem(QFrame):
     exportRequested = Signal(str)  # segment_name
     bounceChanged = Signal(str, bool)  # segment_name, bounce_mode
     frameHoldsChanged = Signal(str, dict)  # segment_name, frame_holds
+    canvasPlaybackRequested = Signal(str)  # segment_name
 
     def __init__(
         self,
         segment_name: str,
         color: QColor,
-        frames: list[QPixmap],
+        frames: list[QImage | QPixmap],
         bounce_mode: bool = False,
         frame_holds: dict[int, int] | None = None,
         zoom_factor: float = 1.0,
@@ -67,17 +75,27 @@ class _SegmentPreviewItem(QFrame):
         self._is_playing = False
         self._fps = 10  # Default FPS
         self._zoom_factor = zoom_factor
-
-        # Animation mode properties
+        # Display-ready (scaled, padded) pixmaps at the current zoom, keyed by
+        # the frame's cacheKey() so duplicate frames share one entry. Filled
+        # from the shared thumbnail cache by a worker pool, never on the GUI thread.
+        self._display_pixmaps: dict[int, QPixmap] = {}
+        self._requested: set[int] = set()  # Cache keys queued at the current zoom
+        self._thumbnails = _ThumbnailLoader(self._thumbnail_size(), self)
+        self._thumbnails.thumbnailReady.connect(self._on_thumbnail_ready)
+
+        # Animation mode properties (compiled into a timeline of ticks)
         self._bounce_mode = bounce_mode
         self._frame_holds = frame_holds or {}
-        self._playback_direction = 1  # 1 for forward, -1 for backward
-        self._hold_counter = 0  # Counter for frame holds
+        self._timeline = compile_timeline(0, len(frames) - 1, bounce_mode, self._frame_holds)
+        self._tick = 0  # Position in the timeline
+
+        # Mini animation controller: a wall clock polled by the shared ticker
+        self._clock = PlaybackClock(self._fps)
+        self._ticker = shared_animation_ticker()
 
-        # Create mini animation controller
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_frame)
-        self._update_timer_interval()
+        # Visibility: the ticker only wakes this preview while it can be seen
+        self._shown = False  # Between show and hide events (tabs, minimized window)
+        self._in_viewport = True  # Maintained by the owning scroll area
 
         self._setup_ui()
 
@@ -192,57 +210,72 @@ class _SegmentPreviewItem(QFrame):
         layout.addWidget(self.preview_label)
 
     def _display_frame(self, index: int):
-        """Display a specific frame in the preview."""
+        """Display a specific frame in the preview.
+
+        Pixmaps come from ``_display_pixmaps``; a frame whose thumbnail has not
+        arrived yet leaves the previous image up and is requested first.
+        """
         if 0 <= index < len(self._frames):
-            pixmap = self._frames[index]
-
-            # Create padded pixmap to prevent edge cutoff
-            padded = create_padded_pixmap(pixmap, padding=1)
-
-            # Scale to fit preview area
-            scaled_size = int(Config.UI.PREVIEW_SCALED * self._zoom_factor)
-            scaled = padded.scaled(
-                scaled_size,
-                scaled_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.preview_label.setPixmap(scaled)
+            pixmap = self._display_pixmaps.get(self._frames[index].cacheKey())
+            if pixmap is not None:
+                self.preview_label.setPixmap(pixmap)
+            else:
+                self._request_thumbnails()
             self.frame_counter.setText(f"{index + 1} / {len(self._frames)}")
 
-    def _update_frame(self):
-        """Update to next frame in animation."""
-        if len(self._frames) <= 1:
+    def _thumbnail_size(self) -> int:
+        """Thumbnail box at the current zoom, leaving room for the padding."""
+        return int(Config.UI.PREVIEW_SCALED * self._zoom_factor) - 2
+
+    def _request_thumbnails(self):
+        """Queue every frame not yet rendered at the current zoom, the shown one first."""
+        for index in (self._current_frame, *range(len(self._frames))):
+            if not 0 <= index < len(self._frames):
+                continue
+            key = self._frames[index].cacheKey()
+            if key in self._display_pixmaps or key in self._requested:
+                continue
+            self._requested.add(key)
+            self._thumbnails.request(
+                index, self._frames[index], urgent=index == self._current_frame
+            )
+
+    def _on_thumbnail_ready(self, index: int, thumbnail: QImage):
+        """Pad an arrived thumbnail (whole-pixel scaled by the cache) and show it if current."""
+        if not 0 <= index < len(self._frames):
             return
+        key = self._frames[index].cacheKey()
+        self._display_pixmaps[key] = create_padded_pixmap(thumbnail, padding=1)
+        if self._frames[self._current_frame].cacheKey() == key:
+            self._display_frame(self._current_frame)
 
-        # Check if we're holding the current frame
-        if self._current_frame in self._frame_holds:
-            if self._hold_counter < self._frame_holds[self._current_frame]:
-                self._hold_counter += 1
-                return  # Keep displaying the same frame
-            else:
-                self._hold_counter = 0  # Reset counter for next time
-
-        # Update frame based on playback mode
-        if self._bounce_mode:
-            # Bounce mode: reverse direction at ends
-            next_frame = self._current_frame + self._playback_direction
-
-            if next_frame >= len(self._frames):
-                # Hit the end, reverse direction
-                self._playback_direction = -1
-                next_frame = len(self._frames) - 2  # Go back one frame
-            elif next_frame < 0:
-                # Hit the start, reverse direction
-                self._playback_direction = 1
-                next_frame = 1  # Go forward one frame
-
-            self._current_frame = max(0, min(next_frame, len(self._frames) - 1))
-        else:
-            # Normal loop mode
-            self._current_frame = (self._current_frame + 1) % len(self._frames)
+    def _update_frame(self, ticks: int = 1):
+        """Advance ticks along the timeline and show the frame there."""
+        if len(self._frames) <= 1:
+            return
 
-        self._display_frame(self._current_frame)
+        self._tick += ticks
+        frame = self._timeline.frame_at(self._tick)
+        if frame != self._current_frame:
+            self._current_frame = frame
+            self._display_frame(frame)
+
+    def _on_ticker(self):
+        """Shared ticker callback: advance by the ticks wall time says are due.
+
+        Ticker passes before this preview's next frame boundary do nothing;
+        late passes skip ahead instead of drifting.
+        """
+        ticks = self._clock.poll()
+        if ticks:
+            self._update_frame(ticks)
+
+    def _rebuild_timeline(self):
+        """Recompile the timeline after a bounce/hold edit, keeping the shown frame."""
+        self._timeline = compile_timeline(
+            0, len(self._frames) - 1, self._bounce_mode, self._frame_holds
+        )
+        self._tick = self._timeline.first_tick_of(self._current_frame)
 
     def _toggle_playback(self):
         """Toggle animation playback."""
@@ -252,24 +285,57 @@ class _SegmentPreviewItem(QFrame):
             self.play_button.setText("⏸")
             self.play_button.setStyleSheet(StyleManager.button_warning())
             if len(self._frames) > 1:
-                self._timer.start()
+                self._clock.start()
         else:
             self.play_button.setText("▶")
             self.play_button.setStyleSheet(StyleManager.button_success())
-            self._timer.stop()
+            self._clock.stop()
+        self._update_ticker_subscription()
 
         self.playToggled.emit(self.segment_name, self._is_playing)
 
-    def _update_timer_interval(self):
-        """Update timer interval based on current FPS."""
-        if self._fps > 0:
-            interval = 1000 // self._fps
-            self._timer.setInterval(interval)
+    @property
+    def is_suspended(self) -> bool:
+        """True while playing but not advancing because the preview is not visible."""
+        return self._is_playing and not self._is_viewable()
+
+    def set_in_viewport(self, in_viewport: bool):
+        """Report whether the preview intersects its scroll area's viewport."""
+        if in_viewport != self._in_viewport:
+            self._in_viewport = in_viewport
+            self._update_ticker_subscription()
+
+    def _is_viewable(self) -> bool:
+        return self._shown and self._in_viewport
+
+    def _update_ticker_subscription(self):
+        """Wake on the shared ticker only while playing and viewable.
+
+        The playback clock keeps running while suspended, so the first pass
+        after resuming jumps straight to the frame wall time has reached.
+        """
+        if self._is_playing and len(self._frames) > 1 and self._is_viewable():
+            self._ticker.subscribe(self, self._on_ticker)
+            self._on_ticker()  # Catch up before the preview is painted again
+        else:
+            self._ticker.unsubscribe(self)
+
+    def showEvent(self, event: QShowEvent):
+        """Resume playback when shown (tab switched back, window restored)."""
+        super().showEvent(event)
+        self._shown = True
+        self._update_ticker_subscription()
+
+    def hideEvent(self, event: QHideEvent):
+        """Suspend playback while hidden (other tab, minimized window)."""
+        super().hideEvent(event)
+        self._shown = False
+        self._update_ticker_subscription()
 
     def _on_fps_changed(self, value: int):
         """Handle FPS change from spinner."""
         self._fps = value
-        self._update_timer_interval()
+        self._clock.set_fps(value)
 
     def set_playing(self, playing: bool):
         """Set playback state externally."""
@@ -281,13 +347,14 @@ class _SegmentPreviewItem(QFrame):
         if self._is_playing:
             self._toggle_playback()
         self._current_frame = 0
+        self._tick = 0
         self._display_frame(0)
 
     def cleanup(self):
-        """Clean up timer and signal connections before deletion."""
-        self._timer.stop()
-        with contextlib.suppress(RuntimeError, TypeError):
-            self._timer.timeout.disconnect(self._update_frame)
+        """Leave the shared ticker and drop signal connections before deletion."""
+        self._ticker.unsubscribe(self)
+        self._clock.stop()
+        self._thumbnails.reset()
         with contextlib.suppress(RuntimeError, TypeError):
             self.customContextMenuRequested.disconnect(self._show_context_menu)
 
@@ -299,6 +366,12 @@ class _SegmentPreviewItem(QFrame):
         export_action = menu.addAction("Export Segment...")
         export_action.triggered.connect(lambda: self.exportRequested.emit(self.segment_name))
 
+        # Main canvas playback (toggles between this segment and all frames)
+        canvas_action = menu.addAction("Play on Main Canvas")
+        canvas_action.triggered.connect(
+            lambda: self.canvasPlaybackRequested.emit(self.segment_name)
+        )
+
         menu.addSeparator()
 
         # Remove action
@@ -310,8 +383,7 @@ class _SegmentPreviewItem(QFrame):
     def _on_bounce_toggled(self, checked: bool):
         """Handle bounce mode toggle."""
         self._bounce_mode = checked
-        # Reset playback direction when toggling mode
-        self._playback_direction = 1
+        self._rebuild_timeline()
         # Emit signal for persistence
         self.bounceChanged.emit(self.segment_name, checked)
 
@@ -373,6 +445,7 @@ class _SegmentPreviewItem(QFrame):
 
             if ok:
                 self._frame_holds[frame_idx] = duration
+                self._rebuild_timeline()
                 self._update_hold_button_text()
                 # Emit signal for persistence
                 self.frameHoldsChanged.emit(self.segment_name, self._frame_holds)
@@ -396,6 +469,7 @@ class _SegmentPreviewItem(QFrame):
             else:
                 # Remove hold if duration is 0
                 self._frame_holds.pop(frame_idx, None)
+            self._rebuild_timeline()
             self._update_hold_button_text()
             # Emit signal for persistence
             self.frameHoldsChanged.emit(self.segment_name, self._frame_holds)
@@ -403,7 +477,7 @@ class _SegmentPreviewItem(QFrame):
     def _clear_frame_holds(self):
         """Clear all frame holds."""
         self._frame_holds.clear()
-        self._hold_counter = 0
+        self._rebuild_timeline()
         self._update_hold_button_text()
         # Emit signal for persistence
         self.frameHoldsChanged.emit(self.segment_name, self._frame_holds)
@@ -428,6 +502,7 @@ class _SegmentPreviewItem(QFrame):
             for i in range(len(self._frames)):
                 self._frame_holds[i] = duration
 
+            self._rebuild_timeline()
             self._update_hold_button_text()
             # Emit signal for persistence
             self.frameHoldsChanged.emit(self.segment_name, self._frame_holds)
@@ -441,8 +516,13 @@ class _SegmentPreviewItem(QFrame):
 
     def set_zoom_factor(self, zoom_factor: float):
         """Update the zoom factor and redraw the preview content."""
+        if zoom_factor == self._zoom_factor:
+            return
         self._zoom_factor = zoom_factor
-        # Redraw current frame with new zoom
+        # Rendered for the old zoom; the shown frame stays up until its replacement arrives
+        self._display_pixmaps.clear()
+        self._requested.clear()
+        self._thumbnails.set_size(self._thumbnail_size())
         self._display_frame(self._current_frame)
 
 
@@ -454,6 +534,7 @@ class AnimationSegmentPreview(QWidget):
     - Global play/stop controls for all segments
     - Content zoom (50% to 200%) - scales sprites while keeping widget size constant
     - Keyboard shortcuts: Ctrl+/- for zoom control
+    - Previews scrolled out of view stop animating until scrolled back
     """
 
     # Signals
@@ -461,11 +542,12 @@ class AnimationSegmentPreview(QWidget):
     playbackStateChanged = Signal(str, bool)  # segment_name, is_playing
     segmentBounceChanged = Signal(str, bool)  # segment_name, bounce_mode
     segmentFrameHoldsChanged = Signal(str, dict)  # segment_name, frame_holds
+    segmentCanvasPlaybackRequested = Signal(str)  # segment_name
 
     def __init__(self):
         super().__init__()
         self._preview_items: dict[str, _SegmentPreviewItem] = {}
-        self._all_frames: list[QPixmap] = []
+        self._all_frames: list[QImage | QPixmap] = []
         self._zoom_factor = 1.0  # Default zoom level
 
         self._setup_ui()
@@ -549,6 +631,11 @@ class AnimationSegmentPreview(QWidget):
         self.scroll_area.setWidget(self.container)
         layout.addWidget(self.scroll_area)
 
+        # Scrolling moves the container; layout changes and splitter drags resize
+        # it or the viewport. Each can change which previews are in view.
+        self.container.installEventFilter(self)
+        self.scroll_area.viewport().installEventFilter(self)
+
         # Empty state
         self.empty_label = QLabel(
             "No animation segments yet.\nSelect frames and right-click to create."
@@ -557,7 +644,20 @@ class AnimationSegmentPreview(QWidget):
         self.empty_label.setStyleSheet(StyleManager.label_empty_state())
         self.container_layout.addWidget(self.empty_label)
 
-    def set_frames(self, frames: Sequence[QPixmap]):
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Track which previews intersect the scroll viewport."""
+        if event.type() in (QEvent.Type.Move, QEvent.Type.Resize):
+            self._update_viewport_visibility()
+        return super().eventFilter(watched, event)
+
+    def _update_viewport_visibility(self):
+        """Tell each preview whether it intersects the visible part of the scroll area."""
+        viewport = self.scroll_area.viewport().rect()
+        offset = self.container.pos()
+        for item in self._preview_items.values():
+            item.set_in_viewport(item.geometry().translated(offset).intersects(viewport))
+
+    def set_frames(self, frames: Sequence[QImage | QPixmap]):
         """Set the available frames for segment extraction."""
         self._all_frames = list(frames)
 
@@ -594,6 +694,7 @@ class AnimationSegmentPreview(QWidget):
         preview_item.playToggled.connect(self._on_play_toggled)
         preview_item.bounceChanged.connect(self._on_bounce_changed)
         preview_item.frameHoldsChanged.connect(self._on_frame_holds_changed)
+        preview_item.canvasPlaybackRequested.connect(self._on_canvas_playback_requested)
 
         # Add to container
         self.container_layout.insertWidget(self.container_layout.count() - 1, preview_item)
@@ -634,6 +735,10 @@ class AnimationSegmentPreview(QWidget):
         """Handle frame holds change."""
         self.segmentFrameHoldsChanged.emit(name, frame_holds)
 
+    def _on_canvas_playback_requested(self, name: str):
+        """Handle request to play a segment on the main canvas."""
+        self.segmentCanvasPlaybackRequested.emit(name)
+
     def _toggle_all_playback(self):
         """Toggle playback for all segments."""
         # Check if any are playing
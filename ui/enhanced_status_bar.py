@@ -3,7 +3,7 @@
 Enhanced Status Bar Module
 ==========================
 
-Status bar with temporary message and mouse-position indicator.
+Status bar with temporary message, mouse-position and pixel-inspector indicators.
 """
 
 from PySide6.QtCore import QTimer
@@ -26,10 +26,15 @@ class EnhancedStatusBar(QStatusBar):
         self._mouse_label.setToolTip("Mouse position in sprite coordinates")
         self._mouse_label.setMinimumWidth(100)
 
+        self._pixel_label = QLabel()
+        self._pixel_label.setToolTip("Pixel under the mouse")
+        self._pixel_label.setVisible(False)
+
         permanent_widget = QWidget()
         permanent_layout = QHBoxLayout(permanent_widget)
         permanent_layout.setContentsMargins(5, 0, 5, 0)
         permanent_layout.setSpacing(15)
+        permanent_layout.addWidget(self._pixel_label)
         permanent_layout.addWidget(self._mouse_label)
 
         self.addPermanentWidget(permanent_widget)
@@ -48,3 +53,8 @@ class EnhancedStatusBar(QStatusBar):
         else:
             self._mouse_label.setText("Mouse: -")
             self._mouse_label.setToolTip("Mouse position not available")
+
+    def update_pixel_info(self, text: str | None) -> None:
+        """Show pixel-inspector text next to the mouse position (None hides it)."""
+        self._pixel_label.setVisible(text is not None)
+        self._pixel_label.setText(text or "")
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Sheet Overview Widget
+=====================
+
+Whole-sprite-sheet view for checking grid offsets and CCL results:
+- Zoomed-out views draw from a tile pyramid built on a worker thread
+- Extraction regions (grid cells or CCL sprite bounds) drawn as boxes,
+  culled with a spatial index to the ones on screen and large enough to see
+- Wheel zoom around the cursor, drag to pan, double-click to fit
+"""
+
+import logging
+import threading
+
+import numpy as np
+from PySide6.QtCore import (
+    QObject,
+    QPoint,
+    QPointF,
+    QRect,
+    QRectF,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    Signal,
+)
+from PySide6.QtGui import (
+    QImage,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QPixmap,
+    QResizeEvent,
+    QShowEvent,
+    QWheelEvent,
+)
+from PySide6.QtWidgets import QWidget
+
+from config import Config
+from sprite_model.spatial_index import SpatialIndex
+from utils.tile_pyramid import TilePyramid, generate_pyramid_tiles
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["SheetOverview"]
+
+
+class _PyramidSignals(QObject):
+    """Signal carrier for _PyramidTask (QRunnable cannot emit signals itself)."""
+
+    tileReady = Signal(int, int, int, int, QImage)  # generation, level, column, row, tile
+
+
+class _PyramidTask(QRunnable):
+    """Builds the tile pyramid of one sheet on a pool thread."""
+
+    def __init__(self, generation: int, image: QImage, cancelled: threading.Event):
+        super().__init__()
+        self.signals = _PyramidSignals()
+        self._generation = generation
+        self._image = image
+        self._cancelled = cancelled
+
+    def run(self):
+        """Emit each tile tagged with its generation, coarsest level first."""
+        try:
+            generate_pyramid_tiles(
+                self._image,
+                Config.Canvas.OVERVIEW_TILE_SIZE,
+                self._emit_tile,
+                self._cancelled.is_set,
+            )
+        except Exception:
+            logger.exception("Sheet overview tile generation failed")
+        finally:
+            self._image = QImage()  # Release the sheet copy once its tiles exist
+
+    def _emit_tile(self, level: int, column: int, row: int, tile: QImage) -> None:
+        self.signals.tileReady.emit(self._generation, level, column, row, tile)
+
+
+class SheetOverview(QWidget):
+    """Pan/zoom view of the whole sprite sheet with extraction regions overlaid.
+
+    The pyramid is only built while the widget is shown, so loading a sheet
+    costs nothing until the overview is opened. At zoom 1 and above the
+    sheet pixmap is drawn directly (clipped to the viewport); below that the
+    tiles of the matching pyramid level are drawn, falling back to coarser
+    levels for tiles still being generated.
+    """
+
+    zoomChanged = Signal(float)  # zoom factor
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setCursor(Qt.CursorShape.OpenHandCursor)
+
+        self._sheet: QPixmap | None = None
+        self._sheet_image: QImage | None = None  # Same pixels, until the pyramid task takes them
+        self._pyramid: TilePyramid | None = None
+        self._build_pending = False  # Sheet set but its pyramid not started yet
+        self._generation = 0
+        self._cancel_build = threading.Event()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._regions = SpatialIndex(())
+        self._region_rects: list[QRectF] = []  # Sheet-space outline per region, built once
+        # Outline tiles in zoomed sheet space: (column, row) -> image, valid at _region_tiles_zoom
+        self._region_tiles: dict[tuple[int, int], QImage] = {}
+        self._region_tiles_zoom = 0.0
+        self._zoom = 1.0
+        self._origin = QPointF()  # Widget position of the sheet's top-left corner
+        self._fit_pending = False
+        self._last_pan_point: QPoint | None = None
+
+    # ------------------------------------------------------------------
+    # Content
+    # ------------------------------------------------------------------
+
+    def set_sheet(self, sheet: QPixmap | None, image: QImage | None = None) -> None:
+        """Show a new sprite sheet (None to clear); drops the previous regions.
+
+        ``image`` is the same sheet as a QImage (as it was loaded). The pyramid
+        is built from it and the reference is dropped once the build starts;
+        without it the pixmap is converted on the GUI thread.
+        """
+        self._stop_build()
+        self._sheet = sheet if sheet is not None and not sheet.isNull() else None
+        self._sheet_image = image if self._sheet is not None else None
+        self._pyramid = None
+        self._set_region_index(SpatialIndex(()))
+        self._build_pending = self._sheet is not None
+        self._fit_pending = self._sheet is not None
+        if self.isVisible():
+            self._start_pending_work()
+        self.update()
+
+    def set_regions(self, regions: np.ndarray | SpatialIndex) -> None:
+        """Overlay (n, 4) x, y, width, height sheet boxes; a SpatialIndex is used as is."""
+        if not isinstance(regions, SpatialIndex):
+            regions = SpatialIndex(regions)
+        self._set_region_index(regions)
+        self.update()
+
+    def clear(self) -> None:
+        """Drop the sheet and stop any pyramid generation."""
+        self.set_sheet(None)
+
+    def _set_region_index(self, regions: SpatialIndex) -> None:
+        self._regions = regions
+        self._region_rects = [QRectF(*box) for box in regions.boxes.tolist()]
+        self._region_tiles.clear()
+
+    @property
+    def pyramid(self) -> TilePyramid | None:
+        """Tile pyramid of the current sheet (None until its build starts)."""
+        return self._pyramid
+
+    @property
+    def regions(self) -> SpatialIndex:
+        """Spatial index over the overlaid regions."""
+        return self._regions
+
+    # ------------------------------------------------------------------
+    # View
+    # ------------------------------------------------------------------
+
+    def get_zoom_factor(self) -> float:
+        """Get current zoom factor."""
+        return self._zoom
+
+    def set_zoom(self, factor: float, anchor: QPointF | None = None) -> None:
+        """Zoom keeping the sheet point under anchor (default: widget center) fixed."""
+        zoom = max(Config.Canvas.OVERVIEW_ZOOM_MIN, min(Config.Canvas.OVERVIEW_ZOOM_MAX, factor))
+        if anchor is None:
+            anchor = QPointF(self.width() / 2.0, self.height() / 2.0)
+        self._origin = anchor - (anchor - self._origin) * (zoom / self._zoom)
+        self._zoom = zoom
+        self.update()
+        self.zoomChanged.emit(self._zoom)
+
+    def fit_to_view(self) -> None:
+        """Zoom and center so the whole sheet is visible."""
+        if self._sheet is None or self.width() <= 0 or self.height() <= 0:
+            return
+        fit = min(self.width() / self._sheet.width(), self.height() / self._sheet.height())
+        self._zoom = max(
+            Config.Canvas.OVERVIEW_ZOOM_MIN,
+            min(Config.Canvas.OVERVIEW_ZOOM_MAX, fit * Config.Canvas.ZOOM_FIT_MARGIN),
+        )
+        self._origin = QPointF(
+            (self.width() - self._sheet.width() * self._zoom) / 2.0,
+            (self.height() - self._sheet.height() * self._zoom) / 2.0,
+        )
+        self._fit_pending = False
+        self.update()
+        self.zoomChanged.emit(self._zoom)
+
+    def visible_sheet_rect(self, area: QRectF | None = None) -> QRect:
+        """Return the sheet pixels under area (default: the whole widget)."""
+        if self._sheet is None:
+            return QRect()
+        if area is None:
+            area = QRectF(self.rect())
+        sheet_area = QRectF(
+            (area.x() - self._origin.x()) / self._zoom,
+            (area.y() - self._origin.y()) / self._zoom,
+            area.width() / self._zoom,
+            area.height() / self._zoom,
+        )
+        return sheet_area.toAlignedRect().intersected(self._sheet.rect())
+
+    # ------------------------------------------------------------------
+    # Painting
+    # ------------------------------------------------------------------
+
+    def paintEvent(self, event: QPaintEvent):
+        """Draw the visible part of the sheet and the regions over it."""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), Config.Canvas.DEFAULT_BG_COLOR)
+        visible = self.visible_sheet_rect(QRectF(event.rect()))
+        if visible.isEmpty():
+            return
+
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self._zoom < 1.0)
+        level = self._pyramid.level_for_zoom(self._zoom) if self._pyramid else 0
+        if level == 0 and self._sheet is not None:
+            painter.drawPixmap(self._to_widget(visible), self._sheet, QRectF(visible))
+        else:
+            self._draw_level(painter, level, visible)
+
+        self._draw_regions(painter, visible)
+
+    def _draw_level(self, painter: QPainter, level: int, area: QRect) -> None:
+        """Draw area from one pyramid level; missing tiles fall back to coarser levels."""
+        pyramid = self._pyramid
+        if pyramid is None:
+            return
+        scale = float(1 << level)
+        for column, row in pyramid.tiles_in(level, area):
+            covered = pyramid.tile_rect(level, column, row).intersected(area)
+            tile = pyramid.tile(level, column, row)
+            if tile is None:
+                if level + 1 < pyramid.level_count:
+                    self._draw_level(painter, level + 1, covered)
+                continue
+            tile_origin = pyramid.tile_rect(level, column, row).topLeft()
+            source = QRectF(
+                (covered.x() - tile_origin.x()) / scale,
+                (covered.y() - tile_origin.y()) / scale,
+                covered.width() / scale,
+                covered.height() / scale,
+            )
+            painter.drawImage(self._to_widget(covered), tile, source)
+
+    def _draw_regions(self, painter: QPainter, visible: QRect) -> None:
+        """Outline the regions overlapping visible that are big enough to see.
+
+        Outlines are rendered into tiles of the zoomed sheet and reused until
+        the zoom changes, so panning only renders the tiles scrolling into view.
+        """
+        if not len(self._regions):
+            return
+        if self._region_tiles_zoom != self._zoom:
+            self._region_tiles.clear()
+            self._region_tiles_zoom = self._zoom
+
+        tile_size = Config.Canvas.OVERVIEW_TILE_SIZE
+        zoomed = self._to_widget(visible).translated(-self._origin)
+        columns = range(int(zoomed.left()) // tile_size, int(zoomed.right()) // tile_size + 1)
+        rows = range(int(zoomed.top()) // tile_size, int(zoomed.bottom()) // tile_size + 1)
+        wanted = [(column, row) for row in rows for column in columns]
+        if len(self._region_tiles) + len(wanted) > Config.Canvas.OVERVIEW_REGION_TILE_CACHE:
+            self._region_tiles = {
+                key: self._region_tiles[key] for key in wanted if key in self._region_tiles
+            }
+
+        origin = self._origin.toPoint()
+        for column, row in wanted:
+            tile = self._region_tiles.get((column, row))
+            if tile is None:
+                tile = self._render_region_tile(column, row)
+                self._region_tiles[(column, row)] = tile
+            painter.drawImage(origin + QPoint(column * tile_size, row * tile_size), tile)
+
+    def _render_region_tile(self, column: int, row: int) -> QImage:
+        """Render the outlines falling in one tile of the zoomed sheet."""
+        tile_size = Config.Canvas.OVERVIEW_TILE_SIZE
+        tile = QImage(tile_size, tile_size, QImage.Format.Format_ARGB32_Premultiplied)
+        tile.fill(Qt.GlobalColor.transparent)
+        area = QRectF(
+            column * tile_size / self._zoom,
+            row * tile_size / self._zoom,
+            tile_size / self._zoom,
+            tile_size / self._zoom,
+        ).toAlignedRect()
+        indices = _visible_regions(self._regions, area, self._zoom).tolist()
+        painter = QPainter(tile)
+        self._outline_regions(
+            painter,
+            [self._region_rects[i] for i in indices],
+            QPointF(-column * tile_size, -row * tile_size),
+        )
+        painter.end()
+        return tile
+
+    def _outline_regions(self, painter: QPainter, rects: list[QRectF], origin: QPointF) -> None:
+        """Stroke sheet-space rects with a one-pixel pen, sheet (0, 0) at origin."""
+        if not rects:
+            return
+        pen = QPen(Config.Canvas.OVERVIEW_OVERLAY_COLOR)
+        pen.setCosmetic(True)
+        painter.save()
+        painter.translate(origin)
+        painter.scale(self._zoom, self._zoom)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.drawRects(rects)
+        painter.restore()
+
+    def _to_widget(self, rect: QRect) -> QRectF:
+        """Map a sheet rectangle to widget coordinates."""
+        return QRectF(
+            self._origin.x() + rect.x() * self._zoom,
+            self._origin.y() + rect.y() * self._zoom,
+            rect.width() * self._zoom,
+            rect.height() * self._zoom,
+        )
+
+    # ------------------------------------------------------------------
+    # Pyramid generation
+    # ------------------------------------------------------------------
+
+    def _start_pending_work(self) -> None:
+        if self._fit_pending:
+            self.fit_to_view()
+        if not self._build_pending or self._sheet is None:
+            return
+        self._build_pending = False
+        image, self._sheet_image = self._sheet_image, None  # The task owns the only copy
+        self._pyramid = TilePyramid(self._sheet.size(), Config.Canvas.OVERVIEW_TILE_SIZE)
+        if self._pyramid.level_count < 2:
+            return  # Small sheets are drawn directly at every zoom
+        # QPixmap is GUI-thread only, so hand the pool a QImage
+        if image is None:
+            image = self._sheet.toImage()
+        task = _PyramidTask(self._generation, image, self._cancel_build)
+        task.signals.tileReady.connect(self._on_tile_ready)
+        self._pool.start(task)
+
+    def _stop_build(self) -> None:
+        """Cancel the running build; its late tiles are ignored by generation."""
+        self._cancel_build.set()
+        self._cancel_build = threading.Event()
+        self._generation += 1
+        self._pool.clear()
+
+    def _on_tile_ready(self, generation: int, level: int, column: int, row: int, tile: QImage):
+        if generation != self._generation or self._pyramid is None:
+            return
+        self._pyramid.add(level, column, row, tile)
+        self.update(self._to_widget(self._pyramid.tile_rect(level, column, row)).toAlignedRect())
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def showEvent(self, event: QShowEvent):
+        """Start deferred fitting and pyramid generation once visible."""
+        super().showEvent(event)
+        self._start_pending_work()
+
+    def resizeEvent(self, event: QResizeEvent):
+        """Refit a sheet that has not been fitted to a real size yet."""
+        super().resizeEvent(event)
+        if self._fit_pending and self.isVisible():
+            self.fit_to_view()
+
+    def wheelEvent(self, event: QWheelEvent):
+        """Zoom around the cursor."""
+        step = Config.Canvas.ZOOM_FACTOR
+        factor = self._zoom * step if event.angleDelta().y() > 0 else self._zoom / step
+        self.set_zoom(factor, event.position())
+
+    def mousePressEvent(self, event: QMouseEvent):
+        """Start panning."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._last_pan_point = event.position().toPoint()
+            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        """Pan while the left button is held."""
+        if self._last_pan_point and (event.buttons() & Qt.MouseButton.LeftButton):
+            position = event.position().toPoint()
+            self._origin += QPointF(position - self._last_pan_point)
+            self._last_pan_point = position
+            self.update()
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        """Stop panning."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._last_pan_point = None
+            self.setCursor(Qt.CursorShape.OpenHandCursor)
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent):
+        """Fit the sheet to the view."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.fit_to_view()
+
+
+def _visible_regions(regions: SpatialIndex, visible: QRect, zoom: float) -> np.ndarray:
+    """Indices of regions overlapping visible whose longer side spans the minimum on-screen size."""
+    indices = regions.query_rect(visible.x(), visible.y(), visible.width(), visible.height())
+    boxes = regions.boxes[indices]
+    min_extent = Config.Canvas.OVERVIEW_MIN_OVERLAY_PX / zoom
+    return indices[np.maximum(boxes[:, 2], boxes[:, 3]) >= min_extent]
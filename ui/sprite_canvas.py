@@ -5,7 +5,9 @@ Custom canvas widget for displaying sprites with zoom and pan capabilities.
 Part of Python Sprite Viewer - Phase 5: UI Component Extraction.
 """
 
-from PySide6.QtCore import QPoint, QRect, Qt, Signal
+import math
+
+from PySide6.QtCore import QLineF, QPoint, QPointF, QRect, QRectF, Qt, Signal
 from PySide6.QtGui import (
     QColor,
     QFont,
@@ -172,8 +174,9 @@ class SpriteCanvas(QLabel):
             QPainter.RenderHint.SmoothPixmapTransform, False
         )  # Keep pixel-perfect for sprites
 
-        # Get the full widget rect
+        # Get the full widget rect, and the part of it this paint must cover
         rect = self.rect()
+        clip = QRectF(event.rect().intersected(rect))
 
         # Ensure we're using the full widget area
         painter.setViewport(rect)
@@ -197,32 +200,36 @@ class SpriteCanvas(QLabel):
                 temp_painter.drawPixmap(1, 1, self._pixmap)
                 temp_painter.end()
             temp_pixmap = self._cached_padded_pixmap
-
-            # Scale the temporary pixmap
-            scaled_size = temp_pixmap.size() * self._zoom_factor
+            zoom = self._zoom_factor
 
             # Center the sprite - use floating point for accuracy
-            x = (rect.width() - scaled_size.width()) / 2.0 + self._pan_offset[0]
-            y = (rect.height() - scaled_size.height()) / 2.0 + self._pan_offset[1]
+            x = (rect.width() - temp_pixmap.width() * zoom) / 2.0 + self._pan_offset[0]
+            y = (rect.height() - temp_pixmap.height() * zoom) / 2.0 + self._pan_offset[1]
 
             # Round to nearest pixel to avoid subpixel rendering issues
-            x = round(x)
-            y = round(y)
-
-            # Draw the temporary pixmap (which includes padding)
-            target_rect = QRect(x, y, scaled_size.width(), scaled_size.height())
-            painter.drawPixmap(target_rect, temp_pixmap)
+            origin = QPointF(round(x), round(y))
+
+            # Draw only the source pixels that land inside the clip: at high zoom
+            # the full scaled sprite is far larger than the viewport
+            source = _visible_source_rect(origin, zoom, temp_pixmap.rect(), clip)
+            if not source.isEmpty():
+                target = QRectF(
+                    origin.x() + source.x() * zoom,
+                    origin.y() + source.y() * zoom,
+                    source.width() * zoom,
+                    source.height() * zoom,
+                )
+                painter.drawPixmap(target, temp_pixmap, QRectF(source))
 
-            # Draw grid overlay if enabled (adjust for padding)
+            # Draw grid overlay if enabled (offset by the 1px padding)
             if self._show_grid:
-                # Adjust grid rect to account for the 1px padding
-                grid_rect = QRect(
-                    target_rect.x() + int(self._zoom_factor),
-                    target_rect.y() + int(self._zoom_factor),
-                    int(self._pixmap.width() * self._zoom_factor),
-                    int(self._pixmap.height() * self._zoom_factor),
+                grid_rect = QRectF(
+                    origin.x() + zoom,
+                    origin.y() + zoom,
+                    self._pixmap.width() * zoom,
+                    self._pixmap.height() * zoom,
                 )
-                self._draw_grid(painter, grid_rect)
+                self._draw_grid(painter, grid_rect, clip)
 
             # Draw frame info overlay
             self._draw_frame_info(painter, rect)
@@ -282,27 +289,32 @@ class SpriteCanvas(QLabel):
         cache_painter.end()
         return pixmap
 
-    def _draw_grid(self, painter: QPainter, sprite_rect: QRect):
-        """Draw grid overlay on sprite."""
+    def _draw_grid(self, painter: QPainter, sprite_rect: QRectF, clip: QRectF):
+        """Draw grid overlay on sprite, limited to the part inside clip."""
         grid_size = self._grid_size * self._zoom_factor
         if grid_size < 1.0:
             return
 
+        visible = sprite_rect.intersected(clip)
+        if visible.isEmpty():
+            return
+
         pen = QPen(Config.Drawing.GRID_COLOR)
         pen.setWidth(Config.Drawing.GRID_PEN_WIDTH)
         painter.setPen(pen)
 
-        # Vertical lines
-        x = sprite_rect.left()
-        while x <= sprite_rect.right():
-            painter.drawLine(int(x), sprite_rect.top(), int(x), sprite_rect.bottom())
-            x += grid_size
-
-        # Horizontal lines
-        y = sprite_rect.top()
-        while y <= sprite_rect.bottom():
-            painter.drawLine(sprite_rect.left(), int(y), sprite_rect.right(), int(y))
-            y += grid_size
+        # Lines start at the sprite's top-left edge; its far edges get none
+        right = min(visible.right(), sprite_rect.right() - 1)
+        bottom = min(visible.bottom(), sprite_rect.bottom() - 1)
+        lines = [
+            QLineF(int(x), visible.top(), int(x), visible.bottom())
+            for x in _grid_positions(sprite_rect.left(), grid_size, visible.left(), right)
+        ]
+        lines += [
+            QLineF(visible.left(), int(y), visible.right(), int(y))
+            for y in _grid_positions(sprite_rect.top(), grid_size, visible.top(), bottom)
+        ]
+        painter.drawLines(lines)
 
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press for panning."""
@@ -396,5 +408,21 @@ class SpriteCanvas(QLabel):
         return None
 
 
+def _visible_source_rect(origin: QPointF, zoom: float, source: QRect, clip: QRectF) -> QRect:
+    """Return the pixels of source that, drawn at origin scaled by zoom, intersect clip."""
+    left = math.floor((clip.left() - origin.x()) / zoom)
+    top = math.floor((clip.top() - origin.y()) / zoom)
+    right = math.ceil((clip.right() - origin.x()) / zoom)
+    bottom = math.ceil((clip.bottom() - origin.y()) / zoom)
+    return QRect(left, top, right - left, bottom - top).intersected(source)
+
+
+def _grid_positions(start: float, step: float, low: float, high: float) -> list[float]:
+    """Return start + k * step (k >= 0) for every grid line between low and high."""
+    first = max(0, math.ceil((low - start) / step))
+    last = math.floor((high - start) / step)
+    return [start + k * step for k in range(first, last + 1)]
+
+
 # Export for easy importing
 __all__ = ["SpriteCanvas"]
@@ -4,34 +4,193 @@ Sprite rendering utilities.
 Helper functions for rendering and manipulating sprite images.
 """
 
+import hashlib
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtGui import QImage, QPainter, QPixmap
+
+# 32-bit formats whose pixels can be replicated as whole uint32 words
+_WORD_FORMATS = (
+    QImage.Format.Format_ARGB32,
+    QImage.Format.Format_ARGB32_Premultiplied,
+    QImage.Format.Format_RGB32,
+)
+# 32-bit formats stored as 0xAARRGGBB words with straight alpha (RGB32 is 0xFFRRGGBB)
+_STRAIGHT_ARGB_FORMATS = (QImage.Format.Format_ARGB32, QImage.Format.Format_RGB32)
 
 
-def create_padded_pixmap(pixmap: QPixmap, padding: int = 1) -> QPixmap:
+def create_padded_pixmap(pixmap: QPixmap | QImage, padding: int = 1) -> QPixmap:
     """Create a padded pixmap to prevent edge cutoff during display.
 
     Adds transparent padding around the pixmap to ensure edges aren't
     clipped when displayed in widgets with borders or scaling.
 
     Args:
-        pixmap: The source pixmap to pad
+        pixmap: The source pixmap (or image) to pad
         padding: Pixels of padding to add on each side (default: 1)
 
     Returns:
         A new QPixmap with transparent padding around the original
     """
     if pixmap.isNull():
-        return pixmap
+        return QPixmap()
 
     padded = QPixmap(pixmap.width() + padding * 2, pixmap.height() + padding * 2)
     padded.fill(Qt.GlobalColor.transparent)
 
     painter = QPainter(padded)
-    painter.drawPixmap(padding, padding, pixmap)
+    if isinstance(pixmap, QImage):
+        painter.drawImage(padding, padding, pixmap)
+    else:
+        painter.drawPixmap(padding, padding, pixmap)
     painter.end()
 
     return padded
 
 
-__all__ = ["create_padded_pixmap"]
+def integer_scale_factor(scale_factor: float) -> int | None:
+    """Return scale_factor as an int if it is a whole-number upscale, else None."""
+    rounded = round(scale_factor)
+    if rounded >= 1 and abs(scale_factor - rounded) < 1e-9:
+        return rounded
+    return None
+
+
+def scale_image_nearest(image: QImage, factor: int) -> QImage:
+    """Upscale image by an integer factor using exact pixel replication.
+
+    Works directly on the pixel buffer with numpy, so the result is
+    bit-exact (no filtering) and the copy runs without holding the GIL.
+    Safe to call from worker threads.
+
+    Args:
+        image: Source image
+        factor: Whole-number scale factor (>= 1)
+
+    Returns:
+        A new image ``factor`` times larger in each dimension, or the source
+        image itself when factor is 1 or the image is null
+    """
+    if factor < 1:
+        raise ValueError(f"Scale factor must be >= 1, got {factor}")
+    if factor == 1 or image.isNull():
+        return image
+
+    source = image
+    if source.format() not in _WORD_FORMATS:
+        source = source.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+    width = source.width()
+    height = source.height()
+    words_per_line = source.bytesPerLine() // 4
+    pixels = np.frombuffer(
+        source.constBits(), dtype=np.uint32, count=height * words_per_line
+    ).reshape(height, words_per_line)[:, :width]
+
+    scaled = QImage(width * factor, height * factor, source.format())
+    # 32-bit scanlines are always 4-byte aligned, so the target has no row padding
+    target = np.frombuffer(scaled.bits(), dtype=np.uint32, count=scaled.sizeInBytes() // 4)
+    # Widen each row once, then broadcast it to ``factor`` output rows; this is
+    # markedly faster than a single 4-D broadcast over (row, dy, col, dx).
+    wide_rows = np.repeat(pixels, factor, axis=1)
+    target.reshape(height, factor, width * factor)[...] = wide_rows[:, None, :]
+    return scaled
+
+
+def scale_images_nearest(
+    images: Sequence[QImage], factor: int, max_workers: int = 1
+) -> list[QImage]:
+    """Upscale several images by an integer factor, optionally in parallel.
+
+    Args:
+        images: Source images
+        factor: Whole-number scale factor (>= 1)
+        max_workers: Threads to spread frames across; 1 scales serially
+
+    Returns:
+        Scaled images in the same order as images
+    """
+    if factor == 1:
+        return list(images)
+    if max_workers <= 1 or len(images) < 2:
+        return [scale_image_nearest(image, factor) for image in images]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as pool:
+        return list(pool.map(lambda image: scale_image_nearest(image, factor), images))
+
+
+def fit_scaled_image(source: QImage, width: int, height: int) -> QImage:
+    """Scale source to fit within (width, height), keeping its aspect ratio.
+
+    Uses whole-pixel replication (``scale_image_nearest``) when at least a 1x
+    fit is possible, so pixel art stays crisp; only sources larger than the
+    box fall back to smooth Qt downscaling.
+    """
+    if source.isNull() or width <= 0 or height <= 0:
+        return source
+    factor = min(width // source.width(), height // source.height())
+    if factor >= 1:
+        return scale_image_nearest(source, factor)
+    return source.scaled(
+        width,
+        height,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+def frame_digest(image: QImage) -> bytes:
+    """Return a SHA-256 digest of image's size and pixels.
+
+    Two images get the same digest exactly when they hold identical pixels,
+    whatever their source format: pixels are hashed as non-premultiplied
+    ARGB32 words, the layout ARGB32 and RGB32 images already use, so only
+    other formats pay for a conversion.
+    """
+    if image.format() not in _STRAIGHT_ARGB_FORMATS:
+        image = image.convertToFormat(QImage.Format.Format_ARGB32)
+    # SHA-256 is hardware-accelerated on current CPUs, so it outruns blake2b here
+    digest = hashlib.sha256(usedforsecurity=False)
+    digest.update(f"{image.width()}x{image.height()}".encode())
+    if not image.isNull():
+        digest.update(image.constBits())
+    return digest.digest()
+
+
+def duplicate_frame_map(frames: Sequence[QImage]) -> list[int]:
+    """Map every frame to the first frame with identical pixels.
+
+    Returns:
+        One index per frame: the frame's own index when it is the first of
+        its content, otherwise the index of the earlier frame it duplicates
+    """
+    canonical: list[int] = []
+    by_digest: dict[bytes, int] = {}
+    by_cache_key: dict[int, int] = {}  # Shared QImages skip hashing
+    for index, frame in enumerate(frames):
+        original = by_cache_key.get(frame.cacheKey())
+        if original is None:
+            original = by_digest.setdefault(frame_digest(frame), index)
+            by_cache_key[frame.cacheKey()] = original
+        canonical.append(original)
+    return canonical
+
+
+def _as_word_image(image: QImage) -> QImage:
+    """Return image in a 32-bit-per-pixel format (unchanged if it already is)."""
+    if image.isNull() or image.format() in _WORD_FORMATS:
+        return image
+    return image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+
+__all__ = [
+    "create_padded_pixmap",
+    "duplicate_frame_map",
+    "fit_scaled_image",
+    "frame_digest",
+    "integer_scale_factor",
+    "scale_image_nearest",
+    "scale_images_nearest",
+]
@@ -584,64 +584,6 @@ class StyleManager:
             }}
         """
 
-    @classmethod
-    def thumbnail_style(
-        cls,
-        selected: bool = False,
-        segment_color: str | None = None,
-        segment_bg: str | None = None,
-        is_segment_start: bool = False,
-        is_segment_end: bool = False,
-    ) -> str:
-        """Build thumbnail style based on state.
-
-        Args:
-            selected: Whether the thumbnail is selected
-            segment_color: Hex color of the segment border, if in a segment
-            segment_bg: Hex color for segment background (lighter version of segment_color)
-            is_segment_start: Whether this is the first frame of a segment
-            is_segment_end: Whether this is the last frame of a segment
-        """
-        if selected:
-            border_color = cls.Colors.SUCCESS
-            border_width = "3px"
-            background = cls.Colors.SUCCESS_LIGHT
-        elif segment_color:
-            border_color = segment_color
-            border_width = "3px"
-            background = segment_bg if segment_bg else "#F5F5F5"
-        else:
-            border_color = cls.Colors.DISABLED_BG
-            border_width = "1px"
-            background = "white"
-
-        hover_style = ""
-        if not selected:
-            hover_style = f"""
-                QLabel:hover {{
-                    border-color: {cls.Colors.SELECTION_BORDER};
-                    background-color: #F0F8FF;
-                }}
-            """
-
-        overlay_style = ""
-        if is_segment_start:
-            overlay_style += "border-left-width: 5px; border-left-style: solid;"
-        if is_segment_end:
-            overlay_style += "border-right-width: 5px; border-right-style: solid;"
-
-        return f"""
-            QLabel {{
-                border: {border_width} solid {border_color};
-                background-color: {background};
-                border-radius: 4px;
-                margin: 2px;
-                padding: 2px;
-                {overlay_style}
-            }}
-            {hover_style}
-        """
-
     @classmethod
     def export_option(cls, selected: bool = False) -> str:
         """Export option card style."""
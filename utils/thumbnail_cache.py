@@ -0,0 +1,307 @@
+"""
+Thumbnail cache.
+
+Persistent, content-addressed store for scaled frame thumbnails, shared by the
+animation grid and the segment previews, whose worker pools do the lookups off
+the GUI thread. Entries are keyed by a hash of the frame's pixels plus the
+target box size, so reopening or re-extracting a sheet reuses thumbnails for
+every frame whose pixels did not change.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtGui import QImage
+
+from config import Config
+from utils.sprite_rendering import _as_word_image, fit_scaled_image, frame_digest
+
+__all__ = ["ThumbnailCache", "shared_thumbnail_cache"]
+
+logger = logging.getLogger(__name__)
+
+# Bump when thumbnail scaling or key derivation changes so stale entries stop matching
+_KEY_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS thumbnails (
+    key TEXT PRIMARY KEY,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    format INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+class ThumbnailCache:
+    """Size-bounded SQLite blob store for scaled thumbnails.
+
+    Pixels are stored zlib-compressed in their native 32-bit layout, so a hit
+    costs one indexed read plus a decompress, with no image codec involved.
+    When the stored blobs exceed ``max_bytes`` the least recently used entries
+    are evicted. All methods are thread-safe; the thumbnail pool workers and
+    the GUI thread share one connection behind a lock.
+
+    Database errors are logged and treated as cache misses, so a corrupt or
+    read-only cache file never stops thumbnails from being produced.
+    """
+
+    # Evict down to this fraction of max_bytes so eviction doesn't run every put
+    _EVICT_TARGET = 0.9
+    # Batch last-used timestamps so lookups stay read-only
+    _TOUCH_BATCH = 256
+    # Minimum remembered content digests per in-memory image (see _key_for)
+    _KEY_MEMO_LIMIT = 8192
+
+    def __init__(self, path: Path | str | None = None, max_bytes: int | None = None):
+        """
+        Args:
+            path: SQLite file to use; None keeps the cache in memory only
+            max_bytes: Upper bound for stored thumbnail data
+                (default: Config.UI.THUMBNAIL_CACHE_MAX_BYTES)
+        """
+        self._max_bytes = Config.UI.THUMBNAIL_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._touched: dict[str, float] = {}
+        # Least recently used first; grows to hold every frame handed to remember_digests
+        self._digests: OrderedDict[int, bytes] = OrderedDict()
+        self._memo_limit = self._KEY_MEMO_LIMIT
+        self._path = path
+        self._connection: sqlite3.Connection | None = self._open(path)
+        self._total_bytes = self._query_total(self._connection)
+
+    @staticmethod
+    def frame_key(image: QImage, width: int, height: int) -> str:
+        """Return the cache key for image scaled into a (width, height) box."""
+        return _box_key(frame_digest(image), width, height)
+
+    def remember_digests(self, images: Sequence[QImage], digests: Sequence[bytes]) -> None:
+        """Record precomputed ``frame_digest`` values so lookups skip hashing.
+
+        Extraction already hashes every frame (``SpriteModel.frame_metadata``);
+        handing those digests over means no thumbnail request re-reads pixels
+        to build its key.
+        """
+        with self._lock:
+            self._memo_limit = max(self._KEY_MEMO_LIMIT, len(images))
+            for image, digest in zip(images, digests, strict=True):
+                self._remember(image.cacheKey(), digest)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes of thumbnail data currently stored."""
+        return self._total_bytes
+
+    def thumbnail(self, image: QImage, width: int, height: int) -> QImage:
+        """Return image scaled to fit (width, height), reusing a cached copy.
+
+        Scaling follows ``fit_scaled_image``; a miss scales and stores the result.
+        """
+        if image.isNull():
+            return image
+        key = self._key_for(image, width, height)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        scaled = fit_scaled_image(image, width, height)
+        if scaled.cacheKey() != image.cacheKey():  # Nothing to store for a 1x fit
+            self.put(key, scaled)
+        return scaled
+
+    def get(self, key: str) -> QImage | None:
+        """Return the cached image for key, or None on a miss."""
+        with self._lock:
+            try:
+                connection = self._db()
+                row = connection.execute(
+                    "SELECT width, height, format, data FROM thumbnails WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Thumbnail cache read failed: %s", e)
+                return None
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= self._TOUCH_BATCH:
+                self._flush_touched()
+
+        width, height, image_format, data = row
+        try:
+            pixels = zlib.decompress(data)
+        except zlib.error:
+            return None
+        image = QImage(pixels, width, height, width * 4, QImage.Format(image_format))
+        if image.sizeInBytes() != len(pixels):
+            return None
+        # Detach from the Python buffer before it goes out of scope
+        return image.copy()
+
+    def put(self, key: str, image: QImage) -> None:
+        """Store image under key, evicting old entries if over budget."""
+        if image.isNull():
+            return
+        image = _as_word_image(image)
+        data = zlib.compress(bytes(image.constBits()), 1)
+
+        with self._lock:
+            try:
+                connection = self._db()
+                previous = connection.execute(
+                    "SELECT size FROM thumbnails WHERE key = ?", (key,)
+                ).fetchone()
+                connection.execute(
+                    "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        image.width(),
+                        image.height(),
+                        image.format().value,
+                        data,
+                        len(data),
+                        time.time(),
+                    ),
+                )
+                self._total_bytes += len(data) - (previous[0] if previous else 0)
+                self._touched.pop(key, None)
+                if self._total_bytes > self._max_bytes:
+                    self._flush_touched()
+                    self._evict()
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning("Thumbnail cache write failed: %s", e)
+
+    def clear(self) -> None:
+        """Remove every cached thumbnail."""
+        with self._lock:
+            try:
+                connection = self._db()
+                connection.execute("DELETE FROM thumbnails")
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning("Thumbnail cache clear failed: %s", e)
+                return
+            self._touched.clear()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Persist pending last-used times and close the database.
+
+        The cache reopens on its next use, so closing a shared instance is safe.
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._flush_touched()
+                self._connection.commit()
+            except sqlite3.Error as e:
+                logger.warning("Thumbnail cache flush failed: %s", e)
+            self._connection.close()
+            self._connection = None
+
+    def _key_for(self, image: QImage, width: int, height: int) -> str:
+        # Hashing dominates a hit, so remember digests per in-memory image; QImage
+        # cache keys change whenever the pixel data is detached or modified.
+        memo_key = image.cacheKey()
+        with self._lock:
+            digest = self._digests.get(memo_key)
+            if digest is not None:
+                self._digests.move_to_end(memo_key)
+        if digest is None:
+            digest = frame_digest(image)
+            with self._lock:
+                self._remember(memo_key, digest)
+        return _box_key(digest, width, height)
+
+    def _remember(self, memo_key: int, digest: bytes) -> None:
+        # Caller holds the lock; evict least recently used digests past the limit
+        self._digests[memo_key] = digest
+        self._digests.move_to_end(memo_key)
+        while len(self._digests) > self._memo_limit:
+            self._digests.popitem(last=False)
+
+    def _db(self) -> sqlite3.Connection:
+        # Caller holds the lock; reopen after close()
+        if self._connection is None:
+            self._connection = self._open(self._path)
+            self._total_bytes = self._query_total(self._connection)
+        return self._connection
+
+    def _open(self, path: Path | str | None) -> sqlite3.Connection:
+        if path is not None:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(str(path), check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(_SCHEMA)
+                connection.commit()
+                return connection
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Thumbnail cache unavailable at %s, using memory: %s", path, e)
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        connection.execute(_SCHEMA)
+        return connection
+
+    @staticmethod
+    def _query_total(connection: sqlite3.Connection) -> int:
+        try:
+            row = connection.execute("SELECT COALESCE(SUM(size), 0) FROM thumbnails").fetchone()
+        except sqlite3.Error:
+            return 0
+        return int(row[0])
+
+    def _flush_touched(self) -> None:
+        # Caller holds the lock
+        if self._touched:
+            self._db().executemany(
+                "UPDATE thumbnails SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        # Caller holds the lock; drop least recently used rows until under target
+        target = int(self._max_bytes * self._EVICT_TARGET)
+        connection = self._db()
+        rows = connection.execute("SELECT key, size FROM thumbnails ORDER BY last_used").fetchall()
+        evicted: list[tuple[str]] = []
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        connection.executemany("DELETE FROM thumbnails WHERE key = ?", evicted)
+
+
+def _box_key(digest: bytes, width: int, height: int) -> str:
+    """Return the cache key for a frame digest scaled into a (width, height) box."""
+    return f"v{_KEY_VERSION}-{digest.hex()[:32]}-{width}x{height}"
+
+
+_shared_instance: ThumbnailCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_thumbnail_cache() -> ThumbnailCache:
+    """Get the process-wide thumbnail cache in the user cache directory (thread-safe)."""
+    global _shared_instance
+    if _shared_instance is None:
+        with _shared_lock:
+            if _shared_instance is None:
+                cache_dir = QStandardPaths.writableLocation(
+                    QStandardPaths.StandardLocation.CacheLocation
+                )
+                path = Path(cache_dir) / Config.UI.THUMBNAIL_CACHE_FILE if cache_dir else None
+                _shared_instance = ThumbnailCache(path)
+    return _shared_instance
@@ -0,0 +1,132 @@
+"""
+Tile pyramid (mipmaps) for drawing very large images zoomed out.
+
+Scaling a whole 8k-16k sprite sheet down on every paint is slow. A pyramid
+holds the image pre-reduced by powers of two, cut into fixed-size tiles, so
+a paint only draws the few tiles under the viewport from the level closest
+to the zoom. Level 0 is the source image itself and is not stored.
+"""
+
+import math
+from collections.abc import Callable, Iterator
+
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QImage
+
+__all__ = ["TilePyramid", "generate_pyramid_tiles", "pyramid_level_count"]
+
+
+class TilePyramid:
+    """Reduced copies of an image, one dict of tiles per level.
+
+    A tile at level L covers ``tile_size * 2**L`` source pixels per side.
+    Tiles arrive one at a time (see ``generate_pyramid_tiles``); ``tile``
+    returns None for tiles that have not been added yet.
+    """
+
+    def __init__(self, size: QSize, tile_size: int):
+        """
+        Args:
+            size: Size of the source image (level 0)
+            tile_size: Tile edge in pixels at every level
+        """
+        self._size = QSize(size)
+        self._tile_size = tile_size
+        self._tiles: dict[tuple[int, int, int], QImage] = {}  # (level, column, row) -> tile
+
+    @property
+    def size(self) -> QSize:
+        """Size of the source image."""
+        return QSize(self._size)
+
+    @property
+    def tile_size(self) -> int:
+        """Tile edge in pixels."""
+        return self._tile_size
+
+    @property
+    def level_count(self) -> int:
+        """Levels including level 0; the last one fits in a single tile."""
+        return pyramid_level_count(self._size, self._tile_size)
+
+    def level_for_zoom(self, zoom: float) -> int:
+        """Return the coarsest level that still has at least one pixel per screen pixel."""
+        if zoom >= 1.0 or zoom <= 0.0:
+            return 0
+        return min(math.floor(math.log2(1.0 / zoom) + 1e-9), self.level_count - 1)
+
+    def add(self, level: int, column: int, row: int, tile: QImage) -> None:
+        """Store one generated tile."""
+        self._tiles[(level, column, row)] = tile
+
+    def tile(self, level: int, column: int, row: int) -> QImage | None:
+        """Return a stored tile, or None if it has not been generated yet."""
+        return self._tiles.get((level, column, row))
+
+    def tile_rect(self, level: int, column: int, row: int) -> QRect:
+        """Return the source-image rectangle a tile covers."""
+        span = self._tile_size << level
+        return QRect(column * span, row * span, span, span).intersected(
+            QRect(0, 0, self._size.width(), self._size.height())
+        )
+
+    def tiles_in(self, level: int, rect: QRect) -> Iterator[tuple[int, int]]:
+        """Yield (column, row) of the level's tiles overlapping a source rectangle."""
+        area = rect.intersected(QRect(0, 0, self._size.width(), self._size.height()))
+        if area.isEmpty():
+            return
+        span = self._tile_size << level
+        for row in range(area.top() // span, area.bottom() // span + 1):
+            for column in range(area.left() // span, area.right() // span + 1):
+                yield column, row
+
+
+def pyramid_level_count(size: QSize, tile_size: int) -> int:
+    """Number of levels for an image of size, down to one that fits in one tile."""
+    longest = max(size.width(), size.height(), 1)
+    return max(1, math.ceil(math.log2(max(longest / tile_size, 1.0))) + 1)
+
+
+def generate_pyramid_tiles(
+    image: QImage,
+    tile_size: int,
+    on_tile: Callable[[int, int, int, QImage], None],
+    is_cancelled: Callable[[], bool] = lambda: False,
+) -> None:
+    """
+    Build the reduced levels of image and pass each tile to on_tile.
+
+    Uses only QImage, so it can run on a worker thread. Levels are halved
+    from the one above, then delivered coarsest first so a zoomed-out view
+    has something to draw almost immediately.
+
+    Args:
+        image: Source image (level 0, not tiled)
+        tile_size: Tile edge in pixels
+        on_tile: Called with (level, column, row, tile) for levels >= 1
+        is_cancelled: Polled between steps; generation stops when it returns True
+    """
+    level_count = pyramid_level_count(image.size(), tile_size)
+    levels: list[QImage] = []
+    current = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    for _ in range(1, level_count):
+        if is_cancelled():
+            return
+        current = current.scaled(
+            max(1, (current.width() + 1) // 2),
+            max(1, (current.height() + 1) // 2),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        levels.append(current)
+
+    for level in range(len(levels), 0, -1):
+        reduced = levels[level - 1]
+        for row in range(math.ceil(reduced.height() / tile_size)):
+            for column in range(math.ceil(reduced.width() / tile_size)):
+                if is_cancelled():
+                    return
+                area = QRect(column * tile_size, row * tile_size, tile_size, tile_size)
+                tile = reduced.copy(area.intersected(reduced.rect()))
+                on_tile(level, column, row, tile)
+        levels[level - 1] = QImage()  # Tiles hold the pixels now